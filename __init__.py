@@ -1,8 +1,14 @@
 import os
 import sys
+import importlib
 
 from enum import IntEnum
 
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
 
 class DCC(IntEnum):
     """
@@ -13,6 +19,7 @@ class DCC(IntEnum):
     MAX = 0
     MAYA = 1
     BLENDER = 2
+    HEADLESS = 3
 
 
 def detectApplication(executable):
@@ -57,5 +64,99 @@ def detectApplication(executable):
     return DCC.UNKNOWN
 
 
+def findApplication(executable):
+    """
+    Returns the DCC application to use.
+    The `DCC_BACKEND` environment variable takes precedence over the supplied executable, for example: `DCC_BACKEND=headless`
+    Any unrecognized backends are ignored in favour of the supplied executable so a bad environment cannot break this package on import!
+
+    :type executable: str
+    :rtype: DCC
+    """
+
+    # Check if backend has been overridden
+    #
+    backend = os.environ.get('DCC_BACKEND', '').strip().upper()
+
+    if len(backend) == 0:
+
+        return detectApplication(executable)
+
+    # Evaluate backend name
+    #
+    application = DCC.__members__.get(backend, None)
+
+    if application is None:
+
+        log.warning(f'Unrecognized DCC backend: {backend}, detecting application from executable instead!')
+        return detectApplication(executable)
+
+    return application
+
+
+def setApplication(application):
+    """
+    Updates the DCC application used to resolve function set backends.
+    This must be called before any function set modules are imported since backends are resolved on import!
+
+    :type application: Union[DCC, str]
+    :rtype: None
+    """
+
+    global __application__
+
+    # Evaluate supplied argument
+    #
+    if isinstance(application, str):
+
+        application = DCC.__members__.get(application.upper(), None)
+
+    if not isinstance(application, DCC):
+
+        raise TypeError(f'setApplication() expects a valid DCC ({type(application).__name__} given)!')
+
+    __application__ = application
+
+
 __executable__ = os.path.normpath(sys.executable)
-__application__ = detectApplication(__executable__)
+__application__ = findApplication(__executable__)
+
+
+__lazy_modules__ = (
+    'fnfbx',
+    'fnlayer',
+    'fnmenubar',
+    'fnmesh',
+    'fnnode',
+    'fnnotify',
+    'fnqt',
+    'fnreference',
+    'fnscene',
+    'fnselectionset',
+    'fnskin',
+    'fntexture',
+    'fntransform',
+    'collections',
+    'dataclasses',
+    'json',
+    'math',
+    'perforce'
+)
+
+
+def __getattr__(name):
+    """
+    Private method that lazily imports the requested submodule.
+    This allows headless sessions to only pay for the submodules they actually use!
+
+    :type name: str
+    :rtype: module
+    """
+
+    if name in __lazy_modules__:
+
+        return importlib.import_module(f'.{name}', __name__)
+
+    else:
+
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
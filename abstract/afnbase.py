@@ -20,8 +20,9 @@ class AFnBase(with_metaclass(ABCMeta, object)):
     """
 
     # region Dunderscores
-    __slots__ = ('_object', '_queue')
+    __slots__ = ('_object', '_queue', '_epoch', '_validEpoch')
     __array_index_type__ = ArrayIndexType.ZeroBased
+    __dispatch__ = {}
 
     def __init__(self, *args, **kwargs):
         """
@@ -38,6 +39,8 @@ class AFnBase(with_metaclass(ABCMeta, object)):
         #
         self._object = None
         self._queue = deque()
+        self._epoch = 0
+        self._validEpoch = -1
 
         # Check if any arguments were supplied
         #
@@ -82,29 +85,44 @@ class AFnBase(with_metaclass(ABCMeta, object)):
     def __getattribute__(self, name):
         """
         Private method that provides attribute access for instances of the class.
+        Whether an attribute is a guarded instance method is cached per class, and the attached object is only validated once per object epoch.
 
         :type name: str
         :rtype: Any
         """
 
-        # Get class definition
-        # Evaluate if this is an instance method
+        # Evaluate if this is a guarded instance method
         #
-        cls = super(AFnBase, self).__getattribute__('__class__')
-        obj = getattr(cls, name)
+        cls = type(self)
+        key = (cls, name)
 
-        if not inspect.isfunction(obj) or hasattr(AFnBase, name):
+        isGuarded = AFnBase.__dispatch__.get(key, None)
 
-            return super(AFnBase, self).__getattribute__(name)
+        if isGuarded is None:
+
+            isGuarded = inspect.isfunction(getattr(cls, name, None)) and not hasattr(AFnBase, name)
+            AFnBase.__dispatch__[key] = isGuarded
+
+        if not isGuarded:
+
+            return object.__getattribute__(self, name)
+
+        # Check if function set has been validated since the object last changed
+        #
+        epoch = object.__getattribute__(self, '_epoch')
+
+        if object.__getattribute__(self, '_validEpoch') == epoch:
+
+            return object.__getattribute__(self, name)
 
         # Check if function set is valid
         #
-        func = super(AFnBase, self).__getattribute__('isValid')
-        isValid = func()
+        isValid = object.__getattribute__(self, 'isValid')()
 
         if isValid:
 
-            return super(AFnBase, self).__getattribute__(name)
+            self._validEpoch = epoch
+            return object.__getattribute__(self, name)
 
         else:
 
@@ -196,6 +214,7 @@ class AFnBase(with_metaclass(ABCMeta, object)):
         """
 
         self._object = obj
+        self.invalidate()
 
     def trySetObject(self, obj):
         """
@@ -226,6 +245,7 @@ class AFnBase(with_metaclass(ABCMeta, object)):
         """
 
         self._object = None
+        self.invalidate()
 
     def hasObject(self):
         """
@@ -256,6 +276,26 @@ class AFnBase(with_metaclass(ABCMeta, object)):
 
         return True
 
+    def epoch(self):
+        """
+        Returns the object epoch for this function set.
+        The epoch is incremented whenever the attached object changes.
+
+        :rtype: int
+        """
+
+        return self._epoch
+
+    def invalidate(self):
+        """
+        Increments the object epoch so the attached object is re-validated on the next method call.
+        This should be called whenever the object is changed without going through `setObject`!
+
+        :rtype: None
+        """
+
+        self._epoch += 1
+
     def queue(self):
         """
         Returns the object queue for this function set.
@@ -340,4 +380,99 @@ class AFnBase(with_metaclass(ABCMeta, object)):
             # Remove last item from function set
             #
             self.resetObject()
+
+    @staticmethod
+    def decomposeQuery(query):
+        """
+        Returns the method name and arguments from the supplied query.
+        Queries can either be a method name or a tuple containing the method name followed by its arguments.
+
+        :type query: Union[str, Tuple[str, ...]]
+        :rtype: Tuple[str, tuple]
+        """
+
+        if isinstance(query, string_types):
+
+            return query, ()
+
+        elif isinstance(query, (list, tuple)) and len(query) > 0 and isinstance(query[0], string_types):
+
+            return query[0], tuple(query[1:])
+
+        else:
+
+            raise TypeError(f'decomposeQuery() expects a method name ({type(query).__name__} given)!')
+
+    def batchQuery(self, objects, name, *args):
+        """
+        Returns the results from the named method for each of the supplied objects.
+        Overload this method to evaluate a query in bulk without attaching each object to a function set.
+        By default, none is returned to signal that the query should be evaluated per object!
+
+        :type objects: List[Any]
+        :type name: str
+        :rtype: Union[List[Any], None]
+        """
+
+        return None
+
+    def queryQueue(self, queue, *queries):
+        """
+        Returns columnar results for the supplied queries evaluated against each object in the queue.
+        Any queries without a bulk implementation are evaluated together by attaching each object to a single function set.
+        Objects that cannot be attached are assigned none for every per-object query!
+
+        :type queue: Union[List[Any], Iterable[Any]]
+        :type queries: Union[str, Tuple[str, ...]]
+        :rtype: Dict[Union[str, Tuple[str, ...]], List[Any]]
+        """
+
+        # Check if queue is valid
+        #
+        if not self.acceptsQueue(queue):
+
+            raise TypeError(f'queryQueue() expects a sequence ({type(queue).__name__} given)!')
+
+        # Evaluate bulk queries
+        #
+        objects = list(flatten(queue))
+        numObjects = len(objects)
+
+        results = {}
+        remaining = []
+
+        for query in queries:
+
+            name, args = self.decomposeQuery(query)
+            values = self.batchQuery(objects, name, *args)
+
+            if values is not None:
+
+                results[query] = values
+
+            else:
+
+                results[query] = [None] * numObjects
+                remaining.append((query, name, args))
+
+        # Evaluate any remaining queries per object
+        # A separate function set is used so this instance's object is left untouched!
+        #
+        if len(remaining) == 0:
+
+            return results
+
+        fnSet = self.__class__()
+
+        for (i, obj) in enumerate(objects):
+
+            if not (fnSet.trySetObject(obj) and fnSet.isValid()):
+
+                continue
+
+            for (query, name, args) in remaining:
+
+                results[query][i] = getattr(fnSet, name)(*args)
+
+        return results
     # endregion
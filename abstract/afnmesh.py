@@ -1,16 +1,17 @@
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Tuple
 from . import afnbase
 from ..python import importutils
-from ..math import floatmath
+from ..math import floatmath, meshmath, symmetrymath
 from ..dataclasses.vector import Vector
 from ..dataclasses.colour import Colour
 from ..dataclasses.plane import Plane
 from ..dataclasses.transformationmatrix import TransformationMatrix
+from ..decorators.classproperty import classproperty
 from ..vendor.six import with_metaclass
 
 import logging
@@ -19,6 +20,7 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
 spatial = importutils.tryImport('scipy.spatial', __locals__=locals(), __globals__=globals())
 
 
@@ -51,11 +53,44 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
     Overload of `AFnBase` that outlines DCC function set behaviour for meshes.
     """
 
-    __slots__ = ()
+    __slots__ = ('_topology', '_symmetry')
+    __symmetry__ = None
+    __elements__ = OrderedDict()
+    __maxelements__ = 32
 
     ComponentType = ComponentType
     Hit = Hit
 
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Declare private variables
+        #
+        self._topology = None
+        self._symmetry = None
+
+        # Call parent method
+        #
+        super(AFnMesh, self).__init__(*args, **kwargs)
+
+    @classproperty
+    def symmetryCache(cls):
+        """
+        Getter method that returns the symmetry cache shared by all mesh function sets.
+
+        :rtype: symmetrymath.SymmetryCache
+        """
+
+        if AFnMesh.__symmetry__ is None:
+
+            AFnMesh.__symmetry__ = symmetrymath.SymmetryCache()
+
+        return AFnMesh.__symmetry__
+
     def range(self, *args):
         """
         Returns a generator for yielding a range of mesh elements.
@@ -670,86 +705,97 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
         return list(self.iterConnectedFaces(*indices, **kwargs))
 
-    def getElements(self, *indices, **kwargs):
+    def getElementLabels(self, componentType=ComponentType.Vertex):
         """
-        Converts the supplied component indices into element groups.
+        Returns the zero-based element label for each component along with the zero-based component indices for each element.
+        Labels are computed in a single pass from the face-vertex connectivity and cached by topology fingerprint.
 
-        :type indices: Union[int, List[int]]
-        :key componentType: ComponentType
-        :rtype: List[List[int]]
+        :type componentType: ComponentType
+        :rtype: Tuple[numpy.ndarray, List[numpy.ndarray]]
         """
 
-        # Get functions associated with component type
+        # Check if component type is valid
         #
-        componentType = kwargs.get('componentType', self.ComponentType.Vertex)
+        if componentType not in (self.ComponentType.Vertex, self.ComponentType.Edge, self.ComponentType.Face):
 
-        numComponentFunc = None
-        getConnectComponentFunc = None
+            raise TypeError(f'getElementLabels() expects a valid component type ({type(componentType).__name__} given)!')
 
-        if componentType == self.ComponentType.Vertex:
+        # Check if labels have already been cached
+        #
+        fingerprint = self.getTopologyFingerprint()
 
-            numComponentFunc = self.numVertices
-            getConnectComponentFunc = self.getConnectedVertices
+        key = (fingerprint, int(componentType))
+        elements = AFnMesh.__elements__.get(key, None)
 
-        elif componentType == self.ComponentType.Edge:
+        if elements is not None:
+
+            AFnMesh.__elements__.move_to_end(key)
+            return elements
+
+        # Label components by type
+        #
+        numVertices = self.numVertices()
+        labels = None
+
+        if componentType == self.ComponentType.Vertex:
 
-            numComponentFunc = self.numEdges
-            getConnectComponentFunc = self.getConnectedEdges
+            faceVertexCounts, faceVertexIndices = self.getFaceVertexArrays()
+            labels = meshmath.vertexLabels(numVertices, faceVertexCounts, faceVertexIndices)
 
-        elif componentType == self.ComponentType.Face:
+        elif componentType == self.ComponentType.Edge:
 
-            numComponentFunc = self.numFaces
-            getConnectComponentFunc = self.getConnectedFaces
+            labels = meshmath.edgeLabels(numVertices, self.getEdgeVertexIndices())
 
         else:
 
-            raise TypeError(f'getElements() expects a valid component type ({type(componentType).__name__} given)!')
+            faceVertexCounts, faceVertexIndices = self.getFaceVertexArrays()
+            labels = meshmath.faceLabels(faceVertexCounts, faceVertexIndices)
 
-        # Evaluate supplied indices
+        # Cache element labels
         #
-        numIndices = len(indices)
+        elements = (labels, meshmath.groupLabels(labels))
+        AFnMesh.__elements__[key] = elements
 
-        if numIndices == 0:
+        while len(AFnMesh.__elements__) > AFnMesh.__maxelements__:
 
-            indices = self.range(numComponentFunc())
+            AFnMesh.__elements__.popitem(last=False)
 
-        # Iterate through indices
-        #
-        indexTracker = {}
-        elementGroups = []
+        return elements
 
-        for index in indices:
+    def getElements(self, *indices, **kwargs):
+        """
+        Converts the supplied component indices into element groups.
 
-            # Check if index has been processed
-            #
-            exists = indexTracker.get(index, False)
+        :type indices: Union[int, List[int]]
+        :key componentType: ComponentType
+        :rtype: List[Set[int]]
+        """
 
-            if exists:
+        # Get labels associated with component type
+        #
+        componentType = kwargs.get('componentType', self.ComponentType.Vertex)
 
-                continue
+        if componentType not in (self.ComponentType.Vertex, self.ComponentType.Edge, self.ComponentType.Face):
 
-            # Collect indices from element group
-            #
-            elementIndices = {index}
+            raise TypeError(f'getElements() expects a valid component type ({type(componentType).__name__} given)!')
 
-            previousCount = 1
-            growthCount = 1
+        labels, elements = self.getElementLabels(componentType=componentType)
+        offset = self.arrayIndexType
 
-            while growthCount >= 1:
+        # Evaluate supplied indices
+        # Elements are returned in the order they are first encountered!
+        #
+        numIndices = len(indices)
 
-                connectedIndices = getConnectComponentFunc(*elementIndices, componentType=componentType)
-                elementIndices = elementIndices.union(connectedIndices)
+        if numIndices == 0:
 
-                newCount = len(elementIndices)
-                growthCount = newCount - previousCount
-                previousCount = int(newCount)
+            elementLabels = range(len(elements))
 
-            # Append element group and update tracker
-            #
-            elementGroups.append(elementIndices)
-            indexTracker.update(dict.fromkeys(elementIndices, True))
+        else:
 
-        return elementGroups
+            elementLabels = dict.fromkeys(labels[numpy.array(indices, dtype=int) - offset].tolist()).keys()
+
+        return [set((elements[elementLabel] + offset).tolist()) for elementLabel in elementLabels]
 
     def distanceBetweenVertices(self, *indices):
         """
@@ -836,14 +882,120 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
         return []
 
-    def mirrorVertices(self, vertexIndices, axis=0, tolerance=1e-3):
+    def getFaceVertexArrays(self):
+        """
+        Returns the face-vertex counts and zero-based face-vertex indices as arrays.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        faceVertexIndices = self.getFaceVertexIndices()
+        faceVertexCounts = numpy.array([len(indices) for indices in faceVertexIndices], dtype=int)
+        faceVertexIndices = numpy.fromiter(chain.from_iterable(faceVertexIndices), dtype=int, count=int(faceVertexCounts.sum())) - self.arrayIndexType
+
+        return faceVertexCounts, faceVertexIndices
+
+    def getEdgeVertexIndices(self):
+        """
+        Returns the zero-based vertex pair for each edge as an array.
+        By default, this expects the connected vertices of multiple edges to be yielded as pairs in edge order.
+        Overloads should replace this with a single query wherever the DCC does not yield pairs!
+
+        :rtype: numpy.ndarray
+        """
+
+        edgeVertexIndices = self.getConnectedVertices(*self.range(self.numEdges()), componentType=self.ComponentType.Edge)
+        return numpy.array(edgeVertexIndices, dtype=int).reshape(-1, 2) - self.arrayIndexType
+
+    def getTopologyArrays(self):
+        """
+        Returns the zero-based rest points, face-vertex counts and face-vertex indices as arrays.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+
+        points = numpy.array([tuple(point) for point in self.iterVertices()], dtype=float).reshape(-1, 3)
+        faceVertexCounts, faceVertexIndices = self.getFaceVertexArrays()
+
+        return points, faceVertexCounts, faceVertexIndices
+
+    def getTopologyFingerprint(self):
+        """
+        Returns a fingerprint of the face-vertex connectivity for this mesh.
+        The fingerprint is cached per object epoch and is only recomputed when the vertex, edge or face counts change.
+        Be sure to call `invalidate` after any topology changes that preserve these counts!
+
+        :rtype: str
+        """
+
+        # Check if fingerprint is up-to-date
+        #
+        epoch = self.epoch()
+        counts = (self.numVertices(), self.numEdges(), self.numFaces())
+
+        if self._topology is not None and self._topology[:2] == (epoch, counts):
+
+            return self._topology[2]
+
+        # Compute connectivity fingerprint
+        #
+        faceVertexCounts, faceVertexIndices = self.getFaceVertexArrays()
+        fingerprint = symmetrymath.connectivityFingerprint(faceVertexCounts, faceVertexIndices, counts[0])
+
+        self._topology = (epoch, counts, fingerprint)
+        return fingerprint
+
+    def symmetry(self, axis=0, tolerance=1e-3, method='position'):
+        """
+        Returns the zero-based mirrored vertex index for each vertex.
+        Symmetry maps are cached by topology fingerprint so they are only computed once per mesh, axis, tolerance and method.
+        The fingerprints are cached per object epoch so the mesh is only read again when the vertex, edge or face counts change.
+        Be sure to call `invalidate` after any deformations that should update the symmetry!
+        Any vertices without a mirrored vertex are assigned -1.
+
+        :type axis: int
+        :type tolerance: float
+        :type method: str
+        :rtype: numpy.ndarray
+        """
+
+        # Check if fingerprints are up-to-date
+        #
+        epoch = self.epoch()
+        counts = (self.numVertices(), self.numEdges(), self.numFaces())
+
+        if self._symmetry is not None and self._symmetry[:2] == (epoch, counts):
+
+            key = self.symmetryCache.key(*self._symmetry[2:], axis=axis, tolerance=tolerance, method=method)
+            symmetry = self.symmetryCache.get(key)
+
+            if symmetry is not None:
+
+                return symmetry
+
+        # Compute fingerprints from topology arrays
+        #
+        points, faceVertexCounts, faceVertexIndices = self.getTopologyArrays()
+
+        connectivity = symmetrymath.connectivityFingerprint(faceVertexCounts, faceVertexIndices, counts[0])
+        fingerprint = symmetrymath.topologyFingerprint(faceVertexCounts, faceVertexIndices, points)
+
+        self._topology = (epoch, counts, connectivity)
+        self._symmetry = (epoch, counts, connectivity, fingerprint)
+
+        key = self.symmetryCache.key(connectivity, fingerprint, axis=axis, tolerance=tolerance, method=method)
+        return self.symmetryCache.symmetry(faceVertexCounts, faceVertexIndices, points, axis=axis, tolerance=tolerance, method=method, key=key)
+
+    def mirrorVertices(self, vertexIndices, axis=0, tolerance=1e-3, method='position'):
         """
         Mirrors the supplied list of vertex indices.
+        The method can either be "position", to match mirrored points, or "topology", to walk the mesh from the symmetry seam.
         If no match is found then no key-value pair is created!
 
         :type vertexIndices: List[int]
         :type axis: int
         :type tolerance: float
+        :type method: str
         :rtype: Dict[int, int]
         """
 
@@ -853,30 +1005,21 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
             raise TypeError(f'mirrorVertices() expects a list ({type(vertexIndices).__name__} given)!')
 
-        # Define inverse map
-        # This will be used to inverse out input data
-        #
-        points = self.getVertices(*vertexIndices)
-
-        inverse = {i: -1 if i == axis else 1 for i in range(3)}
-        mirrorPoints = [[value * inverse[index] for (index, value) in enumerate(point)] for point in points]
-
-        # Query the closest points from point tree
-        # TODO: Might be worth trying to optimize this with only opposite points?
+        # Lookup the cached symmetry map
+        # Don't forget to compensate for 1-based arrays!
         #
-        tree = spatial.cKDTree(self.getVertices())
-        closestDistances, closestIndices = tree.query(mirrorPoints, distance_upper_bound=tolerance)
+        symmetry = self.symmetry(axis=axis, tolerance=tolerance, method=method).tolist()
+        offset = self.arrayIndexType
 
-        # Generate mirror map
-        #
         mirrorMap = {}
-        numVertices = self.numVertices()
 
-        for (vertexIndex, closestIndex) in zip(vertexIndices, closestIndices):
+        for vertexIndex in vertexIndices:
 
-            if closestIndex != numVertices:
+            mirrorIndex = symmetry[vertexIndex - offset]
 
-                mirrorMap[vertexIndex] = int(closestIndex + self.arrayIndexType)  # Don't forget to compensate for 1-based arrays!
+            if mirrorIndex != -1:
+
+                mirrorMap[vertexIndex] = mirrorIndex + offset
 
             else:
 
@@ -1145,6 +1288,7 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
         """
         Returns the faces that are closest to the given points.
         An optional list of faces can be used to limit the range of surfaces considered.
+        Points are projected in batches, grouped by face size, so large point sets are resolved in a single pass.
 
         :type points: Union[Vector, List[Vector]]
         :type dataset: List[int]
@@ -1157,65 +1301,88 @@ class AFnMesh(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
             dataset = list(self.range(self.numFaces()))
 
-        # Get face centroids
+        # Collect face-vertex arrays
+        # Only the vertices referenced by the dataset are queried!
         #
-        faceMap = dict(enumerate(dataset))
         faceVertexIndices = self.getFaceVertexIndices(*dataset)
-        faceVertexPoints = [self.getVertices(*vertexIndices, worldSpace=True) for vertexIndices in faceVertexIndices]
+        faceVertexCounts = numpy.array([len(vertexIndices) for vertexIndices in faceVertexIndices], dtype=int)
+        faceVertexOffsets = meshmath.faceVertexOffsets(faceVertexCounts)
+
+        flatIndices = numpy.fromiter(chain.from_iterable(faceVertexIndices), dtype=int, count=int(faceVertexCounts.sum()))
+        uniqueIndices, inverseIndices = numpy.unique(flatIndices, return_inverse=True)
 
-        faceCentroids = [sum(vertexPoints) / len(vertexPoints) for vertexPoints in faceVertexPoints]
+        vertexPoints = self.getVertices(*uniqueIndices.tolist(), worldSpace=True)
+        facePoints = numpy.array([tuple(point) for point in vertexPoints], dtype=float).reshape(-1, 3)[inverseIndices]
 
-        # Get the closest triangles using point tree
+        # Get the closest faces using point tree
         #
+        faceCentroids = numpy.add.reduceat(facePoints, faceVertexOffsets, axis=0) / faceVertexCounts[:, None]
+
+        points = numpy.array([tuple(point) for point in points], dtype=float).reshape(-1, 3)
+        numHits = len(points)
+
         tree = spatial.cKDTree(faceCentroids)
         distances, closestIndices = tree.query(points)
 
+        closestCounts = faceVertexCounts[closestIndices]
+        closestOffsets = faceVertexOffsets[closestIndices]
+
         # Project points onto the closest triangles
-        # Remember to use the triangle map to resolve the local indices!
         #
-        numHits = len(closestIndices)
-        hits = [None] * numHits
+        hitPoints = numpy.empty((numHits, 3), dtype=float)
+        baryCoords = numpy.zeros((numHits, 3), dtype=float)
+        biCoords = numpy.zeros((numHits, 2), dtype=float)
 
-        for (i, (closestIndex, closestPoint)) in enumerate(zip(closestIndices, points)):
+        triangleMask = closestCounts == 3
 
-            # Evaluate face topology
-            #
-            closestPoint = Vector(*closestPoint)
-            faceIndex = faceMap[closestIndex]
+        if numpy.any(triangleMask):
 
-            faceCentroid = faceCentroids[closestIndex]
-            vertexIndices = faceVertexIndices[closestIndex]
-            vertexPoints = faceVertexPoints[closestIndex]
-            numVertices = len(vertexIndices)
+            triangles = facePoints[closestOffsets[triangleMask, None] + numpy.arange(3)]
+            baryCoords[triangleMask] = meshmath.barycentricCoordinates(points[triangleMask], triangles)
+            hitPoints[triangleMask] = meshmath.barycentricPoints(triangles, baryCoords[triangleMask])
 
-            hitPoint = None
-            baryCoords, biCoords = None, None
+        # Project points onto the closest quadrilaterals
+        #
+        quadrilateralMask = closestCounts == 4
 
-            if numVertices == 3:
+        if numpy.any(quadrilateralMask):
 
-                baryCoords = self.getBarycentricCoordinates(closestPoint, vertexPoints)
-                hitPoint = (vertexPoints[0] * baryCoords[0]) + (vertexPoints[1] * baryCoords[1]) + (vertexPoints[2] * baryCoords[2])
+            quadrilaterals = facePoints[closestOffsets[quadrilateralMask, None] + numpy.arange(4)]
+            biCoords[quadrilateralMask] = meshmath.bilinearCoordinates(points[quadrilateralMask], quadrilaterals)
+            hitPoints[quadrilateralMask] = meshmath.bilinearPoints(quadrilaterals, biCoords[quadrilateralMask])
 
-            elif numVertices == 4:
+        # Project points onto the closest n-gons
+        # It's lazy but we shouldn't even be supporting n-gons!
+        #
+        polygonMask = ~(triangleMask | quadrilateralMask)
 
-                biCoords = self.getBilinearCoordinates(closestPoint, vertexPoints)
-                hitPoint = floatmath.lerp(floatmath.lerp(vertexPoints[0], vertexPoints[1], biCoords[0]), floatmath.lerp(vertexPoints[3], vertexPoints[2], biCoords[0]), biCoords[1])
+        if numpy.any(polygonMask):
 
-            else:
+            faceNormals = meshmath.newellNormals(facePoints, faceVertexCounts)
+            polygonIndices = closestIndices[polygonMask]
 
-                faceNormal = self.getFaceNormals(faceIndex)[0]
-                hitPoint = Plane(origin=faceCentroid, normal=faceNormal).project(closestPoint)  # It's lazy but we shouldn't even be supporting n-gons!
+            hitPoints[polygonMask] = meshmath.projectPoints(points[polygonMask], faceCentroids[polygonIndices], faceNormals[polygonIndices])
+
+        # Initialize hit specs
+        # Remember to use the dataset to resolve the local indices!
+        #
+        faceVertexPoints = {}
+        hits = [None] * numHits
+
+        for (i, closestIndex) in enumerate(closestIndices.tolist()):
+
+            if closestIndex not in faceVertexPoints:
+
+                offset, count = faceVertexOffsets[closestIndex], faceVertexCounts[closestIndex]
+                faceVertexPoints[closestIndex] = [Vector(*point) for point in facePoints[offset:offset + count].tolist()]
 
-            # Initialize hit specs
-            #
-            log.debug('Hit: point=%s -> closestPoint=%s, bary=%s' % (hitPoint, closestPoint, baryCoords))
             hits[i] = self.Hit(
-                point=hitPoint,
-                faceIndex=faceIndex,
-                faceVertexIndices=vertexIndices,
-                faceVertexPoints=vertexPoints,
-                baryCoords=baryCoords,
-                biCoords=biCoords
+                point=Vector(*hitPoints[i].tolist()),
+                faceIndex=dataset[closestIndex],
+                faceVertexIndices=faceVertexIndices[closestIndex],
+                faceVertexPoints=faceVertexPoints[closestIndex],
+                baryCoords=tuple(baryCoords[i].tolist()) if triangleMask[i] else None,
+                biCoords=tuple(biCoords[i].tolist()) if quadrilateralMask[i] else None
             )
 
         return hits
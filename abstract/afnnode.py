@@ -1,4 +1,5 @@
 import re
+import weakref
 
 from abc import ABCMeta, abstractmethod
 from fnmatch import fnmatch
@@ -12,6 +13,379 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+class NodeIndex(object):
+    """
+    Base class used to index scene nodes by name, handle, namespace and type.
+    The index is built in a single pass over the scene and is rebuilt lazily after it has been invalidated.
+    Where supported, node added, removed and renamed notifies are used to invalidate the index automatically!
+    User attributes are not indexed since no DCC notifies when they are added or removed.
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__weakref__',
+        '__cls__',
+        '__notifies__',
+        '__epoch__',
+        '__builtEpoch__',
+        '__nodes__',
+        '__names__',
+        '__shortNames__',
+        '__namespaces__',
+        '__types__'
+    )
+
+    __types_queries__ = {
+        'transform': 'isTransform',
+        'joint': 'isJoint',
+        'mesh': 'isMesh'
+    }
+
+    def __init__(self, cls):
+        """
+        Private method called after a new instance has been created.
+
+        :type cls: Callable
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NodeIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self.__cls__ = cls
+        self.__notifies__ = None
+        self.__epoch__ = 0
+        self.__builtEpoch__ = -1
+        self.__nodes__ = {}
+        self.__names__ = {}
+        self.__shortNames__ = {}
+        self.__namespaces__ = {}
+        self.__types__ = {}
+
+        # Register scene notifies
+        #
+        self.registerNotifies()
+
+    def __contains__(self, handle):
+        """
+        Private method that evaluates if the supplied handle has been indexed.
+
+        :type handle: int
+        :rtype: bool
+        """
+
+        return handle in self.nodes()
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of indexed nodes.
+
+        :rtype: int
+        """
+
+        return len(self.nodes())
+    # endregion
+
+    # region Methods
+    def registerNotifies(self):
+        """
+        Registers the notifies used to keep this index consistent with the scene.
+        Any notifies that are not supported by the current DCC are skipped!
+
+        :rtype: None
+        """
+
+        # Check if notifies are supported
+        #
+        try:
+
+            from dcc import fnnotify
+            self.__notifies__ = fnnotify.FnNotify()
+
+        except (ImportError, AttributeError) as exception:
+
+            log.debug(exception)
+            return
+
+        # Register scene change notifies
+        # Use a weak reference so the notifies do not keep this index alive!
+        #
+        notifies = self.__notifies__
+        reference = weakref.ref(self)
+
+        def sceneChanged(*args, **kwargs):
+
+            index = reference()
+
+            if index is not None:
+
+                index.invalidate()
+
+        for notification in (notifies.Notification.PostFileOpen, notifies.Notification.Undo, notifies.Notification.Redo, notifies.Notification.NodeAdded, notifies.Notification.NodeRemoved, notifies.Notification.NameChanged):
+
+            try:
+
+                notifies.addNotify(notification, sceneChanged)
+
+            except TypeError as exception:
+
+                log.debug(exception)
+                continue
+
+    def unregisterNotifies(self):
+        """
+        Unregisters any notifies used to keep this index consistent with the scene.
+
+        :rtype: None
+        """
+
+        if self.__notifies__ is not None:
+
+            self.__notifies__.clear()
+            self.__notifies__ = None
+
+    def epoch(self):
+        """
+        Returns the scene epoch for this index.
+        The epoch is incremented whenever the index is invalidated.
+
+        :rtype: int
+        """
+
+        return self.__epoch__
+
+    def invalidate(self):
+        """
+        Increments the scene epoch so the index is rebuilt on the next lookup.
+
+        :rtype: None
+        """
+
+        self.__epoch__ += 1
+
+    def isDirty(self):
+        """
+        Evaluates if the index is out of date with the scene epoch.
+
+        :rtype: bool
+        """
+
+        return self.__builtEpoch__ != self.__epoch__
+
+    def update(self):
+        """
+        Rebuilds the index from the scene nodes.
+        All node properties are collected using columnar queries to minimize the number of DCC calls.
+
+        :rtype: None
+        """
+
+        # Collect node properties
+        #
+        fnNode = self.__cls__()
+        nodes = list(fnNode.iterInstances())
+
+        typeQueries = tuple(self.__types_queries__.values())
+        columns = fnNode.queryQueue(nodes, 'handle', 'name', 'namespace', *typeQueries)
+
+        # Reset internal trackers
+        #
+        self.__nodes__.clear()
+        self.__names__.clear()
+        self.__shortNames__.clear()
+        self.__namespaces__.clear()
+        self.__types__ = {typeName: set() for typeName in self.__types_queries__.keys()}
+
+        # Iterate through nodes
+        #
+        handles = columns['handle']
+        names = columns['name']
+        namespaces = columns['namespace']
+
+        for (i, (node, handle, name, namespace)) in enumerate(zip(nodes, handles, names, namespaces)):
+
+            # Check if node is valid
+            #
+            if handle is None:
+
+                continue
+
+            # Index names
+            # Names can be shared by DAG nodes under different parents so every match is recorded!
+            #
+            absoluteName = f'{namespace}:{name}' if namespace else name
+
+            self.__nodes__[handle] = node
+            self.__names__.setdefault(absoluteName, []).append(handle)
+            self.__shortNames__.setdefault(name, []).append(handle)
+
+            # Index namespace
+            #
+            branch = self.__namespaces__
+
+            for part in (namespace.split(':') if namespace else ()):
+
+                branch = branch.setdefault(part, {})
+
+            branch.setdefault(None, []).append(handle)
+
+            # Index types
+            #
+            for (typeName, query) in self.__types_queries__.items():
+
+                if columns[query][i]:
+
+                    self.__types__[typeName].add(handle)
+
+        self.__builtEpoch__ = self.__epoch__
+
+    def ensureUpdated(self):
+        """
+        Rebuilds the index if it is out of date.
+
+        :rtype: None
+        """
+
+        if self.isDirty():
+
+            self.update()
+
+    def nodes(self):
+        """
+        Returns the handle-node pairs from this index.
+
+        :rtype: Dict[int, Any]
+        """
+
+        self.ensureUpdated()
+        return self.__nodes__
+
+    def getNodeByName(self, name):
+        """
+        Returns a node with the given name.
+        If no namespace is supplied then the node with a matching short name is returned instead.
+        Ambiguous names return none so that callers can defer to the scene instead!
+
+        :type name: str
+        :rtype: Any
+        """
+
+        self.ensureUpdated()
+        handles = self.__names__.get(name, None) or self.__shortNames__.get(name, None)
+
+        if handles is not None and len(handles) == 1:
+
+            return self.__nodes__.get(handles[0], None)
+
+        else:
+
+            return None
+
+    def getNodeByHandle(self, handle):
+        """
+        Returns a node with the given handle.
+
+        :type handle: int
+        :rtype: Any
+        """
+
+        return self.nodes().get(handle, None)
+
+    def getNodesByType(self, typeName):
+        """
+        Returns a list of nodes with the given type.
+        See `NodeIndex.__types_queries__` for a list of supported types!
+
+        :type typeName: str
+        :rtype: List[Any]
+        """
+
+        self.ensureUpdated()
+        return [self.__nodes__[handle] for handle in self.__types__.get(typeName, ())]
+
+    def getNodesByNamespace(self, namespace, recursive=False):
+        """
+        Returns a list of nodes from the given namespace.
+        An empty string represents the root namespace.
+
+        :type namespace: str
+        :type recursive: bool
+        :rtype: List[Any]
+        """
+
+        # Walk the namespace trie
+        #
+        self.ensureUpdated()
+        branch = self.__namespaces__
+
+        for part in (namespace.strip(':').split(':') if namespace.strip(':') else ()):
+
+            branch = branch.get(part, None)
+
+            if branch is None:
+
+                return []
+
+        # Collect handles from branches
+        #
+        handles = []
+        branches = [branch]
+
+        while len(branches) > 0:
+
+            branch = branches.pop()
+            handles.extend(branch.get(None, ()))
+
+            if recursive:
+
+                branches.extend(child for (key, child) in branch.items() if key is not None)
+
+        return [self.__nodes__[handle] for handle in handles]
+
+    def iterNodesByPattern(self, pattern):
+        """
+        Returns a generator that yields nodes whose short name matches the given pattern.
+        Patterns are only evaluated once per unique name!
+
+        :type pattern: str
+        :rtype: Iterator[Any]
+        """
+
+        self.ensureUpdated()
+
+        for (name, handles) in self.__shortNames__.items():
+
+            if fnmatch(name, pattern):
+
+                for handle in handles:
+
+                    yield self.__nodes__[handle]
+
+    def iterNodesByRegex(self, pattern):
+        """
+        Returns a generator that yields nodes whose short name matches the given regex expression.
+        Expressions are only evaluated once per unique name!
+
+        :type pattern: str
+        :rtype: Iterator[Any]
+        """
+
+        self.ensureUpdated()
+        regex = re.compile(pattern)
+
+        for (name, handles) in self.__shortNames__.items():
+
+            if regex.match(name):
+
+                for handle in handles:
+
+                    yield self.__nodes__[handle]
+    # endregion
+
+
 class AFnNode(with_metaclass(ABCMeta, afnobject.AFnObject)):
     """
     Overload of AFnObject that outlines scene node interfaces.
@@ -21,6 +395,7 @@ class AFnNode(with_metaclass(ABCMeta, afnobject.AFnObject)):
 
     __slots__ = ()
     __scene__ = None
+    __nodeindex__ = None
 
     @classproperty
     def scene(cls):
@@ -287,6 +662,99 @@ class AFnNode(with_metaclass(ABCMeta, afnobject.AFnObject)):
 
         pass
 
+    @classmethod
+    def nodeIndex(cls):
+        """
+        Returns the scene node index.
+        If the index has not been enabled then none is returned!
+
+        :rtype: Union[NodeIndex, None]
+        """
+
+        return AFnNode.__nodeindex__
+
+    @classmethod
+    def enableNodeIndex(cls):
+        """
+        Enables the scene node index for all node lookups.
+        The index is built from the instances of this class so it is best enabled from `FnNode`!
+
+        :rtype: NodeIndex
+        """
+
+        if AFnNode.__nodeindex__ is None:
+
+            AFnNode.__nodeindex__ = NodeIndex(cls)
+
+        return AFnNode.__nodeindex__
+
+    @classmethod
+    def disableNodeIndex(cls):
+        """
+        Disables the scene node index.
+
+        :rtype: None
+        """
+
+        if AFnNode.__nodeindex__ is not None:
+
+            AFnNode.__nodeindex__.unregisterNotifies()
+            AFnNode.__nodeindex__ = None
+
+    @classmethod
+    def findNodeByName(cls, name):
+        """
+        Returns a node with the given name.
+        If the node index is enabled then it is used instead of querying the scene, falling back on the scene for any misses.
+
+        :type name: str
+        :rtype: Any
+        """
+
+        nodeIndex = cls.nodeIndex()
+        node = nodeIndex.getNodeByName(name) if nodeIndex is not None else None
+
+        if node is not None:
+
+            return node
+
+        else:
+
+            return cls.getNodeByName(name)
+
+    @classmethod
+    def findNodeByHandle(cls, handle):
+        """
+        Returns a node with the given handle.
+        If the node index is enabled then it is used instead of querying the scene, falling back on the scene for any misses.
+
+        :type handle: int
+        :rtype: Any
+        """
+
+        nodeIndex = cls.nodeIndex()
+        node = nodeIndex.getNodeByHandle(handle) if nodeIndex is not None else None
+
+        if node is not None:
+
+            return node
+
+        else:
+
+            return cls.getNodeByHandle(handle)
+
+    @classmethod
+    def findNodesByAttribute(cls, name):
+        """
+        Returns a list of nodes with the given attribute name.
+        Attributes are always queried from the scene since the node index cannot detect when they are added or removed!
+
+        :type name: str
+        :rtype: List[Any]
+        """
+
+        return cls.getNodesByAttribute(name)
+
     @classmethod
     @abstractmethod
     def iterInstances(cls):
@@ -317,16 +785,26 @@ class AFnNode(with_metaclass(ABCMeta, afnobject.AFnObject)):
         :rtype: iter
         """
 
-        node = cls()
-        node.setQueue(cls.iterInstances())
+        # Check if node index is enabled
+        #
+        nodeIndex = cls.nodeIndex()
 
-        while not node.isDone():
+        if nodeIndex is not None:
 
-            if fnmatch(node.name(), pattern):
+            yield from nodeIndex.iterNodesByPattern(pattern)
+            return
 
-                yield node.object()
+        # Query the names of all nodes
+        #
+        node = cls()
+        instances = list(cls.iterInstances())
+        names = node.queryQueue(instances, 'name')['name']
+
+        for (instance, name) in zip(instances, names):
 
-            node.next()
+            if name is not None and fnmatch(name, pattern):
+
+                yield instance
 
     @classmethod
     def iterInstancesByRegex(cls, pattern):
@@ -337,15 +815,25 @@ class AFnNode(with_metaclass(ABCMeta, afnobject.AFnObject)):
         :rtype: iter
         """
 
+        # Check if node index is enabled
+        #
+        nodeIndex = cls.nodeIndex()
+
+        if nodeIndex is not None:
+
+            yield from nodeIndex.iterNodesByRegex(pattern)
+            return
+
+        # Query the names of all nodes
+        #
         node = cls()
-        node.setQueue(cls.iterInstances())
+        instances = list(cls.iterInstances())
+        names = node.queryQueue(instances, 'name')['name']
 
         regex = re.compile(pattern)
 
-        while not node.isDone():
-
-            if regex.match(node.name()):
+        for (instance, name) in zip(instances, names):
 
-                yield node.object()
+            if name is not None and regex.match(name):
 
-            node.next()
+                yield instance
@@ -7,7 +7,9 @@ That way it is the responsibility of the function set to clean up callbacks upon
 """
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum
+from functools import partial
 from . import afnbase
+from .notifydispatcher import NotifyDispatcher
 from ..collections import notifylist
 from ..vendor.six import with_metaclass
 
@@ -27,6 +29,11 @@ class Notification(IntEnum):
     SelectionChanged = 2
     Undo = 3
     Redo = 4
+    NodeAdded = 5
+    NodeRemoved = 6
+    NameChanged = 7
+    ReferenceLoaded = 8
+    ReferenceUnloaded = 9
 
 
 class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
@@ -39,7 +46,7 @@ class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
     # endregion
 
     # region Dunderscores
-    __slots__ = ('_notifications', '__weakref__')
+    __slots__ = ('_notifications', '_dispatcher', '__weakref__')
 
     __notifications__ = {
         Notification.PreFileOpen: 'addPreFileOpenNotify',
@@ -47,6 +54,11 @@ class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
         Notification.SelectionChanged: 'addSelectionChangedNotify',
         Notification.Undo: 'addUndoNotify',
         Notification.Redo: 'addRedoNotify',
+        Notification.NodeAdded: 'addNodeAddedNotify',
+        Notification.NodeRemoved: 'addNodeRemovedNotify',
+        Notification.NameChanged: 'addNameChangedNotify',
+        Notification.ReferenceLoaded: 'addReferenceLoadedNotify',
+        Notification.ReferenceUnloaded: 'addReferenceUnloadedNotify'
     }
 
     def __init__(self, *args, **kwargs):
@@ -63,6 +75,7 @@ class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
         # Declare private variables
         #
         self._notifications = {}
+        self._dispatcher = None
 
         for member in Notification:
 
@@ -212,6 +225,55 @@ class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
         pass
 
+    def dispatcher(self):
+        """
+        Returns the dispatcher used to coalesce notifications for this function set.
+
+        :rtype: NotifyDispatcher
+        """
+
+        if self._dispatcher is None:
+
+            self._dispatcher = NotifyDispatcher()
+
+        return self._dispatcher
+
+    def setDispatcher(self, dispatcher):
+        """
+        Updates the dispatcher used to coalesce notifications for this function set.
+        This must be called before any dispatched notifies are added!
+
+        :type dispatcher: NotifyDispatcher
+        :rtype: None
+        """
+
+        if not isinstance(dispatcher, NotifyDispatcher):
+
+            raise TypeError(f'setDispatcher() expects a NotifyDispatcher ({type(dispatcher).__name__} given)!')
+
+        self._dispatcher = dispatcher
+
+    def addDispatchedNotify(self, notification, func, priority=0, throttle=0.0):
+        """
+        Adds a debounced notify using the specified notify type.
+        Bursts of notifications are coalesced into a single delivery, see `NotifyDispatcher` for details.
+        Only one DCC callback is registered per notify type regardless of the number of handlers!
+
+        :type notification: Notification
+        :type func: Callable[[notifydispatcher.Delivery], None]
+        :type priority: int
+        :type throttle: float
+        :rtype: notifydispatcher.Handler
+        """
+
+        dispatcher = self.dispatcher()
+
+        if notification not in dispatcher.notifications():
+
+            self.addNotify(notification, partial(dispatcher.post, notification))
+
+        return dispatcher.addHandler(notification, func, priority=priority, throttle=throttle)
+
     def clear(self):
         """
         Removes all notifications.
@@ -222,4 +284,8 @@ class AFnNotify(with_metaclass(ABCMeta, afnbase.AFnBase)):
         for (notification, notifyIds) in self._notifications.items():
 
             notifyIds.clear()
+
+        if self._dispatcher is not None:
+
+            self._dispatcher.clear()
     # endregion
@@ -1,4 +1,5 @@
 import os
+import weakref
 
 from abc import ABCMeta, abstractmethod
 from . import afnobject
@@ -10,12 +11,396 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+class ReferenceGraph(object):
+    """
+    Base class used to cache the scene reference hierarchy along with UID, GUID, namespace and file path lookups.
+    The graph is built in a single pass over the scene and is rebuilt lazily after it has been invalidated.
+    Where supported, file open and reference load/unload notifies are used to invalidate the graph automatically!
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__weakref__',
+        '__cls__',
+        '__notifies__',
+        '__epoch__',
+        '__builtEpoch__',
+        '__references__',
+        '__parents__',
+        '__children__',
+        '__uids__',
+        '__guids__',
+        '__handleGuids__',
+        '__namespaces__',
+        '__filePaths__'
+    )
+
+    def __init__(self, cls):
+        """
+        Private method called after a new instance has been created.
+
+        :type cls: Callable
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ReferenceGraph, self).__init__()
+
+        # Declare private variables
+        #
+        self.__cls__ = cls
+        self.__notifies__ = None
+        self.__epoch__ = 0
+        self.__builtEpoch__ = -1
+        self.__references__ = {}
+        self.__parents__ = {}
+        self.__children__ = {}
+        self.__uids__ = {}
+        self.__guids__ = {}
+        self.__handleGuids__ = {}
+        self.__namespaces__ = {}
+        self.__filePaths__ = {}
+
+        # Register scene notifies
+        #
+        self.registerNotifies()
+
+    def __contains__(self, handle):
+        """
+        Private method that evaluates if the supplied handle has been cached.
+
+        :type handle: Union[int, str]
+        :rtype: bool
+        """
+
+        return handle in self.references()
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of cached references.
+
+        :rtype: int
+        """
+
+        return len(self.references())
+    # endregion
+
+    # region Methods
+    def registerNotifies(self):
+        """
+        Registers the notifies used to keep this graph consistent with the scene.
+        Any notifies that are not supported by the current DCC are skipped!
+
+        :rtype: None
+        """
+
+        # Check if notifies are supported
+        #
+        try:
+
+            from dcc import fnnotify
+            self.__notifies__ = fnnotify.FnNotify()
+
+        except (ImportError, AttributeError) as exception:
+
+            log.debug(exception)
+            return
+
+        # Register scene change notifies
+        # Use a weak reference so the notifies do not keep this graph alive!
+        #
+        notifies = self.__notifies__
+        reference = weakref.ref(self)
+
+        def sceneChanged(*args, **kwargs):
+
+            graph = reference()
+
+            if graph is not None:
+
+                graph.invalidate()
+
+        for notification in (notifies.Notification.PostFileOpen, notifies.Notification.ReferenceLoaded, notifies.Notification.ReferenceUnloaded):
+
+            try:
+
+                notifies.addNotify(notification, sceneChanged)
+
+            except TypeError as exception:
+
+                log.debug(exception)
+                continue
+
+    def unregisterNotifies(self):
+        """
+        Unregisters any notifies used to keep this graph consistent with the scene.
+
+        :rtype: None
+        """
+
+        if self.__notifies__ is not None:
+
+            self.__notifies__.clear()
+            self.__notifies__ = None
+
+    def epoch(self):
+        """
+        Returns the scene epoch for this graph.
+        The epoch is incremented whenever the graph is invalidated.
+
+        :rtype: int
+        """
+
+        return self.__epoch__
+
+    def invalidate(self):
+        """
+        Increments the scene epoch so the graph is rebuilt on the next lookup.
+
+        :rtype: None
+        """
+
+        self.__epoch__ += 1
+
+    def isAlive(self, reference):
+        """
+        Evaluates if the supplied cached reference still exists in the scene.
+
+        :type reference: Any
+        :rtype: bool
+        """
+
+        fnReference = self.__cls__()
+        return fnReference.trySetObject(reference) and fnReference.isValid()
+
+    def isDirty(self):
+        """
+        Evaluates if the graph is out of date with the scene epoch.
+
+        :rtype: bool
+        """
+
+        return self.__builtEpoch__ != self.__epoch__
+
+    def update(self):
+        """
+        Rebuilds the graph from the scene references.
+        All reference properties are collected using columnar queries to minimize the number of DCC calls.
+
+        :rtype: None
+        """
+
+        # Collect reference properties
+        #
+        fnReference = self.__cls__()
+        references = list(fnReference.iterSceneReferences(topLevelOnly=False))
+
+        columns = fnReference.queryQueue(references, 'handle', 'uid', 'parent', 'associatedNamespace', 'filePath')
+
+        parents = [parent for parent in columns['parent'] if parent is not None]
+        parentHandles = iter(fnReference.queryQueue(parents, 'handle')['handle'])
+
+        # Reset internal trackers
+        #
+        self.__references__.clear()
+        self.__parents__.clear()
+        self.__children__.clear()
+        self.__uids__.clear()
+        self.__guids__.clear()
+        self.__handleGuids__.clear()
+        self.__namespaces__.clear()
+        self.__filePaths__.clear()
+
+        # Iterate through references
+        #
+        uids = {}
+
+        for (reference, handle, uid, parent, namespace, filePath) in zip(references, columns['handle'], columns['uid'], columns['parent'], columns['associatedNamespace'], columns['filePath']):
+
+            # Check if reference is valid
+            #
+            parentHandle = next(parentHandles) if parent is not None else None
+
+            if handle is None:
+
+                continue
+
+            # Index hierarchy
+            #
+            self.__references__[handle] = reference
+            self.__parents__[handle] = parentHandle
+            self.__children__.setdefault(parentHandle, []).append(handle)
+            self.__uids__[(parentHandle, str(uid))] = handle
+
+            uids[handle] = str(uid)
+
+            # Index namespaces and file paths
+            #
+            if namespace:
+
+                self.__namespaces__.setdefault(namespace, []).append(handle)
+
+            if filePath:
+
+                self.__filePaths__.setdefault(os.path.normcase(os.path.normpath(filePath)), []).append(handle)
+
+        # Index global unique identifiers
+        # Parents are resolved first so that each GUID is only joined once!
+        #
+        for handle in self.__references__.keys():
+
+            trace = []
+            current = handle
+
+            while current is not None and current not in self.__handleGuids__:
+
+                trace.append(current)
+                current = self.__parents__.get(current, None)
+
+            prefix = self.__handleGuids__.get(current, None)
+
+            for item in reversed(trace):
+
+                prefix = uids[item] if prefix is None else f'{prefix}:{uids[item]}'
+
+                self.__handleGuids__[item] = prefix
+                self.__guids__[prefix] = item
+
+        self.__builtEpoch__ = self.__epoch__
+
+    def ensureUpdated(self):
+        """
+        Rebuilds the graph if it is out of date.
+
+        :rtype: None
+        """
+
+        if self.isDirty():
+
+            self.update()
+
+    def references(self):
+        """
+        Returns the handle-reference pairs from this graph.
+
+        :rtype: Dict[Union[int, str], Any]
+        """
+
+        self.ensureUpdated()
+        return self.__references__
+
+    def getReferenceByHandle(self, handle):
+        """
+        Returns a reference with the given handle.
+
+        :type handle: Union[int, str]
+        :rtype: Any
+        """
+
+        return self.references().get(handle, None)
+
+    def getReferenceByUid(self, uid, parentHandle=None):
+        """
+        Returns a reference with the given UID under the specified parent.
+
+        :type uid: Union[int, str]
+        :type parentHandle: Union[int, str, None]
+        :rtype: Any
+        """
+
+        self.ensureUpdated()
+        return self.__references__.get(self.__uids__.get((parentHandle, str(uid)), None), None)
+
+    def getReferenceByGuid(self, guid):
+        """
+        Returns a reference with the given GUID.
+
+        :type guid: str
+        :rtype: Any
+        """
+
+        # Check if cached reference is still alive
+        # Not every DCC notifies when a reference is removed, so dead references force a rebuild!
+        #
+        self.ensureUpdated()
+        reference = self.__references__.get(self.__guids__.get(guid, None), None)
+
+        if reference is None or self.isAlive(reference):
+
+            return reference
+
+        self.invalidate()
+        self.ensureUpdated()
+
+        reference = self.__references__.get(self.__guids__.get(guid, None), None)
+        return reference if reference is not None and self.isAlive(reference) else None
+
+    def getReferencesByNamespace(self, namespace):
+        """
+        Returns a list of references associated with the given namespace.
+
+        :type namespace: str
+        :rtype: List[Any]
+        """
+
+        self.ensureUpdated()
+        return [self.__references__[handle] for handle in self.__namespaces__.get(namespace, ())]
+
+    def getReferencesByFilePath(self, filePath):
+        """
+        Returns a list of references derived from the given file path.
+
+        :type filePath: str
+        :rtype: List[Any]
+        """
+
+        self.ensureUpdated()
+        return [self.__references__[handle] for handle in self.__filePaths__.get(os.path.normcase(os.path.normpath(filePath)), ())]
+
+    def guid(self, handle):
+        """
+        Returns the GUID for the given reference handle.
+
+        :type handle: Union[int, str]
+        :rtype: Union[str, None]
+        """
+
+        self.ensureUpdated()
+        return self.__handleGuids__.get(handle, None)
+
+    def parent(self, handle):
+        """
+        Returns the parent of the given reference handle.
+
+        :type handle: Union[int, str]
+        :rtype: Any
+        """
+
+        self.ensureUpdated()
+        return self.__references__.get(self.__parents__.get(handle, None), None)
+
+    def children(self, handle=None):
+        """
+        Returns the children of the given reference handle.
+        If no handle is supplied then the top-level references are returned instead.
+
+        :type handle: Union[int, str, None]
+        :rtype: List[Any]
+        """
+
+        self.ensureUpdated()
+        return [self.__references__[child] for child in self.__children__.get(handle, ())]
+    # endregion
+
+
 class AFnReference(with_metaclass(ABCMeta, afnobject.AFnObject)):
     """
     Overload of AFnObject that outlines scene reference interfaces.
     """
 
     __slots__ = ()
+    __referencegraph__ = None
 
     def isValid(self):
         """
@@ -49,17 +434,25 @@ class AFnReference(with_metaclass(ABCMeta, afnobject.AFnObject)):
     def guid(self):
         """
         Returns a global unique identifier to this reference.
+        If the reference graph is enabled then the cached GUID is returned instead of tracing the parents!
 
         :rtype: str
         """
 
+        referenceGraph = self.referenceGraph()
+        guid = referenceGraph.guid(self.handle()) if referenceGraph is not None else None
+
+        if guid is not None:
+
+            return guid
+
         fnReference = self.__class__()
         uids = []
 
         for reference in self.trace():
 
             fnReference.setObject(reference)
-            uids.append(fnReference.uid())
+            uids.append(str(fnReference.uid()))
 
         return ':'.join(uids)
 
@@ -231,16 +624,63 @@ class AFnReference(with_metaclass(ABCMeta, afnobject.AFnObject)):
 
         pass
 
+    @classmethod
+    def referenceGraph(cls):
+        """
+        Returns the scene reference graph.
+        If the graph has not been enabled then none is returned!
+
+        :rtype: Union[ReferenceGraph, None]
+        """
+
+        return AFnReference.__referencegraph__
+
+    @classmethod
+    def enableReferenceGraph(cls):
+        """
+        Enables the scene reference graph for all reference lookups.
+        The graph is built from the references of this class so it is best enabled from `FnReference`!
+
+        :rtype: ReferenceGraph
+        """
+
+        if AFnReference.__referencegraph__ is None:
+
+            AFnReference.__referencegraph__ = ReferenceGraph(cls)
+
+        return AFnReference.__referencegraph__
+
+    @classmethod
+    def disableReferenceGraph(cls):
+        """
+        Disables the scene reference graph.
+
+        :rtype: None
+        """
+
+        if AFnReference.__referencegraph__ is not None:
+
+            AFnReference.__referencegraph__.unregisterNotifies()
+            AFnReference.__referencegraph__ = None
+
     @classmethod
     def getReferenceByGuid(cls, guid):
         """
         Returns a reference with the given handle.
         If no reference is associated with this GUID then none is returned.
+        If the reference graph is enabled then it is used instead of querying the scene, falling back on the scene for any misses.
 
         :type guid: str
         :rtype: object
         """
 
+        referenceGraph = cls.referenceGraph()
+        reference = referenceGraph.getReferenceByGuid(guid) if referenceGraph is not None else None
+
+        if reference is not None:
+
+            return reference
+
         uids = guid.split(':')
         parentReference = None
 
@@ -492,35 +492,100 @@ class AFnScene(with_metaclass(ABCMeta, afnbase.AFnBase)):
             log.warning('Unable to make path variable: %s' % path)
             return path
 
-    def makeTexturesRelative(self):
+    def getTexturePaths(self):
         """
-        Converts all the texture paths to relative.
+        Returns a dictionary of texture file paths and the textures that use them.
+        All the file paths are collected in a single pass so that shared paths are only resolved once!
 
-        :rtype: None
+        :rtype: Dict[str, List[Any]]
         """
 
         fnTexture = fntexture.FnTexture()
-        fnTexture.setQueue(fnTexture.instances())
+        textures = fnTexture.instances()
+        filePaths = fnTexture.queryQueue(textures, 'filePath')['filePath']
 
-        while not fnTexture.isDone():
+        texturePaths = {}
 
-            fnTexture.makeRelative()
-            fnTexture.next()
+        for (texture, filePath) in zip(textures, filePaths):
 
-    def makeTexturesAbsolute(self):
+            if filePath is None:
+
+                continue
+
+            texturePaths.setdefault(filePath, []).append(texture)
+
+        return texturePaths
+
+    def setTexturePaths(self, remapping, texturePaths=None):
         """
-        Converts all the texture paths to absolute.
+        Updates the textures using the supplied file path remapping.
+        Only the textures whose file paths have changed are updated!
+
+        :type remapping: Dict[str, str]
+        :type texturePaths: Union[Dict[str, List[Any]], None]
+        :rtype: int
+        """
+
+        # Check if texture paths were supplied
+        #
+        if texturePaths is None:
+
+            texturePaths = self.getTexturePaths()
+
+        # Iterate through changed file paths
+        #
+        fnTexture = fntexture.FnTexture()
+        count = 0
+
+        for (filePath, textures) in texturePaths.items():
+
+            newFilePath = remapping.get(filePath, filePath)
+
+            if newFilePath == filePath:
+
+                continue
+
+            for texture in textures:
+
+                if fnTexture.trySetObject(texture):
+
+                    fnTexture.setFilePath(newFilePath)
+                    count += 1
+
+        return count
+
+    def remapTexturePaths(self, func):
+        """
+        Updates all the texture paths using the supplied function.
+        The function is only evaluated once per unique file path!
+
+        :type func: Callable[[str], str]
+        :rtype: int
+        """
+
+        texturePaths = self.getTexturePaths()
+        remapping = {filePath: func(filePath) for filePath in texturePaths.keys()}
+
+        return self.setTexturePaths(remapping, texturePaths=texturePaths)
+
+    def makeTexturesRelative(self):
+        """
+        Converts all the texture paths to relative.
 
         :rtype: None
         """
 
-        texture = fntexture.FnTexture()
-        texture.setQueue(texture.instances())
+        self.remapTexturePaths(self.makePathRelative)
+
+    def makeTexturesAbsolute(self):
+        """
+        Converts all the texture paths to absolute.
 
-        while not texture.isDone():
+        :rtype: None
+        """
 
-            texture.makeAbsolute()
-            texture.next()
+        paths = self.paths()
+        self.remapTexturePaths(lambda filePath: pathutils.makePathAbsolute(filePath, paths=paths))
 
     def makeTexturesVariable(self):
         """
@@ -529,13 +594,7 @@ class AFnScene(with_metaclass(ABCMeta, afnbase.AFnBase)):
         :rtype: None
         """
 
-        texture = fntexture.FnTexture()
-        texture.setQueue(texture.instances())
-
-        while not texture.isDone():
-
-            texture.makeVariable()
-            texture.next()
+        self.remapTexturePaths(lambda filePath: self.makePathVariable(filePath, '$P4ROOT'))
 
     @abstractmethod
     def suspendViewport(self):
@@ -721,6 +780,16 @@ class AFnScene(with_metaclass(ABCMeta, afnbase.AFnBase)):
 
         pass
 
+    @abstractmethod
+    def isDirty(self):
+        """
+        Evaluates if the scene has any unsaved changes.
+
+        :rtype: bool
+        """
+
+        pass
+
     @abstractmethod
     def markDirty(self):
         """
@@ -755,8 +824,9 @@ class AFnScene(with_metaclass(ABCMeta, afnbase.AFnBase)):
     def executePython(self, string):
         """
         Executes the supplied string using python.
+        Pre-compiled code objects are also accepted.
 
-        :type string: str
+        :type string: Union[str, types.CodeType]
         :rtype: bool
         """
 
@@ -6,6 +6,7 @@ from ..naming import namingutils
 from ..python import stringutils
 from ..math import floatmath, skinmath
 from ..dataclasses.vector import Vector
+from ..generators.flatten import flatten
 from ..vendor.six import with_metaclass, integer_types, string_types
 from ..vendor.six.moves import collections_abc
 
@@ -233,13 +234,189 @@ class Influences(collections_abc.MutableMapping):
     # endregion
 
 
+class InfluenceIndex(object):
+    """
+    Base class used to index which vertices are weighted to each influence.
+    The index is built in a single pass over the vertex weights and then updated incrementally as weights are applied.
+    A weight signature is stored alongside the index so any changes made outside of the index can be detected!
+    """
+
+    # region Dunderscores
+    __slots__ = ('__object__', '__signature__', '__influences__', '__vertices__')
+
+    def __init__(self, obj, vertexWeights, signature=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type obj: Any
+        :type vertexWeights: Iterable[Tuple[int, Dict[int, float]]]
+        :type signature: Hashable
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(InfluenceIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self.__object__ = obj
+        self.__signature__ = signature
+        self.__influences__ = {}
+        self.__vertices__ = {}
+
+        # Update index
+        #
+        self.update(vertexWeights)
+
+    def __contains__(self, influenceId):
+        """
+        Private method that evaluates if the supplied influence ID has any weighted vertices.
+
+        :type influenceId: int
+        :rtype: bool
+        """
+
+        return influenceId in self.__influences__
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of weighted influences.
+
+        :rtype: int
+        """
+
+        return len(self.__influences__)
+    # endregion
+
+    # region Methods
+    def object(self):
+        """
+        Returns the skin this index was built from.
+
+        :rtype: Any
+        """
+
+        return self.__object__
+
+    def signature(self):
+        """
+        Returns the weight signature this index is up-to-date with.
+
+        :rtype: Hashable
+        """
+
+        return self.__signature__
+
+    def setSignature(self, signature):
+        """
+        Updates the weight signature this index is up-to-date with.
+
+        :type signature: Hashable
+        :rtype: None
+        """
+
+        self.__signature__ = signature
+
+    def update(self, vertexWeights):
+        """
+        Updates the index from the supplied vertex weights.
+        Any influences that are no longer weighted to a vertex are removed from the index.
+
+        :type vertexWeights: Union[Dict[int, Dict[int, float]], Iterable[Tuple[int, Dict[int, float]]]]
+        :rtype: None
+        """
+
+        items = vertexWeights.items() if isinstance(vertexWeights, dict) else vertexWeights
+
+        for (vertexIndex, weights) in items:
+
+            # Evaluate which influences have changed
+            #
+            previous = self.__vertices__.get(vertexIndex, frozenset())
+            current = frozenset(weights.keys())
+
+            if previous == current:
+
+                continue
+
+            # Remove vertex from stale influences
+            #
+            for influenceId in previous.difference(current):
+
+                vertexIndices = self.__influences__[influenceId]
+                vertexIndices.discard(vertexIndex)
+
+                if len(vertexIndices) == 0:
+
+                    del self.__influences__[influenceId]
+
+            # Add vertex to new influences
+            #
+            for influenceId in current.difference(previous):
+
+                self.__influences__.setdefault(influenceId, set()).add(vertexIndex)
+
+            self.__vertices__[vertexIndex] = current
+
+    def vertexIndices(self, *influenceIds):
+        """
+        Returns the sorted vertex indices weighted to any of the supplied influence IDs.
+
+        :type influenceIds: Union[int, List[int]]
+        :rtype: List[int]
+        """
+
+        vertexIndices = set()
+
+        for influenceId in influenceIds:
+
+            vertexIndices.update(self.__influences__.get(influenceId, ()))
+
+        return sorted(vertexIndices)
+
+    def influenceIds(self, *vertexIndices):
+        """
+        Returns the influence IDs weighted to the supplied vertex indices.
+        If no vertex indices are supplied then all weighted influence IDs are returned instead!
+
+        :type vertexIndices: Union[int, List[int]]
+        :rtype: Set[int]
+        """
+
+        if len(vertexIndices) == 0:
+
+            return set(self.__influences__.keys())
+
+        influenceIds = set()
+
+        for vertexIndex in vertexIndices:
+
+            influenceIds.update(self.__vertices__.get(vertexIndex, ()))
+
+        return influenceIds
+    # endregion
+
+
+def weightsChanged(*args, **kwargs):
+    """
+    Notify callback that increments the weight revision shared by all skins.
+
+    :rtype: None
+    """
+
+    AFnSkin.markWeightsChanged()
+
+
 class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
     """
     Overload of AFnBase that outlines function set behaviour for DCC skinning.
     """
 
     # region Dunderscores
-    __slots__ = ('_influences', '_clipboard')
+    __slots__ = ('_influences', '_clipboard', '_influenceIndex')
+    __revision__ = 0
+    __notifies__ = None
 
     def __init__(self, *args, **kwargs):
         """
@@ -252,6 +429,7 @@ class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
         #
         self._influences = Influences()
         self._clipboard = {}
+        self._influenceIndex = None
 
         # Call parent method
         #
@@ -544,6 +722,126 @@ class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
 
         pass
 
+    def influenceIndex(self):
+        """
+        Returns the influence index for this skin.
+        The index is built on first use and rebuilt whenever a different skin is attached or the weight signature changes.
+        This keeps the index up-to-date with any weight changes made outside of this function set, such as undoing or painting!
+
+        :rtype: InfluenceIndex
+        """
+
+        obj = self.object()
+        signature = self.weightSignature()
+
+        if self._influenceIndex is None or self._influenceIndex.object() != obj or self._influenceIndex.signature() != signature:
+
+            self._influenceIndex = InfluenceIndex(obj, self.iterVertexWeights(), signature=signature)
+
+        return self._influenceIndex
+
+    @classmethod
+    def registerNotifies(cls):
+        """
+        Registers the undo and redo notifies used to increment the weight revision.
+        Any notifies that are not supported by the current DCC are skipped!
+
+        :rtype: None
+        """
+
+        # Check if notifies are supported
+        #
+        try:
+
+            from dcc import fnnotify
+            AFnSkin.__notifies__ = fnnotify.FnNotify()
+
+        except (ImportError, AttributeError) as exception:
+
+            log.debug(exception)
+            AFnSkin.__notifies__ = False
+
+            return
+
+        # Register undo notifies
+        #
+        notifies = AFnSkin.__notifies__
+
+        for notification in (notifies.Notification.Undo, notifies.Notification.Redo):
+
+            try:
+
+                notifies.addNotify(notification, weightsChanged)
+
+            except TypeError as exception:
+
+                log.debug(exception)
+                continue
+
+    @classmethod
+    def weightRevision(cls):
+        """
+        Returns the weight revision shared by all skins.
+        The revision is incremented whenever weights are applied, influence indices are invalidated or the scene is undone!
+
+        :rtype: int
+        """
+
+        if AFnSkin.__notifies__ is None:
+
+            cls.registerNotifies()
+
+        return AFnSkin.__revision__
+
+    @classmethod
+    def markWeightsChanged(cls):
+        """
+        Increments the weight revision shared by all skins.
+
+        :rtype: None
+        """
+
+        AFnSkin.__revision__ += 1
+
+    def weightSignature(self):
+        """
+        Returns a cheap signature that changes whenever the weights on this skin change.
+        By default, only the shared weight revision is used so overloads should include any DCC-side change trackers.
+        The weights should never be read from here since this is evaluated by every index lookup!
+
+        :rtype: Hashable
+        """
+
+        return self.weightRevision()
+
+    def updateInfluenceIndex(self, vertexWeights):
+        """
+        Updates the influence index, if any, with the supplied vertex weights.
+        The applied vertices are read back from the skin since the DCC may omit any zero weights.
+        Overloads should call this method after applying vertex weights!
+
+        :type vertexWeights: Dict[int, Dict[int, float]]
+        :rtype: None
+        """
+
+        self.markWeightsChanged()
+
+        if self._influenceIndex is not None and self._influenceIndex.object() == self.object() and len(vertexWeights) > 0:
+
+            self._influenceIndex.update(self.iterVertexWeights(*vertexWeights.keys()))
+            self._influenceIndex.setSignature(self.weightSignature())
+
+    def invalidateInfluenceIndex(self):
+        """
+        Invalidates the influence index.
+        The weight revision is also incremented so the indices from any other function sets are rebuilt on next use.
+
+        :rtype: None
+        """
+
+        self._influenceIndex = None
+        self.markWeightsChanged()
+
     def getUsedInfluenceIds(self, *indices):
         """
         Returns a list of active influence IDs from the specified vertices.
@@ -553,15 +851,7 @@ class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
         :rtype: List[int]
         """
 
-        # Iterate through weights
-        #
-        influenceIds = set()
-
-        for (vertexIndex, vertexWeights) in self.iterVertexWeights(*indices):
-
-            influenceIds = influenceIds.union(set(vertexWeights.keys()))
-
-        return list(influenceIds)
+        return list(self.influenceIndex().influenceIds(*flatten(indices)))
 
     def getUnusedInfluenceIds(self, *indices):
         """
@@ -668,28 +958,11 @@ class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
     def getVerticesByInfluenceId(self, *influenceIds):
         """
         Returns a list of vertices associated with the supplied influence ids.
-        This can be an expensive operation so use sparingly.
 
         :rtype: List[int]
         """
 
-        # Iterate through vertices
-        #
-        vertexIndices = []
-
-        for (vertexIndex, weights) in self.iterVertexWeights():
-
-            # Check if weights contain influence ID
-            #
-            if any([influenceId in weights for influenceId in influenceIds]):
-
-                vertexIndices.append(vertexIndex)
-
-            else:
-
-                continue
-
-        return vertexIndices
+        return self.influenceIndex().vertexIndices(*flatten(influenceIds))
 
     def findRoot(self):
         """
@@ -880,21 +1153,23 @@ class AFnSkin(with_metaclass(ABCMeta, afnnode.AFnNode)):
 
             log.warning('Unable to slab paste selection!')
 
-    def mirrorVertexWeights(self, vertexIndices, pull=False, axis=0, tolerance=1e-3):
+    def mirrorVertexWeights(self, vertexIndices, pull=False, axis=0, tolerance=1e-3, method='position'):
         """
         Returns a series of mirrored weights for the supplied vertex weights.
+        See `AFnMesh.mirrorVertices` for the available symmetry methods.
 
         :type vertexIndices: List[int]
         :type pull: bool
         :type axis: int
         :type tolerance: float
+        :type method: str
         :rtype: Dict[int, Dict[int, float]]
         """
 
         # Mirror the supplied vertex indices
         #
         mesh = fnmesh.FnMesh(self.intermediateObject())
-        mirrorIndices = mesh.mirrorVertices(vertexIndices, axis=axis, tolerance=tolerance)
+        mirrorIndices = mesh.mirrorVertices(vertexIndices, axis=axis, tolerance=tolerance, method=method)
 
         # Mirror the found vertex pairs
         #
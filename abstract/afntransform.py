@@ -1,6 +1,8 @@
 from abc import ABCMeta, abstractmethod
 from . import afnnode
 from ..dataclasses import vector, eulerangles, transformationmatrix
+from ..math import kinematicsmath
+from ..python import importutils
 from ..vendor.six import with_metaclass
 
 import logging
@@ -9,6 +11,9 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
 class AFnTransform(with_metaclass(ABCMeta, afnnode.AFnNode)):
     """
     Overload of AFnNode used to outline a transform node interface.
@@ -95,6 +100,16 @@ class AFnTransform(with_metaclass(ABCMeta, afnnode.AFnNode)):
 
         pass
 
+    def preEulerRotation(self):
+        """
+        Returns the rotation applied after the euler rotation values, such as Maya's joint orient.
+        By default, this returns a zero rotation!
+
+        :rtype: eulerangles.EulerAngles
+        """
+
+        return eulerangles.EulerAngles()
+
     @abstractmethod
     def setEulerRotation(self, eulerRotation, **kwargs):
         """
@@ -376,3 +391,88 @@ class AFnTransform(with_metaclass(ABCMeta, afnnode.AFnNode)):
             matrix = worldMatrix * parentInverseMatrix
 
             fnTransform.setMatrix(matrix)
+
+    def captureHierarchy(self, times=None):
+        """
+        Returns a hierarchy snapshot of this node and all of its descendants.
+        The local matrices are captured for each of the supplied times, or the current time if none are supplied.
+        Each frame is captured with a single queue query so that the snapshot can be evaluated without touching the DCC!
+
+        :type times: Union[List[float], None]
+        :rtype: kinematicsmath.HierarchySnapshot
+        """
+
+        # Collect hierarchy in breadth-first order
+        # This guarantees that parents are always collected before their children!
+        #
+        nodes = [self.object()]
+        parents = [-1]
+
+        fnTransform = self.__class__()
+        index = 0
+
+        while index < len(nodes):
+
+            fnTransform.setObject(nodes[index])
+            children = fnTransform.children()
+
+            nodes.extend(children)
+            parents.extend([index] * len(children))
+
+            index += 1
+
+        # Capture static properties
+        #
+        properties = self.queryQueue(nodes, 'handle', 'name', 'rotationOrder', 'preEulerRotation')
+        preRotations = [tuple(eulerRotation)[:3] for eulerRotation in properties['preEulerRotation']]
+
+        # Capture local matrices per frame
+        # The current time is restored afterwards!
+        #
+        currentTime = self.scene.getTime()
+        times = [currentTime] if times is None else list(times)
+
+        matrices = numpy.empty((len(times), len(nodes), 4, 4), dtype=float)
+        rootMatrices = numpy.broadcast_to(numpy.eye(4), matrices.shape).copy()
+
+        try:
+
+            for (frame, time) in enumerate(times):
+
+                self.scene.setTime(time)
+
+                results = self.queryQueue(nodes, 'matrix')
+                matrices[frame] = [matrix.toList() for matrix in results['matrix']]
+                rootMatrices[frame, 0] = self.parentMatrix().toList()
+
+        finally:
+
+            self.scene.setTime(currentTime)
+
+        return kinematicsmath.HierarchySnapshot(
+            handles=properties['handle'],
+            names=properties['name'],
+            parents=numpy.array(parents, dtype=int),
+            orders=properties['rotationOrder'],
+            preRotations=numpy.array(preRotations, dtype=float).reshape(-1, 3),
+            matrices=matrices,
+            rootMatrices=rootMatrices,
+            times=times
+        )
+
+    def assumeHierarchy(self, snapshot, frame=0, **kwargs):
+        """
+        Reassigns the local matrices from the supplied hierarchy snapshot.
+        Since the snapshot stores local matrices, no parent matrices need to be queried from the DCC!
+
+        :type snapshot: kinematicsmath.HierarchySnapshot
+        :type frame: int
+        :rtype: None
+        """
+
+        fnTransform = self.__class__()
+
+        for (handle, matrix) in zip(snapshot.handles, snapshot.matrices[frame]):
+
+            fnTransform.setObject(handle)
+            fnTransform.setMatrix(transformationmatrix.TransformationMatrix(matrix.tolist()), **kwargs)
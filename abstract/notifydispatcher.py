@@ -0,0 +1,450 @@
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Tuple
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def defaultScheduler(delay, callback):
+    """
+    Schedules the supplied callback on the Qt event loop.
+    If there is no running Qt application then the callback is invoked immediately, and any throttled handlers are retried on the next notification!
+
+    :type delay: float
+    :type callback: Callable
+    :rtype: None
+    """
+
+    try:
+
+        from ..vendor.Qt import QtCore
+
+    except ImportError as exception:
+
+        log.debug(exception)
+        return callback()
+
+    if QtCore.QCoreApplication.instance() is not None:
+
+        QtCore.QTimer.singleShot(int(round(delay * 1000.0)), callback)
+
+    else:
+
+        callback()
+
+
+def defaultSelection():
+    """
+    Returns the handles of the active selection.
+
+    :rtype: List[int]
+    """
+
+    from dcc import fnscene, fnnode
+
+    selection = fnscene.FnScene().getActiveSelection()
+    handles = fnnode.FnNode().queryQueue(selection, 'handle')['handle']
+
+    return [handle for handle in handles if handle is not None]
+
+
+@dataclass
+class Delivery:
+    """
+    Data class for interfacing with coalesced notifications.
+    """
+
+    notification: Any = None
+    count: int = 0
+    args: Tuple[Any, ...] = field(default_factory=tuple)
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class Handler:
+    """
+    Data class for interfacing with dispatched notification handlers.
+    """
+
+    func: Callable = None
+    priority: int = 0
+    throttle: float = 0.0
+    pending: int = 0
+    args: Tuple[Any, ...] = field(default_factory=tuple)
+    lastDelivered: float = float('-inf')
+    selection: List[Any] = None
+
+
+class NotifyDispatcher(object):
+    """
+    Base class used to debounce and coalesce bursts of notifications before delivering them to handlers.
+    Notifications are posted as they fire and delivered once per flush, either on the next event loop tick or after the debounce interval.
+    Handlers are delivered in descending priority and can be throttled to a minimum interval between deliveries.
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__weakref__',
+        '__handlers__',
+        '__interval__',
+        '__scheduler__',
+        '__clock__',
+        '__selection__',
+        '__scheduled__',
+        '__flushing__',
+        '__fired__',
+        '__delivered__'
+    )
+
+    def __init__(self, interval=0.0, scheduler=None, clock=None, selection=None):
+        """
+        Private method called after a new instance has been created.
+        The scheduler, clock and selection callables can be overridden to drive the dispatcher from a fake event source.
+
+        :type interval: float
+        :type scheduler: Union[Callable[[float, Callable], None], None]
+        :type clock: Union[Callable[[], float], None]
+        :type selection: Union[Callable[[], List[Any]], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NotifyDispatcher, self).__init__()
+
+        # Declare private variables
+        #
+        self.__handlers__ = {}
+        self.__interval__ = interval
+        self.__scheduler__ = scheduler if callable(scheduler) else defaultScheduler
+        self.__clock__ = clock if callable(clock) else time.monotonic
+        self.__selection__ = selection if callable(selection) else defaultSelection
+        self.__scheduled__ = False
+        self.__flushing__ = False
+        self.__fired__ = {}
+        self.__delivered__ = {}
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of registered handlers.
+
+        :rtype: int
+        """
+
+        return sum(map(len, self.__handlers__.values()))
+    # endregion
+
+    # region Methods
+    def interval(self):
+        """
+        Returns the debounce interval in seconds.
+        An interval of zero delivers on the next event loop tick.
+
+        :rtype: float
+        """
+
+        return self.__interval__
+
+    def setInterval(self, interval):
+        """
+        Updates the debounce interval in seconds.
+
+        :type interval: float
+        :rtype: None
+        """
+
+        self.__interval__ = float(interval)
+
+    def addHandler(self, notification, func, priority=0, throttle=0.0):
+        """
+        Adds a handler for the specified notification.
+        Handlers with a higher priority are delivered first.
+
+        :type notification: Any
+        :type func: Callable[[Delivery], None]
+        :type priority: int
+        :type throttle: float
+        :rtype: Handler
+        """
+
+        # Check if function is callable
+        #
+        if not callable(func):
+
+            raise TypeError(f'addHandler() expects a callable ({type(func).__name__} given)!')
+
+        # Append handler and sort by priority
+        #
+        handler = Handler(func=func, priority=priority, throttle=throttle)
+
+        handlers = self.__handlers__.setdefault(notification, [])
+        handlers.append(handler)
+        handlers.sort(key=lambda item: item.priority, reverse=True)
+
+        return handler
+
+    def removeHandler(self, notification, func):
+        """
+        Removes the handlers using the supplied function from the specified notification.
+
+        :type notification: Any
+        :type func: Callable
+        :rtype: None
+        """
+
+        handlers = self.__handlers__.get(notification, [])
+        self.__handlers__[notification] = [handler for handler in handlers if handler.func != func]
+
+    def notifications(self):
+        """
+        Returns the notifications that handlers have been added for.
+        Notifications remain listed after their handlers are removed until the dispatcher is cleared!
+
+        :rtype: List[Any]
+        """
+
+        return list(self.__handlers__.keys())
+
+    def hasHandlers(self, notification):
+        """
+        Evaluates if the specified notification has any handlers.
+
+        :type notification: Any
+        :rtype: bool
+        """
+
+        return len(self.__handlers__.get(notification, ())) > 0
+
+    def post(self, notification, *args):
+        """
+        Posts a fired notification to be coalesced into the next delivery.
+        This method should be used as the DCC callback!
+
+        :type notification: Any
+        :rtype: None
+        """
+
+        # Update fired counter
+        #
+        self.__fired__[notification] = self.__fired__.get(notification, 0) + 1
+
+        # Mark handlers as pending
+        # Only the arguments from the most recent notification are kept!
+        #
+        handlers = self.__handlers__.get(notification, ())
+
+        for handler in handlers:
+
+            handler.pending += 1
+            handler.args = args
+
+        if len(handlers) > 0:
+
+            self.schedule(self.__interval__)
+
+    def schedule(self, delay):
+        """
+        Schedules a flush after the specified delay.
+        Any redundant requests are ignored while a flush is already scheduled!
+
+        :type delay: float
+        :rtype: None
+        """
+
+        if self.__scheduled__:
+
+            return
+
+        self.__scheduled__ = True
+        self.__scheduler__(delay, self.flush)
+
+    def flush(self):
+        """
+        Delivers all pending notifications to their handlers.
+        Any throttled handlers are rescheduled for when their throttle expires.
+
+        :rtype: None
+        """
+
+        # Check if a flush is already in progress
+        # Synchronous schedulers can re-enter this method when rescheduling throttled handlers!
+        #
+        self.__scheduled__ = False
+
+        if self.__flushing__:
+
+            return
+
+        self.__flushing__ = True
+
+        try:
+
+            # Check if any handlers were throttled
+            #
+            delay = self.deliver(self.__clock__())
+
+            if delay is not None:
+
+                self.schedule(delay)
+
+        finally:
+
+            self.__flushing__ = False
+
+    def deliver(self, now):
+        """
+        Delivers all pending notifications whose handlers are not throttled.
+        Any exceptions raised by handlers are logged so the remaining handlers are still delivered.
+        The shortest remaining throttle is returned, if any handlers were skipped.
+
+        :type now: float
+        :rtype: Union[float, None]
+        """
+
+        delay = None
+
+        for (notification, handlers) in list(self.__handlers__.items()):
+
+            for handler in list(handlers):
+
+                # Check if handler is pending
+                #
+                if handler.pending == 0:
+
+                    continue
+
+                # Check if handler is throttled
+                #
+                remaining = (handler.lastDelivered + handler.throttle) - now
+
+                if remaining > 0.0:
+
+                    delay = remaining if delay is None else min(delay, remaining)
+                    continue
+
+                # Deliver coalesced notification
+                #
+                delivery = Delivery(notification=notification, count=handler.pending, args=handler.args)
+
+                if self.isSelectionNotification(notification):
+
+                    delivery.added, delivery.removed = self.selectionDelta(handler)
+
+                handler.pending = 0
+                handler.args = ()
+                handler.lastDelivered = now
+
+                self.__delivered__[notification] = self.__delivered__.get(notification, 0) + 1
+
+                # Guard against faulty handlers
+                # One failing handler should never starve any lower priority handlers!
+                #
+                try:
+
+                    handler.func(delivery)
+
+                except Exception as exception:
+
+                    log.error(f'Unable to deliver {getattr(notification, "name", notification)} notification to: {handler.func} ({exception})', exc_info=True)
+
+        return delay
+
+    def isSelectionNotification(self, notification):
+        """
+        Evaluates if the supplied notification represents a selection change.
+
+        :type notification: Any
+        :rtype: bool
+        """
+
+        return getattr(notification, 'name', notification) == 'SelectionChanged'
+
+    def selectionDelta(self, handler):
+        """
+        Returns the items added to, and removed from, the selection since the handler was last delivered.
+
+        :type handler: Handler
+        :rtype: Tuple[List[Any], List[Any]]
+        """
+
+        # Get current selection
+        #
+        try:
+
+            current = list(self.__selection__())
+
+        except (ImportError, RuntimeError, TypeError) as exception:
+
+            log.debug(exception)
+            return [], []
+
+        # Compare against previous selection
+        #
+        previous = handler.selection if handler.selection is not None else []
+        handler.selection = current
+
+        previousSet, currentSet = set(previous), set(current)
+
+        added = [item for item in current if item not in previousSet]
+        removed = [item for item in previous if item not in currentSet]
+
+        return added, removed
+
+    def fired(self, notification=None):
+        """
+        Returns the number of notifications that have fired.
+        If no notification is supplied then the total is returned instead.
+
+        :type notification: Any
+        :rtype: int
+        """
+
+        if notification is None:
+
+            return sum(self.__fired__.values())
+
+        else:
+
+            return self.__fired__.get(notification, 0)
+
+    def delivered(self, notification=None):
+        """
+        Returns the number of deliveries made to handlers.
+        If no notification is supplied then the total is returned instead.
+
+        :type notification: Any
+        :rtype: int
+        """
+
+        if notification is None:
+
+            return sum(self.__delivered__.values())
+
+        else:
+
+            return self.__delivered__.get(notification, 0)
+
+    def resetCounters(self):
+        """
+        Resets the fired and delivered counters.
+
+        :rtype: None
+        """
+
+        self.__fired__.clear()
+        self.__delivered__.clear()
+
+    def clear(self):
+        """
+        Removes all handlers and pending notifications.
+
+        :rtype: None
+        """
+
+        self.__handlers__.clear()
+    # endregion
@@ -0,0 +1,1059 @@
+from enum import IntEnum
+from collections.abc import Sequence
+from ..python import importutils
+from ..dataclasses.keyframe import Keyframe
+from ..dataclasses.vector import Vector
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+class TangentType(IntEnum):
+    """
+    Enum class of all the available tangent types.
+    These values mirror the tangent types used by Maya's `MFnAnimCurve` class.
+    """
+
+    Global = 0
+    Fixed = 1
+    Linear = 2
+    Flat = 3
+    Smooth = 4
+    Step = 5
+    Slow = 6
+    Fast = 7
+    Clamped = 8
+    Plateau = 9
+    StepNext = 10
+    Auto = 11
+
+
+class AnimCurveArray(object):
+    """
+    Base class used to interface with a batch of animation curves using struct-of-arrays storage.
+    The keys from every curve are stored inside flattened arrays, with an offset array delimiting each curve.
+    Tangents use the same convention as `Keyframe`: a vector, in time and value units, that spans 3x the bezier handle.
+    Unweighted segments are evaluated as hermite splines while weighted segments are evaluated as 2D bezier splines.
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '_times',
+        '_values',
+        '_inTangents',
+        '_outTangents',
+        '_inTangentTypes',
+        '_outTangentTypes',
+        '_weighted',
+        '_locked',
+        '_offsets',
+        '_stepped',
+        '_steppedNext'
+    )
+
+    __step_types__ = (TangentType.Step, 'step', 'stepped')
+    __step_next_types__ = (TangentType.StepNext, 'stepnext', 'step_next')
+    __chunk_size__ = 1 << 20
+    __iterations__ = 8
+    __tolerance__ = 1e-9
+
+    def __init__(self, times=(), values=(), inTangents=None, outTangents=None, inTangentTypes=None, outTangentTypes=None, weighted=None, locked=None, offsets=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type times: Sequence[float]
+        :type values: Sequence[float]
+        :type inTangents: Union[Sequence[Tuple[float, float, float]], None]
+        :type outTangents: Union[Sequence[Tuple[float, float, float]], None]
+        :type inTangentTypes: Union[Sequence[Union[int, str]], None]
+        :type outTangentTypes: Union[Sequence[Union[int, str]], None]
+        :type weighted: Union[Sequence[bool], None]
+        :type locked: Union[Sequence[bool], None]
+        :type offsets: Union[Sequence[int], None]
+        :rtype: None
+        """
+
+        # Check if numpy is available
+        #
+        if numpy is None:
+
+            raise ModuleNotFoundError('AnimCurveArray() requires numpy!')
+
+        # Call parent method
+        #
+        super(AnimCurveArray, self).__init__()
+
+        # Declare private variables
+        #
+        self._times = numpy.array(times, dtype=float).reshape(-1)
+        self._values = numpy.array(values, dtype=float).reshape(-1)
+
+        numKeys = self._times.size
+
+        if self._values.size != numKeys:
+
+            raise TypeError(f'__init__() expects {numKeys} values ({self._values.size} given)!')
+
+        self._inTangents = self.__tangents__(inTangents, numKeys)
+        self._outTangents = self.__tangents__(outTangents, numKeys)
+        self._inTangentTypes = self.__types__(inTangentTypes, numKeys)
+        self._outTangentTypes = self.__types__(outTangentTypes, numKeys)
+        self._weighted = numpy.zeros(numKeys, dtype=bool) if weighted is None else numpy.array(weighted, dtype=bool).reshape(-1)
+        self._locked = numpy.ones(numKeys, dtype=bool) if locked is None else numpy.array(locked, dtype=bool).reshape(-1)
+        self._offsets = numpy.array([0, numKeys] if offsets is None else offsets, dtype=numpy.int64).reshape(-1)
+        self._stepped = None
+        self._steppedNext = None
+
+        if self._offsets[0] != 0 or self._offsets[-1] != numKeys or numpy.any(numpy.diff(self._offsets) < 0):
+
+            raise TypeError('__init__() expects ascending offsets that span all keys!')
+
+        # Ensure keys are sorted by time within each curve
+        #
+        curveIds = self.curveIds()
+        order = numpy.lexsort((self._times, curveIds))
+
+        if numpy.any(order != numpy.arange(numKeys)):
+
+            self.__reorder__(order)
+
+    @staticmethod
+    def __tangents__(tangents, numKeys):
+        """
+        Private method that returns a tangent array from the supplied items.
+        Tangents default to flat vectors with a unit time component.
+
+        :type tangents: Union[Sequence[Sequence[float]], None]
+        :type numKeys: int
+        :rtype: numpy.ndarray
+        """
+
+        array = numpy.zeros((numKeys, 3), dtype=float)
+
+        if numKeys == 0:
+
+            return array
+
+        elif tangents is None:
+
+            array[:, 0] = 1.0
+
+        else:
+
+            tangents = numpy.array(tangents, dtype=float).reshape(numKeys, -1)
+            size = min(tangents.shape[1], 3)
+            array[:, :size] = tangents[:, :size]
+
+        return array
+
+    @staticmethod
+    def __types__(types, numKeys):
+        """
+        Private method that returns a tangent type array from the supplied items.
+        Object arrays are used since tangent types can either be integers or strings!
+
+        :type types: Union[Sequence[Union[int, str]], None]
+        :type numKeys: int
+        :rtype: numpy.ndarray
+        """
+
+        array = numpy.empty(numKeys, dtype=object)
+
+        if types is None:
+
+            array.fill(TangentType.Global)
+
+        else:
+
+            array[:] = list(types)
+
+        return array
+
+    def __reorder__(self, order):
+        """
+        Private method that reorders the keys using the supplied indices.
+
+        :type order: numpy.ndarray
+        :rtype: None
+        """
+
+        self._times = self._times[order]
+        self._values = self._values[order]
+        self._inTangents = self._inTangents[order]
+        self._outTangents = self._outTangents[order]
+        self._inTangentTypes = self._inTangentTypes[order]
+        self._outTangentTypes = self._outTangentTypes[order]
+        self._weighted = self._weighted[order]
+        self._locked = self._locked[order]
+        self._stepped = None
+        self._steppedNext = None
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of curves in this array.
+
+        :rtype: int
+        """
+
+        return self._offsets.size - 1
+
+    def __getitem__(self, index):
+        """
+        Private method that returns a subset of curves from this array.
+
+        :type index: Union[int, slice, Sequence[int]]
+        :rtype: AnimCurveArray
+        """
+
+        # Evaluate index type
+        #
+        numCurves = len(self)
+
+        if isinstance(index, (int, numpy.integer)):
+
+            index = int(index) + numCurves if index < 0 else int(index)
+
+            if not (0 <= index < numCurves):
+
+                raise IndexError('__getitem__() index is out of range!')
+
+            curveIndices = [index]
+
+        elif isinstance(index, slice):
+
+            curveIndices = range(*index.indices(numCurves))
+
+        elif isinstance(index, (Sequence, numpy.ndarray)):
+
+            curveIndices = [int(i) for i in index]
+
+        else:
+
+            raise TypeError(f'__getitem__() expects an int or slice ({type(index).__name__} given)!')
+
+        # Collect keys from curves
+        #
+        curveIndices = numpy.array(curveIndices, dtype=numpy.int64)
+        starts, ends = self._offsets[curveIndices], self._offsets[curveIndices + 1]
+        counts = ends - starts
+
+        keyIndices = numpy.concatenate([numpy.arange(start, end) for (start, end) in zip(starts, ends)]) if counts.size > 0 else numpy.array([], dtype=numpy.int64)
+        offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+
+        return self.take(keyIndices.astype(numpy.int64), offsets)
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the curves from this array.
+
+        :rtype: Iterator[AnimCurveArray]
+        """
+
+        for i in range(len(self)):
+
+            yield self[i]
+
+    def __copy__(self):
+        """
+        Private method that returns a copy of this array.
+
+        :rtype: AnimCurveArray
+        """
+
+        return self.copy()
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this instance.
+
+        :rtype: str
+        """
+
+        return f'<{self.__class__.__name__}: {len(self)} curve(s), {self.numKeys()} key(s) at {hex(id(self))}>'
+    # endregion
+
+    # region Properties
+    @property
+    def times(self):
+        """
+        Getter method that returns the key times.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._times
+
+    @property
+    def values(self):
+        """
+        Getter method that returns the key values.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._values
+
+    @property
+    def inTangents(self):
+        """
+        Getter method that returns the in-tangents.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._inTangents
+
+    @property
+    def outTangents(self):
+        """
+        Getter method that returns the out-tangents.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._outTangents
+
+    @property
+    def inTangentTypes(self):
+        """
+        Getter method that returns the in-tangent types.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._inTangentTypes
+
+    @property
+    def outTangentTypes(self):
+        """
+        Getter method that returns the out-tangent types.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._outTangentTypes
+
+    @property
+    def weighted(self):
+        """
+        Getter method that returns the weighted flags.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._weighted
+
+    @property
+    def locked(self):
+        """
+        Getter method that returns the locked flags.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._locked
+
+    @property
+    def offsets(self):
+        """
+        Getter method that returns the offsets that delimit each curve.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._offsets
+    # endregion
+
+    # region Methods
+    @classmethod
+    def fromKeyframes(cls, keyframes):
+        """
+        Returns an array containing a single curve from the supplied keyframes.
+
+        :type keyframes: List[Keyframe]
+        :rtype: AnimCurveArray
+        """
+
+        return cls.fromCurves([keyframes])
+
+    @classmethod
+    def fromCurves(cls, curves):
+        """
+        Returns an array from the supplied keyframe lists.
+
+        :type curves: List[List[Keyframe]]
+        :rtype: AnimCurveArray
+        """
+
+        keyframes = [keyframe for keyframes in curves for keyframe in keyframes]
+        offsets = numpy.concatenate([[0], numpy.cumsum([len(keyframes) for keyframes in curves], dtype=numpy.int64)])
+
+        return cls(
+            times=[keyframe.time for keyframe in keyframes],
+            values=[keyframe.value for keyframe in keyframes],
+            inTangents=[(keyframe.inTangent.x, keyframe.inTangent.y, keyframe.inTangent.z) for keyframe in keyframes],
+            outTangents=[(keyframe.outTangent.x, keyframe.outTangent.y, keyframe.outTangent.z) for keyframe in keyframes],
+            inTangentTypes=[keyframe.inTangentType for keyframe in keyframes],
+            outTangentTypes=[keyframe.outTangentType for keyframe in keyframes],
+            weighted=[keyframe.weighted for keyframe in keyframes],
+            locked=[keyframe.locked for keyframe in keyframes],
+            offsets=offsets
+        )
+
+    def toKeyframes(self, index=0):
+        """
+        Returns the keyframes from the specified curve.
+
+        :type index: int
+        :rtype: List[Keyframe]
+        """
+
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+
+        times = self._times[start:end].tolist()
+        values = self._values[start:end].tolist()
+        inTangents = self._inTangents[start:end].tolist()
+        outTangents = self._outTangents[start:end].tolist()
+        weighted = self._weighted[start:end].tolist()
+        locked = self._locked[start:end].tolist()
+
+        return [
+            Keyframe(
+                time=times[i],
+                value=values[i],
+                inTangent=Vector(*inTangents[i]),
+                inTangentType=self._inTangentTypes[start + i],
+                outTangent=Vector(*outTangents[i]),
+                outTangentType=self._outTangentTypes[start + i],
+                weighted=weighted[i],
+                locked=locked[i]
+            )
+            for i in range(end - start)
+        ]
+
+    def toCurves(self):
+        """
+        Returns the keyframes from every curve.
+
+        :rtype: List[List[Keyframe]]
+        """
+
+        return [self.toKeyframes(index=i) for i in range(len(self))]
+
+    def copy(self):
+        """
+        Returns a copy of this array.
+
+        :rtype: AnimCurveArray
+        """
+
+        return self.take(numpy.arange(self.numKeys()), self._offsets)
+
+    def take(self, keyIndices, offsets):
+        """
+        Returns a new array from the supplied key indices and offsets.
+
+        :type keyIndices: numpy.ndarray
+        :type offsets: numpy.ndarray
+        :rtype: AnimCurveArray
+        """
+
+        return self.__class__(
+            times=self._times[keyIndices],
+            values=self._values[keyIndices],
+            inTangents=self._inTangents[keyIndices],
+            outTangents=self._outTangents[keyIndices],
+            inTangentTypes=self._inTangentTypes[keyIndices],
+            outTangentTypes=self._outTangentTypes[keyIndices],
+            weighted=self._weighted[keyIndices],
+            locked=self._locked[keyIndices],
+            offsets=offsets
+        )
+
+    def numKeys(self, index=None):
+        """
+        Returns the number of keys from the specified curve.
+        If no index is supplied then the total number of keys is returned instead!
+
+        :type index: Union[int, None]
+        :rtype: int
+        """
+
+        if index is None:
+
+            return int(self._offsets[-1])
+
+        else:
+
+            return int(self._offsets[index + 1] - self._offsets[index])
+
+    def curveIds(self):
+        """
+        Returns the curve index for each key.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.repeat(numpy.arange(len(self)), numpy.diff(self._offsets))
+
+    def timeRange(self):
+        """
+        Returns the start and end time for each curve.
+        Empty curves have a time range of zero.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        starts, ends = self._offsets[:-1], self._offsets[1:]
+        isValid = starts != ends
+
+        startTimes = numpy.zeros(len(self), dtype=float)
+        startTimes[isValid] = self._times[starts[isValid]]
+
+        endTimes = numpy.zeros(len(self), dtype=float)
+        endTimes[isValid] = self._times[ends[isValid] - 1]
+
+        return startTimes, endTimes
+
+    def isStepped(self):
+        """
+        Returns a mask of keys with stepped out-tangents.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        # Check if masks require initializing
+        #
+        if self._stepped is None:
+
+            isStep = numpy.frompyfunc(lambda tangentType: tangentType in self.__step_types__, 1, 1)
+            isStepNext = numpy.frompyfunc(lambda tangentType: tangentType in self.__step_next_types__, 1, 1)
+
+            self._stepped = isStep(self._outTangentTypes).astype(bool) if self._outTangentTypes.size > 0 else numpy.zeros(0, dtype=bool)
+            self._steppedNext = isStepNext(self._outTangentTypes).astype(bool) if self._outTangentTypes.size > 0 else numpy.zeros(0, dtype=bool)
+
+        return self._stepped, self._steppedNext
+
+    def locate(self, curveIds, times, side='right'):
+        """
+        Returns the index of the key at, or preceding, each time within the associated curve.
+        Searching from the left will exclude any keys that coincide with the supplied times.
+        Any times that precede a curve's first key will return the index before the curve's start offset!
+
+        :type curveIds: numpy.ndarray
+        :type times: numpy.ndarray
+        :type side: str
+        :rtype: numpy.ndarray
+        """
+
+        # Check if there are any keys
+        #
+        if self.numKeys() == 0:
+
+            return self._offsets[curveIds] - 1
+
+        # Offset each curve into its own band so a single search can be used
+        #
+        minTime = min(self._times.min(), times.min())
+        maxTime = max(self._times.max(), times.max())
+        span = (maxTime - minTime) + 1.0
+
+        keys = (self.curveIds() * span) + (self._times - minTime)
+        queries = (curveIds * span) + (times - minTime)
+
+        return numpy.searchsorted(keys, queries, side=side) - 1
+
+    def controlPoints(self, startIndices):
+        """
+        Returns the bezier control points for the segments that start at the supplied key indices.
+        The x-components are clamped inside each segment to ensure the curves remain monotonic in time.
+
+        :type startIndices: numpy.ndarray
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        # Collect segment end points
+        #
+        endIndices = startIndices + 1
+
+        t0, t1 = self._times[startIndices], self._times[endIndices]
+        v0, v1 = self._values[startIndices], self._values[endIndices]
+        dt = t1 - t0
+
+        outX, outY = self._outTangents[startIndices, 0], self._outTangents[startIndices, 1]
+        inX, inY = self._inTangents[endIndices, 0], self._inTangents[endIndices, 1]
+
+        # Evaluate unweighted handles
+        # These handles are always placed at a third of the segment which reduces the bezier to a hermite spline!
+        #
+        outSlope = numpy.divide(outY, outX, out=numpy.zeros_like(outY), where=outX != 0.0)
+        inSlope = numpy.divide(inY, inX, out=numpy.zeros_like(inY), where=inX != 0.0)
+
+        p1 = numpy.stack([t0 + (dt / 3.0), v0 + ((outSlope * dt) / 3.0)], axis=-1)
+        p2 = numpy.stack([t1 - (dt / 3.0), v1 - ((inSlope * dt) / 3.0)], axis=-1)
+
+        # Evaluate weighted handles
+        # Any handles that overshoot the segment are scaled down along their tangent
+        #
+        isWeighted = self._weighted[startIndices] | self._weighted[endIndices]
+
+        if numpy.any(isWeighted):
+
+            outX, outY = numpy.maximum(outX, 0.0) / 3.0, outY / 3.0
+            inX, inY = numpy.maximum(inX, 0.0) / 3.0, inY / 3.0
+
+            outScale = numpy.divide(dt, outX, out=numpy.ones_like(dt), where=(outX > dt) & (outX > 0.0))
+            inScale = numpy.divide(dt, inX, out=numpy.ones_like(dt), where=(inX > dt) & (inX > 0.0))
+
+            p1 = numpy.where(isWeighted[:, None], numpy.stack([t0 + (outX * outScale), v0 + (outY * outScale)], axis=-1), p1)
+            p2 = numpy.where(isWeighted[:, None], numpy.stack([t1 - (inX * inScale), v1 - (inY * inScale)], axis=-1), p2)
+
+        p0 = numpy.stack([t0, v0], axis=-1)
+        p3 = numpy.stack([t1, v1], axis=-1)
+
+        return numpy.stack([p0, p1, p2, p3], axis=1), isWeighted
+
+    @staticmethod
+    def polynomial(p0, p1, p2, p3):
+        """
+        Returns the cubic polynomial coefficients for the supplied bezier control points.
+
+        :type p0: numpy.ndarray
+        :type p1: numpy.ndarray
+        :type p2: numpy.ndarray
+        :type p3: numpy.ndarray
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+
+        return (p3 - p0) + (3.0 * (p1 - p2)), 3.0 * (p0 - (2.0 * p1) + p2), 3.0 * (p1 - p0), p0
+
+    def solveParameters(self, points, isWeighted, times):
+        """
+        Returns the bezier parameters that intersect the supplied times.
+        Unweighted segments are linear in time while weighted segments are solved using newton's method.
+
+        :type points: numpy.ndarray
+        :type isWeighted: numpy.ndarray
+        :type times: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+
+        # Evaluate linear parameters
+        #
+        x0, x1, x2, x3 = points[:, 0, 0], points[:, 1, 0], points[:, 2, 0], points[:, 3, 0]
+        dt = x3 - x0
+
+        parameters = numpy.clip(numpy.divide(times - x0, dt, out=numpy.zeros_like(times), where=dt != 0.0), 0.0, 1.0)
+
+        if not numpy.any(isWeighted):
+
+            return parameters
+
+        # Refine weighted parameters
+        #
+        indices = numpy.flatnonzero(isWeighted)
+        u, t = parameters[indices], times[indices]
+        a, b, c, d = self.polynomial(x0[indices], x1[indices], x2[indices], x3[indices])
+
+        for i in range(self.__iterations__):
+
+            error = (((a * u + b) * u + c) * u + d) - t
+
+            if numpy.abs(error).max() <= self.__tolerance__:
+
+                break
+
+            dx = ((3.0 * a * u) + (2.0 * b)) * u + c
+            dx = numpy.where(numpy.abs(dx) > 1e-12, dx, 1e-12)
+
+            u = numpy.clip(u - (error / dx), 0.0, 1.0)
+
+        parameters[indices] = u
+
+        return parameters
+
+    def segments(self):
+        """
+        Returns the bezier control points for every segment.
+        Segments are indexed by their start key, any segments that span two curves should be ignored!
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        return self.controlPoints(numpy.arange(max(self.numKeys() - 1, 0)))
+
+    def evaluateAt(self, curveIds, times, side='right', segments=None):
+        """
+        Returns the values and slopes for each curve and time pair.
+        Times outside a curve's range are held constant.
+        When evaluated from the left, any times that coincide with a key will return the key's in-slope.
+
+        :type curveIds: numpy.ndarray
+        :type times: numpy.ndarray
+        :type side: str
+        :type segments: Union[Tuple[numpy.ndarray, numpy.ndarray], None]
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        # Locate segments
+        #
+        curveIds = numpy.asarray(curveIds, dtype=numpy.int64)
+        times = numpy.asarray(times, dtype=float)
+
+        values = numpy.zeros(times.shape, dtype=float)
+        slopes = numpy.zeros(times.shape, dtype=float)
+
+        if self.numKeys() == 0 or times.size == 0:
+
+            return values, slopes
+
+        indices = self.locate(curveIds, times, side=side)
+        starts, ends = self._offsets[curveIds], self._offsets[curveIds + 1]
+
+        isEmpty = starts == ends
+        isBefore = (indices < starts) & ~isEmpty
+        isAfter = (indices >= (ends - 1)) & ~isEmpty
+        isInside = ~(isEmpty | isBefore | isAfter)
+
+        values[isBefore] = self._values[starts[isBefore]]
+        values[isAfter] = self._values[ends[isAfter] - 1]
+
+        if not numpy.any(isInside):
+
+            return values, slopes
+
+        # Collect segment control points
+        #
+        startIndices = indices[isInside]
+        t = times[isInside]
+
+        if segments is None:
+
+            points, isWeighted = self.controlPoints(startIndices)
+
+        else:
+
+            points, isWeighted = segments[0][startIndices], segments[1][startIndices]
+
+        # Evaluate bezier segments
+        #
+        u = self.solveParameters(points, isWeighted, t)
+
+        x0, y0, y3 = points[:, 0, 0], points[:, 0, 1], points[:, 3, 1]
+        ax, bx, cx, _ = self.polynomial(x0, points[:, 1, 0], points[:, 2, 0], points[:, 3, 0])
+        ay, by, cy, _ = self.polynomial(y0, points[:, 1, 1], points[:, 2, 1], y3)
+
+        y = ((ay * u + by) * u + cy) * u + y0
+        dx = ((3.0 * ax * u) + (2.0 * bx)) * u + cx
+        dy = ((3.0 * ay * u) + (2.0 * by)) * u + cy
+        slope = numpy.divide(dy, dx, out=numpy.zeros_like(dy), where=dx != 0.0)
+
+        # Evaluate stepped segments
+        #
+        isStepped, isSteppedNext = self.isStepped()
+        isStepped, isSteppedNext = isStepped[startIndices], isSteppedNext[startIndices]
+
+        if numpy.any(isStepped) or numpy.any(isSteppedNext):
+
+            y = numpy.where(isStepped, y0, y)
+            y = numpy.where(isSteppedNext & (t > x0), y3, y)
+            slope = numpy.where(isStepped | isSteppedNext, 0.0, slope)
+
+        values[isInside] = y
+        slopes[isInside] = slope
+
+        return values, slopes
+
+    def evaluate(self, times, slopes=False, side='right'):
+        """
+        Returns the values for every curve at the supplied times.
+        The times can either be shared by all curves or supplied per curve as a 2D array.
+        The samples are processed in chunks to keep the memory footprint bounded.
+
+        :type times: Union[float, Sequence[float], numpy.ndarray]
+        :type slopes: bool
+        :type side: str
+        :rtype: Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+
+        # Evaluate supplied times
+        #
+        numCurves = len(self)
+        times = numpy.asarray(times, dtype=float)
+        isScalar = times.ndim == 0
+
+        if times.ndim < 2:
+
+            times = numpy.broadcast_to(times.reshape(1, -1), (numCurves, times.size))
+
+        elif times.shape[0] != numCurves:
+
+            raise TypeError(f'evaluate() expects {numCurves} rows of times ({times.shape[0]} given)!')
+
+        # Evaluate curves in chunks
+        #
+        numSamples = times.shape[1]
+        values = numpy.zeros((numCurves, numSamples), dtype=float)
+        derivatives = numpy.zeros((numCurves, numSamples), dtype=float)
+
+        segments = self.segments()
+        chunkSize = max(1, self.__chunk_size__ // max(numSamples, 1))
+
+        for start in range(0, numCurves, chunkSize):
+
+            end = min(start + chunkSize, numCurves)
+            curveIds = numpy.repeat(numpy.arange(start, end), numSamples)
+
+            chunkValues, chunkSlopes = self.evaluateAt(curveIds, times[start:end].reshape(-1), side=side, segments=segments)
+            values[start:end] = chunkValues.reshape(end - start, numSamples)
+            derivatives[start:end] = chunkSlopes.reshape(end - start, numSamples)
+
+        # Reshape results for scalar times
+        #
+        if isScalar:
+
+            values, derivatives = values[:, 0], derivatives[:, 0]
+
+        return (values, derivatives) if slopes else values
+
+    def resample(self, times, tangentType=TangentType.Fixed):
+        """
+        Returns a new array with keys at the supplied times.
+        Each key's tangents are derived from the curve's in and out slopes to preserve the curve's shape.
+        Be aware that stepped segments are not preserved!
+
+        :type times: Union[Sequence[float], numpy.ndarray]
+        :type tangentType: Union[int, str]
+        :rtype: AnimCurveArray
+        """
+
+        # Evaluate curves at times
+        #
+        times = numpy.unique(numpy.asarray(list(times) if not isinstance(times, numpy.ndarray) else times, dtype=float))
+        values, outSlopes = self.evaluate(times, slopes=True)
+        inSlopes = self.evaluate(times, slopes=True, side='left')[1]
+
+        # Build keys from samples
+        #
+        numCurves, numSamples = values.shape
+        numKeys = numCurves * numSamples
+
+        inTangents = numpy.zeros((numKeys, 3), dtype=float)
+        inTangents[:, 0] = 1.0
+        inTangents[:, 1] = inSlopes.reshape(-1)
+
+        outTangents = numpy.zeros((numKeys, 3), dtype=float)
+        outTangents[:, 0] = 1.0
+        outTangents[:, 1] = outSlopes.reshape(-1)
+
+        return self.__class__(
+            times=numpy.tile(times, numCurves),
+            values=values.reshape(-1),
+            inTangents=inTangents,
+            outTangents=outTangents,
+            inTangentTypes=[tangentType] * numKeys,
+            outTangentTypes=[tangentType] * numKeys,
+            weighted=numpy.zeros(numKeys, dtype=bool),
+            locked=numpy.ones(numKeys, dtype=bool),
+            offsets=numpy.arange(numCurves + 1, dtype=numpy.int64) * numSamples
+        )
+
+    def insert(self, time, tolerance=1e-6):
+        """
+        Returns a new array with a key inserted at the supplied time on every curve.
+        Segments are split using De Casteljau's algorithm so the curve's shape is preserved.
+        Keys inserted outside a curve's range are flattened to preserve the held values.
+
+        :type time: float
+        :type tolerance: float
+        :rtype: AnimCurveArray
+        """
+
+        # Locate segments
+        #
+        numCurves = len(self)
+        curveIds = numpy.arange(numCurves)
+        times = numpy.full(numCurves, float(time))
+
+        indices = self.locate(curveIds, times)
+        starts, ends = self._offsets[:-1], self._offsets[1:]
+
+        isEmpty = starts == ends
+        exists = numpy.zeros(numCurves, dtype=bool)
+        exists[~isEmpty] = numpy.abs(self._times[numpy.clip(indices[~isEmpty], 0, None)] - time) <= tolerance
+        exists &= indices >= starts
+
+        isBefore = (indices < starts) & ~isEmpty & ~exists
+        isAfter = (indices >= (ends - 1)) & ~isEmpty & ~exists
+        isInside = ~(isEmpty | isBefore | isAfter | exists)
+
+        if not numpy.any(isBefore | isAfter | isInside):
+
+            return self.copy()
+
+        # Copy arrays that require modifying
+        #
+        copy = self.copy()
+        inserted = numpy.flatnonzero(isBefore | isAfter | isInside)
+        positions = numpy.where(isBefore, starts, numpy.where(isAfter, ends, indices + 1))[inserted]
+
+        newValues = numpy.zeros(numCurves, dtype=float)
+        newInTangents = numpy.tile([1.0, 0.0, 0.0], (numCurves, 1))
+        newOutTangents = newInTangents.copy()
+        newInTypes = numpy.empty(numCurves, dtype=object)
+        newInTypes.fill(TangentType.Flat)
+        newOutTypes = newInTypes.copy()
+        newWeighted = numpy.zeros(numCurves, dtype=bool)
+
+        # Flatten keys outside the curve range
+        #
+        newValues[isBefore] = self._values[starts[isBefore]]
+        newValues[isAfter] = self._values[ends[isAfter] - 1]
+
+        copy._inTangents[starts[isBefore]] = [1.0, 0.0, 0.0]
+        copy._inTangentTypes[starts[isBefore]] = TangentType.Flat
+        copy._outTangents[ends[isAfter] - 1] = [1.0, 0.0, 0.0]
+        copy._outTangentTypes[ends[isAfter] - 1] = TangentType.Flat
+
+        # Split segments inside the curve range
+        #
+        if numpy.any(isInside):
+
+            startIndices = indices[isInside]
+            endIndices = startIndices + 1
+
+            points, isWeighted = self.controlPoints(startIndices)
+            u = self.solveParameters(points, isWeighted, times[isInside])[:, None]
+
+            p0, p1, p2, p3 = points[:, 0], points[:, 1], points[:, 2], points[:, 3]
+            q0, q1, q2 = p0 + ((p1 - p0) * u), p1 + ((p2 - p1) * u), p2 + ((p3 - p2) * u)
+            r0, r1 = q0 + ((q1 - q0) * u), q1 + ((q2 - q1) * u)
+            s = r0 + ((r1 - r0) * u)
+
+            # Check for any stepped segments
+            # These segments are held rather than split!
+            #
+            isStepped, isSteppedNext = self.isStepped()
+            isHeld = (isStepped | isSteppedNext)[startIndices]
+            isSplit = ~isHeld
+
+            heldValues = numpy.where(isSteppedNext[startIndices], p3[:, 1], p0[:, 1])
+            newValues[isInside] = numpy.where(isHeld, heldValues, s[:, 1])
+
+            inTangents, outTangents = newInTangents[isInside], newOutTangents[isInside]
+            inTangents[isSplit, :2] = 3.0 * (s - r0)[isSplit]
+            outTangents[isSplit, :2] = 3.0 * (r1 - s)[isSplit]
+            newInTangents[isInside], newOutTangents[isInside] = inTangents, outTangents
+
+            heldTypes = self._outTangentTypes[startIndices]
+            newInTypes[isInside] = numpy.where(isHeld, heldTypes, TangentType.Fixed)
+            newOutTypes[isInside] = numpy.where(isHeld, heldTypes, TangentType.Fixed)
+            newWeighted[isInside] = isWeighted
+
+            # Update neighbouring tangents
+            #
+            copy._outTangents[startIndices[isSplit], :2] = 3.0 * (q0 - p0)[isSplit]
+            copy._inTangents[endIndices[isSplit], :2] = 3.0 * (p3 - q2)[isSplit]
+
+        # Insert new keys
+        #
+        counts = numpy.zeros(numCurves, dtype=numpy.int64)
+        counts[inserted] = 1
+
+        return self.__class__(
+            times=numpy.insert(copy._times, positions, times[inserted]),
+            values=numpy.insert(copy._values, positions, newValues[inserted]),
+            inTangents=numpy.insert(copy._inTangents, positions, newInTangents[inserted], axis=0),
+            outTangents=numpy.insert(copy._outTangents, positions, newOutTangents[inserted], axis=0),
+            inTangentTypes=numpy.insert(copy._inTangentTypes, positions, newInTypes[inserted]),
+            outTangentTypes=numpy.insert(copy._outTangentTypes, positions, newOutTypes[inserted]),
+            weighted=numpy.insert(copy._weighted, positions, newWeighted[inserted]),
+            locked=numpy.insert(copy._locked, positions, True),
+            offsets=numpy.concatenate([[0], numpy.cumsum(numpy.diff(self._offsets) + counts)])
+        )
+
+    def slice(self, startTime, endTime, tolerance=1e-6):
+        """
+        Returns a new array containing the keys between the supplied times.
+        Keys are inserted at the start and end time so each curve's shape is preserved.
+
+        :type startTime: float
+        :type endTime: float
+        :type tolerance: float
+        :rtype: AnimCurveArray
+        """
+
+        # Insert boundary keys
+        #
+        if endTime < startTime:
+
+            raise TypeError(f'slice() expects an ascending time range ({startTime} to {endTime} given)!')
+
+        array = self.insert(startTime, tolerance=tolerance).insert(endTime, tolerance=tolerance)
+
+        # Collect keys inside time range
+        #
+        mask = (array._times >= (startTime - tolerance)) & (array._times <= (endTime + tolerance))
+        counts = numpy.bincount(array.curveIds()[mask], minlength=len(array))
+
+        return array.take(numpy.flatnonzero(mask), numpy.concatenate([[0], numpy.cumsum(counts)]))
+
+    def shift(self, offset):
+        """
+        Returns a new array with the keys shifted by the supplied time offset.
+        The offset can either be shared by all curves or supplied per curve.
+
+        :type offset: Union[float, Sequence[float]]
+        :rtype: AnimCurveArray
+        """
+
+        offset = numpy.asarray(offset, dtype=float)
+
+        array = self.copy()
+        array._times = array._times + (offset[array.curveIds()] if offset.ndim > 0 else offset)
+
+        return array
+
+    def scale(self, factor, pivot=0.0):
+        """
+        Returns a new array with the key times scaled about the supplied pivot.
+        The time components of the tangents are also scaled in order to preserve the curve's shape.
+
+        :type factor: float
+        :type pivot: float
+        :rtype: AnimCurveArray
+        """
+
+        if factor <= 0.0:
+
+            raise TypeError(f'scale() expects a positive factor ({factor} given)!')
+
+        array = self.copy()
+        array._times = pivot + ((array._times - pivot) * factor)
+        array._inTangents[:, 0] *= factor
+        array._outTangents[:, 0] *= factor
+
+        return array
+
+    def scaleValues(self, factor, pivot=0.0):
+        """
+        Returns a new array with the key values scaled about the supplied pivot.
+        The value components of the tangents are also scaled in order to preserve the curve's shape.
+
+        :type factor: float
+        :type pivot: float
+        :rtype: AnimCurveArray
+        """
+
+        array = self.copy()
+        array._values = pivot + ((array._values - pivot) * factor)
+        array._inTangents[:, 1] *= factor
+        array._outTangents[:, 1] *= factor
+
+        return array
+    # endregion
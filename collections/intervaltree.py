@@ -0,0 +1,379 @@
+from bisect import insort
+from itertools import count
+from ..dataclasses.interval import Interval
+from ..vendor.six.moves import collections_abc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class IntervalTree(collections_abc.Collection):
+    """
+    Overload of `Collection` that indexes items by their intervals.
+    Entries are kept sorted by start time and form an implicit balanced tree, where each node tracks the maximum end time of its subtree.
+    This allows for logarithmic stab and overlap queries, with the tree being lazily rebuilt after any edits!
+    """
+
+    # region Dunderscores
+    __slots__ = ('__entries__', '__maxes__', '__dirty__', '__counter__')
+
+    def __init__(self, *args):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(IntervalTree, self).__init__()
+
+        # Declare class variables
+        #
+        self.__entries__ = []
+        self.__maxes__ = []
+        self.__dirty__ = False
+        self.__counter__ = count()
+
+        # Check for any arguments
+        #
+        numArgs = len(args)
+
+        if numArgs == 1:
+
+            self.update(args[0])
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of indexed items.
+
+        :rtype: int
+        """
+
+        return len(self.__entries__)
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the indexed items in order of their start time.
+
+        :rtype: Iterator[Any]
+        """
+
+        for (startTime, endTime, index, interval, item) in self.__entries__:
+
+            yield item
+
+    def __contains__(self, item):
+        """
+        Private method that evaluates if the supplied item is indexed.
+
+        :type item: Any
+        :rtype: bool
+        """
+
+        return any(entry[4] is item for entry in self.__entries__)
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def ensureInterval(interval):
+        """
+        Returns an interval from the supplied object.
+        Sequences are treated as start and end times, while any objects with an `interval` method are evaluated.
+
+        :type interval: Union[Interval, Tuple[Union[int, float], Union[int, float]], Any]
+        :rtype: Interval
+        """
+
+        if isinstance(interval, Interval):
+
+            return interval
+
+        elif isinstance(interval, collections_abc.Sequence):
+
+            return Interval(*interval)
+
+        elif callable(getattr(interval, 'interval', None)):
+
+            return interval.interval()
+
+        else:
+
+            raise TypeError(f'ensureInterval() expects an interval ({type(interval).__name__} given)!')
+
+    def add(self, interval, item=None):
+        """
+        Indexes the supplied item using the specified interval.
+        If no item is supplied then the interval itself is indexed.
+
+        :type interval: Union[Interval, Tuple[Union[int, float], Union[int, float]], Any]
+        :type item: Any
+        :rtype: None
+        """
+
+        # Evaluate supplied interval
+        #
+        item = interval if item is None else item
+        interval = self.ensureInterval(interval)
+
+        startTime, endTime = min(interval.startTime, interval.endTime), max(interval.startTime, interval.endTime)
+
+        # Insert sorted entry
+        # The insertion index keeps entries with identical times in a stable order!
+        #
+        index = next(self.__counter__)
+        insort(self.__entries__, (startTime, endTime, index, interval, item))
+
+        self.__dirty__ = True
+
+    def update(self, items):
+        """
+        Indexes the supplied items.
+        Any objects that implement an `interval` method are indexed as themselves.
+
+        :type items: Iterable[Union[Interval, Tuple[Any, Any], Any]]
+        :rtype: None
+        """
+
+        for item in items:
+
+            if callable(getattr(item, 'interval', None)):
+
+                self.add(item.interval(), item=item)
+
+            else:
+
+                self.add(item)
+
+    def remove(self, item):
+        """
+        Removes the supplied item from this tree.
+
+        :type item: Any
+        :rtype: None
+        """
+
+        for (i, entry) in enumerate(self.__entries__):
+
+            if entry[4] is item:
+
+                del self.__entries__[i]
+                self.__dirty__ = True
+
+                return
+
+        raise ValueError('remove() cannot locate item!')
+
+    def clear(self):
+        """
+        Removes all items from this tree.
+
+        :rtype: None
+        """
+
+        self.__entries__.clear()
+        self.__maxes__.clear()
+        self.__dirty__ = False
+
+    def rebuild(self):
+        """
+        Recomputes the maximum end time for each subtree.
+
+        :rtype: None
+        """
+
+        numEntries = len(self.__entries__)
+        self.__maxes__ = [None] * numEntries
+
+        # Iterate through subtrees in post-order
+        #
+        stack = [(0, numEntries, False)]
+
+        while len(stack) > 0:
+
+            start, end, isVisited = stack.pop()
+
+            if start >= end:
+
+                continue
+
+            middle = (start + end) // 2
+
+            if not isVisited:
+
+                stack.append((start, end, True))
+                stack.append((start, middle, False))
+                stack.append((middle + 1, end, False))
+
+                continue
+
+            maxEnd = self.__entries__[middle][1]
+
+            if start < middle:
+
+                maxEnd = max(maxEnd, self.__maxes__[(start + middle) // 2])
+
+            if (middle + 1) < end:
+
+                maxEnd = max(maxEnd, self.__maxes__[(middle + 1 + end) // 2])
+
+            self.__maxes__[middle] = maxEnd
+
+        self.__dirty__ = False
+
+    def iterEntries(self, startTime, endTime):
+        """
+        Returns a generator that yields the entries that overlap the specified time range, in order of their start time.
+
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :rtype: Iterator[Tuple[Union[int, float], Union[int, float], int, Interval, Any]]
+        """
+
+        # Check if tree requires rebuilding
+        #
+        if self.__dirty__:
+
+            self.rebuild()
+
+        # Walk tree in-order while pruning subtrees that end too early or start too late
+        #
+        stack = [(0, len(self.__entries__), False)]
+
+        while len(stack) > 0:
+
+            start, end, isVisited = stack.pop()
+
+            if start >= end:
+
+                continue
+
+            middle = (start + end) // 2
+            entry = self.__entries__[middle]
+
+            if isVisited:
+
+                if entry[1] >= startTime:
+
+                    yield entry
+
+                continue
+
+            if self.__maxes__[middle] < startTime:
+
+                continue
+
+            if entry[0] <= endTime:
+
+                stack.append((middle + 1, end, False))
+                stack.append((middle, middle + 1, True))
+
+            stack.append((start, middle, False))
+
+    def overlap(self, startTime, endTime):
+        """
+        Returns the items whose intervals overlap the specified time range.
+        Both ends of each interval are inclusive.
+
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :rtype: List[Any]
+        """
+
+        return [entry[4] for entry in self.iterEntries(startTime, endTime)]
+
+    def stab(self, time):
+        """
+        Returns the items whose intervals contain the specified time.
+
+        :type time: Union[int, float]
+        :rtype: List[Any]
+        """
+
+        return self.overlap(time, time)
+
+    def span(self):
+        """
+        Returns the interval that spans every indexed item.
+        If there are no items then none is returned!
+
+        :rtype: Union[Interval, None]
+        """
+
+        if len(self.__entries__) == 0:
+
+            return None
+
+        startTime = self.__entries__[0][0]
+        endTime = max(entry[1] for entry in self.__entries__)
+        step = min(entry[3].step for entry in self.__entries__)
+
+        return Interval(startTime, endTime, step)
+
+    def union(self, tolerance=0):
+        """
+        Returns the merged intervals that cover every indexed item.
+        Intervals separated by no more than the supplied tolerance are merged, which allows consecutive frame ranges to be combined.
+        Each merged interval inherits the smallest step from its intervals.
+
+        :type tolerance: Union[int, float]
+        :rtype: List[Interval]
+        """
+
+        intervals = []
+
+        for (startTime, endTime, index, interval, item) in self.__entries__:
+
+            if len(intervals) > 0 and startTime <= (intervals[-1].endTime + tolerance):
+
+                intervals[-1].endTime = max(intervals[-1].endTime, endTime)
+                intervals[-1].step = min(intervals[-1].step, interval.step)
+
+            else:
+
+                intervals.append(Interval(startTime, endTime, interval.step))
+
+        return intervals
+
+    def gaps(self, startTime=None, endTime=None, tolerance=0):
+        """
+        Returns the open intervals that are not covered by any indexed item.
+        If a start or end time is supplied then any uncovered time leading up to, or following, the items is also returned.
+
+        :type startTime: Union[int, float, None]
+        :type endTime: Union[int, float, None]
+        :type tolerance: Union[int, float]
+        :rtype: List[Interval]
+        """
+
+        # Check if there are any items
+        #
+        intervals = self.union(tolerance=tolerance)
+
+        if len(intervals) == 0:
+
+            return [Interval(startTime, endTime)] if (startTime is not None and endTime is not None) else []
+
+        # Collect uncovered time between intervals
+        #
+        boundaries = [(intervals[0].startTime if startTime is None else startTime, intervals[0].startTime)]
+        boundaries.extend((previous.endTime, current.startTime) for (previous, current) in zip(intervals[:-1], intervals[1:]))
+        boundaries.append((intervals[-1].endTime, intervals[-1].endTime if endTime is None else endTime))
+
+        lower = float('-inf') if startTime is None else startTime
+        upper = float('inf') if endTime is None else endTime
+
+        return [Interval(max(start, lower), min(end, upper)) for (start, end) in boundaries if max(start, lower) < min(end, upper)]
+
+    def frames(self):
+        """
+        Returns the sorted frames covered by every indexed item.
+        Frames shared between overlapping intervals are only returned once.
+
+        :rtype: List[Union[int, float]]
+        """
+
+        return sorted(set(frame for entry in self.__entries__ for frame in entry[3]))
+    # endregion
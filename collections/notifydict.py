@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from .weakreflist import WeakRefList
 from ..vendor.six.moves import collections_abc
 
@@ -11,11 +12,12 @@ class NotifyDict(collections_abc.MutableMapping):
     """
     Overload of MutableMapping used to provide callback mechanisms for any dictionary changes.
     At this time there are only 2 callbacks: itemAdded and itemRemoved.
-    We can add more as demand needs.
+    Callbacks can also opt in to batched delivery via: itemsAdded and itemsRemoved.
+    Any changes made inside a `batch` scope are coalesced into a single batched notify!
     """
 
     # region Dunderscores
-    __slots__ = ('__items__', '__callbacks__')
+    __slots__ = ('__items__', '__callbacks__', '__depth__', '__notifies__')
 
     def __init__(self, *args, **kwargs):
         """
@@ -32,7 +34,9 @@ class NotifyDict(collections_abc.MutableMapping):
         # Declare private variables
         #
         self.__items__ = kwargs.get('cls', dict).__call__()
-        self.__callbacks__ = {'itemAdded': WeakRefList(), 'itemRemoved': WeakRefList()}
+        self.__callbacks__ = {'itemAdded': WeakRefList(), 'itemRemoved': WeakRefList(), 'itemsAdded': WeakRefList(), 'itemsRemoved': WeakRefList()}
+        self.__depth__ = 0
+        self.__notifies__ = []
 
         # Check for any arguments
         #
@@ -101,7 +105,7 @@ class NotifyDict(collections_abc.MutableMapping):
         """
 
         item = self.__items__.pop(index)
-        self.itemRemoved(item)
+        self.itemRemoved(item, key=index)
 
         return item
     # endregion
@@ -141,9 +145,11 @@ class NotifyDict(collections_abc.MutableMapping):
         :rtype: None
         """
 
-        for (key, value) in items.items():
+        with self.batch():
 
-            self.__setitem__(key, value)
+            for (key, value) in items.items():
+
+                self.__setitem__(key, value)
 
     def clear(self):
         """
@@ -154,9 +160,46 @@ class NotifyDict(collections_abc.MutableMapping):
 
         keys = list(self.keys())
 
-        for key in reversed(keys):
+        with self.batch():
+
+            for key in reversed(keys):
+
+                self.pop(key)
+
+    @contextmanager
+    def batch(self):
+        """
+        Returns a context manager that defers any batched notifies until the outermost batch exits.
+        Batches can be nested safely!
+
+        :rtype: contextlib.contextmanager
+        """
+
+        self.__depth__ += 1
+
+        try:
+
+            yield self
+
+        finally:
+
+            # Check if this is the outermost batch
+            #
+            self.__depth__ -= 1
+
+            if self.__depth__ == 0:
+
+                notifies, self.__notifies__ = self.__notifies__, []
+                self.flushNotifies(notifies)
 
-            self.pop(key)
+    def isBatching(self):
+        """
+        Evaluates if this dictionary is currently inside a batch.
+
+        :rtype: bool
+        """
+
+        return self.__depth__ > 0
 
     def callbackNames(self):
         """
@@ -206,6 +249,7 @@ class NotifyDict(collections_abc.MutableMapping):
     def itemAdded(self, index, item):
         """
         Notifies any functions if an item has been added.
+        Per-item functions are notified immediately, while batched functions are deferred until the outermost batch exits.
 
         :type index: int
         :type item: Any
@@ -216,15 +260,91 @@ class NotifyDict(collections_abc.MutableMapping):
 
             func(index, item)
 
-    def itemRemoved(self, item):
+        self.queueNotify('itemAdded', index, item)
+
+    def itemRemoved(self, item, key=None):
         """
         Notifies any functions if an item has been removed.
+        Per-item functions are notified immediately, while batched functions are deferred until the outermost batch exits.
 
         :type item: Any
+        :type key: Union[int, str, None]
         :rtype: None
         """
 
         for func in self.__callbacks__['itemRemoved']:
 
             func(item)
+
+        self.queueNotify('itemRemoved', key, item)
+
+    def itemsAdded(self, keys, items):
+        """
+        Notifies any batched functions if multiple items have been added.
+
+        :type keys: List[Union[int, str]]
+        :type items: List[Any]
+        :rtype: None
+        """
+
+        for func in self.__callbacks__['itemsAdded']:
+
+            func(keys, items)
+
+    def itemsRemoved(self, keys, items):
+        """
+        Notifies any batched functions if multiple items have been removed.
+
+        :type keys: List[Union[int, str]]
+        :type items: List[Any]
+        :rtype: None
+        """
+
+        for func in self.__callbacks__['itemsRemoved']:
+
+            func(keys, items)
+
+    def queueNotify(self, name, key, item):
+        """
+        Queues the supplied notify for any batched functions.
+        If this dictionary is not batching then the notify is delivered immediately!
+
+        :type name: str
+        :type key: Union[int, str, None]
+        :type item: Any
+        :rtype: None
+        """
+
+        if self.__depth__ > 0:
+
+            self.__notifies__.append((name, key, item))
+
+        else:
+
+            self.flushNotifies([(name, key, item)])
+
+    def flushNotifies(self, notifies):
+        """
+        Delivers the supplied notifies to any batched functions.
+        Per-item functions are not notified since they have already been notified as each change was made!
+
+        :type notifies: List[Tuple[str, Union[int, str], Any]]
+        :rtype: None
+        """
+
+        # Deliver batched notifies
+        # Removals are delivered before additions to mirror any `clear` followed by `update`!
+        #
+        removed = [(key, item) for (name, key, item) in notifies if name == 'itemRemoved']
+        added = [(key, item) for (name, key, item) in notifies if name == 'itemAdded']
+
+        if len(removed) > 0:
+
+            keys, items = map(list, zip(*removed))
+            self.itemsRemoved(keys, items)
+
+        if len(added) > 0:
+
+            keys, items = map(list, zip(*added))
+            self.itemsAdded(keys, items)
     # endregion
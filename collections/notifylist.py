@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from .weakreflist import WeakRefList
 from ..vendor.six import integer_types
 from ..vendor.six.moves import collections_abc
@@ -8,13 +9,66 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def coalesceNotifies(notifies):
+    """
+    Returns a generator that yields contiguous runs from the supplied notifies.
+    Each notify consists of a callback name, index and item.
+    Consecutive notifies of the same name are merged so long as their indices remain contiguous!
+
+    :type notifies: List[Tuple[str, int, Any]]
+    :rtype: Iterator[Tuple[str, range, List[Any]]]
+    """
+
+    name, start, stop, items = None, 0, 0, []
+
+    for (notifyName, index, item) in notifies:
+
+        # Check if notify continues the current run
+        # Removals can either repeat the same index or walk backwards, like `clear` does!
+        #
+        isSameName = notifyName == name
+
+        if isSameName and notifyName == 'itemAdded' and index == stop:
+
+            stop += 1
+            items.append(item)
+
+        elif isSameName and notifyName == 'itemRemoved' and index == start:
+
+            stop += 1
+            items.append(item)
+
+        elif isSameName and notifyName == 'itemRemoved' and index == (start - 1):
+
+            start -= 1
+            items.insert(0, item)
+
+        else:
+
+            # Yield previous run and start a new one
+            #
+            if name is not None:
+
+                yield name, range(start, stop), items
+
+            name, start, stop, items = notifyName, index, index + 1, [item]
+
+    # Yield any remaining run
+    #
+    if name is not None:
+
+        yield name, range(start, stop), items
+
+
 class NotifyList(collections_abc.MutableSequence):
     """
     Overload of MutableSequence used to provide callback mechanisms for any list changes.
+    Callbacks can either subscribe to per-item notifies, `itemAdded` and `itemRemoved`, or opt in to batched delivery, `itemsAdded` and `itemsRemoved`.
+    Any changes made inside a `batch` scope are coalesced into a single batched notify per contiguous run!
     """
 
     # region Dunderscores
-    __slots__ = ('__items__', '__callbacks__')
+    __slots__ = ('__items__', '__callbacks__', '__depth__', '__notifies__')
 
     def __init__(self, *args, **kwargs):
         """
@@ -39,7 +93,9 @@ class NotifyList(collections_abc.MutableSequence):
         # Declare private variables
         #
         self.__items__ = cls()
-        self.__callbacks__ = {'itemAdded': WeakRefList(), 'itemRemoved': WeakRefList()}
+        self.__callbacks__ = {'itemAdded': WeakRefList(), 'itemRemoved': WeakRefList(), 'itemsAdded': WeakRefList(), 'itemsRemoved': WeakRefList()}
+        self.__depth__ = 0
+        self.__notifies__ = []
 
         # Check for any arguments
         #
@@ -122,6 +178,7 @@ class NotifyList(collections_abc.MutableSequence):
     def itemAdded(self, index, item):
         """
         Notifies any functions if an item has been added.
+        Per-item functions are notified immediately, while batched functions are deferred until the outermost batch exits.
 
         :type index: int
         :type item: Any
@@ -132,20 +189,135 @@ class NotifyList(collections_abc.MutableSequence):
 
             func(index, item)
 
-    def itemRemoved(self, item):
+        self.queueNotify('itemAdded', index, item)
+
+    def itemRemoved(self, item, index=None):
         """
         Notifies any functions if an item has been removed.
+        Per-item functions are notified immediately, while batched functions are deferred until the outermost batch exits.
 
         :type item: Any
+        :type index: Union[int, None]
         :rtype: None
         """
 
         for func in self.__callbacks__['itemRemoved']:
 
             func(item)
+
+        self.queueNotify('itemRemoved', index, item)
+
+    def itemsAdded(self, indices, items):
+        """
+        Notifies any batched functions if a contiguous run of items has been added.
+
+        :type indices: range
+        :type items: List[Any]
+        :rtype: None
+        """
+
+        for func in self.__callbacks__['itemsAdded']:
+
+            func(indices, items)
+
+    def itemsRemoved(self, indices, items):
+        """
+        Notifies any batched functions if a contiguous run of items has been removed.
+        The indices reflect the positions the items occupied before they were removed.
+
+        :type indices: range
+        :type items: List[Any]
+        :rtype: None
+        """
+
+        for func in self.__callbacks__['itemsRemoved']:
+
+            func(indices, items)
+
+    def queueNotify(self, name, index, item):
+        """
+        Queues the supplied notify for any batched functions.
+        If this list is not batching then the notify is delivered immediately!
+
+        :type name: str
+        :type index: Union[int, None]
+        :type item: Any
+        :rtype: None
+        """
+
+        if self.__depth__ > 0:
+
+            self.__notifies__.append((name, index, item))
+
+        else:
+
+            self.flushNotifies([(name, index, item)])
+
+    def flushNotifies(self, notifies):
+        """
+        Delivers the supplied notifies to any batched functions per contiguous run.
+        Per-item functions are not notified since they have already been notified as each change was made!
+
+        :type notifies: List[Tuple[str, int, Any]]
+        :rtype: None
+        """
+
+        # Deliver batched notifies per contiguous run
+        #
+        hasItemsAdded = len(self.__callbacks__['itemsAdded']) > 0
+        hasItemsRemoved = len(self.__callbacks__['itemsRemoved']) > 0
+
+        if not (hasItemsAdded or hasItemsRemoved):
+
+            return
+
+        for (name, indices, items) in coalesceNotifies(notifies):
+
+            if name == 'itemAdded':
+
+                self.itemsAdded(indices, items)
+
+            else:
+
+                self.itemsRemoved(indices, items)
     # endregion
 
     # region Methods
+    @contextmanager
+    def batch(self):
+        """
+        Returns a context manager that defers any batched notifies until the outermost batch exits.
+        Batches can be nested safely!
+
+        :rtype: contextlib.contextmanager
+        """
+
+        self.__depth__ += 1
+
+        try:
+
+            yield self
+
+        finally:
+
+            # Check if this is the outermost batch
+            #
+            self.__depth__ -= 1
+
+            if self.__depth__ == 0:
+
+                notifies, self.__notifies__ = self.__notifies__, []
+                self.flushNotifies(notifies)
+
+    def isBatching(self):
+        """
+        Evaluates if this list is currently inside a batch.
+
+        :rtype: bool
+        """
+
+        return self.__depth__ > 0
+
     def callbackNames(self):
         """
         Returns a list of callback names that can be used.
@@ -244,9 +416,11 @@ class NotifyList(collections_abc.MutableSequence):
         :rtype: None
         """
 
-        for item in items:
+        with self.batch():
 
-            self.append(item)
+            for item in items:
+
+                self.append(item)
 
     def remove(self, child):
         """
@@ -279,7 +453,7 @@ class NotifyList(collections_abc.MutableSequence):
         if isinstance(index, integer_types):
 
             item = self.__items__.pop(index)
-            self.itemRemoved(item)
+            self.itemRemoved(item, index=index if index >= 0 else (self.__len__() + index + 1))
 
             return item
 
@@ -289,7 +463,9 @@ class NotifyList(collections_abc.MutableSequence):
             stop = len(self) if index.stop is None else index.stop
             step = 1 if index.step is None else index.step
 
-            return [self.pop(i) for i in reversed(range(start, stop, step))]
+            with self.batch():
+
+                return [self.pop(i) for i in reversed(range(start, stop, step))]
 
         else:
 
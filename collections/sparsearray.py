@@ -1,5 +1,7 @@
 import types
 
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, repeat, accumulate
 from ..vendor.six import integer_types
 from ..vendor.six.moves import collections_abc
 
@@ -12,11 +14,13 @@ log.setLevel(logging.INFO)
 class SparseArray(collections_abc.MutableSequence):
     """
     Overload of `MutableSequence` that implements sparse array containers.
-    This class uses an internal sorted dictionary to track items!
+    This class uses an internal dictionary to track items alongside an ordered index made up of sorted chunks.
+    Each chunk is bisect-maintained which keeps insertions, deletions and physical lookups logarithmic!
     """
 
     # region Dunderscores
-    __slots__ = ('__indices__', '__items__', '__range__')
+    __slots__ = ('__items__', '__chunks__', '__maxes__', '__offsets__')
+    __load__ = 1000
 
     def __init__(self, *args):
         """
@@ -29,9 +33,10 @@ class SparseArray(collections_abc.MutableSequence):
 
         # Declare class variables
         #
-        self.__indices__ = {}
         self.__items__ = {}
-        self.__range__ = [0, 0]
+        self.__chunks__ = []
+        self.__maxes__ = []
+        self.__offsets__ = None
 
         # Check for any arguments
         #
@@ -57,7 +62,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: str
         """
 
-        return repr(self.__items__)
+        return repr(self.toDict())
 
     def __call__(self, index):
         """
@@ -94,28 +99,15 @@ class SparseArray(collections_abc.MutableSequence):
 
             raise TypeError(f'__setitem__() expects an int ({type(index).__name__} given)!')
 
-        # Assign item to array
+        # Check if index requires inserting
         #
-        self.__indices__[index] = True
-        self.__items__[index] = item
-
-        # Update internal trackers and sort
-        #
-        firstIndex, lastIndex = self.__range__
-
-        if index < firstIndex:
+        if index not in self.__items__:
 
-            self.__range__[0] = index
-
-        elif index > lastIndex:
-
-            self.__range__[1] = index
-
-        else:
+            self.insertIndex(index)
 
-            pass
-
-        self.sort()
+        # Assign item to array
+        #
+        self.__items__[index] = item
 
     def __delitem__(self, index):
         """
@@ -127,7 +119,7 @@ class SparseArray(collections_abc.MutableSequence):
 
         if self.hasIndex(index):
 
-            self.__indices__[index] = False
+            self.removeIndex(index)
             del self.__items__[index]
 
         else:
@@ -151,7 +143,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: Iterator[Any]
         """
 
-        return iter(self.__items__.values())
+        return map(self.__items__.__getitem__, self.iterIndices())
 
     def __len__(self):
         """
@@ -172,7 +164,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: int
         """
 
-        return self.__range__[0]
+        return self.__chunks__[0][0] if len(self.__chunks__) > 0 else 0
 
     @property
     def lastIndex(self):
@@ -182,7 +174,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: int
         """
 
-        return self.__range__[1]
+        return self.__maxes__[-1] if len(self.__maxes__) > 0 else 0
     # endregion
 
     # region Methods
@@ -221,6 +213,161 @@ class SparseArray(collections_abc.MutableSequence):
 
             return False
 
+    @classmethod
+    def fromItems(cls, items):
+        """
+        Returns a new sparse array from the supplied key-value pairs.
+        Unlike `extend`, the indices are only sorted once which makes this ideal for out-of-order bulk data!
+
+        :type items: Union[Dict[int, Any], Iterable[Tuple[int, Any]]]
+        :rtype: SparseArray
+        """
+
+        # Collect key-value pairs
+        # Duplicate indices are resolved by the last occurrence!
+        #
+        items = dict(items)
+
+        if not all(isinstance(index, integer_types) for index in items.keys()):
+
+            raise TypeError('fromItems() expects integer indices!')
+
+        # Populate internal trackers
+        #
+        instance = cls()
+        instance.__items__ = items
+        instance.rebuildIndices(sorted(items.keys()))
+
+        return instance
+
+    def rebuildIndices(self, indices):
+        """
+        Rebuilds the internal chunks from the supplied sorted indices.
+
+        :type indices: List[int]
+        :rtype: None
+        """
+
+        load = self.__load__
+
+        self.__chunks__ = [indices[i:(i + load)] for i in range(0, len(indices), load)]
+        self.__maxes__ = [chunk[-1] for chunk in self.__chunks__]
+        self.__offsets__ = None
+
+    def insertIndex(self, index):
+        """
+        Inserts the supplied logical index into the internal chunks.
+        Oversized chunks are split in half to keep insertions logarithmic!
+
+        :type index: int
+        :rtype: None
+        """
+
+        # Check if there are any chunks
+        #
+        if len(self.__chunks__) == 0:
+
+            self.__chunks__.append([index])
+            self.__maxes__.append(index)
+            self.__offsets__ = None
+
+            return
+
+        # Locate chunk and insert index
+        # Appending to the end of the array skips the binary search altogether!
+        #
+        chunkIndex = bisect_left(self.__maxes__, index)
+
+        if chunkIndex == len(self.__maxes__):
+
+            chunkIndex -= 1
+            self.__chunks__[chunkIndex].append(index)
+            self.__maxes__[chunkIndex] = index
+
+        else:
+
+            insort(self.__chunks__[chunkIndex], index)
+
+        # Check if chunk requires splitting
+        #
+        chunk = self.__chunks__[chunkIndex]
+
+        if len(chunk) > (self.__load__ * 2):
+
+            half = len(chunk) // 2
+
+            self.__chunks__.insert(chunkIndex + 1, chunk[half:])
+            del chunk[half:]
+
+            self.__maxes__.insert(chunkIndex, chunk[-1])
+
+        self.__offsets__ = None
+
+    def removeIndex(self, index):
+        """
+        Removes the supplied logical index from the internal chunks.
+
+        :type index: int
+        :rtype: None
+        """
+
+        # Locate chunk and remove index
+        #
+        chunkIndex = bisect_left(self.__maxes__, index)
+        chunk = self.__chunks__[chunkIndex]
+
+        del chunk[bisect_left(chunk, index)]
+
+        # Check if chunk is now empty
+        #
+        if len(chunk) == 0:
+
+            del self.__chunks__[chunkIndex]
+            del self.__maxes__[chunkIndex]
+
+        else:
+
+            self.__maxes__[chunkIndex] = chunk[-1]
+
+        self.__offsets__ = None
+
+    def physicalToLogicalIndex(self, index):
+        """
+        Returns the logical index located at the supplied physical index.
+
+        :type index: int
+        :rtype: int
+        """
+
+        # Check if offsets require updating
+        # This is only done once per modification and remains valid for all subsequent lookups!
+        #
+        if self.__offsets__ is None:
+
+            self.__offsets__ = list(accumulate(chain((0,), map(len, self.__chunks__))))
+
+        chunkIndex = bisect_right(self.__offsets__, index) - 1
+        return self.__chunks__[chunkIndex][index - self.__offsets__[chunkIndex]]
+
+    def logicalToPhysicalIndex(self, index):
+        """
+        Returns the physical index associated with the supplied logical index.
+
+        :type index: int
+        :rtype: int
+        """
+
+        if not self.hasIndex(index):
+
+            raise IndexError('logicalToPhysicalIndex() array index out of range!')
+
+        if self.__offsets__ is None:
+
+            self.__offsets__ = list(accumulate(chain((0,), map(len, self.__chunks__))))
+
+        chunkIndex = bisect_left(self.__maxes__, index)
+        return self.__offsets__[chunkIndex] + bisect_left(self.__chunks__[chunkIndex], index)
+
     def insert(self, index, item):
         """
         Inserts an item at the specified index.
@@ -301,7 +448,14 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: Any
         """
 
-        return self.__items__.pop(index, default)
+        if self.hasIndex(index):
+
+            self.removeIndex(index)
+            return self.__items__.pop(index)
+
+        else:
+
+            return default
 
     def remove(self, item):
         """
@@ -321,6 +475,9 @@ class SparseArray(collections_abc.MutableSequence):
         """
 
         self.__items__.clear()
+        self.__chunks__.clear()
+        self.__maxes__.clear()
+        self.__offsets__ = None
 
     def index(self, item):
         """
@@ -330,18 +487,13 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: int
         """
 
-        try:
-
-            keys = list(self.__items__.keys())
-            values = list(self.__items__.values())
+        for (index, value) in zip(self.iterIndices(), self):
 
-            physicalIndex = values.index(item)
-            return keys[physicalIndex]
+            if value == item:
 
-        except ValueError as exception:
+                return index
 
-            log.debug(exception)
-            raise ValueError(f'index() {item} is not in array!')
+        raise ValueError(f'index() {item} is not in array!')
 
     def hasIndex(self, index):
         """
@@ -351,7 +503,16 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: bool
         """
 
-        return self.__indices__.get(index, False)
+        return index in self.__items__
+
+    def iterIndices(self):
+        """
+        Returns a generator that yields the sorted indices currently in use.
+
+        :rtype: Iterator[int]
+        """
+
+        return chain.from_iterable(self.__chunks__)
 
     def indices(self):
         """
@@ -360,7 +521,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: List[int]
         """
 
-        return self.__items__.keys()
+        return list(self.iterIndices())
 
     def values(self):
         """
@@ -369,7 +530,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: list
         """
 
-        return self.__items__.values()
+        return list(self)
 
     def items(self):
         """
@@ -378,7 +539,7 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: list
         """
 
-        return self.__items__.items()
+        return list(zip(self.iterIndices(), self))
 
     def getItemByLogicalIndex(self, index):
         """
@@ -439,12 +600,11 @@ class SparseArray(collections_abc.MutableSequence):
 
         # Check if index is in range
         #
-        indices = list(self.indices())
-        numIndices = len(indices)
+        numIndices = self.__len__()
 
         if 0 <= index < numIndices:
 
-            return self.getItemByLogicalIndex(indices[index])
+            return self.__items__[self.physicalToLogicalIndex(index)]
 
         else:
 
@@ -491,17 +651,34 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: int
         """
 
-        # Look for a mismatch
+        # Check if there are any gaps
         #
-        for (physicalIndex, logicalIndex) in enumerate(self.indices()):
+        if self.isSequential():
+
+            return self.nextIndex()
 
-            if physicalIndex != logicalIndex:
+        elif self.firstIndex != 0:
 
-                return physicalIndex
+            return 0
 
-        # Return next index
+        # Perform a binary search for the first mismatch
+        # Since the indices are sorted and unique, `logicalIndex - physicalIndex` never decreases!
         #
-        return self.nextIndex()
+        lower, upper = 0, self.__len__()
+
+        while lower < upper:
+
+            middle = (lower + upper) // 2
+
+            if self.physicalToLogicalIndex(middle) == middle:
+
+                lower = middle + 1
+
+            else:
+
+                upper = middle
+
+        return lower
 
     def isOrdered(self):
         """
@@ -510,17 +687,8 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: bool
         """
 
-        indices = tuple(self.__items__.keys())
-        numIndices = len(indices)
-
-        if numIndices >= 2:
-
-            firstIndex, *otherIndices, lastIndex = indices
-            return firstIndex == self.firstIndex and lastIndex == self.lastIndex
-
-        else:
-
-            return True
+        indices = self.indices()
+        return all(previousIndex < nextIndex for (previousIndex, nextIndex) in zip(indices, indices[1:]))
 
     def isSequential(self):
         """
@@ -529,18 +697,27 @@ class SparseArray(collections_abc.MutableSequence):
         :rtype: bool
         """
 
-        return all(physicalIndex == logicalIndex for (physicalIndex, logicalIndex) in enumerate(self.indices()))
+        numIndices = self.__len__()
+
+        if numIndices > 0:
+
+            return self.firstIndex == 0 and self.lastIndex == (numIndices - 1)
+
+        else:
+
+            return True
 
     def sort(self):
         """
-        Sorts the internal items once they're no longer in order.
+        Sorts the internal indices once they're no longer in order.
+        Since indices are always inserted in order this only exists for legacy purposes!
 
         :rtype: None
         """
 
         if not self.isOrdered():
 
-            self.__items__ = dict(sorted(self.__items__.items(), key=lambda pair: pair[0]))
+            self.rebuildIndices(sorted(self.__items__.keys()))
 
     def toList(self, **kwargs):
         """
@@ -553,14 +730,25 @@ class SparseArray(collections_abc.MutableSequence):
 
         # Check if list should be filled
         #
-        if 'fill' in kwargs:
+        if 'fill' not in kwargs:
 
-            fill = kwargs['fill']
-            return [self.tryGetItemByPhysicalIndex(i, default=fill) for i in range(self.lastIndex)]
+            return self.values()
 
-        else:
+        # Pre-allocate filled list and assign items in one pass
+        # Any negative indices cannot be represented and are skipped!
+        #
+        fill = kwargs['fill']
+        size = self.nextIndex() if self.lastIndex >= 0 else 0
+
+        items = list(repeat(fill, size))
+
+        for (index, item) in self.__items__.items():
+
+            if index >= 0:
+
+                items[index] = item
 
-            return list(self.values())
+        return items
 
     def toDict(self):
         """
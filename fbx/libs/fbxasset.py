@@ -48,8 +48,8 @@ class FbxAsset(fbxbase.FbxBase):
 
         # Setup notifies
         #
-        self._exportSets.addCallback('itemAdded', self.exportSetAdded)
-        self._exportSets.addCallback('itemRemoved', self.exportSetRemoved)
+        self._exportSets.addCallback('itemsAdded', self.exportSetsAdded)
+        self._exportSets.addCallback('itemsRemoved', self.exportSetsRemoved)
     # endregion
 
     # region Properties
@@ -166,8 +166,10 @@ class FbxAsset(fbxbase.FbxBase):
         :rtype: None
         """
 
-        self._exportSets.clear()
-        self._exportSets.extend(exportSets)
+        with self._exportSets.batch():
+
+            self._exportSets.clear()
+            self._exportSets.extend(exportSets)
 
     @property
     def useBuiltinSerializer(self):
@@ -192,24 +194,31 @@ class FbxAsset(fbxbase.FbxBase):
     # endregion
 
     # region Callbacks
-    def exportSetAdded(self, index, exportSet):
+    def exportSetsAdded(self, indices, exportSets):
         """
-        Adds a reference of this asset to the supplied export set.
+        Adds a reference of this asset to the supplied export sets.
 
-        :type index: int
-        :type exportSet: fbxexportset.FbxExportSet
+        :type indices: range
+        :type exportSets: List[fbxexportset.FbxExportSet]
         :rtype: None
         """
 
-        exportSet._asset = self.weakReference()
+        weakReference = self.weakReference()
+
+        for exportSet in exportSets:
 
-    def exportSetRemoved(self, exportSet):
+            exportSet._asset = weakReference
+
+    def exportSetsRemoved(self, indices, exportSets):
         """
-        Removes the reference of this asset from the supplied export set.
+        Removes the reference of this asset from the supplied export sets.
 
-        :type exportSet: fbxexportset.FbxExportSet
+        :type indices: range
+        :type exportSets: List[fbxexportset.FbxExportSet]
         :rtype: None
         """
 
-        exportSet._asset = self.nullWeakReference
+        for exportSet in exportSets:
+
+            exportSet._asset = self.nullWeakReference
     # endregion
@@ -0,0 +1,652 @@
+import os
+import sys
+import time
+import marshal
+import hashlib
+import tempfile
+
+from collections import OrderedDict, namedtuple
+from ...json import jsonutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+CacheEntry = namedtuple('CacheEntry', ['signature', 'item', 'size'])
+
+
+class FbxAssetCache(object):
+    """
+    Base class used to cache decoded fbx assets by file path, size and modification time.
+    Assets are kept in a least recently used memory cache, with a byte budget, that is backed by an on-disk cache of parsed JSON objects.
+    The on-disk cache is bounded by both size and age, and only the latest entry is kept for each file.
+    If content validation is enabled then a content hash is used in place of the modification time, which is useful for network file systems!
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__directory__',
+        '__entries__',
+        '__budget__',
+        '__size__',
+        '__diskBudget__',
+        '__maxAge__',
+        '__validate__',
+        '__hashes__',
+        '__statistics__'
+    )
+
+    __version__ = 2
+
+    def __init__(self, directory=None, budget=67108864, diskBudget=268435456, maxAge=2592000, validateContent=False):
+        """
+        Private method called after a new instance has been created.
+        If no directory is supplied then the `DCC_FBX_CACHE` environment variable, or the temp directory, is used instead.
+
+        :type directory: Union[str, None]
+        :type budget: int
+        :type diskBudget: int
+        :type maxAge: float
+        :type validateContent: bool
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FbxAssetCache, self).__init__()
+
+        # Declare private variables
+        #
+        self.__directory__ = directory
+        self.__entries__ = OrderedDict()
+        self.__budget__ = budget
+        self.__size__ = 0
+        self.__diskBudget__ = diskBudget
+        self.__maxAge__ = maxAge
+        self.__validate__ = validateContent
+        self.__hashes__ = {}
+        self.__statistics__ = dict.fromkeys(('memoryHits', 'diskHits', 'misses', 'evictions', 'prunes'), 0)
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of assets in the memory cache.
+
+        :rtype: int
+        """
+
+        return len(self.__entries__)
+    # endregion
+
+    # region Methods
+    def directory(self):
+        """
+        Returns the on-disk cache directory.
+        An empty string signifies that the on-disk cache is disabled!
+
+        :rtype: str
+        """
+
+        if self.__directory__ is not None:
+
+            return self.__directory__
+
+        else:
+
+            return os.environ.get('DCC_FBX_CACHE', os.path.join(tempfile.gettempdir(), 'dcc', 'fbxio'))
+
+    def budget(self):
+        """
+        Returns the memory budget in bytes.
+
+        :rtype: int
+        """
+
+        return self.__budget__
+
+    def setBudget(self, budget):
+        """
+        Updates the memory budget in bytes.
+        Any assets that exceed the new budget are evicted immediately!
+
+        :type budget: int
+        :rtype: None
+        """
+
+        self.__budget__ = budget
+        self.evict()
+
+    def size(self):
+        """
+        Returns the estimated size of the memory cache in bytes.
+        The size of each asset is estimated from the size of its parsed JSON objects.
+
+        :rtype: int
+        """
+
+        return self.__size__
+
+    def diskBudget(self):
+        """
+        Returns the on-disk budget in bytes.
+
+        :rtype: int
+        """
+
+        return self.__diskBudget__
+
+    def setDiskBudget(self, diskBudget):
+        """
+        Updates the on-disk budget in bytes.
+
+        :type diskBudget: int
+        :rtype: None
+        """
+
+        self.__diskBudget__ = diskBudget
+
+    def maxAge(self):
+        """
+        Returns the max age, in seconds, of any on-disk entries.
+
+        :rtype: float
+        """
+
+        return self.__maxAge__
+
+    def setMaxAge(self, maxAge):
+        """
+        Updates the max age, in seconds, of any on-disk entries.
+
+        :type maxAge: float
+        :rtype: None
+        """
+
+        self.__maxAge__ = maxAge
+
+    def validateContent(self):
+        """
+        Evaluates if content hashes are used to validate cached assets.
+
+        :rtype: bool
+        """
+
+        return self.__validate__
+
+    def setValidateContent(self, validateContent):
+        """
+        Updates whether content hashes are used to validate cached assets.
+
+        :type validateContent: bool
+        :rtype: None
+        """
+
+        self.__validate__ = validateContent
+
+    @staticmethod
+    def normalizePath(filePath):
+        """
+        Returns a normalized version of the supplied file path.
+
+        :type filePath: str
+        :rtype: str
+        """
+
+        return os.path.normcase(os.path.normpath(os.path.abspath(filePath)))
+
+    def contentHash(self, filePath, stats):
+        """
+        Returns the content hash for the supplied file.
+        Hashes are only recomputed when the file size or modification time changes!
+
+        :type filePath: str
+        :type stats: os.stat_result
+        :rtype: str
+        """
+
+        key = (filePath, stats.st_size, stats.st_mtime_ns)
+        contentHash = self.__hashes__.get(key, None)
+
+        if contentHash is not None:
+
+            return contentHash
+
+        hasher = hashlib.sha1()
+
+        with open(filePath, 'rb') as stream:
+
+            for chunk in iter(lambda: stream.read(1048576), b''):
+
+                hasher.update(chunk)
+
+        contentHash = hasher.hexdigest()
+        self.__hashes__[key] = contentHash
+
+        return contentHash
+
+    def signature(self, filePath):
+        """
+        Returns the signature used to validate the cached asset for the supplied file.
+        If the file does not exist then none is returned!
+
+        :type filePath: str
+        :rtype: Union[Tuple[int, Union[int, str]], None]
+        """
+
+        try:
+
+            stats = os.stat(filePath)
+
+        except OSError as exception:
+
+            log.debug(exception)
+            return None
+
+        if self.__validate__:
+
+            return stats.st_size, self.contentHash(filePath, stats)
+
+        else:
+
+            return stats.st_size, stats.st_mtime_ns
+
+    @staticmethod
+    def keyDigest(key):
+        """
+        Returns the digest used to prefix the on-disk file names for the supplied key.
+
+        :type key: Tuple[str, str]
+        :rtype: str
+        """
+
+        return hashlib.sha1('|'.join(key).encode('utf-8')).hexdigest()
+
+    def filePath(self, key, signature):
+        """
+        Returns the on-disk file path for the supplied key and signature.
+        File names are prefixed with the key digest so that superseded entries can be located!
+
+        :type key: Tuple[str, str]
+        :type signature: Tuple[int, Union[int, str]]
+        :rtype: str
+        """
+
+        identifier = '|'.join(map(str, signature + (self.__version__,) + sys.version_info[:2]))
+        digest = hashlib.sha1(identifier.encode('utf-8')).hexdigest()
+
+        return os.path.join(self.directory(), f'{self.keyDigest(key)}-{digest}.bin')
+
+    def get(self, filePath, name, **kwargs):
+        """
+        Returns the cached asset, under the specified property name, for the supplied file.
+        Any keyword arguments will be passed to the class constructors when decoding from the disk cache.
+        If no asset has been cached then none is returned!
+
+        :type filePath: str
+        :type name: str
+        :rtype: Any
+        """
+
+        # Check if file exists
+        #
+        signature = self.signature(filePath)
+
+        if signature is None:
+
+            return None
+
+        # Check memory cache
+        #
+        key = (self.normalizePath(filePath), name)
+        entry = self.__entries__.get(key, None)
+
+        if entry is not None and entry.signature == signature:
+
+            self.__statistics__['memoryHits'] += 1
+            self.__entries__.move_to_end(key)
+
+            return entry.item
+
+        # Check disk cache
+        #
+        data = self.read(key, signature)
+
+        if data is None:
+
+            self.__statistics__['misses'] += 1
+            return None
+
+        try:
+
+            obj = marshal.loads(data)
+
+        except (EOFError, ValueError, TypeError) as exception:
+
+            log.warning(f'Unable to load fbx cache: {filePath} ({exception})')
+            self.__statistics__['misses'] += 1
+
+            return None
+
+        self.__statistics__['diskHits'] += 1
+
+        item = jsonutils.decode(obj, **kwargs)
+        self.store(key, signature, item, len(data))
+
+        return item
+
+    def loads(self, filePath, name, string, default=None, persist=True, **kwargs):
+        """
+        Decodes the supplied string and caches the resulting asset, under the specified property name, for the supplied file.
+        The parsed JSON objects are written to the disk cache before they are decoded.
+        If the string does not reflect the file on disk, such as unsaved scene changes, then disable persist to skip the disk cache!
+
+        :type filePath: str
+        :type name: str
+        :type string: str
+        :type default: Any
+        :type persist: bool
+        :rtype: Any
+        """
+
+        # Parse json string
+        #
+        obj = jsonutils.parse(string, default=None)
+
+        if obj is None:
+
+            return default
+
+        # Check if file exists
+        #
+        item = jsonutils.decode(obj, **kwargs)
+        signature = self.signature(filePath)
+
+        if signature is None:
+
+            return item
+
+        # Cache parsed objects and decoded item
+        #
+        key = (self.normalizePath(filePath), name)
+        data = marshal.dumps(obj)
+
+        if persist:
+
+            self.write(key, signature, data)
+
+        self.store(key, signature, item, len(data))
+
+        return item
+
+    def store(self, key, signature, item, size):
+        """
+        Caches the supplied item in memory and evicts any assets that exceed the budget.
+
+        :type key: Tuple[str, str]
+        :type signature: Tuple[int, Union[int, str]]
+        :type item: Any
+        :type size: int
+        :rtype: None
+        """
+
+        previous = self.__entries__.pop(key, None)
+
+        if previous is not None:
+
+            self.__size__ -= previous.size
+
+        self.__entries__[key] = CacheEntry(signature=signature, item=item, size=size)
+        self.__size__ += size
+
+        self.evict()
+
+    def evict(self):
+        """
+        Evicts the least recently used assets until the memory cache is within budget.
+        The most recently used asset is always kept regardless of its size!
+
+        :rtype: None
+        """
+
+        while self.__size__ > self.__budget__ and len(self.__entries__) > 1:
+
+            key, entry = self.__entries__.popitem(last=False)
+
+            self.__size__ -= entry.size
+            self.__statistics__['evictions'] += 1
+
+    def read(self, key, signature):
+        """
+        Returns the marshalled JSON objects from the disk cache.
+        If no objects have been written then none is returned!
+
+        :type key: Tuple[str, str]
+        :type signature: Tuple[int, Union[int, str]]
+        :rtype: Union[bytes, None]
+        """
+
+        directory = self.directory()
+
+        if len(directory) == 0:
+
+            return None
+
+        filePath = self.filePath(key, signature)
+
+        if not os.path.isfile(filePath):
+
+            return None
+
+        try:
+
+            with open(filePath, 'rb') as stream:
+
+                data = stream.read()
+
+            os.utime(filePath)
+            return data
+
+        except OSError as exception:
+
+            log.warning(f'Unable to read fbx cache: {filePath} ({exception})')
+            return None
+
+    def write(self, key, signature, data):
+        """
+        Writes the supplied marshalled objects to the disk cache.
+        Any superseded entries for the same key are removed and the disk cache is then pruned.
+        Be sure to write to a temporary file first to remain safe across processes!
+
+        :type key: Tuple[str, str]
+        :type signature: Tuple[int, Union[int, str]]
+        :type data: bytes
+        :rtype: None
+        """
+
+        directory = self.directory()
+
+        if len(directory) == 0:
+
+            return
+
+        try:
+
+            os.makedirs(directory, exist_ok=True)
+
+            filePath = self.filePath(key, signature)
+            tempPath = f'{filePath}.{os.getpid()}.tmp'
+
+            with open(tempPath, 'wb') as stream:
+
+                stream.write(data)
+
+            os.replace(tempPath, filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to write fbx cache: {directory} ({exception})')
+            return
+
+        # Remove superseded entries
+        #
+        prefix = f'{self.keyDigest(key)}-'
+        fileName = os.path.basename(filePath)
+
+        for entry in self.iterDiskEntries():
+
+            if entry.name.startswith(prefix) and entry.name != fileName:
+
+                self.removeDiskEntry(entry.path)
+
+        self.prune()
+
+    def iterDiskEntries(self):
+        """
+        Returns a generator that yields the on-disk cache entries.
+
+        :rtype: Iterator[os.DirEntry]
+        """
+
+        directory = self.directory()
+
+        if len(directory) == 0:
+
+            return
+
+        try:
+
+            with os.scandir(directory) as entries:
+
+                for entry in entries:
+
+                    if entry.name.endswith('.bin') and entry.is_file():
+
+                        yield entry
+
+        except OSError as exception:
+
+            log.debug(exception)
+
+    def removeDiskEntry(self, filePath):
+        """
+        Removes the supplied on-disk cache entry.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        try:
+
+            os.remove(filePath)
+            self.__statistics__['prunes'] += 1
+
+            return True
+
+        except OSError as exception:
+
+            log.debug(exception)
+            return False
+
+    def prune(self):
+        """
+        Removes any on-disk entries that exceed the max age, followed by the least recently used entries that exceed the disk budget.
+
+        :rtype: None
+        """
+
+        # Collect on-disk entries
+        #
+        entries = []
+
+        for entry in self.iterDiskEntries():
+
+            try:
+
+                stats = entry.stat()
+
+            except OSError as exception:
+
+                log.debug(exception)
+                continue
+
+            entries.append((stats.st_mtime, stats.st_size, entry.path))
+
+        # Remove expired entries
+        #
+        expiry = time.time() - self.__maxAge__
+        entries.sort()
+
+        size = 0
+        remaining = []
+
+        for (modified, entrySize, entryPath) in entries:
+
+            if modified < expiry:
+
+                self.removeDiskEntry(entryPath)
+
+            else:
+
+                size += entrySize
+                remaining.append((entrySize, entryPath))
+
+        # Remove least recently used entries until within budget
+        # The most recently used entry is always kept regardless of its size!
+        #
+        for (entrySize, entryPath) in remaining[:-1]:
+
+            if size <= self.__diskBudget__:
+
+                break
+
+            if self.removeDiskEntry(entryPath):
+
+                size -= entrySize
+
+    def invalidate(self, filePath=None):
+        """
+        Removes any assets cached in memory for the supplied file.
+        If no file is supplied then all assets are removed instead.
+
+        :type filePath: Union[str, None]
+        :rtype: None
+        """
+
+        if filePath is None:
+
+            self.__entries__.clear()
+            self.__size__ = 0
+
+            return
+
+        normalizedPath = self.normalizePath(filePath)
+
+        for key in [key for key in self.__entries__.keys() if key[0] == normalizedPath]:
+
+            self.__size__ -= self.__entries__.pop(key).size
+
+    def statistics(self):
+        """
+        Returns the hit and miss statistics for this cache.
+
+        :rtype: Dict[str, int]
+        """
+
+        statistics = dict(self.__statistics__)
+        statistics['entries'] = len(self.__entries__)
+        statistics['size'] = self.__size__
+
+        return statistics
+
+    def resetStatistics(self):
+        """
+        Resets the hit and miss statistics for this cache.
+
+        :rtype: None
+        """
+
+        for key in self.__statistics__.keys():
+
+            self.__statistics__[key] = 0
+    # endregion
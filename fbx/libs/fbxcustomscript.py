@@ -2,11 +2,11 @@
 
 """
 import os
+import time
 
 from enum import IntEnum
-from . import fbxbase, FbxExportStatus
+from . import fbxbase, fbxscriptpool, FbxExportStatus
 from ... import fnscene
-from ...ui import qfileedit
 from ...python import importutils
 
 import logging
@@ -35,7 +35,11 @@ class FbxCustomScript(fbxbase.FbxBase):
         '_scene',
         '_filePath',
         '_script',
-        '_language'
+        '_language',
+        '_isolated',
+        '_code',
+        '_timings',
+        '_future'
     )
 
     def __init__(self, *args, **kwargs):
@@ -54,6 +58,10 @@ class FbxCustomScript(fbxbase.FbxBase):
         self._filePath = ''
         self._script = ''
         self._language = Language.PYTHON
+        self._isolated = False
+        self._code = None
+        self._timings = {}
+        self._future = None
     # endregion
 
     # region Properties
@@ -118,6 +126,7 @@ class FbxCustomScript(fbxbase.FbxBase):
         """
 
         self._script = script
+        self._code = None
 
     @property
     def language(self):
@@ -139,6 +148,30 @@ class FbxCustomScript(fbxbase.FbxBase):
         """
 
         self._language = Language(language)
+        self._code = None
+
+    @property
+    def isolated(self):
+        """
+        Getter method that returns the isolation state for the post-export file.
+        Isolated python files are executed in a worker process while the next export continues.
+        This should only be enabled for scripts that operate on the exported file, via the `exportPath` global, rather than the scene!
+
+        :rtype: bool
+        """
+
+        return self._isolated
+
+    @isolated.setter
+    def isolated(self, isolated):
+        """
+        Setter method that updates the isolation state for the post-export file.
+
+        :type isolated: bool
+        :rtype: None
+        """
+
+        self._isolated = bool(isolated)
     # endregion
 
     # region Methods
@@ -154,6 +187,7 @@ class FbxCustomScript(fbxbase.FbxBase):
 
         if name == 'filePath':
 
+            from ...ui import qfileedit
             return qfileedit.QFileEdit(filter='Script Files (*.ms *.mel *.py)', parent=parent)
 
         else:
@@ -227,15 +261,66 @@ class FbxCustomScript(fbxbase.FbxBase):
 
             return False
 
-    def executeFile(self, filePath):
+    def isIsolatedFile(self, filePath, exportPath=''):
+        """
+        Evaluates if the supplied file path should be submitted to the script pool.
+        Only python files can be isolated and only once an export path has been supplied!
+
+        :type filePath: str
+        :type exportPath: str
+        :rtype: bool
+        """
+
+        isPython = filePath.lower().endswith('.py')
+        return self.isolated and isPython and not self.scene.isNullOrEmpty(exportPath) and os.path.isfile(filePath)
+
+    def executeFile(self, filePath, exportPath=''):
         """
         Executes the supplied file path.
+        If an export path is supplied and this script is isolated then python files are submitted to the script pool instead.
+        The future of any isolated files is kept so their worker-side time can be included in the timings!
 
         :type filePath: str
+        :type exportPath: str
         :rtype: bool
         """
 
-        return self.scene.executeFile(filePath)
+        # Check if file should be isolated
+        #
+        if self.isIsolatedFile(filePath, exportPath=exportPath):
+
+            self._future = fbxscriptpool.__script_pool__.submit(filePath, exportPath=exportPath)
+            return True
+
+        else:
+
+            return self.scene.executeFile(filePath)
+
+    def compileScript(self):
+        """
+        Returns the compiled code object for the python script.
+        The code object is only compiled once for each script change!
+
+        :rtype: Union[types.CodeType, None]
+        """
+
+        # Check if code has been cached
+        #
+        if self._code is not None:
+
+            return self._code
+
+        # Try and compile script
+        #
+        try:
+
+            self._code = compile(self.script, f'<{self.name}>', 'exec')
+            return self._code
+
+        except (SyntaxError, ValueError) as exception:
+
+            log.warning(exception)
+            return None
 
     def executeScript(self, script, language):
         """
@@ -250,12 +335,47 @@ class FbxCustomScript(fbxbase.FbxBase):
 
         if asPython:
 
-            return self.scene.executePython(script)
+            code = self.compileScript() if script == self.script else script
+            return self.scene.executePython(code) if code is not None else False
 
         else:
 
             return self.scene.execute(script)
 
+    def timeExecution(self, label, func, *args, **kwargs):
+        """
+        Executes the supplied function and records the elapsed time under the specified label.
+
+        :type label: str
+        :type func: Callable
+        :rtype: Any
+        """
+
+        startTime = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - startTime
+
+        self._timings[label] = elapsed
+        log.info(f'Executed {label} for "{self.name}" custom script, in {elapsed:.3f} secs.')
+
+        return result
+
+    def timings(self):
+        """
+        Returns the elapsed times from the last pre or post-export execution.
+        Isolated files complete asynchronously so their worker-side time is only included once the script pool has executed them!
+
+        :rtype: Dict[str, float]
+        """
+
+        timings = dict(self._timings)
+
+        if self._future is not None and self._future.done() and self._future.exception() is None:
+
+            timings['file'] = self._future.result()
+
+        return timings
+
     def preExport(self, exporter):
         """
         Executes the pre-export override.
@@ -264,47 +384,63 @@ class FbxCustomScript(fbxbase.FbxBase):
         :rtype: None
         """
 
+        # Reset previous timings
+        #
+        self._timings.clear()
+        self._future = None
+
         # Check if name is valid
         #
         if not self.scene.isNullOrEmpty(self.name):
 
-            self.executeModule(self.name, FbxExportStatus.PRE_EXPORT)
+            self.timeExecution('module', self.executeModule, self.name, FbxExportStatus.PRE_EXPORT)
 
         # Check if file path is valid
         #
         if not self.scene.isNullOrEmpty(self.filePath):
 
-            self.executeFile(self.filePath)
+            self.timeExecution('file', self.executeFile, self.filePath)
 
         # Check if script is valid
         #
         if not self.scene.isNullOrEmpty(self.script):
 
-            self.executeScript(self.script, self.language)
+            self.timeExecution('script', self.executeScript, self.script, self.language)
 
-    def postExport(self, exporter):
+    def postExport(self, exporter, exportPath=''):
         """
         Executes the post-export override.
 
         :type exporter: Union[fbxexportset.FbxExportSet, fbxexportrange.FbxExportRange]
+        :type exportPath: str
         :rtype: None
         """
 
+        # Reset previous timings
+        #
+        self._timings.clear()
+        self._future = None
+
         # Check if name is valid
         #
         if not self.scene.isNullOrEmpty(self.name):
 
-            self.executeModule(self.name, FbxExportStatus.POST_EXPORT)
+            self.timeExecution('module', self.executeModule, self.name, FbxExportStatus.POST_EXPORT)
 
         # Check if file path is valid
+        # Isolated files are timed inside the worker since submitting them returns immediately!
         #
-        if not self.scene.isNullOrEmpty(self.filePath):
+        if self.isIsolatedFile(self.filePath, exportPath=exportPath):
+
+            self.executeFile(self.filePath, exportPath=exportPath)
+
+        elif not self.scene.isNullOrEmpty(self.filePath):
 
-            self.executeFile(self.filePath)
+            self.timeExecution('file', self.executeFile, self.filePath, exportPath=exportPath)
 
         # Check if script is valid
         #
         if not self.scene.isNullOrEmpty(self.script):
 
-            self.executeScript(self.script, self.language)
+            self.timeExecution('script', self.executeScript, self.script, self.language)
     # endregion
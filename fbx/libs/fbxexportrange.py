@@ -3,10 +3,10 @@ import os
 from enum import Enum, IntEnum
 from . import fbxbase, fbxcustomscript, fbxserializer, FbxExportStatus
 from ... import fnfbx, fnscene
-from ...ui import qdirectoryedit, qtimespinbox
 from ...python import stringutils
 from ...perforce import p4utils
 from ...collections import notifylist
+from ...dataclasses.interval import Interval
 
 import logging
 logging.basicConfig()
@@ -30,6 +30,7 @@ class FbxExportRange(fbxbase.FbxBase):
         '_step',
         '_useTimeline',
         '_moveToOrigin',
+        '_reduceKeys',
         '_exportGroupId',
         '_exportSetId',
         '_customScripts'
@@ -60,6 +61,7 @@ class FbxExportRange(fbxbase.FbxBase):
         self._step = 1
         self._useTimeline = True
         self._moveToOrigin = False
+        self._reduceKeys = False
         self._exportGroupId = 0
         self._exportSetId = 0
         self._customScripts = notifylist.NotifyList()
@@ -246,6 +248,27 @@ class FbxExportRange(fbxbase.FbxBase):
 
         self._moveToOrigin = moveToOrigin
 
+    @property
+    def reduceKeys(self):
+        """
+        Getter method that returns the `reduceKeys` flag.
+
+        :rtype: bool
+        """
+
+        return self._reduceKeys
+
+    @reduceKeys.setter
+    def reduceKeys(self, reduceKeys):
+        """
+        Setter method that updates the `reduceKeys` flag.
+
+        :type reduceKeys: bool
+        :rtype: None
+        """
+
+        self._reduceKeys = reduceKeys
+
     @property
     def exportGroupId(self):
         """
@@ -345,6 +368,10 @@ class FbxExportRange(fbxbase.FbxBase):
         :rtype: Union[QtWidgets.QWidget, None]
         """
 
+        # Qt editors are imported on demand to keep headless sessions Qt-free!
+        #
+        from ...ui import qdirectoryedit, qtimespinbox
+
         if name == 'directory':
 
             return qdirectoryedit.QDirectoryEdit(parent=parent)
@@ -385,6 +412,16 @@ class FbxExportRange(fbxbase.FbxBase):
 
             return self.startFrame, self.endFrame
 
+    def interval(self):
+        """
+        Returns the time range as an interval.
+
+        :rtype: Interval
+        """
+
+        startFrame, endFrame = self.timeRange()
+        return Interval(startFrame, endFrame, self.step)
+
     def asset(self):
         """
         Returns the asset associated with this export range.
@@ -522,7 +559,7 @@ class FbxExportRange(fbxbase.FbxBase):
         # Execute post-scripts
         #
         exportSet.editExportFile(exportPath)
-        exportSet.postExport()
+        exportSet.postExport(exportPath=exportPath)
 
         return exportPath
 
@@ -3,7 +3,6 @@ import os
 from . import fbxbase, fbxskeleton, fbxmesh, fbxcamera, fbxcustomscript, fbxserializer, FbxExportStatus
 from ..interop import fbxfile
 from ... import fnscene, fnfbx
-from ...ui import qdirectoryedit
 from ...perforce import p4utils
 from ...python import stringutils
 from ...collections import notifylist
@@ -290,6 +289,7 @@ class FbxExportSet(fbxbase.FbxBase):
 
         if name == 'directory':
 
+            from ...ui import qdirectoryedit
             return qdirectoryedit.QDirectoryEdit(parent=parent)
 
         else:
@@ -491,7 +491,7 @@ class FbxExportSet(fbxbase.FbxBase):
         # Execute post-scripts
         #
         self.editExportFile(exportPath, **kwargs)
-        self.postExport()
+        self.postExport(exportPath=exportPath)
 
         return exportPath
 
@@ -544,10 +544,12 @@ class FbxExportSet(fbxbase.FbxBase):
 
         return exportPath
 
-    def postExport(self):
+    def postExport(self, exportPath=''):
         """
         Executes any post-export scripts.
+        The export path is passed along to any isolated scripts that operate on the exported file.
 
+        :type exportPath: str
         :rtype: None
         """
 
@@ -559,7 +561,7 @@ class FbxExportSet(fbxbase.FbxBase):
         #
         for customScript in self.customScripts:
 
-            customScript.postExport(self)
+            customScript.postExport(self, exportPath=exportPath)
 
         # Reset export status
         #
@@ -1,12 +1,10 @@
-import os
-
-from collections import namedtuple
-from . import fbxasset, fbxexportset, fbxreferencedasset, fbxexportrange
+from . import fbxasset, fbxexportset, fbxreferencedasset, fbxexportrange, fbxassetcache, fbxscriptpool
 from ... import fnscene, fnreference
 from ...abstract import singleton
 from ...json import jsonutils
 from ...python import stringutils
 from ...perforce import p4utils
+from ...collections.intervaltree import IntervalTree
 
 import logging
 logging.basicConfig()
@@ -19,10 +17,6 @@ FBX_REFERENCED_ASSET_KEY = 'fbxReferencedAssets'
 FBX_SEQUENCERS_KEY = 'fbxSequencers'  # Deprecated!
 
 
-AssetCache = namedtuple('AssetCache', ['item', 'lastModified'])
-ReferencedAssetCache = namedtuple('ReferencedAssetCache', ['items', 'lastModified'])
-
-
 class FbxIO(singleton.Singleton):
     """
     Singleton class that interfaces with fbx assets and sequencers.
@@ -31,7 +25,7 @@ class FbxIO(singleton.Singleton):
     """
 
     # region Dunderscores
-    __slots__ = ('_scene', '_assets', '_referencedAssets')
+    __slots__ = ('_scene', '_cache')
 
     def __init__(self, *args, **kwargs):
         """
@@ -47,8 +41,7 @@ class FbxIO(singleton.Singleton):
         # Declare private variables
         #
         self._scene = fnscene.FnScene()
-        self._assets = {}
-        self._referencedAssets = {}
+        self._cache = fbxassetcache.FbxAssetCache()
     # endregion
 
     # region Properties
@@ -63,86 +56,35 @@ class FbxIO(singleton.Singleton):
         return self._scene
 
     @property
-    def assets(self):
+    def cache(self):
         """
         Getter method that returns the asset cache.
 
-        :rtype: Dict[int, AssetCache]
-        """
-
-        return self._assets
-
-    @property
-    def referencedAssets(self):
-        """
-        Getter method that returns the sequencer cache.
-
-        :rtype: Dict[int, SequencerCache]
+        :rtype: fbxassetcache.FbxAssetCache
         """
 
-        return self._referencedAssets
+        return self._cache
     # endregion
 
     # region Methods
     def getCachedAsset(self, filePath, referenced=False):
         """
-        Returns a cached asset using the supplied file's iNode id.
+        Returns a cached asset using the supplied file's path, size and modification time.
 
         :type filePath: str
         :type referenced: bool
-        :rtype: Union[fbxasset.FbxAsset, None]
+        :rtype: Union[fbxasset.FbxAsset, List[fbxreferencedasset.FbxReferencedAsset], None]
         """
 
-        # Check if file exists
-        #
-        if not os.path.isfile(filePath):
-
-            return None
-
-        # Evaluate which asset type to return
-        #
-        stats = os.stat(filePath)
-        fileId = stats.st_ino
-
         if referenced:
 
-            # Check if cache exists
-            #
-            cache = self.referencedAssets.get(fileId, None)
-
-            if stringutils.isNullOrEmpty(cache):
-
-                return []
-
-            # Check if cache is up-to-date
-            #
-            if stats.st_mtime == cache.lastModified:
-
-                return cache.items
-
-            else:
-
-                return []
+            referencedAssets = self.cache.get(filePath, FBX_REFERENCED_ASSET_KEY)
+            return referencedAssets if isinstance(referencedAssets, list) else []
 
         else:
 
-            # Check if cache exists
-            #
-            cache = self.assets.get(fileId, None)
-
-            if not isinstance(cache, AssetCache):
-
-                return None
-
-            # Check if cache is up-to-date
-            #
-            if stats.st_mtime == cache.lastModified:
-
-                return cache.item
-
-            else:
-
-                return None
+            asset = self.cache.get(filePath, FBX_ASSET_KEY)
+            return asset if isinstance(asset, fbxasset.FbxAsset) else None
 
     def loadAsset(self):
         """
@@ -167,18 +109,12 @@ class FbxIO(singleton.Singleton):
             return asset
 
         # Inspect file properties for asset
+        # Unsaved changes are not written to the disk cache since they do not reflect the file on disk!
         #
         sceneProperties = self.scene.fileProperties()
         jsonString = sceneProperties.get(FBX_ASSET_KEY, '')
 
-        asset = jsonutils.loads(jsonString)
-
-        if asset is not None:
-
-            stats = os.stat(filePath)
-            self.assets[stats.st_ino] = AssetCache(item=asset, lastModified=stats.st_mtime)
-
-        return asset
+        return self.cache.loads(filePath, FBX_ASSET_KEY, jsonString, persist=not self.scene.isDirty())
 
     def saveAsset(self, asset):
         """
@@ -239,6 +175,10 @@ class FbxIO(singleton.Singleton):
             #
             exportSet.export(checkout=checkout)
 
+        # Wait for any isolated post-export scripts
+        #
+        fbxscriptpool.__script_pool__.wait()
+
     def loadAssetFromReference(self, reference):
         """
         Returns an asset from a referenced scene file.
@@ -258,7 +198,7 @@ class FbxIO(singleton.Singleton):
         filePath = reference.filePath()
         asset = self.getCachedAsset(filePath)
 
-        if asset is not None:
+        if isinstance(asset, fbxasset.FbxAsset):
 
             return asset
 
@@ -267,14 +207,7 @@ class FbxIO(singleton.Singleton):
         sceneProperties = reference.fileProperties()
         jsonString = sceneProperties.get(FBX_ASSET_KEY, '')
 
-        asset = jsonutils.loads(jsonString)
-
-        if asset is not None:
-
-            stats = os.stat(filePath)
-            self.assets[stats.st_ino] = AssetCache(item=asset, lastModified=stats.st_mtime)
-
-        return asset
+        return self.cache.loads(filePath, FBX_ASSET_KEY, jsonString)
 
     def loadReferencedAssets(self):
         """
@@ -299,19 +232,13 @@ class FbxIO(singleton.Singleton):
             return referencedAssets
 
         # Inspect file properties for asset
+        # Unsaved changes are not written to the disk cache since they do not reflect the file on disk!
         #
         sceneProperties = self.scene.fileProperties()
         defaultString = sceneProperties.get(FBX_SEQUENCERS_KEY, '')
         jsonString = sceneProperties.get(FBX_REFERENCED_ASSET_KEY, defaultString)
 
-        referencedAssets = jsonutils.loads(jsonString, default=[])
-
-        if not stringutils.isNullOrEmpty(referencedAssets):
-
-            stats = os.stat(scenePath)
-            self.assets[stats.st_ino] = ReferencedAssetCache(items=referencedAssets, lastModified=stats.st_mtime)
-
-        return referencedAssets
+        return self.cache.loads(scenePath, FBX_REFERENCED_ASSET_KEY, jsonString, default=[], persist=not self.scene.isDirty())
 
     def saveReferencedAssets(self, referencedAssets):
         """
@@ -338,6 +265,37 @@ class FbxIO(singleton.Singleton):
 
         jsonutils.dump(filePath, referencedAssets)
 
+    def exportRangeTree(self, referencedAssets=None):
+        """
+        Returns an interval tree of the export ranges from the supplied referenced assets.
+        If no referenced assets are supplied then the assets from the current scene are used instead.
+
+        :type referencedAssets: Union[List[fbxreferencedasset.FbxReferencedAsset], None]
+        :rtype: IntervalTree
+        """
+
+        # Check if referenced assets were supplied
+        #
+        if referencedAssets is None:
+
+            referencedAssets = self.loadReferencedAssets()
+
+        # Collect export ranges from valid assets
+        #
+        tree = IntervalTree()
+
+        for referencedAsset in referencedAssets:
+
+            if referencedAsset.isValid():
+
+                tree.update(referencedAsset.exportRanges)
+
+            else:
+
+                continue
+
+        return tree
+
     def exportAnimationFromReferences(self, directory='', checkout=False):
         """
         Tries to export any animation from referenced files.
@@ -420,17 +378,15 @@ class FbxIO(singleton.Singleton):
         #
         for referencedAsset in referencedAssets:
 
-            # Iterate through export-ranges
+            # Check if directory has been overridden
             #
-            for exportRange in referencedAsset.exportRanges:
+            if not stringutils.isNullOrEmpty(directory):
 
-                # Check if directory has been overridden
-                #
-                if not stringutils.isNullOrEmpty(directory):
+                for exportRange in referencedAsset.exportRanges:
 
                     exportRange.directory = directory
 
-                # Export range
-                #
-                exportRange.export(checkout=checkout)
+            # Export ranges
+            #
+            referencedAsset.export(checkout=checkout)
     # endregion
@@ -1,7 +1,9 @@
-from . import fbxbase, fbxio, fbxasset, fbxexportrange
+from . import fbxbase, fbxio, fbxasset, fbxexportrange, fbxserializer, fbxscriptpool
 from ... import fnreference
 from ...python import stringutils
+from ...perforce import p4utils
 from ...collections import notifylist
+from ...collections.intervaltree import IntervalTree
 
 import logging
 logging.basicConfig()
@@ -41,8 +43,8 @@ class FbxReferencedAsset(fbxbase.FbxBase):
 
         # Setup notifies
         #
-        self._exportRanges.addCallback('itemAdded', self.exportRangeAdded)
-        self._exportRanges.addCallback('itemRemoved', self.exportRangeRemoved)
+        self._exportRanges.addCallback('itemsAdded', self.exportRangesAdded)
+        self._exportRanges.addCallback('itemsRemoved', self.exportRangesRemoved)
 
     def __post_init__(self, *args, **kwargs):
         """
@@ -133,33 +135,45 @@ class FbxReferencedAsset(fbxbase.FbxBase):
         :rtype: None
         """
 
-        self._exportRanges.clear()
-        self._exportRanges.extend(exportRanges)
+        with self._exportRanges.batch():
+
+            self._exportRanges.clear()
+            self._exportRanges.extend(exportRanges)
     # endregion
 
     # region Callbacks
-    def exportRangeAdded(self, index, exportRange):
+    def exportRangesAdded(self, indices, exportRanges):
         """
-        Adds a reference of this asset to the supplied export set.
+        Adds a reference of this asset to the supplied export ranges.
+        Since the export-set return type is shared by all export ranges only a single refresh is required!
 
-        :type index: int
-        :type exportRange: fbxexportrange.FbxExportRange
+        :type indices: range
+        :type exportRanges: List[fbxexportrange.FbxExportRange]
         :rtype: None
         """
 
-        exportRange._referencedAsset = self.weakReference()
-        exportRange.refresh()
+        weakReference = self.weakReference()
+
+        for exportRange in exportRanges:
 
-    def exportRangeRemoved(self, exportRange):
+            exportRange._referencedAsset = weakReference
+
+        exportRanges[-1].refresh()
+
+    def exportRangesRemoved(self, indices, exportRanges):
         """
-        Removes the reference of this asset from the supplied export set.
+        Removes the reference of this asset from the supplied export ranges.
 
-        :type exportRange: fbxexportrange.FbxExportRange
+        :type indices: range
+        :type exportRanges: List[fbxexportrange.FbxExportRange]
         :rtype: None
         """
 
-        exportRange._referencedAsset = self.nullWeakReference
-        exportRange.refresh()
+        for exportRange in exportRanges:
+
+            exportRange._referencedAsset = self.nullWeakReference
+
+        exportRanges[-1].refresh()
     # endregion
 
     # region Methods
@@ -188,6 +202,78 @@ class FbxReferencedAsset(fbxbase.FbxBase):
 
             return ''
 
+    def exportRangeTree(self):
+        """
+        Returns an interval tree of the export ranges from this sequencer.
+
+        :rtype: IntervalTree
+        """
+
+        return IntervalTree(self.exportRanges)
+
+    def export(self, checkout=False):
+        """
+        Exports all the export ranges from this sequencer.
+        When using the custom serializer, export ranges that share an export set are sampled together so overlapping frames are only baked once!
+
+        :type checkout: bool
+        :rtype: List[str]
+        """
+
+        # Check if sequencer is valid
+        #
+        if not self.isValid():
+
+            log.error(f'Cannot locate asset associated with: {self.guid}')
+            return []
+
+        # Check which serializer to use
+        # Isolated post-export scripts overlap with the next range so wait for them before returning!
+        #
+        if self.asset.useBuiltinSerializer:
+
+            exportPaths = [exportRange.export(checkout=checkout) for exportRange in self.exportRanges]
+            fbxscriptpool.__script_pool__.wait()
+
+            return exportPaths
+
+        # Group export ranges by export set
+        #
+        groups = {}
+
+        for exportRange in self.exportRanges:
+
+            if exportRange.isValid():
+
+                groups.setdefault(exportRange.exportSetId, []).append(exportRange)
+
+            else:
+
+                log.error(f'Cannot find asset associated with "{exportRange.name}" range!')
+
+        # Serialize each group of export ranges
+        #
+        namespace = self.namespace()
+        asAscii = bool(self.asset.fileType)
+        exportPaths = []
+
+        for exportRanges in groups.values():
+
+            serializer = fbxserializer.FbxSerializer(namespace=namespace)
+            exportPaths.extend(serializer.serializeExportRanges(exportRanges, asAscii=asAscii))
+
+        # Check if files require adding
+        #
+        if checkout and p4utils.isInstalled():
+
+            for exportPath in exportPaths:
+
+                if not stringutils.isNullOrEmpty(exportPath):
+
+                    p4utils.smartCheckout(exportPath)
+
+        return exportPaths
+
     def invalidate(self):
         """
         Invalidates all the dynamic components that make up this sequencer.
@@ -256,10 +342,13 @@ class FbxReferencedAsset(fbxbase.FbxBase):
         """
 
         # Refresh export-ranges
+        # Since the export-set return type is shared by all export ranges only a single refresh is required!
         #
-        for exportRange in self.exportRanges:
+        numExportRanges = len(self.exportRanges)
+
+        if numExportRanges > 0:
 
-            exportRange.refresh()
+            self.exportRanges[-1].refresh()
 
         return True
     # endregion
@@ -0,0 +1,170 @@
+import time
+
+from concurrent import futures
+from functools import partial
+from multiprocessing import get_context
+from ...python import importutils, piputils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def executeFile(filePath, exportPath=''):
+    """
+    Executes the supplied python file inside a worker process and returns the elapsed time.
+    The export path is made available to the script through the `exportPath` global!
+
+    :type filePath: str
+    :type exportPath: str
+    :rtype: float
+    """
+
+    startTime = time.perf_counter()
+    importutils.executeFile(filePath, __globals__={'exportPath': exportPath})
+
+    return time.perf_counter() - startTime
+
+
+class FbxScriptPool(object):
+    """
+    Class used to execute custom scripts in a pool of worker processes.
+    Since scripts are executed outside the DCC, they can only operate on files such as the exported fbx file!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_executor', '_maxWorkers', '_pending')
+
+    def __init__(self, maxWorkers=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type maxWorkers: Union[int, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FbxScriptPool, self).__init__()
+
+        # Declare private variables
+        #
+        self._executor = None
+        self._maxWorkers = maxWorkers
+        self._pending = []
+    # endregion
+
+    # region Methods
+    def executor(self):
+        """
+        Returns the process pool executor.
+        The executor is created on demand using the python interpreter for this DCC platform.
+
+        :rtype: futures.ProcessPoolExecutor
+        """
+
+        # Check if executor already exists
+        #
+        if self._executor is not None:
+
+            return self._executor
+
+        # Spawn processes using the DCC's python interpreter
+        # Otherwise, each worker would launch another instance of the DCC!
+        #
+        context = get_context('spawn')
+
+        try:
+
+            context.set_executable(piputils.getPythonInterpreter())
+
+        except RuntimeError as exception:
+
+            log.debug(exception)
+
+        self._executor = futures.ProcessPoolExecutor(max_workers=self._maxWorkers, mp_context=context)
+        return self._executor
+
+    def submit(self, filePath, exportPath=''):
+        """
+        Submits the supplied python file for execution and returns the future.
+
+        :type filePath: str
+        :type exportPath: str
+        :rtype: futures.Future
+        """
+
+        future = self.executor().submit(executeFile, filePath, exportPath=exportPath)
+        future.add_done_callback(partial(self.scriptCompleted, filePath))
+
+        self._pending.append(future)
+
+        return future
+
+    def scriptCompleted(self, filePath, future):
+        """
+        Callback method that reports the outcome of an executed script.
+
+        :type filePath: str
+        :type future: futures.Future
+        :rtype: None
+        """
+
+        exception = future.exception()
+
+        if exception is not None:
+
+            log.error(f'Unable to execute isolated script: {filePath} ({exception})')
+
+        else:
+
+            log.info(f'Executed isolated script: {filePath}, in {future.result():.3f} secs.')
+
+    def pending(self):
+        """
+        Returns the number of scripts that have yet to complete.
+
+        :rtype: int
+        """
+
+        return sum(1 for future in self._pending if not future.done())
+
+    def wait(self, timeout=None):
+        """
+        Waits for all the submitted scripts to complete.
+        The return value indicates whether every script executed successfully.
+
+        :type timeout: Union[float, None]
+        :rtype: bool
+        """
+
+        # Check if there are any pending scripts
+        #
+        if len(self._pending) == 0:
+
+            return True
+
+        # Wait for scripts to complete
+        #
+        done, notDone = futures.wait(self._pending, timeout=timeout)
+        self._pending = list(notDone)
+
+        return len(notDone) == 0 and all(future.exception() is None for future in done)
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker processes.
+
+        :type wait: bool
+        :rtype: None
+        """
+
+        if self._executor is not None:
+
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+    # endregion
+
+
+__script_pool__ = FbxScriptPool()
@@ -1,11 +1,15 @@
 import os
 import math
+import tempfile
 import fbx
 import FbxCommon
 
 from itertools import chain
 from ... import __application__, DCC, fnscene, fnnode, fntransform, fnmesh, fnskin
-from ...python import stringutils
+from ...python import stringutils, importutils
+from ...math import keyreduction, rotationmath
+from ...collections.intervaltree import IntervalTree
+from ...dataclasses.interval import Interval
 from ...generators.inclusiverange import inclusiveRange
 
 import logging
@@ -14,6 +18,9 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
 def getEnumMember(obj, member, cls=None):
     """
     Returns the enum member value from the supplied object.
@@ -35,6 +42,72 @@ def getEnumMember(obj, member, cls=None):
         return getattr(cls, member)
 
 
+def compareFbxFiles(filePath, otherPath, interval, tolerance=1e-3):
+    """
+    Evaluates if the local transforms from the supplied fbx files match over the specified interval.
+    Nodes are paired by name and any unpaired nodes are considered a mismatch!
+
+    :type filePath: str
+    :type otherPath: str
+    :type interval: Interval
+    :type tolerance: float
+    :rtype: bool
+    """
+
+    # Load fbx scenes
+    #
+    fbxManager, fbxScene = FbxCommon.InitializeSdkObjects()
+    otherScene = fbx.FbxScene.Create(fbxManager, 'Other')
+
+    try:
+
+        if not (FbxCommon.LoadScene(fbxManager, fbxScene, filePath) and FbxCommon.LoadScene(fbxManager, otherScene, otherPath)):
+
+            log.warning(f'Unable to load FBX files: {filePath}, {otherPath}')
+            return False
+
+        # Pair nodes by name
+        #
+        fbxNodes = {fbxScene.GetNode(i).GetName(): fbxScene.GetNode(i) for i in range(fbxScene.GetNodeCount())}
+        otherNodes = {otherScene.GetNode(i).GetName(): otherScene.GetNode(i) for i in range(otherScene.GetNodeCount())}
+
+        if fbxNodes.keys() != otherNodes.keys():
+
+            return False
+
+        # Compare local transforms on each frame
+        #
+        timeMode = fbxScene.GetGlobalSettings().GetTimeMode()
+        time = fbx.FbxTime()
+
+        for frame in interval:
+
+            if isinstance(frame, int):
+
+                time.SetFrame(frame, timeMode)
+
+            else:
+
+                time.SetFramePrecise(frame, timeMode)
+
+            for (name, fbxNode) in fbxNodes.items():
+
+                matrix = fbxNode.EvaluateLocalTransform(time)
+                otherMatrix = otherNodes[name].EvaluateLocalTransform(time)
+
+                for (row, column) in ((row, column) for row in range(4) for column in range(4)):
+
+                    if abs(matrix.Get(row, column) - otherMatrix.Get(row, column)) > tolerance:
+
+                        return False
+
+        return True
+
+    finally:
+
+        fbxManager.Destroy()
+
+
 class FbxSerializer(object):
     """
     Base class used for composing fbx files from DCC scene nodes.
@@ -87,6 +160,27 @@ class FbxSerializer(object):
         'zyx': getEnumMember(fbx, 'eEulerZYX', cls=fbx.EFbxRotationOrder)
     }
 
+    __root_properties__ = (
+        'LclTranslation',
+        'LclRotation',
+        'LclScaling',
+        'RotationPivot',
+        'PreRotation',
+        'PostRotation'
+    )
+
+    __channels__ = {
+        'translateX': ('LclTranslation', 'X'),
+        'translateY': ('LclTranslation', 'Y'),
+        'translateZ': ('LclTranslation', 'Z'),
+        'rotateX': ('LclRotation', 'X'),
+        'rotateY': ('LclRotation', 'Y'),
+        'rotateZ': ('LclRotation', 'Z'),
+        'scaleX': ('LclScaling', 'X'),
+        'scaleY': ('LclScaling', 'Y'),
+        'scaleZ': ('LclScaling', 'Z')
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -278,7 +372,7 @@ class FbxSerializer(object):
         fbxProperty = fbxNode.FindProperty('handle')
         handle = int(str(fbx.FbxPropertyString(fbxProperty).Get()))
 
-        return fnnode.FnNode.getNodeByHandle(handle)
+        return fnnode.FnNode.findNodeByHandle(handle)
 
     def allocateFbxNodes(self, *nodes):
         """
@@ -390,6 +484,45 @@ class FbxSerializer(object):
             childNode.PostRotation.Set(fbx.FbxDouble3(0.0, 0.0, 0.0))
             childNode.LclScaling.Set(fbx.FbxDouble3(scale.x, scale.y, scale.z))
 
+    def getRootTransforms(self):
+        """
+        Returns the static transform properties from all the root objects.
+        These properties are modified by `moveToOrigin` so they can be restored between export ranges!
+
+        :rtype: List[Tuple[fbx.FbxNode, Dict[str, Tuple[float, float, float]]]]
+        """
+
+        rootNode = self.fbxScene.GetRootNode()
+        rootTransforms = []
+
+        for i in range(rootNode.GetChildCount()):
+
+            childNode = rootNode.GetChild(i)
+            properties = {}
+
+            for name in self.__root_properties__:
+
+                value = getattr(childNode, name).Get()
+                properties[name] = (value[0], value[1], value[2])
+
+            rootTransforms.append((childNode, properties))
+
+        return rootTransforms
+
+    def setRootTransforms(self, rootTransforms):
+        """
+        Updates the static transform properties on the supplied root objects.
+
+        :type rootTransforms: List[Tuple[fbx.FbxNode, Dict[str, Tuple[float, float, float]]]]
+        :rtype: None
+        """
+
+        for (childNode, properties) in rootTransforms:
+
+            for (name, value) in properties.items():
+
+                getattr(childNode, name).Set(fbx.FbxDouble3(*value))
+
     def copyTransform(self, copyFrom, copyTo, **kwargs):
         """
         Copies the local transform values from the supplied scene node to the specified fbx node.
@@ -817,14 +950,43 @@ class FbxSerializer(object):
 
         return fbxTime
 
-    def bakeFbxNode(self, fbxNode, time=None, animLayer=None, **kwargs):
+    def getFbxAnimCurve(self, fbxNode, name, animLayer=None):
         """
-        Keys the individual translate, rotate and scale components at the specified time.
+        Returns the anim-curve for the specified channel from the supplied FBX node.
+        Any channels that do not correspond to a transform component are assumed to be custom attributes!
 
         :type fbxNode: fbx.FbxNode
-        :type time: fbx.FbxTime
+        :type name: str
         :type animLayer: fbx.FbxAnimLayer
-        :rtype: None
+        :rtype: fbx.FbxAnimCurve
+        """
+
+        # Check if this is a transform component
+        #
+        channel = self.__channels__.get(name, None)
+        animCurve = None
+
+        if channel is not None:
+
+            propertyName, axis = channel
+            fbxProperty = getattr(fbxNode, propertyName)
+            animCurve = fbxProperty.GetCurve(animLayer, axis, True)
+
+        else:
+
+            fbxProperty = fbxNode.FindProperty(name)
+            animCurve = fbxProperty.GetCurve(animLayer, True)
+
+        animCurve.SetName(f'{fbxNode.GetName()}_anim_{name}')
+
+        return animCurve
+
+    def sampleFbxNode(self, fbxNode, **kwargs):
+        """
+        Returns the individual translate, rotate and scale components, and any animatable custom attributes, at the current time.
+
+        :type fbxNode: fbx.FbxNode
+        :rtype: Dict[str, float]
         """
 
         # Get local transform matrix
@@ -842,21 +1004,13 @@ class FbxSerializer(object):
         #
         names = ('translate', 'rotate', 'scale')
         values = (translation, eulerAngles, scale)
-        interpolationType = getEnumMember(fbx.FbxAnimCurveDef, 'eInterpolationLinear', cls=fbx.FbxAnimCurveDef.EInterpolationType)
+        samples = {}
 
-        for (i, fbxProperty) in enumerate([fbxNode.LclTranslation, fbxNode.LclRotation, fbxNode.LclScaling]):
+        for (i, name) in enumerate(names):
 
-            # Iterate through each axis
-            #
             for (j, axis) in enumerate(['X', 'Y', 'Z']):
 
-                animCurve = fbxProperty.GetCurve(animLayer, axis, True)
-                animCurve.SetName(f'{fbxNode.GetName()}_anim_{names[i]}{axis}')
-
-                animCurve.KeyModifyBegin()
-                keyIndex, lastIndex = animCurve.KeyAdd(time)
-                animCurve.KeySet(keyIndex, time, values[i][j], interpolationType)
-                animCurve.KeyModifyEnd()
+                samples[f'{name}{axis}'] = values[i][j]
 
         # Iterate through custom attributes
         #
@@ -880,16 +1034,306 @@ class FbxSerializer(object):
 
                 continue
 
+            samples[attributeName] = joint.getAttr(attributeName)
+
+        return samples
+
+    def bakeFbxNode(self, fbxNode, time=None, animLayer=None, **kwargs):
+        """
+        Keys the individual translate, rotate and scale components at the specified time.
+
+        :type fbxNode: fbx.FbxNode
+        :type time: fbx.FbxTime
+        :type animLayer: fbx.FbxAnimLayer
+        :rtype: None
+        """
+
+        samples = self.sampleFbxNode(fbxNode, **kwargs)
+        self.keyFbxNode(fbxNode, samples, time=time, animLayer=animLayer)
+
+    def keyFbxNode(self, fbxNode, samples, time=None, animLayer=None):
+        """
+        Keys the supplied channel samples at the specified time.
+
+        :type fbxNode: fbx.FbxNode
+        :type samples: Dict[str, float]
+        :type time: fbx.FbxTime
+        :type animLayer: fbx.FbxAnimLayer
+        :rtype: None
+        """
+
+        # Iterate through sampled channels
+        #
+        interpolationType = getEnumMember(fbx.FbxAnimCurveDef, 'eInterpolationLinear', cls=fbx.FbxAnimCurveDef.EInterpolationType)
+
+        for (name, value) in samples.items():
+
             # Update anim-curve
             #
-            animCurve = fbxProperty.GetCurve(animLayer, True)
-            animCurve.SetName(f'{fbxNode.GetName()}_anim_{attributeName}')
+            animCurve = self.getFbxAnimCurve(fbxNode, name, animLayer=animLayer)
 
             animCurve.KeyModifyBegin()
             keyIndex, lastIndex = animCurve.KeyAdd(time)
-            animCurve.KeySet(keyIndex, time, joint.getAttr(attributeName), interpolationType)
+            animCurve.KeySet(keyIndex, time, value, interpolationType)
+            animCurve.KeyModifyEnd()
+
+    def getChannelTolerance(self, name, **kwargs):
+        """
+        Returns the key reduction tolerance for the specified channel.
+
+        :type name: str
+        :key translateTolerance: float
+        :key rotateTolerance: float
+        :key scaleTolerance: float
+        :key attributeTolerance: float
+        :rtype: float
+        """
+
+        if name.startswith('translate'):
+
+            return kwargs.get('translateTolerance', 1e-3)
+
+        elif name.startswith('rotate'):
+
+            return kwargs.get('rotateTolerance', 1e-2)
+
+        elif name.startswith('scale'):
+
+            return kwargs.get('scaleTolerance', 1e-4)
+
+        else:
+
+            return kwargs.get('attributeTolerance', 1e-3)
+
+    def unwrapRotations(self, channels, rows):
+        """
+        Unwraps the sampled rotation channels, in place, so that each node's euler angles remain continuous over time.
+        Nodes that share a rotation order are unwrapped together.
+
+        :type channels: List[Tuple[fbx.FbxNode, str]]
+        :type rows: numpy.ndarray
+        :rtype: None
+        """
+
+        # Group rotation rows by node
+        #
+        lookup = {(fbxNode.GetUniqueID(), name): i for (i, (fbxNode, name)) in enumerate(channels)}
+        groups = {}
+
+        for fbxNode in {fbxNode.GetUniqueID(): fbxNode for (fbxNode, name) in channels}.values():
+
+            indices = [lookup.get((fbxNode.GetUniqueID(), f'rotate{axis}'), None) for axis in ('X', 'Y', 'Z')]
+
+            if any(index is None for index in indices):
+
+                continue
+
+            rotationOrder = fntransform.FnTransform(self.getAssociatedNode(fbxNode)).rotationOrder()
+            groups.setdefault(rotationOrder.lower(), []).append(indices)
+
+        # Unwrap each group of rotations
+        #
+        for (rotationOrder, indices) in groups.items():
+
+            indices = numpy.asarray(indices, dtype=int)
+            angles = numpy.radians(rows[indices].transpose(2, 0, 1))
+
+            rows[indices] = numpy.degrees(rotationmath.unwrapEuler(angles, order=rotationOrder)).transpose(1, 2, 0)
+
+    def bakeReducedAnimation(self, fbxNodes, frames, samples, animLayer=None, timeMode=None, **kwargs):
+        """
+        Reduces the supplied per-frame samples and keys the resulting curves on the supplied FBX nodes.
+        Every channel is reduced at once before any keys are written.
+
+        :type fbxNodes: List[fbx.FbxNode]
+        :type frames: List[Union[int, float]]
+        :type samples: List[List[Dict[str, float]]]
+        :type animLayer: fbx.FbxAnimLayer
+        :type timeMode: fbx.FbxTime.EMode
+        :rtype: None
+        """
+
+        # Collect channels from samples
+        #
+        channels, rows, tolerances = [], [], []
+
+        for (fbxNode, nodeSamples) in zip(fbxNodes, samples):
+
+            names = nodeSamples[0].keys() if len(nodeSamples) > 0 else []
+
+            for name in names:
+
+                channels.append((fbxNode, name))
+                rows.append([float(sample.get(name, 0.0)) for sample in nodeSamples])
+                tolerances.append(self.getChannelTolerance(name, **kwargs))
+
+        numChannels = len(channels)
+
+        if numChannels == 0:
+
+            return
+
+        # Unwrap rotations to remove any euler flips before reducing
+        #
+        rows = numpy.asarray(rows, dtype=float)
+        self.unwrapRotations(channels, rows)
+
+        # Reduce channels
+        #
+        curves = keyreduction.reduceSamples(frames, rows, tolerances)
+        log.info(f'Reduced {numChannels * len(frames)} sample(s) to {curves.numKeys()} key(s).')
+
+        # Iterate through reduced curves
+        # FBX tangent slopes are measured in value per second!
+        #
+        if timeMode is None:
+
+            timeMode = self.fbxScene.GetGlobalSettings().GetTimeMode()
+
+        frameRate = fbx.FbxTime.GetFrameRate(timeMode)
+        interpolationType = getEnumMember(fbx.FbxAnimCurveDef, 'eInterpolationCubic', cls=fbx.FbxAnimCurveDef.EInterpolationType)
+        tangentMode = getEnumMember(fbx.FbxAnimCurveDef, 'eTangentUser', cls=fbx.FbxAnimCurveDef.ETangentMode)
+
+        for (i, (fbxNode, name)) in enumerate(channels):
+
+            # Collect keys from curve
+            #
+            start, end = int(curves.offsets[i]), int(curves.offsets[i + 1])
+            times = curves.times[start:end].tolist()
+            values = curves.values[start:end].tolist()
+            inSlopes = (curves.inTangents[start:end, 1] * frameRate).tolist()
+            outSlopes = (curves.outTangents[start:end, 1] * frameRate).tolist()
+
+            # Update anim-curve
+            #
+            animCurve = self.getFbxAnimCurve(fbxNode, name, animLayer=animLayer)
+            animCurve.KeyModifyBegin()
+
+            numKeys = end - start
+
+            for j in range(numKeys):
+
+                time = self.convertFrameToTime(times[j], timeMode=timeMode)
+                nextInSlope = inSlopes[j + 1] if (j + 1) < numKeys else 0.0
+
+                keyIndex, lastIndex = animCurve.KeyAdd(time)
+                animCurve.KeySet(keyIndex, time, values[j], interpolationType, tangentMode, outSlopes[j], nextInSlope)
+
             animCurve.KeyModifyEnd()
 
+    def sampleAnimation(self, fbxNodes, intervals, **kwargs):
+        """
+        Samples the supplied FBX nodes over the union of the specified intervals.
+        Frames shared by overlapping intervals are only sampled once!
+
+        :type fbxNodes: List[fbx.FbxNode]
+        :type intervals: List[Interval]
+        :rtype: Tuple[List[Union[int, float]], List[List[Dict[str, float]]]]
+        """
+
+        # Collect frames from intervals
+        #
+        tree = IntervalTree(intervals)
+        frames = tree.frames()
+
+        samples = [[] for fbxNode in fbxNodes]
+        index, numFrames = 0, len(frames)
+
+        # Iterate through merged intervals
+        #
+        for interval in tree.union():
+
+            # Step through pre-roll
+            # This is here to support nodes that utilize internal caching!
+            #
+            cls = type(interval.step)
+            frameRange = cls(interval.endTime - interval.startTime)
+
+            for frame in inclusiveRange(cls(interval.startTime - frameRange), cls(interval.startTime), interval.step):
+
+                if frame < interval.startTime:
+
+                    self.scene.setTime(frame)
+
+            # Sample frames within interval
+            #
+            while index < numFrames and frames[index] <= interval.endTime:
+
+                self.scene.setTime(frames[index])
+
+                for (i, fbxNode) in enumerate(fbxNodes):
+
+                    samples[i].append(self.sampleFbxNode(fbxNode, **kwargs))
+
+                index += 1
+
+        return frames, samples
+
+    def keyAnimation(self, fbxNodes, frames, samples, animLayer=None, timeMode=None, **kwargs):
+        """
+        Keys the supplied per-frame samples on the supplied FBX nodes.
+
+        :type fbxNodes: List[fbx.FbxNode]
+        :type frames: List[Union[int, float]]
+        :type samples: List[List[Dict[str, float]]]
+        :type animLayer: fbx.FbxAnimLayer
+        :type timeMode: fbx.FbxTime.EMode
+        :key reduceKeys: bool
+        :rtype: None
+        """
+
+        # Check if samples should be reduced
+        #
+        if timeMode is None:
+
+            timeMode = self.fbxScene.GetGlobalSettings().GetTimeMode()
+
+        reduceKeys = kwargs.get('reduceKeys', False)
+
+        if reduceKeys:
+
+            self.bakeReducedAnimation(fbxNodes, frames, samples, animLayer=animLayer, timeMode=timeMode, **kwargs)
+            return
+
+        # Iterate through frames
+        #
+        for (i, frame) in enumerate(frames):
+
+            time = self.convertFrameToTime(frame, timeMode=timeMode)
+
+            for (fbxNode, nodeSamples) in zip(fbxNodes, samples):
+
+                self.keyFbxNode(fbxNode, nodeSamples[i], time=time, animLayer=animLayer)
+
+    def clearAnimation(self, animLayer=None):
+        """
+        Removes all keys from the supplied animation layer.
+
+        :type animLayer: fbx.FbxAnimLayer
+        :rtype: None
+        """
+
+        # Check if anim-layer was supplied
+        #
+        if animLayer is None:
+
+            animLayer = self.fbxAnimLayer
+
+        # Iterate through anim-curve nodes
+        #
+        criteria = fbx.FbxCriteria.ObjectType(fbx.FbxAnimCurveNode.ClassId)
+        curveNodeCount = animLayer.GetSrcObjectCount(criteria)
+
+        for i in range(curveNodeCount):
+
+            animCurveNode = animLayer.GetSrcObject(criteria, i)
+
+            for channel in range(animCurveNode.GetChannelsCount()):
+
+                for j in range(animCurveNode.GetCurveCount(channel)):
+
+                    animCurveNode.GetCurve(channel, j).KeyClear()
+
     def bakeAnimation(self, *fbxNodes, startFrame=0, endFrame=1, step=1, **kwargs):
         """
         Bakes the transform components on the supplied joints over the specified time.
@@ -898,6 +1342,7 @@ class FbxSerializer(object):
         :type startFrame: int
         :type endFrame: int
         :type step: Union[int, float]
+        :key reduceKeys: bool
         :rtype: None
         """
 
@@ -906,34 +1351,14 @@ class FbxSerializer(object):
         self.scene.suspendViewport()
         log.info(f'Exporting range: {startFrame} : {endFrame} @ {step} step.')
 
-        # Iterate through time range
+        # Sample and key time range
         #
         timeMode = self.fbxScene.GetGlobalSettings().GetTimeMode()
         animStack = self.fbxScene.GetCurrentAnimationStack()  # type: fbx.FbxAnimStack
         animLayer = animStack.GetMember(0)
 
-        cls = type(step)
-        frameRange = cls(endFrame - startFrame)
-
-        for frame in inclusiveRange(cls(startFrame - frameRange), cls(endFrame), step):
-
-            # Update current time
-            #
-            self.scene.setTime(frame)
-
-            if startFrame <= frame <= endFrame:
-
-                # Iterate through joints
-                #
-                time = self.convertFrameToTime(frame, timeMode=timeMode)
-
-                for fbxNode in fbxNodes:
-
-                    self.bakeFbxNode(fbxNode, time=time, animLayer=animLayer, **kwargs)
-
-            else:
-
-                continue  # This is here to support nodes that utilize internal caching!
+        frames, samples = self.sampleAnimation(fbxNodes, [Interval(startFrame, endFrame, step)], **kwargs)
+        self.keyAnimation(fbxNodes, frames, samples, animLayer=animLayer, timeMode=timeMode, **kwargs)
 
         # Enable redraw
         #
@@ -1382,12 +1807,33 @@ class FbxSerializer(object):
 
         return self.saveAs(exportPath, asAscii=asAscii)
 
-    def serializeExportRange(self, exportRange, asAscii=False):
+    def getExportPath(self, exportRange, directory=''):
+        """
+        Returns the export path for the supplied export range.
+        If a directory is supplied then the export path is redirected to that directory instead.
+
+        :type exportRange: dcc.fbx.libs.fbxexportrange.FbxExportRange
+        :type directory: str
+        :rtype: str
+        """
+
+        exportPath = exportRange.exportPath()
+
+        if not stringutils.isNullOrEmpty(directory):
+
+            return os.path.join(directory, os.path.basename(exportPath))
+
+        else:
+
+            return exportPath
+
+    def serializeExportRange(self, exportRange, asAscii=False, directory=''):
         """
         Serializes the nodes from the supplied export range.
 
         :type exportRange: dcc.fbx.libs.fbxexportrange.FbxExportRange
         :type asAscii: bool
+        :type directory: str
         :rtype: str
         """
 
@@ -1409,7 +1855,8 @@ class FbxSerializer(object):
             startFrame=startFrame,
             endFrame=endFrame,
             step=step,
-            globalScale=globalScale
+            globalScale=globalScale,
+            reduceKeys=exportRange.reduceKeys
         )
 
         # Check if skeleton should be moved to origin
@@ -1420,12 +1867,140 @@ class FbxSerializer(object):
 
         # Save changes
         #
-        exportPath = exportRange.exportPath()
+        exportPath = self.getExportPath(exportRange, directory=directory)
         self.scene.ensureDirectory(exportPath)
         self.scene.ensureWritable(exportPath)
 
         return self.saveAs(exportPath, asAscii=asAscii)
 
+    def serializeExportRanges(self, exportRanges, asAscii=False, directory=''):
+        """
+        Serializes the nodes from the supplied export ranges.
+        The export ranges are expected to share the same export set!
+        Each frame within the union of the ranges is only sampled once, with every range being keyed from these samples.
+
+        :type exportRanges: List[dcc.fbx.libs.fbxexportrange.FbxExportRange]
+        :type asAscii: bool
+        :type directory: str
+        :rtype: List[str]
+        """
+
+        # Check if there are enough export ranges
+        #
+        numExportRanges = len(exportRanges)
+
+        if numExportRanges == 0:
+
+            return []
+
+        elif numExportRanges == 1:
+
+            return [self.serializeExportRange(exportRanges[0], asAscii=asAscii, directory=directory)]
+
+        else:
+
+            pass
+
+        # Serialize skeleton from shared export set
+        #
+        exportSet = exportRanges[0].exportSet()
+        globalScale = float(exportSet.scale)
+
+        fbxNodes = self.serializeSkeleton(exportSet.skeleton, globalScale=globalScale)
+
+        # Sample union of export ranges
+        #
+        intervals = [exportRange.interval() for exportRange in exportRanges]
+        span = IntervalTree(intervals).span()
+
+        self.scene.suspendViewport()
+        log.info(f'Sampling {numExportRanges} export ranges: {span.startTime} : {span.endTime}')
+
+        self.updateTimeRange(span.startTime, span.endTime)
+        frames, samples = self.sampleAnimation(fbxNodes, intervals, globalScale=globalScale)
+        lookup = {frame: i for (i, frame) in enumerate(frames)}
+
+        self.scene.resumeViewport()
+
+        # Iterate through export ranges
+        # Root transforms are restored before each range in case a previous range moved them to origin!
+        #
+        rootTransforms = self.getRootTransforms()
+        timeMode = self.fbxScene.GetGlobalSettings().GetTimeMode()
+        exportPaths = []
+
+        for (exportRange, interval) in zip(exportRanges, intervals):
+
+            # Key slice of samples
+            #
+            rangeFrames = list(interval)
+            indices = [lookup[frame] for frame in rangeFrames]
+            rangeSamples = [[nodeSamples[index] for index in indices] for nodeSamples in samples]
+
+            self.setRootTransforms(rootTransforms)
+            self.clearAnimation()
+            self.updateTimeRange(interval.startTime, interval.endTime)
+            self.keyAnimation(
+                fbxNodes,
+                rangeFrames,
+                rangeSamples,
+                animLayer=self.fbxAnimLayer,
+                timeMode=timeMode,
+                globalScale=globalScale,
+                reduceKeys=exportRange.reduceKeys
+            )
+
+            # Check if skeleton should be moved to origin
+            #
+            if exportRange.moveToOrigin:
+
+                self.moveToOrigin()
+
+            # Save changes
+            #
+            exportPath = self.getExportPath(exportRange, directory=directory)
+            self.scene.ensureDirectory(exportPath)
+            self.scene.ensureWritable(exportPath)
+
+            exportPaths.append(self.saveAs(exportPath, asAscii=asAscii))
+
+        return exportPaths
+
+    def verifyExportRanges(self, exportRanges, tolerance=1e-3):
+        """
+        Verifies that serializing the supplied export ranges together matches serializing each range on its own.
+        Ranges that move to origin are serialized first so that any leftover root transforms would affect the ranges that follow!
+        The files are written to temporary directories and the names of any mismatched ranges are returned.
+
+        :type exportRanges: List[dcc.fbx.libs.fbxexportrange.FbxExportRange]
+        :type tolerance: float
+        :rtype: List[str]
+        """
+
+        # Serialize export ranges together
+        #
+        exportRanges = sorted(exportRanges, key=lambda exportRange: not exportRange.moveToOrigin)
+
+        groupDirectory = tempfile.mkdtemp(prefix='group')
+        groupPaths = self.serializeExportRanges(exportRanges, directory=groupDirectory)
+
+        # Serialize export ranges individually and compare
+        #
+        singleDirectory = tempfile.mkdtemp(prefix='single')
+        mismatches = []
+
+        for (exportRange, groupPath) in zip(exportRanges, groupPaths):
+
+            serializer = self.__class__(namespace=self.namespace)
+            singlePath = serializer.serializeExportRange(exportRange, directory=singleDirectory)
+
+            if not compareFbxFiles(groupPath, singlePath, exportRange.interval(), tolerance=tolerance):
+
+                log.warning(f'Grouped export does not match single export for "{exportRange.name}" range!')
+                mismatches.append(exportRange.name)
+
+        return mismatches
+
     def saveAs(self, filePath, asAscii=False):
         """
         Commits the fbx scene to the specified file path.
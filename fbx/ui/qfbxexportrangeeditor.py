@@ -481,6 +481,11 @@ class QFbxExportRangeEditor(qsingletonwindow.QSingletonWindow):
 
             self._notifies.addPostFileOpenNotify(self.sceneChanged)
 
+        # Enable reference graph
+        # This avoids re-tracing the scene references whenever the referenced assets are invalidated!
+        #
+        fnreference.FnReference.enableReferenceGraph()
+
         # Invalidate user interface
         #
         self.sceneChanged()
@@ -500,6 +505,10 @@ class QFbxExportRangeEditor(qsingletonwindow.QSingletonWindow):
 
             self._notifies.clear()
 
+        # Disable reference graph
+        #
+        fnreference.FnReference.disableReferenceGraph()
+
     def saveSettings(self, settings):
         """
         Saves the user settings.
@@ -867,6 +876,8 @@ class QFbxExportRangeEditor(qsingletonwindow.QSingletonWindow):
 
                 self.selectedReferencedAsset.exportRanges[row].startFrame = self.scene.getStartTime()
 
+            self.referencedAssetItemModel.invalidate()
+
         else:
 
             row = selectedRows[0]
@@ -900,6 +911,8 @@ class QFbxExportRangeEditor(qsingletonwindow.QSingletonWindow):
 
                 self.selectedReferencedAsset.exportRanges[row].endFrame = self.scene.getEndTime()
 
+            self.referencedAssetItemModel.invalidate()
+
         else:
 
             row = selectedRows[0]
@@ -934,6 +947,8 @@ class QFbxExportRangeEditor(qsingletonwindow.QSingletonWindow):
                 self.selectedReferencedAsset.exportRanges[row].startFrame = self.scene.getStartTime()
                 self.selectedReferencedAsset.exportRanges[row].endFrame = self.scene.getEndTime()
 
+            self.referencedAssetItemModel.invalidate()
+
         else:
 
             row = selectedRows[0]
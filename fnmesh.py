@@ -1,18 +1,17 @@
 from . import __executable__, __application__, DCC
-
-
-if __application__ == DCC.MAYA:
-
-    from .maya.fnmesh import *
-
-elif __application__ == DCC.MAX:
-
-    from .max.fnmesh import *
-
-elif __application__ == DCC.BLENDER:
-
-    from .blender.fnmesh import *
-
-else:
-
-    raise ModuleNotFoundError(f'Unable to import DCC mesh-helpers for: {__executable__}!')
+from .python import importutils
+
+
+__backends__ = {
+    DCC.MAYA: '.maya.fnmesh',
+    DCC.MAX: '.max.fnmesh',
+    DCC.BLENDER: '.blender.fnmesh',
+    DCC.HEADLESS: '.headless.fnmesh'
+}
+
+__getattr__, __dir__ = importutils.lazyImport(
+    __backends__.get(__application__, None),
+    package=__package__,
+    message=f'Unable to import DCC mesh-helpers for: {__executable__}!',
+    __globals__=globals()
+)
@@ -1,18 +1,16 @@
 from . import __executable__, __application__, DCC
+from .python import importutils
 
 
-if __application__ == DCC.MAYA:
+__backends__ = {
+    DCC.MAYA: '.maya.fnnode',
+    DCC.MAX: '.max.fnnode',
+    DCC.BLENDER: '.blender.fnnode'
+}
 
-    from .maya.fnnode import *
-
-elif __application__ == DCC.MAX:
-
-    from .max.fnnode import *
-
-elif __application__ == DCC.BLENDER:
-
-    from .blender.fnnode import *
-
-else:
-
-    raise ModuleNotFoundError(f'Unable to import DCC node-helpers for: {__executable__}!')
+__getattr__, __dir__ = importutils.lazyImport(
+    __backends__.get(__application__, None),
+    package=__package__,
+    message=f'Unable to import DCC node-helpers for: {__executable__}!',
+    __globals__=globals()
+)
@@ -1,21 +1,22 @@
-from . import __executable__, __application__, DCC
-
-
-if __application__ == DCC.MAYA:
-
-    from .maya.fnreference import *
+import inspect
 
-elif __application__ == DCC.MAX:
-
-    from .max.fnreference import *
-
-elif __application__ == DCC.BLENDER:
+from . import __executable__, __application__, DCC
+from .abstract import afnreference
+from .python import importutils
 
-    from .blender.fnreference import *
 
-else:
+__backends__ = {
+    DCC.MAYA: '.maya.fnreference',
+    DCC.MAX: '.max.fnreference',
+    DCC.BLENDER: '.blender.fnreference'
+}
 
-    raise ModuleNotFoundError(f'Unable to import DCC reference-helpers for: {__executable__}!')
+__getattr__, __dir__ = importutils.lazyImport(
+    __backends__.get(__application__, None),
+    package=__package__,
+    message=f'Unable to import DCC reference-helpers for: {__executable__}!',
+    __globals__=globals()
+)
 
 
 def overrideFunctionSet(cls):
@@ -37,7 +38,7 @@ def overrideFunctionSet(cls):
     #
     if issubclass(cls, afnreference.AFnReference):
 
-        __dict__['FnReference'] = cls
+        globals()['FnReference'] = cls
 
     else:
 
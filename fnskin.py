@@ -1,18 +1,17 @@
 from . import __executable__, __application__, DCC
-
-
-if __application__ == DCC.MAYA:
-
-    from .maya.fnskin import *
-
-elif __application__ == DCC.MAX:
-
-    from .max.fnskin import *
-
-elif __application__ == DCC.BLENDER:
-
-    from .blender.fnskin import *
-
-else:
-
-    raise ModuleNotFoundError(f'Unable to import DCC skin-helpers for: {__executable__}!')
+from .python import importutils
+
+
+__backends__ = {
+    DCC.MAYA: '.maya.fnskin',
+    DCC.MAX: '.max.fnskin',
+    DCC.BLENDER: '.blender.fnskin',
+    DCC.HEADLESS: '.headless.fnskin'
+}
+
+__getattr__, __dir__ = importutils.lazyImport(
+    __backends__.get(__application__, None),
+    package=__package__,
+    message=f'Unable to import DCC skin-helpers for: {__executable__}!',
+    __globals__=globals()
+)
@@ -0,0 +1,749 @@
+from itertools import chain
+from .libs import meshio
+from .libs.meshdata import MeshData
+from ..abstract import afnmesh
+from ..python import importutils
+from ..dataclasses.vector import Vector
+from ..dataclasses.colour import Colour
+from ..vendor.six import string_types
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+class FnMesh(afnmesh.AFnMesh):
+    """
+    Overload of `AFnMesh` that implements the mesh interface for in-memory meshes.
+    This allows mesh algorithms to run, and be profiled, without a DCC application.
+    """
+
+    __slots__ = ()
+
+    def setObject(self, obj):
+        """
+        Assigns an object to this function set for manipulation.
+        File paths are loaded using the extension specific loader.
+
+        :type obj: Union[str, MeshData]
+        :rtype: None
+        """
+
+        # Check if object is a file path
+        #
+        if isinstance(obj, string_types):
+
+            obj = meshio.loadMesh(obj)
+
+        # Check if object is compatible
+        #
+        if not isinstance(obj, MeshData):
+
+            raise TypeError(f'setObject() expects a mesh ({type(obj).__name__} given)!')
+
+        super(FnMesh, self).setObject(obj)
+
+    def isValid(self):
+        """
+        Evaluates if the attached object is valid.
+
+        :rtype: bool
+        """
+
+        return isinstance(self.object(), MeshData)
+
+    def name(self):
+        """
+        Returns the name of this mesh.
+
+        :rtype: str
+        """
+
+        return self.object().name
+
+    def batchQuery(self, objects, name, *args):
+        """
+        Returns the results from the named method for each of the supplied objects.
+        Names and element counts are read directly from any in-memory meshes without attaching them to this function set.
+
+        :type objects: List[Union[str, MeshData]]
+        :type name: str
+        :rtype: Union[List[Any], None]
+        """
+
+        # Check if query can be evaluated in bulk
+        # File paths still require loading so defer those to the per-object queries!
+        #
+        isSupported = name in ('name', 'numVertices', 'numEdges', 'numFaces')
+        isLoaded = all(isinstance(obj, MeshData) for obj in objects)
+
+        if not (isSupported and isLoaded):
+
+            return super(FnMesh, self).batchQuery(objects, name, *args)
+
+        if name == 'name':
+
+            return [obj.name for obj in objects]
+
+        else:
+
+            return [getattr(obj, name)() for obj in objects]
+
+    def indices(self, indices, count):
+        """
+        Returns the supplied indices as an array.
+        If no indices are supplied then all indices up to the specified count are returned.
+
+        :type indices: Sequence[int]
+        :type count: int
+        :rtype: numpy.ndarray
+        """
+
+        if len(indices) == 0:
+
+            return numpy.arange(count)
+
+        else:
+
+            return numpy.fromiter(chain.from_iterable(index if hasattr(index, '__iter__') else (index,) for index in indices), dtype=int)
+
+    def triangulatedObject(self):
+        """
+        Returns the triangulated mesh data object for this mesh.
+
+        :rtype: MeshData
+        """
+
+        return self.object().triangulated()
+
+    def numVertices(self):
+        """
+        Returns the number of vertices in this mesh.
+
+        :rtype: int
+        """
+
+        return self.object().numVertices()
+
+    def numEdges(self):
+        """
+        Returns the number of edges in this mesh.
+
+        :rtype: int
+        """
+
+        return self.object().numEdges()
+
+    def numFaces(self):
+        """
+        Returns the number of faces in this mesh.
+
+        :rtype: int
+        """
+
+        return self.object().numFaces()
+
+    def numFaceVertexIndices(self, *indices):
+        """
+        Returns the number of face-vertex indices.
+
+        :type indices: Union[int, List[int]]
+        :rtype: int
+        """
+
+        counts = self.object().faceVertexCounts
+        return int(counts[self.indices(indices, len(counts))].sum())
+
+    def numTriangles(self):
+        """
+        Returns the number of triangles in this mesh.
+
+        :rtype: int
+        """
+
+        triangles, faceIndices = self.object().triangles()
+        return len(triangles)
+
+    def selectedVertices(self):
+        """
+        Returns a list of selected vertex indices.
+
+        :rtype: List[int]
+        """
+
+        return list(self.object().selection[self.ComponentType.Vertex])
+
+    def selectedEdges(self):
+        """
+        Returns a list of selected edge indices.
+
+        :rtype: List[int]
+        """
+
+        return list(self.object().selection[self.ComponentType.Edge])
+
+    def selectedFaces(self):
+        """
+        Returns a list of selected face indices.
+
+        :rtype: List[int]
+        """
+
+        return list(self.object().selection[self.ComponentType.Face])
+
+    def iterVertices(self, *indices, cls=Vector, worldSpace=False):
+        """
+        Returns a generator that yields vertex points.
+        If no arguments are supplied then all vertex points will be yielded.
+
+        :type cls: Callable
+        :type worldSpace: bool
+        :rtype: Iterator[Vector]
+        """
+
+        mesh = self.object()
+        points = mesh.worldPoints() if worldSpace else mesh.points
+
+        for point in points[self.indices(indices, mesh.numVertices())].tolist():
+
+            yield cls(*point)
+
+    def setVertex(self, index, point):
+        """
+        Updates the vertex position at the specified zero-based index.
+
+        :type index: int
+        :type point: Union[Vector, Tuple[float, float, float]]
+        :rtype: None
+        """
+
+        self.object().setPoint(index, list(point))
+
+    def setVertices(self, points):
+        """
+        Updates the vertex positions.
+
+        :type points: Union[List[Vector], List[Tuple[float, float, float]]]
+        :rtype: None
+        """
+
+        self.object().setPoints([list(point) for point in points])
+
+    def iterVertexNormals(self, *indices, cls=Vector):
+        """
+        Returns a generator that yields vertex normals.
+        If no arguments are supplied then all vertex normals will be yielded.
+
+        :type cls: Callable
+        :rtype: Iterator[Vector]
+        """
+
+        mesh = self.object()
+
+        for normal in mesh.vertexNormals()[self.indices(indices, mesh.numVertices())].tolist():
+
+            yield cls(*normal)
+
+    def hasEdgeSmoothings(self):
+        """
+        Evaluates if this mesh uses edge smoothings.
+
+        :rtype: bool
+        """
+
+        return self.object().edgeSmoothings is not None
+
+    def iterEdgeSmoothings(self, *indices):
+        """
+        Returns a generator that yields edge smoothings.
+
+        :rtype: Iterator[bool]
+        """
+
+        mesh = self.object()
+        edgeSmoothings = mesh.edgeSmoothings
+
+        if edgeSmoothings is None:
+
+            edgeSmoothings = numpy.ones(mesh.numEdges(), dtype=bool)
+
+        return iter(edgeSmoothings[self.indices(indices, mesh.numEdges())].tolist())
+
+    def hasSmoothingGroups(self):
+        """
+        Evaluates if this mesh uses smoothing groups.
+
+        :rtype: bool
+        """
+
+        return self.object().smoothingGroups is not None
+
+    def numSmoothingGroups(self):
+        """
+        Returns the number of smoothing groups currently in use.
+
+        :rtype: int
+        """
+
+        smoothingGroups = self.object().smoothingGroups
+
+        if smoothingGroups is None:
+
+            return 0
+
+        else:
+
+            return len(numpy.unique(smoothingGroups[smoothingGroups != 0]))
+
+    def iterSmoothingGroups(self, *indices):
+        """
+        Returns a generator that yields face smoothing groups.
+
+        :rtype: Iterator[int]
+        """
+
+        mesh = self.object()
+
+        if mesh.smoothingGroups is None:
+
+            return iter([])
+
+        else:
+
+            return iter(mesh.smoothingGroups[self.indices(indices, mesh.numFaces())].tolist())
+
+    def iterFaceVertexIndices(self, *indices):
+        """
+        Returns a generator that yields face vertex indices.
+        If no arguments are supplied then all face vertex indices will be yielded.
+
+        :rtype: Iterator[List[int]]
+        """
+
+        mesh = self.object()
+        offsets = mesh.faceOffsets().tolist()
+        faceVertexIndices = mesh.faceVertexIndices.tolist()
+
+        for index in self.indices(indices, mesh.numFaces()).tolist():
+
+            yield tuple(faceVertexIndices[offsets[index]:offsets[index + 1]])
+
+    def iterFaceVertexNormals(self, *indices, cls=Vector):
+        """
+        Returns a generator that yields face-vertex normals for the specified faces.
+
+        :type cls: Callable
+        :rtype: Iterator[List[Vector]]
+        """
+
+        mesh = self.object()
+        offsets = mesh.faceOffsets().tolist()
+        normals = mesh.faceVertexNormals().tolist()
+
+        for index in self.indices(indices, mesh.numFaces()).tolist():
+
+            yield [cls(*normal) for normal in normals[offsets[index]:offsets[index + 1]]]
+
+    def iterFaceCenters(self, *indices, cls=Vector):
+        """
+        Returns a generator that yields face centers.
+        If no arguments are supplied then all face centers will be yielded.
+
+        :type cls: Callable
+        :rtype: Iterator[Vector]
+        """
+
+        mesh = self.object()
+
+        for center in mesh.faceCenters()[self.indices(indices, mesh.numFaces())].tolist():
+
+            yield cls(*center)
+
+    def iterFaceNormals(self, *indices, cls=Vector):
+        """
+        Returns a generator that yields face normals.
+        If no arguments are supplied then all face normals will be yielded.
+
+        :type cls: Callable
+        :rtype: Iterator[Vector]
+        """
+
+        mesh = self.object()
+
+        for normal in mesh.faceNormals()[self.indices(indices, mesh.numFaces())].tolist():
+
+            yield cls(*normal)
+
+    def getTopologyArrays(self):
+        """
+        Returns the zero-based rest points, face-vertex counts and face-vertex indices as arrays.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+
+        mesh = self.object()
+        return mesh.points, mesh.faceVertexCounts, mesh.faceVertexIndices
+
+    def getFaceTriangleVertexIndices(self):
+        """
+        Returns a dictionary of faces and their corresponding triangle-vertex indices.
+
+        :rtype: Dict[int, List[Tuple[int, int, int]]]
+        """
+
+        triangles, faceIndices = self.object().triangles()
+        faceTriangleVertexIndices = {}
+
+        for (faceIndex, triangle) in zip(faceIndices.tolist(), triangles.tolist()):
+
+            faceTriangleVertexIndices.setdefault(faceIndex, []).append(tuple(triangle))
+
+        return faceTriangleVertexIndices
+
+    def iterFaceMaterialIndices(self, *indices):
+        """
+        Returns a generator that yields face material indices.
+        If no arguments are supplied then all face-material indices will be yielded.
+
+        :rtype: Iterator[int]
+        """
+
+        mesh = self.object()
+        return iter(mesh.materialIndices[self.indices(indices, mesh.numFaces())].tolist())
+
+    def getAssignedMaterials(self):
+        """
+        Returns a list of material-texture pairs from this mesh.
+
+        :rtype: List[Tuple[Any, str]]
+        """
+
+        return list(self.object().materials)
+
+    def numUVSets(self):
+        """
+        Returns the number of UV sets.
+
+        :rtype: int
+        """
+
+        return len(self.object().uvSets)
+
+    def getUVSetNames(self):
+        """
+        Returns the UV set names.
+
+        :rtype: List[str]
+        """
+
+        return list(self.object().uvSets.keys())
+
+    def getUVSetName(self, channel):
+        """
+        Returns the UV set name at the specified index.
+
+        :type channel: int
+        :rtype: str
+        """
+
+        uvSetNames = self.getUVSetNames()
+        numUVSetNames = len(uvSetNames)
+
+        if 0 <= channel < numUVSetNames:
+
+            return uvSetNames[channel]
+
+        else:
+
+            return ''
+
+    def numUVs(self, channel=0):
+        """
+        Returns the number of UV points from the specified set.
+
+        :type channel: int
+        :rtype: int
+        """
+
+        uvSet = self.object().uvSets.get(self.getUVSetName(channel), None)
+        return 0 if uvSet is None else len(uvSet[0])
+
+    def iterUVs(self, *indices, channel=0):
+        """
+        Returns a generator that yields UV vertex points from the specified set.
+
+        :type indices: Union[int, List[int]]
+        :type channel: int
+        :rtype: Iterator[Tuple[float, float]]
+        """
+
+        uvSet = self.object().uvSets.get(self.getUVSetName(channel), None)
+
+        if uvSet is None:
+
+            return iter([])
+
+        uvs, uvIndices = uvSet
+        return iter(map(tuple, uvs[self.indices(indices, len(uvs))].tolist()))
+
+    def iterAssignedUVs(self, *indices, channel=0):
+        """
+        Returns a generator that yields UV face-vertex indices from the specified set.
+
+        :type indices: Union[int, List[int]]
+        :type channel: int
+        :rtype: Iterator[Tuple[int]]
+        """
+
+        mesh = self.object()
+        uvSet = mesh.uvSets.get(self.getUVSetName(channel), None)
+
+        if uvSet is None:
+
+            return
+
+        offsets = mesh.faceOffsets().tolist()
+        uvIndices = uvSet[1].tolist()
+
+        for index in self.indices(indices, mesh.numFaces()).tolist():
+
+            yield tuple(uvIndices[offsets[index]:offsets[index + 1]])
+
+    def iterTangentsAndBinormals(self, *indices, cls=Vector, channel=0):
+        """
+        Returns a generator that yields face-vertex tangents and binormals for the specified channel.
+
+        :type indices: Union[int, List[int]]
+        :type cls: Callable
+        :type channel: int
+        :rtype: Iterator[List[Vector], List[Vector]]
+        """
+
+        mesh = self.object()
+        uvSetName = self.getUVSetName(channel)
+
+        if uvSetName not in mesh.uvSets:
+
+            return
+
+        offsets = mesh.faceOffsets().tolist()
+        tangents, binormals = (array.tolist() for array in mesh.faceVertexTangents(uvSetName))
+
+        for index in self.indices(indices, mesh.numFaces()).tolist():
+
+            start, end = offsets[index], offsets[index + 1]
+            yield [cls(*tangent) for tangent in tangents[start:end]], [cls(*binormal) for binormal in binormals[start:end]]
+
+    def getColorSetNames(self):
+        """
+        Returns a list of color set names.
+
+        :rtype: List[str]
+        """
+
+        return list(self.object().colorSets.keys())
+
+    def getColorSetName(self, channel):
+        """
+        Returns the color set name at the specified channel.
+
+        :type channel: int
+        :rtype: str
+        """
+
+        colorSetNames = self.getColorSetNames()
+        numColorSetNames = len(colorSetNames)
+
+        if 0 <= channel < numColorSetNames:
+
+            return colorSetNames[channel]
+
+        else:
+
+            return ''
+
+    def iterColors(self, cls=Colour, channel=0):
+        """
+        Returns a generator that yields colors for the specified vertex color channel.
+
+        :type cls: Callable
+        :type channel: int
+        :rtype: Iterator[Colour]
+        """
+
+        colorSet = self.object().colorSets.get(self.getColorSetName(channel), None)
+
+        if colorSet is None:
+
+            return
+
+        for color in colorSet[0].tolist():
+
+            yield cls(*color)
+
+    def iterFaceVertexColorIndices(self, *indices, channel=0):
+        """
+        Returns a generator that yields face-vertex color indices for the specified faces.
+
+        :type channel: int
+        :rtype: Iterator[List[int]]
+        """
+
+        mesh = self.object()
+        colorSet = mesh.colorSets.get(self.getColorSetName(channel), None)
+
+        if colorSet is None:
+
+            return
+
+        offsets = mesh.faceOffsets().tolist()
+        colorIndices = colorSet[1].tolist()
+
+        for index in self.indices(indices, mesh.numFaces()).tolist():
+
+            yield colorIndices[offsets[index]:offsets[index + 1]]
+
+    def iterConnectedComponents(self, indices, offsets, values):
+        """
+        Returns a generator that yields the compressed row values for the supplied indices.
+
+        :type indices: numpy.ndarray
+        :type offsets: numpy.ndarray
+        :type values: numpy.ndarray
+        :rtype: Iterator[int]
+        """
+
+        offsets, values = offsets.tolist(), values.tolist()
+
+        for index in indices.tolist():
+
+            yield from values[offsets[index]:offsets[index + 1]]
+
+    def getEdgeVertexIndices(self):
+        """
+        Returns the zero-based vertex pair for each edge as an array.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.array(self.object().edges(), dtype=int).reshape(-1, 2)
+
+    def iterConnectedVertices(self, *indices, **kwargs):
+        """
+        Returns a generator that yields the connected vertex elements.
+
+        :type indices: Union[int, List[int]]
+        :key componentType: ComponentType
+        :rtype: Iterator[int]
+        """
+
+        # Inspect component type
+        #
+        mesh = self.object()
+        componentType = kwargs.get('componentType', self.ComponentType.Vertex)
+
+        if componentType == self.ComponentType.Vertex:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), *mesh.vertexNeighbours())
+
+        elif componentType == self.ComponentType.Edge:
+
+            return iter(mesh.edges()[self.indices(indices, 0)].reshape(-1).tolist())
+
+        elif componentType == self.ComponentType.Face:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), mesh.faceOffsets(), mesh.faceVertexIndices)
+
+        else:
+
+            raise TypeError(f'iterConnectedVertices() expects a valid component type ({componentType} given)!')
+
+    def iterConnectedEdges(self, *indices, **kwargs):
+        """
+        Returns a generator that yields the connected edge elements.
+
+        :type indices: Union[int, List[int]]
+        :key componentType: ComponentType
+        :rtype: Iterator[int]
+        """
+
+        # Inspect component type
+        #
+        mesh = self.object()
+        componentType = kwargs.get('componentType', self.ComponentType.Edge)
+
+        if componentType == self.ComponentType.Vertex:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), *mesh.vertexEdges())
+
+        elif componentType == self.ComponentType.Edge:
+
+            edgeIndices = self.indices(indices, 0)
+            vertexIndices = mesh.edges()[edgeIndices]
+
+            return (
+                connectedEdge
+                for (edgeIndex, (startVertex, endVertex)) in zip(edgeIndices.tolist(), vertexIndices.tolist())
+                for connectedEdge in self.iterConnectedComponents(numpy.array([startVertex, endVertex]), *mesh.vertexEdges())
+                if connectedEdge != edgeIndex
+            )
+
+        elif componentType == self.ComponentType.Face:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), mesh.faceOffsets(), mesh.faceVertexEdges())
+
+        else:
+
+            raise TypeError(f'iterConnectedEdges() expects a valid component type ({componentType} given)!')
+
+    def iterConnectedFaces(self, *indices, **kwargs):
+        """
+        Returns a generator that yields the connected face elements.
+
+        :type indices: Union[int, List[int]]
+        :key componentType: ComponentType
+        :rtype: Iterator[int]
+        """
+
+        # Inspect component type
+        #
+        mesh = self.object()
+        componentType = kwargs.get('componentType', self.ComponentType.Face)
+
+        if componentType == self.ComponentType.Vertex:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), *mesh.vertexFaces())
+
+        elif componentType == self.ComponentType.Edge:
+
+            return self.iterConnectedComponents(self.indices(indices, 0), *mesh.edgeFaces())
+
+        elif componentType == self.ComponentType.Face:
+
+            faceIndices = self.indices(indices, 0)
+            edgeIndices = list(self.iterConnectedComponents(faceIndices, mesh.faceOffsets(), mesh.faceVertexEdges()))
+            faceSet = set(faceIndices.tolist())
+
+            return (
+                connectedFace
+                for connectedFace in dict.fromkeys(self.iterConnectedComponents(numpy.array(edgeIndices, dtype=int), *mesh.edgeFaces()))
+                if connectedFace not in faceSet
+            )
+
+        else:
+
+            raise TypeError(f'iterConnectedFaces() expects a valid component type ({componentType} given)!')
+
+    @classmethod
+    def iterInstances(cls):
+        """
+        Returns a generator that yields mesh instances.
+
+        :rtype: Iterator[MeshData]
+        """
+
+        return MeshData.iterInstances()
@@ -0,0 +1,782 @@
+from .libs import skinio
+from .libs.skindata import SkinData
+from ..abstract import afnskin, afnmesh
+from ..naming import namingutils
+from ..python import importutils
+from ..vendor.six import string_types
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+class Influence(object):
+    """
+    Base class for headless influences.
+    Without a scene, influences are only identified by their name!
+    """
+
+    # region Dunderscores
+    __slots__ = ('_name',)
+
+    def __init__(self, name):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(Influence, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+
+    def __eq__(self, other):
+        """
+        Private method that evaluates if this influence is equivalent to the other object.
+
+        :type other: Any
+        :rtype: bool
+        """
+
+        if isinstance(other, Influence):
+
+            return self._name == other._name
+
+        else:
+
+            return self._name == other
+
+    def __ne__(self, other):
+        """
+        Private method that evaluates if this influence is not equivalent to the other object.
+
+        :type other: Any
+        :rtype: bool
+        """
+
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        """
+        Private method that returns a hashable representation of this influence.
+
+        :rtype: int
+        """
+
+        return hash(self._name)
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this instance.
+
+        :rtype: str
+        """
+
+        return f'<{self.__class__.__name__}:{self._name}>'
+    # endregion
+
+    # region Methods
+    def name(self):
+        """
+        Returns the name of this influence.
+
+        :rtype: str
+        """
+
+        return self._name.split(':')[-1]
+
+    def namespace(self):
+        """
+        Returns the namespace of this influence.
+
+        :rtype: str
+        """
+
+        return ':'.join(self._name.split(':')[:-1])
+
+    def absoluteName(self):
+        """
+        Returns the absolute name of this influence.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    def object(self):
+        """
+        Returns the object associated with this influence.
+
+        :rtype: str
+        """
+
+        return self._name
+    # endregion
+
+
+class Influences(afnskin.Influences):
+    """
+    Overload of `Influences` that stores headless influences.
+    """
+
+    # region Dunderscores
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        """
+        Private method that updates an indexed influence.
+
+        :type key: int
+        :type value: Union[str, Influence]
+        :rtype: None
+        """
+
+        if isinstance(value, string_types):
+
+            self.__objects__[key] = Influence(value)
+
+        elif isinstance(value, Influence):
+
+            self.__objects__[key] = value
+
+        else:
+
+            raise TypeError(f'__setitem__() expects a valid object ({type(value).__name__} given)!')
+    # endregion
+
+    # region Methods
+    def index(self, influence):
+        """
+        Returns the index for the given influence.
+        If no index is found then None is returned!
+
+        :type influence: Union[str, Influence]
+        :rtype: Union[int, None]
+        """
+
+        return next((influenceId for (influenceId, obj) in self.__objects__.items() if obj == influence), None)
+    # endregion
+
+
+class FnSkin(afnskin.AFnSkin):
+    """
+    Overload of `AFnSkin` that implements the skin interface for in-memory skins.
+    This allows weight processing jobs to run in parallel processes without a DCC application.
+    """
+
+    # region Dunderscores
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance is created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(FnSkin, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._influences = Influences()
+    # endregion
+
+    # region Methods
+    def setObject(self, obj):
+        """
+        Assigns an object to this function set for manipulation.
+        File paths are loaded as weight files.
+
+        :type obj: Union[str, SkinData]
+        :rtype: None
+        """
+
+        # Check if object is a file path
+        #
+        if isinstance(obj, string_types):
+
+            obj = skinio.loadSkin(obj)
+
+        # Check if object is compatible
+        #
+        if not isinstance(obj, SkinData):
+
+            raise TypeError(f'setObject() expects a skin ({type(obj).__name__} given)!')
+
+        super(FnSkin, self).setObject(obj)
+
+    def isValid(self):
+        """
+        Evaluates if the attached object is valid.
+
+        :rtype: bool
+        """
+
+        return isinstance(self.object(), SkinData)
+
+    @classmethod
+    def create(cls, mesh):
+        """
+        Creates a skin and assigns it to the supplied shape.
+
+        :type mesh: Union[MeshData, afnmesh.AFnMesh]
+        :rtype: FnSkin
+        """
+
+        if isinstance(mesh, afnmesh.AFnMesh):
+
+            mesh = mesh.object()
+
+        return cls(SkinData(mesh=mesh, name=f'{mesh.name}_skin'))
+
+    def save(self, filePath, meshPath=''):
+        """
+        Saves this skin to the specified weight file.
+
+        :type filePath: str
+        :type meshPath: str
+        :rtype: None
+        """
+
+        skinio.saveSkin(self.object(), filePath, meshPath=meshPath)
+
+    def handle(self):
+        """
+        Returns the handle for this node.
+
+        :rtype: int
+        """
+
+        return id(self.object())
+
+    def name(self):
+        """
+        Returns the name of this skin.
+
+        :rtype: str
+        """
+
+        return self.object().name
+
+    def setName(self, name):
+        """
+        Updates the name of this skin.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self.object().name = name
+
+    def namespace(self):
+        """
+        Returns the namespace of this skin.
+
+        :rtype: str
+        """
+
+        return ''
+
+    def setNamespace(self, namespace):
+        """
+        Updates the namespace of this skin.
+
+        :type namespace: str
+        :rtype: None
+        """
+
+        pass
+
+    def parent(self):
+        """
+        Returns the parent of this skin.
+
+        :rtype: None
+        """
+
+        return None
+
+    def setParent(self, parent):
+        """
+        Updates the parent of this skin.
+
+        :type parent: Any
+        :rtype: None
+        """
+
+        pass
+
+    def iterChildren(self):
+        """
+        Returns a generator that yields the children of this skin.
+
+        :rtype: Iterator[Any]
+        """
+
+        return iter([])
+
+    def isTransform(self):
+        """
+        Evaluates if this node represents a transform.
+
+        :rtype: bool
+        """
+
+        return False
+
+    def isJoint(self):
+        """
+        Evaluates if this node represents an influence object.
+
+        :rtype: bool
+        """
+
+        return False
+
+    def isMesh(self):
+        """
+        Evaluates if this node represents a mesh.
+
+        :rtype: bool
+        """
+
+        return False
+
+    def getAttr(self, name):
+        """
+        Returns the specified attribute value.
+
+        :type name: str
+        :rtype: Any
+        """
+
+        return self.object().properties[name]
+
+    def hasAttr(self, name):
+        """
+        Evaluates if this node has the specified attribute.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return name in self.object().properties
+
+    def setAttr(self, name, value):
+        """
+        Updates the specified attribute value.
+
+        :type name: str
+        :type value: Any
+        :rtype: None
+        """
+
+        self.object().properties[name] = value
+
+    def iterAttr(self, userDefined=False):
+        """
+        Returns a generator that yields attribute names.
+
+        :type userDefined: bool
+        :rtype: Iterator[str]
+        """
+
+        return iter(list(self.object().properties.keys()))
+
+    def userProperties(self):
+        """
+        Returns the user properties.
+
+        :rtype: dict
+        """
+
+        return self.object().properties
+
+    def getAssociatedReference(self):
+        """
+        Returns the reference this node is associated with.
+
+        :rtype: None
+        """
+
+        return None
+
+    def select(self, replace=True):
+        """
+        Selects the node associated with this function set.
+
+        :type replace: bool
+        :rtype: None
+        """
+
+        pass
+
+    def deselect(self):
+        """
+        Deselects the node associated with this function set.
+
+        :rtype: None
+        """
+
+        pass
+
+    def isSelected(self):
+        """
+        Evaluates if this node is selected.
+
+        :rtype: bool
+        """
+
+        return False
+
+    def isPartiallySelected(self):
+        """
+        Evaluates if this node is partially selected.
+
+        :rtype: bool
+        """
+
+        return len(self.object().selection) > 0
+
+    def transform(self):
+        """
+        Returns the transform node associated with this skin.
+        Headless meshes store their own world matrix so the mesh is returned instead!
+
+        :rtype: Union[MeshData, None]
+        """
+
+        return self.object().mesh
+
+    def shape(self):
+        """
+        Returns the shape node associated with this skin.
+
+        :rtype: Union[MeshData, None]
+        """
+
+        return self.object().mesh
+
+    def intermediateObject(self):
+        """
+        Returns the intermediate object associated with this skin.
+        Headless skins do not deform their mesh so the shape is returned instead!
+
+        :rtype: Union[MeshData, None]
+        """
+
+        return self.object().mesh
+
+    def iterVertices(self):
+        """
+        Returns a generator that yields vertex indices.
+
+        :rtype: Iterator[int]
+        """
+
+        return iter(range(self.object().numVertices()))
+
+    def iterSelection(self):
+        """
+        Returns a generator that yields the selected vertex elements.
+
+        :rtype: Iterator[int]
+        """
+
+        return iter(list(self.object().selection))
+
+    def setSelection(self, vertices):
+        """
+        Updates the active selection with the supplied vertex elements.
+
+        :type vertices: List[int]
+        :rtype: None
+        """
+
+        self.object().selection[:] = list(vertices)
+
+    def iterSoftSelection(self):
+        """
+        Returns a generator that yields selected vertex-weight pairs.
+
+        :rtype Iterator[Tuple[int, float]]
+        """
+
+        return ((vertexIndex, 1.0) for vertexIndex in self.iterSelection())
+
+    def showColors(self):
+        """
+        Enables color feedback for the associated mesh.
+
+        :rtype: None
+        """
+
+        pass
+
+    def hideColors(self):
+        """
+        Disable color feedback for the associated mesh.
+
+        :rtype: None
+        """
+
+        pass
+
+    def iterInfluences(self):
+        """
+        Returns a generator that yields the influence id-name pairs from this skin.
+
+        :rtype: Iterator[Tuple[int, str]]
+        """
+
+        return iter(list(self.object().influences.items()))
+
+    def influenceNames(self):
+        """
+        Returns the influence names from this skin.
+
+        :rtype: Dict[int, str]
+        """
+
+        return dict(self.object().influences)
+
+    def numInfluences(self):
+        """
+        Returns the number of influences in use by this skin.
+
+        :rtype: int
+        """
+
+        return self.object().numInfluences()
+
+    def addInfluence(self, *influences):
+        """
+        Adds an influence to this skin.
+
+        :type influences: Union[str, Influence, List[Union[str, Influence]]]
+        :rtype: None
+        """
+
+        skin = self.object()
+
+        for influence in influences:
+
+            skin.addInfluence(influence.absoluteName() if isinstance(influence, Influence) else str(influence))
+
+        self._influences.clear()
+
+    def removeInfluence(self, *influenceIds):
+        """
+        Removes an influence from this skin by id.
+
+        :type influenceIds: Union[int, List[int]]
+        :rtype: None
+        """
+
+        self.object().removeInfluence(*influenceIds)
+        self._influences.clear()
+        self.invalidateInfluenceIndex()
+
+    def maxInfluences(self):
+        """
+        Returns the max number of influences for this skin.
+
+        :rtype: int
+        """
+
+        return self.object().maxInfluences
+
+    def setMaxInfluences(self, count):
+        """
+        Updates the max number of influences for this skin.
+
+        :type count: int
+        :rtype: None
+        """
+
+        self.object().maxInfluences = count
+
+    def selectInfluence(self, influenceId):
+        """
+        Changes the color display to the specified influence id.
+
+        :type influenceId: int
+        :rtype: None
+        """
+
+        pass
+
+    def iterVertexWeights(self, *indices):
+        """
+        Returns a generator that yields vertex-weights pairs from this skin.
+        If no vertex indices are supplied then all weights are yielded instead.
+
+        :type indices: Union[int, List[int]]
+        :rtype: Iterator[Tuple[int, Dict[int, float]]]
+        """
+
+        skin = self.object()
+
+        if len(indices) == 0:
+
+            indices = numpy.arange(skin.numVertices())
+
+        else:
+
+            indices = numpy.hstack(indices).astype(int)
+
+        return skin.iterVertexWeights(indices)
+
+    def weightSignature(self):
+        """
+        Returns a cheap signature that changes whenever the weights on this skin change.
+        The skin's own revision is included so any changes made directly to the skin data are also detected.
+
+        :rtype: Hashable
+        """
+
+        return self.weightRevision(), self.object().revision
+
+    def applyVertexWeights(self, vertexWeights):
+        """
+        Assigns the supplied vertex weights to this skin.
+
+        :type vertexWeights: Dict[int, Dict[int, float]]
+        :rtype: None
+        """
+
+        self.object().setVertexWeights(vertexWeights)
+        self.updateInfluenceIndex(vertexWeights)
+
+    def mirrorWeights(self, weights, isCenterSeam=False):
+        """
+        Mirrors the influence IDs in the supplied vertex weight dictionary.
+        Without a scene, mirrored influences are looked up by name from this skin's influences.
+
+        :type weights: Dict[int, float]
+        :type isCenterSeam: bool
+        :rtype: Dict[int, float]
+        """
+
+        # Check value type
+        #
+        if not isinstance(weights, dict):
+
+            raise TypeError(f'mirrorWeights() expects a dict ({type(weights).__name__} given)!')
+
+        # Iterate through influences
+        #
+        influences = self.object().influences
+        influenceIds = {influenceName: influenceId for (influenceId, influenceName) in influences.items()}
+
+        mirrorWeights = {}
+
+        for (influenceId, weight) in weights.items():
+
+            # Check if mirrored influence exists
+            #
+            influenceName = influences[influenceId]
+            mirrorId = influenceIds.get(namingutils.mirrorName(influenceName), influenceId)
+
+            if mirrorId == influenceId:
+
+                log.debug(f'No mirrored influence name found for {influenceName}.')
+                mirrorWeights[influenceId] = mirrorWeights.get(influenceId, 0.0) + weight
+
+            elif isCenterSeam:
+
+                average = (weight + weights.get(mirrorId, 0.0)) / 2.0
+                mirrorWeights[influenceId] = average
+                mirrorWeights[mirrorId] = average
+
+            else:
+
+                mirrorWeights[mirrorId] = mirrorWeights.get(mirrorId, 0.0) + weight
+
+        return mirrorWeights
+
+    def resetPreBindMatrices(self):
+        """
+        Resets the pre-bind matrices on the associated joints.
+
+        :rtype: None
+        """
+
+        pass
+
+    def resetIntermediateObject(self):
+        """
+        Resets the control points on the associated intermediate object.
+
+        :rtype: None
+        """
+
+        pass
+
+    @classmethod
+    def doesNodeExist(cls, name):
+        """
+        Evaluates whether a skin exists with the given name.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return cls.getNodeByName(name) is not None
+
+    @classmethod
+    def getNodeByName(cls, name):
+        """
+        Returns a skin with the given name.
+        If no skin is associated with this name then none is returned.
+
+        :type name: str
+        :rtype: Union[SkinData, None]
+        """
+
+        return next((skin for skin in SkinData.iterInstances() if skin.name == name), None)
+
+    @classmethod
+    def getNodeByHandle(cls, handle):
+        """
+        Returns a skin with the given handle.
+        If no skin is associated with this handle then none is returned.
+
+        :type handle: int
+        :rtype: Union[SkinData, None]
+        """
+
+        return next((skin for skin in SkinData.iterInstances() if id(skin) == handle), None)
+
+    @classmethod
+    def getNodesByAttribute(cls, name):
+        """
+        Returns a list of skins with the given attribute name.
+
+        :type name: str
+        :rtype: List[SkinData]
+        """
+
+        return [skin for skin in SkinData.iterInstances() if name in skin.properties]
+
+    @classmethod
+    def iterInstances(cls):
+        """
+        Returns a generator that yields skin instances.
+
+        :rtype: Iterator[SkinData]
+        """
+
+        return SkinData.iterInstances()
+    # endregion
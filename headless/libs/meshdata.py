@@ -0,0 +1,837 @@
+from weakref import WeakSet
+from ...python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+def compressRows(rows, columns, numRows):
+    """
+    Returns the compressed sparse row offsets and values for the supplied row-column pairs.
+    Values within each row preserve their original order.
+
+    :type rows: numpy.ndarray
+    :type columns: numpy.ndarray
+    :type numRows: int
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    order = numpy.argsort(rows, kind='stable')
+    offsets = numpy.zeros(numRows + 1, dtype=int)
+    offsets[1:] = numpy.cumsum(numpy.bincount(rows, minlength=numRows))
+
+    return offsets, numpy.asarray(columns)[order]
+
+
+class MeshData(object):
+    """
+    Base class for in-memory polygon meshes.
+    Topology is stored as face-vertex counts and indices, with all derived connectivity lazily computed as compressed sparse rows!
+    Any UV and colour sets are stored as name-(values, face-vertex indices) pairs.
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__weakref__',
+        '_name',
+        '_points',
+        '_matrix',
+        '_faceVertexCounts',
+        '_faceVertexIndices',
+        '_normals',
+        '_normalIndices',
+        '_uvSets',
+        '_colorSets',
+        '_materials',
+        '_materialIndices',
+        '_smoothingGroups',
+        '_edgeSmoothings',
+        '_selection',
+        '_cache'
+    )
+
+    __instances__ = WeakSet()
+
+    def __init__(self, points=None, faceVertexCounts=None, faceVertexIndices=None, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :type points: Union[numpy.ndarray, List[Tuple[float, float, float]], None]
+        :type faceVertexCounts: Union[numpy.ndarray, List[int], None]
+        :type faceVertexIndices: Union[numpy.ndarray, List[int], None]
+        :key name: str
+        :key matrix: numpy.ndarray
+        :key normals: numpy.ndarray
+        :key normalIndices: numpy.ndarray
+        :key uvSets: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        :key colorSets: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        :key materials: List[Tuple[str, str]]
+        :key materialIndices: numpy.ndarray
+        :key smoothingGroups: numpy.ndarray
+        :key edgeSmoothings: numpy.ndarray
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(MeshData, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = kwargs.get('name', '')
+        self._points = numpy.zeros((0, 3), dtype=float)
+        self._matrix = numpy.asarray(kwargs.get('matrix', numpy.identity(4)), dtype=float)
+        self._faceVertexCounts = numpy.zeros(0, dtype=int)
+        self._faceVertexIndices = numpy.zeros(0, dtype=int)
+        self._normals = None
+        self._normalIndices = None
+        self._uvSets = {}
+        self._colorSets = {}
+        self._materials = list(kwargs.get('materials', []))
+        self._materialIndices = None
+        self._smoothingGroups = None
+        self._edgeSmoothings = None
+        self._selection = {0: [], 1: [], 2: []}
+        self._cache = {}
+
+        # Update topology
+        #
+        self.setTopology(
+            numpy.zeros((0, 3)) if points is None else points,
+            [] if faceVertexCounts is None else faceVertexCounts,
+            [] if faceVertexIndices is None else faceVertexIndices
+        )
+
+        # Update face-vertex data
+        #
+        normals = kwargs.get('normals', None)
+
+        if normals is not None:
+
+            self.setNormals(normals, normalIndices=kwargs.get('normalIndices', None))
+
+        for (name, (values, indices)) in kwargs.get('uvSets', {}).items():
+
+            self.setUVSet(name, values, indices)
+
+        for (name, (values, indices)) in kwargs.get('colorSets', {}).items():
+
+            self.setColorSet(name, values, indices)
+
+        materialIndices = kwargs.get('materialIndices', None)
+        self._materialIndices = numpy.zeros(self.numFaces(), dtype=int) if materialIndices is None else numpy.asarray(materialIndices, dtype=int)
+
+        smoothingGroups = kwargs.get('smoothingGroups', None)
+        self._smoothingGroups = None if smoothingGroups is None else numpy.asarray(smoothingGroups, dtype=int)
+
+        edgeSmoothings = kwargs.get('edgeSmoothings', None)
+        self._edgeSmoothings = None if edgeSmoothings is None else numpy.asarray(edgeSmoothings, dtype=bool)
+
+        self.__instances__.add(self)
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this instance.
+
+        :rtype: str
+        """
+
+        return f'<{self.__class__.__name__}:{self.name} vertices={self.numVertices()} faces={self.numFaces()}>'
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of this mesh.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Setter method that updates the name of this mesh.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._name = name
+
+    @property
+    def points(self):
+        """
+        Getter method that returns the vertex points.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._points
+
+    @property
+    def matrix(self):
+        """
+        Getter method that returns the world matrix.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix):
+        """
+        Setter method that updates the world matrix.
+
+        :type matrix: numpy.ndarray
+        :rtype: None
+        """
+
+        self._matrix = numpy.asarray(matrix, dtype=float).reshape(4, 4)
+
+    @property
+    def faceVertexCounts(self):
+        """
+        Getter method that returns the number of vertices per face.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._faceVertexCounts
+
+    @property
+    def faceVertexIndices(self):
+        """
+        Getter method that returns the flattened face-vertex indices.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._faceVertexIndices
+
+    @property
+    def uvSets(self):
+        """
+        Getter method that returns the UV sets.
+
+        :rtype: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+
+        return self._uvSets
+
+    @property
+    def colorSets(self):
+        """
+        Getter method that returns the colour sets.
+
+        :rtype: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+        """
+
+        return self._colorSets
+
+    @property
+    def materials(self):
+        """
+        Getter method that returns the material-texture pairs.
+
+        :rtype: List[Tuple[str, str]]
+        """
+
+        return self._materials
+
+    @property
+    def materialIndices(self):
+        """
+        Getter method that returns the material index for each face.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._materialIndices
+
+    @property
+    def smoothingGroups(self):
+        """
+        Getter method that returns the smoothing group for each face.
+
+        :rtype: Union[numpy.ndarray, None]
+        """
+
+        return self._smoothingGroups
+
+    @property
+    def edgeSmoothings(self):
+        """
+        Getter method that returns the smoothing flag for each edge.
+
+        :rtype: Union[numpy.ndarray, None]
+        """
+
+        return self._edgeSmoothings
+
+    @property
+    def selection(self):
+        """
+        Getter method that returns the selected component indices.
+
+        :rtype: Dict[int, List[int]]
+        """
+
+        return self._selection
+    # endregion
+
+    # region Methods
+    @classmethod
+    def iterInstances(cls):
+        """
+        Returns a generator that yields all the live mesh instances.
+
+        :rtype: Iterator[MeshData]
+        """
+
+        return iter(list(cls.__instances__))
+
+    def numVertices(self):
+        """
+        Returns the number of vertices.
+
+        :rtype: int
+        """
+
+        return len(self._points)
+
+    def numFaces(self):
+        """
+        Returns the number of faces.
+
+        :rtype: int
+        """
+
+        return len(self._faceVertexCounts)
+
+    def numFaceVertices(self):
+        """
+        Returns the number of face-vertices.
+
+        :rtype: int
+        """
+
+        return len(self._faceVertexIndices)
+
+    def numEdges(self):
+        """
+        Returns the number of edges.
+
+        :rtype: int
+        """
+
+        return len(self.edges())
+
+    def setTopology(self, points, faceVertexCounts, faceVertexIndices):
+        """
+        Updates the points and topology of this mesh.
+        Any derived connectivity is invalidated!
+
+        :type points: Union[numpy.ndarray, List[Tuple[float, float, float]]]
+        :type faceVertexCounts: Union[numpy.ndarray, List[int]]
+        :type faceVertexIndices: Union[numpy.ndarray, List[int]]
+        :rtype: None
+        """
+
+        points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+        faceVertexCounts = numpy.asarray(faceVertexCounts, dtype=int).reshape(-1)
+        faceVertexIndices = numpy.asarray(faceVertexIndices, dtype=int).reshape(-1)
+
+        if faceVertexCounts.sum() != faceVertexIndices.size:
+
+            raise TypeError(f'setTopology() expects {faceVertexCounts.sum()} face-vertex indices ({faceVertexIndices.size} given)!')
+
+        if faceVertexIndices.size > 0 and (faceVertexIndices.min() < 0 or faceVertexIndices.max() >= len(points)):
+
+            raise TypeError('setTopology() expects face-vertex indices within range!')
+
+        self._points = points
+        self._faceVertexCounts = faceVertexCounts
+        self._faceVertexIndices = faceVertexIndices
+        self._cache.clear()
+
+    def setPoints(self, points):
+        """
+        Updates the vertex points of this mesh.
+
+        :type points: Union[numpy.ndarray, List[Tuple[float, float, float]]]
+        :rtype: None
+        """
+
+        points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+        if points.shape != self._points.shape:
+
+            raise TypeError(f'setPoints() expects {len(self._points)} points ({len(points)} given)!')
+
+        self._points = points.copy()
+        self.invalidateGeometry()
+
+    def setPoint(self, index, point):
+        """
+        Updates the vertex point at the specified index.
+
+        :type index: int
+        :type point: Union[Tuple[float, float, float], numpy.ndarray]
+        :rtype: None
+        """
+
+        self._points[index] = numpy.asarray(point, dtype=float)[:3]
+        self.invalidateGeometry()
+
+    def setNormals(self, normals, normalIndices=None):
+        """
+        Updates the explicit face-vertex normals.
+        If no normal indices are supplied then the normals are assumed to be per-vertex!
+
+        :type normals: numpy.ndarray
+        :type normalIndices: Union[numpy.ndarray, None]
+        :rtype: None
+        """
+
+        self._normals = numpy.asarray(normals, dtype=float).reshape(-1, 3)
+        self._normalIndices = self._faceVertexIndices.copy() if normalIndices is None else numpy.asarray(normalIndices, dtype=int).reshape(-1)
+
+    def hasNormals(self):
+        """
+        Evaluates if this mesh has explicit normals.
+
+        :rtype: bool
+        """
+
+        return self._normals is not None
+
+    def setUVSet(self, name, uvs, uvIndices=None):
+        """
+        Updates the specified UV set.
+        If no UV indices are supplied then the UVs are assumed to be per-vertex!
+
+        :type name: str
+        :type uvs: numpy.ndarray
+        :type uvIndices: Union[numpy.ndarray, None]
+        :rtype: None
+        """
+
+        uvs = numpy.asarray(uvs, dtype=float).reshape(-1, 2)
+        uvIndices = self._faceVertexIndices.copy() if uvIndices is None else numpy.asarray(uvIndices, dtype=int).reshape(-1)
+
+        self._uvSets[name] = (uvs, uvIndices)
+
+    def setColorSet(self, name, colors, colorIndices=None):
+        """
+        Updates the specified colour set.
+        Any RGB colours are padded with an opaque alpha channel.
+
+        :type name: str
+        :type colors: numpy.ndarray
+        :type colorIndices: Union[numpy.ndarray, None]
+        :rtype: None
+        """
+
+        colors = numpy.asarray(colors, dtype=float)
+
+        if colors.ndim == 2 and colors.shape[1] == 3:
+
+            colors = numpy.hstack([colors, numpy.ones((len(colors), 1))])
+
+        colorIndices = self._faceVertexIndices.copy() if colorIndices is None else numpy.asarray(colorIndices, dtype=int).reshape(-1)
+        self._colorSets[name] = (colors.reshape(-1, 4), colorIndices)
+
+    def invalidateGeometry(self):
+        """
+        Invalidates any cached geometry such as normals.
+        Connectivity remains valid since it does not depend on the points!
+
+        :rtype: None
+        """
+
+        for key in ('faceNormals', 'vertexNormals'):
+
+            self._cache.pop(key, None)
+
+    def cached(self, key, func):
+        """
+        Returns the cached value for the specified key.
+        If no value exists then the supplied function is used to compute it.
+
+        :type key: str
+        :type func: Callable
+        :rtype: Any
+        """
+
+        value = self._cache.get(key, None)
+
+        if value is None:
+
+            value = func()
+            self._cache[key] = value
+
+        return value
+
+    def worldPoints(self):
+        """
+        Returns the vertex points in world space.
+
+        :rtype: numpy.ndarray
+        """
+
+        return (self._points @ self._matrix[:3, :3]) + self._matrix[3, :3]
+
+    def faceOffsets(self):
+        """
+        Returns the face-vertex offset for each face, with the total face-vertex count appended.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self.cached('faceOffsets', lambda: numpy.concatenate([[0], numpy.cumsum(self._faceVertexCounts)]).astype(int))
+
+    def faceIds(self):
+        """
+        Returns the face index for each face-vertex.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self.cached('faceIds', lambda: numpy.repeat(numpy.arange(self.numFaces()), self._faceVertexCounts))
+
+    def nextFaceVertices(self):
+        """
+        Returns the next face-vertex, in winding order, for each face-vertex.
+
+        :rtype: numpy.ndarray
+        """
+
+        def compute():
+
+            offsets = self.faceOffsets()
+            nextIndices = numpy.arange(1, self.numFaceVertices() + 1)
+
+            isValid = self._faceVertexCounts > 0
+            nextIndices[offsets[1:][isValid] - 1] = offsets[:-1][isValid]
+
+            return nextIndices
+
+        return self.cached('nextFaceVertices', compute)
+
+    def buildEdges(self):
+        """
+        Computes the unique edges along with the edge index for each face-vertex.
+        Edges are ordered by their first appearance in the face-vertex indices.
+
+        :rtype: None
+        """
+
+        # Collect face-vertex edges
+        #
+        start = self._faceVertexIndices
+        end = self._faceVertexIndices[self.nextFaceVertices()]
+
+        lower, upper = numpy.minimum(start, end), numpy.maximum(start, end)
+        keys = (lower * max(self.numVertices(), 1)) + upper
+
+        # Remove duplicate edges while preserving order
+        #
+        uniqueKeys, firstIndices, inverse = numpy.unique(keys, return_index=True, return_inverse=True)
+        order = numpy.argsort(firstIndices, kind='stable')
+
+        ranks = numpy.empty(order.size, dtype=int)
+        ranks[order] = numpy.arange(order.size)
+
+        edges = numpy.stack([start[firstIndices[order]], end[firstIndices[order]]], axis=1)
+
+        self._cache['edges'] = edges
+        self._cache['faceVertexEdges'] = ranks[inverse.reshape(-1)]
+
+    def edges(self):
+        """
+        Returns the vertex pair for each edge.
+
+        :rtype: numpy.ndarray
+        """
+
+        if 'edges' not in self._cache:
+
+            self.buildEdges()
+
+        return self._cache['edges']
+
+    def faceVertexEdges(self):
+        """
+        Returns the edge index for each face-vertex.
+        Each face-vertex owns the edge to the next face-vertex in winding order.
+
+        :rtype: numpy.ndarray
+        """
+
+        if 'faceVertexEdges' not in self._cache:
+
+            self.buildEdges()
+
+        return self._cache['faceVertexEdges']
+
+    def vertexFaces(self):
+        """
+        Returns the compressed connected faces for each vertex.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        return self.cached('vertexFaces', lambda: compressRows(self._faceVertexIndices, self.faceIds(), self.numVertices()))
+
+    def vertexEdges(self):
+        """
+        Returns the compressed connected edges for each vertex.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        def compute():
+
+            edges = self.edges()
+            edgeIndices = numpy.arange(len(edges))
+
+            return compressRows(edges.T.reshape(-1), numpy.concatenate([edgeIndices, edgeIndices]), self.numVertices())
+
+        return self.cached('vertexEdges', compute)
+
+    def vertexNeighbours(self):
+        """
+        Returns the compressed connected vertices for each vertex.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        def compute():
+
+            edges = self.edges()
+            return compressRows(edges.T.reshape(-1), edges[:, ::-1].T.reshape(-1), self.numVertices())
+
+        return self.cached('vertexNeighbours', compute)
+
+    def edgeFaces(self):
+        """
+        Returns the compressed connected faces for each edge.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        return self.cached('edgeFaces', lambda: compressRows(self.faceVertexEdges(), self.faceIds(), self.numEdges()))
+
+    def faceNormals(self, normalize=True):
+        """
+        Returns the normal for each face using Newell's method.
+        Unnormalized normals are scaled by twice the face area.
+
+        :type normalize: bool
+        :rtype: numpy.ndarray
+        """
+
+        def compute():
+
+            # Sum the cross products around each face
+            #
+            points = self._points
+            start = points[self._faceVertexIndices]
+            end = points[self._faceVertexIndices[self.nextFaceVertices()]]
+
+            normals = numpy.zeros((self.numFaces(), 3), dtype=float)
+            numpy.add.at(normals, self.faceIds(), numpy.cross(start, end))
+
+            return normals
+
+        normals = self.cached('faceNormals', compute)
+
+        if normalize:
+
+            lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+            return numpy.divide(normals, lengths, out=numpy.zeros_like(normals), where=lengths > 0.0)
+
+        else:
+
+            return normals
+
+    def vertexNormals(self):
+        """
+        Returns the area-weighted normal for each vertex.
+
+        :rtype: numpy.ndarray
+        """
+
+        def compute():
+
+            normals = numpy.zeros((self.numVertices(), 3), dtype=float)
+            numpy.add.at(normals, self._faceVertexIndices, self.faceNormals(normalize=False)[self.faceIds()])
+
+            lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+            return numpy.divide(normals, lengths, out=numpy.zeros_like(normals), where=lengths > 0.0)
+
+        return self.cached('vertexNormals', compute)
+
+    def faceVertexNormals(self):
+        """
+        Returns the normal for each face-vertex.
+        If this mesh has no explicit normals then the vertex normals are used instead.
+
+        :rtype: numpy.ndarray
+        """
+
+        if self.hasNormals():
+
+            return self._normals[self._normalIndices]
+
+        else:
+
+            return self.vertexNormals()[self._faceVertexIndices]
+
+    def faceCenters(self):
+        """
+        Returns the average of the vertex points for each face.
+
+        :rtype: numpy.ndarray
+        """
+
+        sums = numpy.zeros((self.numFaces(), 3), dtype=float)
+        numpy.add.at(sums, self.faceIds(), self._points[self._faceVertexIndices])
+
+        counts = numpy.maximum(self._faceVertexCounts, 1)[:, None]
+        return sums / counts
+
+    def triangles(self):
+        """
+        Returns the fan triangulated vertex indices alongside the face index for each triangle.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        def compute():
+
+            # Evaluate triangle count per face
+            #
+            offsets = self.faceOffsets()
+            triangleCounts = numpy.maximum(self._faceVertexCounts - 2, 0)
+            faceIndices = numpy.repeat(numpy.arange(self.numFaces()), triangleCounts)
+
+            # Fan each face from its first face-vertex
+            #
+            triangleOffsets = numpy.concatenate([[0], numpy.cumsum(triangleCounts)])
+            localIndices = numpy.arange(faceIndices.size) - triangleOffsets[faceIndices]
+            firstIndices = offsets[faceIndices]
+
+            triangles = numpy.stack(
+                [
+                    self._faceVertexIndices[firstIndices],
+                    self._faceVertexIndices[firstIndices + localIndices + 1],
+                    self._faceVertexIndices[firstIndices + localIndices + 2]
+                ],
+                axis=1
+            )
+
+            return triangles, faceIndices
+
+        return self.cached('triangles', compute)
+
+    def triangulated(self):
+        """
+        Returns a triangulated copy of this mesh.
+        Only the points and topology are copied!
+
+        :rtype: MeshData
+        """
+
+        triangles, faceIndices = self.triangles()
+
+        return self.__class__(
+            self._points.copy(),
+            numpy.full(len(triangles), 3, dtype=int),
+            triangles.reshape(-1),
+            name=self._name,
+            matrix=self._matrix.copy(),
+            materials=self._materials,
+            materialIndices=self._materialIndices[faceIndices]
+        )
+
+    def faceVertexTangents(self, name):
+        """
+        Returns the tangent and binormal for each face-vertex using the specified UV set.
+
+        :type name: str
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+
+        # Evaluate neighbouring face-vertices
+        #
+        uvs, uvIndices = self._uvSets[name]
+
+        current = numpy.arange(self.numFaceVertices())
+        nextIndices = self.nextFaceVertices()
+        previousIndices = numpy.empty_like(nextIndices)
+        previousIndices[nextIndices] = current
+
+        # Solve for tangent frame
+        #
+        points = self._points[self._faceVertexIndices]
+        coords = uvs[uvIndices]
+
+        dp1, dp2 = points[nextIndices] - points, points[previousIndices] - points
+        duv1, duv2 = coords[nextIndices] - coords, coords[previousIndices] - coords
+
+        determinant = (duv1[:, 0] * duv2[:, 1]) - (duv2[:, 0] * duv1[:, 1])
+        scale = numpy.divide(1.0, determinant, out=numpy.zeros_like(determinant), where=numpy.abs(determinant) > 1e-12)[:, None]
+
+        tangents = ((dp1 * duv2[:, 1, None]) - (dp2 * duv1[:, 1, None])) * scale
+        binormals = ((dp2 * duv1[:, 0, None]) - (dp1 * duv2[:, 0, None])) * scale
+
+        # Orthonormalize against normals
+        #
+        normals = self.faceVertexNormals()
+        tangents -= normals * numpy.sum(tangents * normals, axis=1, keepdims=True)
+
+        lengths = numpy.linalg.norm(tangents, axis=1, keepdims=True)
+        tangents = numpy.divide(tangents, lengths, out=numpy.zeros_like(tangents), where=lengths > 0.0)
+
+        handedness = numpy.where(numpy.sum(numpy.cross(normals, tangents) * binormals, axis=1, keepdims=True) < 0.0, -1.0, 1.0)
+        binormals = numpy.cross(normals, tangents) * handedness
+
+        return tangents, binormals
+
+    def copy(self):
+        """
+        Returns a deep copy of this mesh.
+
+        :rtype: MeshData
+        """
+
+        copy = self.__class__(
+            self._points.copy(),
+            self._faceVertexCounts.copy(),
+            self._faceVertexIndices.copy(),
+            name=self._name,
+            matrix=self._matrix.copy(),
+            uvSets={name: (values.copy(), indices.copy()) for (name, (values, indices)) in self._uvSets.items()},
+            colorSets={name: (values.copy(), indices.copy()) for (name, (values, indices)) in self._colorSets.items()},
+            materials=list(self._materials),
+            materialIndices=self._materialIndices.copy(),
+            smoothingGroups=None if self._smoothingGroups is None else self._smoothingGroups.copy(),
+            edgeSmoothings=None if self._edgeSmoothings is None else self._edgeSmoothings.copy()
+        )
+
+        if self.hasNormals():
+
+            copy.setNormals(self._normals.copy(), normalIndices=self._normalIndices.copy())
+
+        return copy
+    # endregion
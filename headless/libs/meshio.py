@@ -0,0 +1,528 @@
+import os
+
+from .meshdata import MeshData
+from ...python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1',
+    'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2',
+    'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4',
+    'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4',
+    'double': 'f8', 'float64': 'f8'
+}
+
+
+def resolveIndices(indices, count):
+    """
+    Returns the zero-based version of the supplied OBJ indices.
+    Negative indices are relative to the number of elements defined so far.
+
+    :type indices: numpy.ndarray
+    :type count: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return numpy.where(indices < 0, count + indices, indices - 1)
+
+
+def loadMTL(filePath):
+    """
+    Returns the diffuse texture paths for each material in the supplied MTL file.
+
+    :type filePath: str
+    :rtype: Dict[str, str]
+    """
+
+    textures = {}
+    material = None
+
+    try:
+
+        with open(filePath, 'r') as stream:
+
+            for line in stream:
+
+                tokens = line.strip().split(maxsplit=1)
+
+                if len(tokens) < 2:
+
+                    continue
+
+                keyword, value = tokens
+
+                if keyword == 'newmtl':
+
+                    material = value.strip()
+                    textures[material] = ''
+
+                elif keyword == 'map_Kd' and material is not None:
+
+                    textures[material] = value.strip().split()[-1]
+
+                else:
+
+                    continue
+
+    except OSError as exception:
+
+        log.warning(exception)
+
+    return textures
+
+
+def loadOBJ(filePath):
+    """
+    Returns a mesh from the supplied Wavefront OBJ file.
+    All the groups and objects within the file are merged into a single mesh.
+
+    :type filePath: str
+    :rtype: MeshData
+    """
+
+    # Bucket lines by keyword
+    #
+    points, uvs, normals = [], [], []
+    faces, faceCounts = [], []
+    pointCounts, uvCounts, normalCounts = [], [], []
+    materialNames, materialIndices, smoothingGroups = [], [], []
+    textures = {}
+
+    materialIndex = 0
+    smoothingGroup = 0
+
+    with open(filePath, 'r') as stream:
+
+        for line in stream:
+
+            # Check if line is empty or a comment
+            #
+            line = line.strip()
+
+            if len(line) == 0 or line.startswith('#'):
+
+                continue
+
+            tokens = line.split(maxsplit=1)
+            keyword, data = tokens[0], tokens[1] if len(tokens) > 1 else ''
+
+            if keyword == 'v':
+
+                points.append(data)
+
+            elif keyword == 'vt':
+
+                uvs.append(data)
+
+            elif keyword == 'vn':
+
+                normals.append(data)
+
+            elif keyword == 'f':
+
+                tokens = data.split()
+                faces.extend(tokens)
+                faceCounts.append(len(tokens))
+
+                pointCounts.append(len(points))
+                uvCounts.append(len(uvs))
+                normalCounts.append(len(normals))
+
+                materialIndices.append(materialIndex)
+                smoothingGroups.append(smoothingGroup)
+
+            elif keyword == 'usemtl':
+
+                name = data.strip()
+
+                if name not in materialNames:
+
+                    materialNames.append(name)
+
+                materialIndex = materialNames.index(name)
+
+            elif keyword == 's':
+
+                value = data.strip()
+                smoothingGroup = 0 if value in ('off', '') else int(value)
+
+            elif keyword == 'mtllib':
+
+                mtlPath = os.path.join(os.path.dirname(filePath), data.strip())
+                textures.update(loadMTL(mtlPath))
+
+            else:
+
+                continue
+
+    # Convert vertex data into arrays
+    # Any trailing vertex colours, following the point coordinates, are preserved!
+    #
+    pointData = [numpy.array(point.split(), dtype=float) for point in points]
+    pointWidth = min((len(point) for point in pointData), default=3)
+    pointData = numpy.array([point[:pointWidth] for point in pointData], dtype=float).reshape(-1, pointWidth)
+
+    uvData = numpy.array([uv.split()[:2] for uv in uvs], dtype=float).reshape(-1, 2)
+    normalData = numpy.array([normal.split()[:3] for normal in normals], dtype=float).reshape(-1, 3)
+
+    # Split face tokens into point, UV and normal indices
+    #
+    faceCounts = numpy.array(faceCounts, dtype=int)
+    numFaceVertices = len(faces)
+
+    columns = numpy.zeros((numFaceVertices, 3), dtype=int)
+    hasColumn = [False, False, False]
+
+    for (i, token) in enumerate(faces):
+
+        for (j, value) in enumerate(token.split('/')):
+
+            if len(value) > 0:
+
+                columns[i, j] = int(value)
+                hasColumn[j] = True
+
+    faceIds = numpy.repeat(numpy.arange(faceCounts.size), faceCounts)
+    pointIndices = resolveIndices(columns[:, 0], numpy.array(pointCounts, dtype=int)[faceIds])
+
+    # Build mesh
+    #
+    name = os.path.splitext(os.path.basename(filePath))[0]
+    materials = [(materialName, textures.get(materialName, '')) for materialName in materialNames]
+    smoothingGroups = numpy.array(smoothingGroups, dtype=int)
+
+    mesh = MeshData(
+        pointData[:, :3],
+        faceCounts,
+        pointIndices,
+        name=name,
+        materials=materials,
+        materialIndices=numpy.array(materialIndices, dtype=int),
+        smoothingGroups=smoothingGroups if smoothingGroups.any() else None
+    )
+
+    if hasColumn[1] and len(uvData) > 0:
+
+        mesh.setUVSet('map1', uvData, resolveIndices(columns[:, 1], numpy.array(uvCounts, dtype=int)[faceIds]))
+
+    if hasColumn[2] and len(normalData) > 0:
+
+        mesh.setNormals(normalData, normalIndices=resolveIndices(columns[:, 2], numpy.array(normalCounts, dtype=int)[faceIds]))
+
+    if pointWidth >= 6:
+
+        mesh.setColorSet('colorSet1', pointData[:, 3:7])
+
+    return mesh
+
+
+def readPLYHeader(stream):
+    """
+    Returns the format and element definitions from the supplied PLY stream.
+    Each element consists of a name, count and list of (name, type, list-count-type) properties.
+
+    :type stream: io.BufferedReader
+    :rtype: Tuple[str, List[Tuple[str, int, List[Tuple[str, str, Union[str, None]]]]]]
+    """
+
+    # Check magic number
+    #
+    magic = stream.readline().strip()
+
+    if magic != b'ply':
+
+        raise TypeError('readPLYHeader() expects a valid PLY file!')
+
+    # Iterate through header lines
+    #
+    fileFormat = 'ascii'
+    elements = []
+
+    while True:
+
+        line = stream.readline()
+
+        if len(line) == 0:
+
+            raise TypeError('readPLYHeader() expects a header terminator!')
+
+        tokens = line.decode('ascii').strip().split()
+
+        if len(tokens) == 0 or tokens[0] in ('comment', 'obj_info'):
+
+            continue
+
+        elif tokens[0] == 'format':
+
+            fileFormat = tokens[1]
+
+        elif tokens[0] == 'element':
+
+            elements.append((tokens[1], int(tokens[2]), []))
+
+        elif tokens[0] == 'property':
+
+            if tokens[1] == 'list':
+
+                elements[-1][2].append((tokens[4], PLY_TYPES[tokens[3]], PLY_TYPES[tokens[2]]))
+
+            else:
+
+                elements[-1][2].append((tokens[2], PLY_TYPES[tokens[1]], None))
+
+        elif tokens[0] == 'end_header':
+
+            break
+
+        else:
+
+            continue
+
+    return fileFormat, elements
+
+
+def readPLYElement(stream, count, properties, byteOrder):
+    """
+    Returns the property values for the supplied binary PLY element.
+    Scalar properties are returned as arrays while list properties are returned as (counts, values) pairs.
+
+    :type stream: io.BufferedReader
+    :type count: int
+    :type properties: List[Tuple[str, str, Union[str, None]]]
+    :type byteOrder: str
+    :rtype: Dict[str, Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]]
+    """
+
+    # Check if element only contains scalar properties
+    # If so, the element can be read as a single structured array
+    #
+    isScalar = all(listType is None for (name, dtype, listType) in properties)
+
+    if isScalar:
+
+        dtype = numpy.dtype([(name, byteOrder + dtype) for (name, dtype, listType) in properties])
+        data = numpy.frombuffer(stream.read(dtype.itemsize * count), dtype=dtype, count=count)
+
+        return {name: data[name] for (name, dtype, listType) in properties}
+
+    # Check if element contains a single list with uniform lengths
+    # This is the most common layout for triangulated and quadrangulated meshes!
+    #
+    if len(properties) == 1 and count > 0:
+
+        name, dtype, listType = properties[0]
+        countType, valueType = numpy.dtype(byteOrder + listType), numpy.dtype(byteOrder + dtype)
+
+        position = stream.tell()
+        size = int(numpy.frombuffer(stream.read(countType.itemsize), dtype=countType)[0])
+        stream.seek(position)
+
+        uniform = numpy.dtype([('count', countType), ('values', valueType, (size,))])
+        buffer = stream.read(uniform.itemsize * count)
+
+        if len(buffer) == uniform.itemsize * count:
+
+            data = numpy.frombuffer(buffer, dtype=uniform, count=count)
+
+            if numpy.all(data['count'] == size):
+
+                return {name: (data['count'].astype(int), data['values'].reshape(-1).astype(int))}
+
+        stream.seek(position)
+
+    # Read items individually
+    #
+    results = {name: ([], []) for (name, dtype, listType) in properties}
+
+    for i in range(count):
+
+        for (name, dtype, listType) in properties:
+
+            if listType is None:
+
+                valueType = numpy.dtype(byteOrder + dtype)
+                results[name][1].append(numpy.frombuffer(stream.read(valueType.itemsize), dtype=valueType)[0])
+
+            else:
+
+                countType, valueType = numpy.dtype(byteOrder + listType), numpy.dtype(byteOrder + dtype)
+                size = int(numpy.frombuffer(stream.read(countType.itemsize), dtype=countType)[0])
+
+                results[name][0].append(size)
+                results[name][1].extend(numpy.frombuffer(stream.read(valueType.itemsize * size), dtype=valueType, count=size))
+
+    output = {}
+
+    for (name, dtype, listType) in properties:
+
+        counts, values = results[name]
+
+        if listType is None:
+
+            output[name] = numpy.array(values)
+
+        else:
+
+            output[name] = (numpy.array(counts, dtype=int), numpy.array(values))
+
+    return output
+
+
+def readPLYText(stream, elements):
+    """
+    Returns the property values for each element from the supplied ASCII PLY stream.
+
+    :type stream: io.BufferedReader
+    :type elements: List[Tuple[str, int, List[Tuple[str, str, Union[str, None]]]]]
+    :rtype: Dict[str, Dict[str, Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]]]
+    """
+
+    lines = iter(stream.read().decode('ascii').splitlines())
+    results = {}
+
+    for (elementName, count, properties) in elements:
+
+        # Collect element lines
+        #
+        rows = [next(lines).split() for i in range(count)]
+        isScalar = all(listType is None for (name, dtype, listType) in properties)
+
+        if isScalar:
+
+            data = numpy.array(rows, dtype=float).reshape(count, len(properties))
+            results[elementName] = {name: data[:, i].astype(dtype) for (i, (name, dtype, listType)) in enumerate(properties)}
+
+            continue
+
+        # Parse list properties
+        #
+        values = {name: ([], []) for (name, dtype, listType) in properties}
+
+        for row in rows:
+
+            position = 0
+
+            for (name, dtype, listType) in properties:
+
+                if listType is None:
+
+                    values[name][1].append(float(row[position]))
+                    position += 1
+
+                else:
+
+                    size = int(row[position])
+                    values[name][0].append(size)
+                    values[name][1].extend(row[position + 1:position + 1 + size])
+
+                    position += size + 1
+
+        results[elementName] = {
+            name: (numpy.array(values[name][0], dtype=int), numpy.array(values[name][1], dtype=float).astype(dtype)) if listType is not None else numpy.array(values[name][1], dtype=dtype)
+            for (name, dtype, listType) in properties
+        }
+
+    return results
+
+
+def loadPLY(filePath):
+    """
+    Returns a mesh from the supplied Stanford PLY file.
+    Both ASCII and binary encodings are supported, along with any per-vertex normals, UVs and colours.
+
+    :type filePath: str
+    :rtype: MeshData
+    """
+
+    # Read elements from file
+    #
+    with open(filePath, 'rb') as stream:
+
+        fileFormat, elements = readPLYHeader(stream)
+
+        if fileFormat == 'ascii':
+
+            data = readPLYText(stream, elements)
+
+        elif fileFormat in ('binary_little_endian', 'binary_big_endian'):
+
+            byteOrder = '<' if fileFormat == 'binary_little_endian' else '>'
+            data = {name: readPLYElement(stream, count, properties, byteOrder) for (name, count, properties) in elements}
+
+        else:
+
+            raise TypeError(f'loadPLY() expects a valid format ({fileFormat} given)!')
+
+    # Collect vertex properties
+    #
+    vertices = data.get('vertex', {})
+    faces = data.get('face', {})
+
+    points = numpy.stack([vertices['x'], vertices['y'], vertices['z']], axis=1).astype(float)
+
+    faceKey = 'vertex_indices' if 'vertex_indices' in faces else 'vertex_index'
+    faceVertexCounts, faceVertexIndices = faces.get(faceKey, (numpy.zeros(0, dtype=int), numpy.zeros(0, dtype=int)))
+
+    name = os.path.splitext(os.path.basename(filePath))[0]
+    mesh = MeshData(points, faceVertexCounts, faceVertexIndices.astype(int), name=name)
+
+    # Collect optional vertex properties
+    #
+    if all(key in vertices for key in ('nx', 'ny', 'nz')):
+
+        mesh.setNormals(numpy.stack([vertices['nx'], vertices['ny'], vertices['nz']], axis=1))
+
+    for (u, v) in (('s', 't'), ('u', 'v'), ('texture_u', 'texture_v')):
+
+        if u in vertices and v in vertices:
+
+            mesh.setUVSet('map1', numpy.stack([vertices[u], vertices[v]], axis=1))
+            break
+
+    if all(key in vertices for key in ('red', 'green', 'blue')):
+
+        channels = [vertices[key] for key in ('red', 'green', 'blue', 'alpha') if key in vertices]
+        colors = numpy.stack(channels, axis=1).astype(float)
+
+        if numpy.issubdtype(vertices['red'].dtype, numpy.integer):
+
+            colors /= 255.0
+
+        mesh.setColorSet('colorSet1', colors)
+
+    return mesh
+
+
+def loadMesh(filePath):
+    """
+    Returns a mesh from the supplied file.
+    The file extension is used to determine which loader to use.
+
+    :type filePath: str
+    :rtype: MeshData
+    """
+
+    extension = os.path.splitext(filePath)[-1].lower()
+
+    if extension == '.obj':
+
+        return loadOBJ(filePath)
+
+    elif extension == '.ply':
+
+        return loadPLY(filePath)
+
+    else:
+
+        raise TypeError(f'loadMesh() expects an OBJ or PLY file ({extension} given)!')
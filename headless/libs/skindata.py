@@ -0,0 +1,585 @@
+from weakref import WeakSet
+from .meshdata import MeshData
+from ...python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+class SkinData(object):
+    """
+    Base class for in-memory skin weights.
+    Weights are stored as a sparse vertices x influences matrix using compressed sparse rows.
+    Influences are stored as id-name pairs so that weights can be remapped between skins without a scene!
+    """
+
+    # region Dunderscores
+    __slots__ = (
+        '__weakref__',
+        '_name',
+        '_mesh',
+        '_influences',
+        '_offsets',
+        '_influenceIds',
+        '_weights',
+        '_revision',
+        '_maxInfluences',
+        '_selection',
+        '_properties'
+    )
+
+    __instances__ = WeakSet()
+
+    def __init__(self, mesh=None, influences=None, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :type mesh: Union[MeshData, None]
+        :type influences: Union[Dict[int, str], List[str], None]
+        :key name: str
+        :key numVertices: int
+        :key offsets: numpy.ndarray
+        :key influenceIds: numpy.ndarray
+        :key weights: numpy.ndarray
+        :key maxInfluences: int
+        :key properties: dict
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SkinData, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = kwargs.get('name', '')
+        self._mesh = None
+        self._influences = {}
+        self._offsets = numpy.zeros(1, dtype=int)
+        self._influenceIds = numpy.zeros(0, dtype=int)
+        self._weights = numpy.zeros(0, dtype=float)
+        self._revision = 0
+        self._maxInfluences = kwargs.get('maxInfluences', 4)
+        self._selection = []
+        self._properties = dict(kwargs.get('properties', {}))
+
+        # Update influences
+        #
+        if isinstance(influences, dict):
+
+            self._influences.update({int(influenceId): str(influenceName) for (influenceId, influenceName) in influences.items()})
+
+        elif influences is not None:
+
+            self._influences.update({influenceId: str(influenceName) for (influenceId, influenceName) in enumerate(influences)})
+
+        else:
+
+            pass
+
+        # Update weights
+        #
+        numVertices = mesh.numVertices() if isinstance(mesh, MeshData) else kwargs.get('numVertices', 0)
+        offsets = kwargs.get('offsets', None)
+
+        if offsets is not None:
+
+            self.setWeights(offsets, kwargs.get('influenceIds', []), kwargs.get('weights', []))
+
+        else:
+
+            self._offsets = numpy.zeros(numVertices + 1, dtype=int)
+
+        self.mesh = mesh
+
+        self.__instances__.add(self)
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this instance.
+
+        :rtype: str
+        """
+
+        return f'<{self.__class__.__name__}:{self.name} vertices={self.numVertices()} influences={self.numInfluences()}>'
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of this skin.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Setter method that updates the name of this skin.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._name = name
+
+    @property
+    def mesh(self):
+        """
+        Getter method that returns the mesh this skin is bound to.
+
+        :rtype: Union[MeshData, None]
+        """
+
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh):
+        """
+        Setter method that updates the mesh this skin is bound to.
+
+        :type mesh: Union[MeshData, None]
+        :rtype: None
+        """
+
+        # Check if mesh is compatible
+        #
+        if mesh is None:
+
+            self._mesh = None
+            return
+
+        if not isinstance(mesh, MeshData):
+
+            raise TypeError(f'mesh.setter() expects a mesh ({type(mesh).__name__} given)!')
+
+        numVertices = self.numVertices()
+
+        if mesh.numVertices() != numVertices:
+
+            raise TypeError(f'mesh.setter() expects {numVertices} vertices ({mesh.numVertices()} given)!')
+
+        self._mesh = mesh
+
+    @property
+    def influences(self):
+        """
+        Getter method that returns the influence id-name pairs.
+
+        :rtype: Dict[int, str]
+        """
+
+        return self._influences
+
+    @property
+    def offsets(self):
+        """
+        Getter method that returns the compressed row offsets for each vertex.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._offsets
+
+    @property
+    def influenceIds(self):
+        """
+        Getter method that returns the compressed influence IDs.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._influenceIds
+
+    @property
+    def weights(self):
+        """
+        Getter method that returns the compressed influence weights.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self._weights
+
+    @property
+    def revision(self):
+        """
+        Getter method that returns the weight revision.
+        The revision is incremented whenever the weights are modified.
+
+        :rtype: int
+        """
+
+        return self._revision
+
+    @property
+    def maxInfluences(self):
+        """
+        Getter method that returns the max number of influences per vertex.
+
+        :rtype: int
+        """
+
+        return self._maxInfluences
+
+    @maxInfluences.setter
+    def maxInfluences(self, maxInfluences):
+        """
+        Setter method that updates the max number of influences per vertex.
+
+        :type maxInfluences: int
+        :rtype: None
+        """
+
+        self._maxInfluences = int(maxInfluences)
+
+    @property
+    def selection(self):
+        """
+        Getter method that returns the selected vertex indices.
+
+        :rtype: List[int]
+        """
+
+        return self._selection
+
+    @property
+    def properties(self):
+        """
+        Getter method that returns the user properties.
+
+        :rtype: dict
+        """
+
+        return self._properties
+    # endregion
+
+    # region Methods
+    @classmethod
+    def iterInstances(cls):
+        """
+        Returns a generator that yields all the live skin instances.
+
+        :rtype: Iterator[SkinData]
+        """
+
+        return iter(list(cls.__instances__))
+
+    def numVertices(self):
+        """
+        Returns the number of weighted vertices.
+
+        :rtype: int
+        """
+
+        return len(self._offsets) - 1
+
+    def numInfluences(self):
+        """
+        Returns the number of influences.
+
+        :rtype: int
+        """
+
+        return len(self._influences)
+
+    def numWeights(self):
+        """
+        Returns the number of non-zero weights.
+
+        :rtype: int
+        """
+
+        return len(self._weights)
+
+    def rows(self):
+        """
+        Returns the vertex index for each compressed weight.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.repeat(numpy.arange(self.numVertices()), numpy.diff(self._offsets))
+
+    def influenceId(self, name):
+        """
+        Returns the ID for the supplied influence name.
+        If no influence exists then none is returned!
+
+        :type name: str
+        :rtype: Union[int, None]
+        """
+
+        return next((influenceId for (influenceId, influenceName) in self._influences.items() if influenceName == name), None)
+
+    def addInfluence(self, name):
+        """
+        Adds the supplied influence name and returns its ID.
+        If the influence already exists then the existing ID is returned instead!
+
+        :type name: str
+        :rtype: int
+        """
+
+        influenceId = self.influenceId(name)
+
+        if influenceId is not None:
+
+            return influenceId
+
+        influenceId = max(self._influences.keys(), default=-1) + 1
+        self._influences[influenceId] = name
+
+        return influenceId
+
+    def removeInfluence(self, *influenceIds):
+        """
+        Removes the supplied influence IDs along with any associated weights.
+
+        :type influenceIds: Union[int, List[int]]
+        :rtype: None
+        """
+
+        mask = numpy.isin(self._influenceIds, influenceIds)
+
+        if mask.any():
+
+            log.warning(f'Removing weighted influences: {sorted(set(self._influenceIds[mask].tolist()))}')
+            self.filterWeights(~mask)
+
+        for influenceId in influenceIds:
+
+            self._influences.pop(influenceId, None)
+
+    def setWeights(self, offsets, influenceIds, weights):
+        """
+        Updates the compressed weights for all vertices.
+
+        :type offsets: Union[numpy.ndarray, List[int]]
+        :type influenceIds: Union[numpy.ndarray, List[int]]
+        :type weights: Union[numpy.ndarray, List[float]]
+        :rtype: None
+        """
+
+        offsets = numpy.asarray(offsets, dtype=int)
+        influenceIds = numpy.asarray(influenceIds, dtype=int)
+        weights = numpy.asarray(weights, dtype=float)
+
+        if len(influenceIds) != len(weights) or offsets[-1] != len(weights):
+
+            raise TypeError('setWeights() expects identical length arrays!')
+
+        if self._mesh is not None and self._mesh.numVertices() != (len(offsets) - 1):
+
+            raise TypeError(f'setWeights() expects {self._mesh.numVertices()} vertices ({len(offsets) - 1} given)!')
+
+        self._offsets, self._influenceIds, self._weights = offsets, influenceIds, weights
+        self._revision += 1
+
+    def filterWeights(self, mask):
+        """
+        Removes any compressed weights that are not marked by the supplied mask.
+
+        :type mask: numpy.ndarray
+        :rtype: None
+        """
+
+        counts = numpy.bincount(self.rows()[mask], minlength=self.numVertices())
+
+        self._offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+        self._influenceIds = self._influenceIds[mask]
+        self._weights = self._weights[mask]
+        self._revision += 1
+
+    def iterVertexWeights(self, indices):
+        """
+        Returns a generator that yields vertex-weights pairs for the supplied vertex indices.
+
+        :type indices: numpy.ndarray
+        :rtype: Iterator[Tuple[int, Dict[int, float]]]
+        """
+
+        offsets = self._offsets.tolist()
+        influenceIds = self._influenceIds.tolist()
+        weights = self._weights.tolist()
+
+        for index in numpy.asarray(indices, dtype=int).tolist():
+
+            start, end = offsets[index], offsets[index + 1]
+            yield index, dict(zip(influenceIds[start:end], weights[start:end]))
+
+    def setVertexWeights(self, vertexWeights):
+        """
+        Replaces the weights for the supplied vertices.
+        Any zero weights are omitted from the compressed rows.
+
+        :type vertexWeights: Dict[int, Dict[int, float]]
+        :rtype: None
+        """
+
+        # Check if there are any updates
+        #
+        numUpdates = len(vertexWeights)
+
+        if numUpdates == 0:
+
+            return
+
+        # Check if influences exist
+        #
+        vertexIndices = numpy.fromiter(vertexWeights.keys(), dtype=int, count=numUpdates)
+        updates = list(vertexWeights.values())
+
+        newRows = numpy.repeat(vertexIndices, [len(weights) for weights in updates])
+        newIds = numpy.fromiter((influenceId for weights in updates for influenceId in weights.keys()), dtype=int, count=len(newRows))
+        newWeights = numpy.fromiter((weight for weights in updates for weight in weights.values()), dtype=float, count=len(newRows))
+
+        missing = set(numpy.unique(newIds).tolist()).difference(self._influences.keys())
+
+        if len(missing) > 0:
+
+            raise KeyError(f'setVertexWeights() expects valid influence IDs ({sorted(missing)} given)!')
+
+        # Merge unchanged rows with updated rows
+        #
+        rows = self.rows()
+        keep = ~numpy.isin(rows, vertexIndices)
+        nonZero = newWeights != 0.0
+
+        rows = numpy.concatenate([rows[keep], newRows[nonZero]])
+        influenceIds = numpy.concatenate([self._influenceIds[keep], newIds[nonZero]])
+        weights = numpy.concatenate([self._weights[keep], newWeights[nonZero]])
+
+        order = numpy.argsort(rows, kind='stable')
+        counts = numpy.bincount(rows, minlength=self.numVertices())
+
+        self._offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+        self._influenceIds = influenceIds[order]
+        self._weights = weights[order]
+        self._revision += 1
+
+    def rowTotals(self):
+        """
+        Returns the total weight for each vertex.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.bincount(self.rows(), weights=self._weights, minlength=self.numVertices())
+
+    def normalize(self):
+        """
+        Normalizes the weights for all vertices.
+        Any vertices without weights are left untouched.
+
+        :rtype: None
+        """
+
+        totals = self.rowTotals()
+        totals[totals == 0.0] = 1.0
+
+        self._weights = self._weights / totals[self.rows()]
+        self._revision += 1
+
+    def prune(self, tolerance=1e-3, normalize=True):
+        """
+        Removes any weights below the specified tolerance.
+        The number of pruned weights is returned.
+
+        :type tolerance: float
+        :type normalize: bool
+        :rtype: int
+        """
+
+        mask = self._weights >= tolerance
+        numPruned = int(len(mask) - mask.sum())
+
+        if numPruned > 0:
+
+            self.filterWeights(mask)
+
+        if normalize:
+
+            self.normalize()
+
+        return numPruned
+
+    def cap(self, maxInfluences=None, normalize=True):
+        """
+        Removes the lowest weights from any vertices that exceed the max number of influences.
+        The number of capped weights is returned.
+
+        :type maxInfluences: Union[int, None]
+        :type normalize: bool
+        :rtype: int
+        """
+
+        # Order weights from highest to lowest per vertex
+        #
+        maxInfluences = self._maxInfluences if maxInfluences is None else maxInfluences
+
+        rows = self.rows()
+        order = numpy.lexsort((-self._weights, rows))
+        ranks = numpy.arange(len(order)) - self._offsets[rows]
+
+        # Remove any surplus weights
+        #
+        mask = numpy.zeros(len(order), dtype=bool)
+        mask[order] = ranks < maxInfluences
+
+        numCapped = int(len(mask) - mask.sum())
+
+        if numCapped > 0:
+
+            self.filterWeights(mask)
+
+        if normalize:
+
+            self.normalize()
+
+        return numCapped
+
+    def denseWeights(self):
+        """
+        Returns the weights as a dense vertices x influences matrix.
+        The columns are indexed by influence ID.
+
+        :rtype: numpy.ndarray
+        """
+
+        numColumns = max(self._influences.keys(), default=-1) + 1
+        weights = numpy.zeros((self.numVertices(), numColumns), dtype=float)
+        weights[self.rows(), self._influenceIds] = self._weights
+
+        return weights
+
+    def copy(self):
+        """
+        Returns a copy of this skin.
+
+        :rtype: SkinData
+        """
+
+        skin = self.__class__(
+            mesh=None,
+            influences=dict(self._influences),
+            name=self._name,
+            offsets=self._offsets.copy(),
+            influenceIds=self._influenceIds.copy(),
+            weights=self._weights.copy(),
+            maxInfluences=self._maxInfluences,
+            properties=self._properties
+        )
+
+        skin.mesh = self._mesh
+
+        return skin
+    # endregion
@@ -0,0 +1,206 @@
+import os
+
+from multiprocessing import get_context
+from . import meshio
+from .skindata import SkinData
+from ...python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+WEIGHT_FILE_VERSION = 1
+
+
+def smallestUnsignedType(maxValue):
+    """
+    Returns the smallest unsigned integer type that can store the supplied value.
+
+    :type maxValue: int
+    :rtype: numpy.dtype
+    """
+
+    for dtype in (numpy.uint8, numpy.uint16, numpy.uint32):
+
+        if maxValue <= numpy.iinfo(dtype).max:
+
+            return dtype
+
+    return numpy.uint64
+
+
+def saveSkin(skin, filePath, meshPath=''):
+    """
+    Saves the supplied skin to a compressed weight file.
+    Weight files are NumPy archives that store per-vertex influence counts, influence IDs and single precision weights.
+    An optional mesh path, relative to the weight file, can be stored so the mesh can be bound on load.
+
+    :type skin: SkinData
+    :type filePath: str
+    :type meshPath: str
+    :rtype: None
+    """
+
+    # Check if skin is valid
+    #
+    if not isinstance(skin, SkinData):
+
+        raise TypeError(f'saveSkin() expects a skin ({type(skin).__name__} given)!')
+
+    # Compress arrays using the smallest possible types
+    #
+    influenceIds = numpy.array(sorted(skin.influences.keys()), dtype=int)
+    influenceNames = numpy.array([skin.influences[influenceId] for influenceId in influenceIds.tolist()], dtype=str)
+
+    counts = numpy.diff(skin.offsets)
+    countType = smallestUnsignedType(int(counts.max(initial=0)))
+    indexType = smallestUnsignedType(int(influenceIds.max(initial=0)))
+
+    # Write arrays to file
+    #
+    with open(filePath, 'wb') as stream:
+
+        numpy.savez_compressed(
+            stream,
+            version=numpy.array(WEIGHT_FILE_VERSION),
+            name=numpy.array(skin.name, dtype=str),
+            mesh=numpy.array(meshPath, dtype=str),
+            maxInfluences=numpy.array(skin.maxInfluences),
+            influenceIds=influenceIds.astype(indexType),
+            influenceNames=influenceNames,
+            counts=counts.astype(countType),
+            indices=skin.influenceIds.astype(indexType),
+            weights=skin.weights.astype(numpy.float32)
+        )
+
+    log.debug(f'Saved {skin.numWeights()} weights to: {filePath}')
+
+
+def loadSkin(filePath, mesh=None):
+    """
+    Returns a skin from the supplied weight file.
+    If no mesh is supplied then the mesh path stored inside the weight file is loaded instead, if any.
+
+    :type filePath: str
+    :type mesh: Union[MeshData, str, None]
+    :rtype: SkinData
+    """
+
+    # Read arrays from file
+    #
+    with numpy.load(filePath, allow_pickle=False) as archive:
+
+        version = int(archive['version'])
+
+        if version > WEIGHT_FILE_VERSION:
+
+            raise TypeError(f'loadSkin() expects a weight file version <= {WEIGHT_FILE_VERSION} ({version} given)!')
+
+        name = str(archive['name'])
+        meshPath = str(archive['mesh'])
+        maxInfluences = int(archive['maxInfluences'])
+        influences = dict(zip(archive['influenceIds'].tolist(), archive['influenceNames'].tolist()))
+        counts = archive['counts'].astype(int)
+        indices = archive['indices'].astype(int)
+        weights = archive['weights'].astype(float)
+
+    # Check if mesh requires loading
+    #
+    if mesh is None and len(meshPath) > 0:
+
+        mesh = os.path.join(os.path.dirname(filePath), meshPath)
+
+    if isinstance(mesh, str):
+
+        mesh = meshio.loadMesh(mesh)
+
+    # Create skin from arrays
+    #
+    offsets = numpy.zeros(len(counts) + 1, dtype=int)
+    numpy.cumsum(counts, out=offsets[1:])
+
+    skin = SkinData(
+        influences=influences,
+        name=name,
+        offsets=offsets,
+        influenceIds=indices,
+        weights=weights,
+        maxInfluences=maxInfluences
+    )
+
+    skin.mesh = mesh
+
+    return skin
+
+
+def processSkin(func, filePath, outputPath):
+    """
+    Loads the supplied weight file, passes the skin to the function and saves the result.
+    This is the unit of work used by `processSkins` and is safe to call from a worker process.
+
+    :type func: Callable[[SkinData], None]
+    :type filePath: str
+    :type outputPath: str
+    :rtype: str
+    """
+
+    with numpy.load(filePath, allow_pickle=False) as archive:
+
+        meshPath = str(archive['mesh'])
+
+    skin = loadSkin(filePath)
+    func(skin)
+
+    if len(meshPath) > 0:
+
+        meshPath = os.path.relpath(os.path.join(os.path.dirname(filePath), meshPath), os.path.dirname(outputPath))
+
+    saveSkin(skin, outputPath, meshPath=meshPath)
+
+    return outputPath
+
+
+def processSkins(func, filePaths, outputPaths=None, processes=None):
+    """
+    Applies the supplied function to each weight file using a pool of worker processes.
+    The function must be defined at module level so that it can be pickled!
+    If no output paths are supplied then the weight files are overwritten.
+
+    :type func: Callable[[SkinData], None]
+    :type filePaths: List[str]
+    :type outputPaths: Union[List[str], None]
+    :type processes: Union[int, None]
+    :rtype: List[str]
+    """
+
+    # Check if output paths are valid
+    #
+    filePaths = list(filePaths)
+    outputPaths = list(filePaths if outputPaths is None else outputPaths)
+
+    if len(filePaths) != len(outputPaths):
+
+        raise TypeError('processSkins() expects identical length lists!')
+
+    # Check if a pool is required
+    #
+    numFiles = len(filePaths)
+
+    if numFiles == 0:
+
+        return []
+
+    elif numFiles == 1 or processes == 1:
+
+        return [processSkin(func, filePath, outputPath) for (filePath, outputPath) in zip(filePaths, outputPaths)]
+
+    else:
+
+        with get_context('spawn').Pool(processes=processes) as pool:
+
+            return pool.starmap(processSkin, [(func, filePath, outputPath) for (filePath, outputPath) in zip(filePaths, outputPaths)])
@@ -100,6 +100,71 @@ def loads(string, default=None, **kwargs):
         return default
 
 
+def parse(string, default=None, **kwargs):
+    """
+    Parses the supplied string into JSON compatible objects without decoding any classes.
+    The parsed objects can be decoded later on using `decode`.
+
+    :type string: str
+    :type default: Any
+    :rtype: Any
+    """
+
+    # Check if string needs decompressing
+    #
+    isCompressed = kwargs.get('decompress', False)
+
+    if isCompressed:
+
+        string = decompress(string)
+
+    # Try and parse json string
+    #
+    try:
+
+        return json.loads(string)
+
+    except json.JSONDecodeError as exception:
+
+        log.debug(exception)
+        return default
+
+
+def decode(obj, **kwargs):
+    """
+    Decodes the supplied JSON compatible objects into python objects.
+    Just like `loads`, leaf objects are decoded before their parents and any keyword arguments will be passed to the class constructors.
+
+    :type obj: Any
+    :rtype: Any
+    """
+
+    decoder = kwargs.pop('cls', psonparser.PSONDecoder)(**kwargs)
+    return decodeObject(obj, decoder.object_hook)
+
+
+def decodeObject(obj, hook):
+    """
+    Recursively decodes the supplied JSON compatible object using the specified object hook.
+
+    :type obj: Any
+    :type hook: Callable[[dict], Any]
+    :rtype: Any
+    """
+
+    if isinstance(obj, dict):
+
+        return hook({key: decodeObject(value, hook) for (key, value) in obj.items()})
+
+    elif isinstance(obj, list):
+
+        return [decodeObject(item, hook) for item in obj]
+
+    else:
+
+        return obj
+
+
 def dump(filePath, obj, **kwargs):
     """
     Dumps the supplied object into the specified json file.
@@ -8,7 +8,6 @@ from ..python import annotationutils, stringutils, arrayutils
 from ..decorators.classproperty import classproperty
 from ..vendor.six import with_metaclass, string_types
 from ..vendor.six.moves import collections_abc
-from ..vendor.Qt import QtGui
 
 import logging
 logging.basicConfig()
@@ -320,6 +319,7 @@ class PSONObject(collections_abc.MutableMapping, metaclass=pabcmeta.PABCMeta):
         :rtype: Union[QtGui.QIcon, None]
         """
 
+        from ..vendor.Qt import QtGui  # Qt is imported on demand to keep headless sessions Qt-free!
         return QtGui.QIcon(':data/icons/dict.svg')
 
     def weakReference(self):
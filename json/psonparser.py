@@ -70,6 +70,7 @@ class PSONDecoder(json.JSONDecoder):
     # region Dunderscores
     __slots__ = ('object_init_hook',)
     __remaps__ = {}
+    __pending_remaps__ = []
 
     @classmethod
     def __static_init__(cls, *args, **kwargs):
@@ -121,14 +122,35 @@ class PSONDecoder(json.JSONDecoder):
     @classmethod
     def registerRemaps(cls, directory):
         """
-        Loads any PSON remaps from the specified directory.
+        Registers the specified directory of PSON remaps.
+        The remaps are not loaded until the first object is remapped!
 
         :type directory: str
         :rtype: None
         """
 
-        remaps = psonremap.loadRemaps(directory)
-        cls.__remaps__.update({remap.name: remap for remap in remaps})
+        cls.__pending_remaps__.append(directory)
+
+    @classmethod
+    def getRemap(cls, className):
+        """
+        Returns the PSON remap associated with the given class name.
+        Any pending remap directories are loaded before the lookup is performed.
+
+        :type className: str
+        :rtype: Union[psonremap.PSONRemap, None]
+        """
+
+        # Check if there are any pending directories
+        #
+        while len(cls.__pending_remaps__) > 0:
+
+            directory = cls.__pending_remaps__.pop(0)
+            remaps = psonremap.loadRemaps(directory)
+
+            cls.__remaps__.update({remap.name: remap for remap in remaps})
+
+        return cls.__remaps__.get(className, None)
 
     @classmethod
     def findClass(cls, className, moduleName):
@@ -184,7 +206,7 @@ class PSONDecoder(json.JSONDecoder):
         className = obj.get('__class__', obj.get('__name__', ''))  # This is here for legacy purposes!
         moduleName = obj.get('__module__', '')
 
-        remap = self.__remaps__.get(className, None)  # type: psonremap.PSONRemap
+        remap = self.getRemap(className)  # type: psonremap.PSONRemap
 
         if remap is None:
 
@@ -0,0 +1,286 @@
+import time
+
+from ..python import importutils
+from ..collections.animcurvearray import AnimCurveArray, TangentType
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+def getTransformTolerances(translate=1e-3, rotate=1e-2, scale=1e-4):
+    """
+    Returns the per-channel tolerances for the translate, rotate and scale channels, in that order.
+    Translation is measured in scene units, rotation in degrees and scale as a unitless factor.
+
+    :type translate: float
+    :type rotate: float
+    :type scale: float
+    :rtype: List[float]
+    """
+
+    return ([translate] * 3) + ([rotate] * 3) + ([scale] * 3)
+
+
+def sampleSlopes(times, samples):
+    """
+    Returns the slopes for the supplied dense samples using second-order finite differences.
+
+    :type times: numpy.ndarray
+    :type samples: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    if times.size < 2:
+
+        return numpy.zeros_like(samples)
+
+    else:
+
+        return numpy.gradient(samples, times, axis=-1)
+
+
+def reduceSamples(times, samples, tolerances, slopes=None, inSlopes=None, required=None, maxIterations=None):
+    """
+    Returns the reduced curves that fit the supplied dense samples within each channel's tolerance.
+    Keys are selected using a Ramer-Douglas-Peucker split against a hermite fit, with tangents fitted from the samples.
+    Every channel is processed at once, so each iteration splits all the failing segments simultaneously.
+    If no in-slopes are supplied then the slopes are used for both the in and out tangents.
+
+    :type times: Union[Sequence[float], numpy.ndarray]
+    :type samples: Union[Sequence[Sequence[float]], numpy.ndarray]
+    :type tolerances: Union[float, Sequence[float], numpy.ndarray]
+    :type slopes: Union[Sequence[Sequence[float]], numpy.ndarray, None]
+    :type inSlopes: Union[Sequence[Sequence[float]], numpy.ndarray, None]
+    :type required: Union[numpy.ndarray, None]
+    :type maxIterations: Union[int, None]
+    :rtype: AnimCurveArray
+    """
+
+    # Evaluate supplied arguments
+    #
+    times = numpy.asarray(times, dtype=float).reshape(-1)
+    samples = numpy.atleast_2d(numpy.asarray(samples, dtype=float))
+    numChannels, numSamples = samples.shape
+
+    if times.size != numSamples:
+
+        raise TypeError(f'reduceSamples() expects {times.size} samples per channel ({numSamples} given)!')
+
+    if numSamples == 0:
+
+        return AnimCurveArray(offsets=numpy.zeros(numChannels + 1, dtype=int))
+
+    tolerances = numpy.broadcast_to(numpy.asarray(tolerances, dtype=float).reshape(-1), (numChannels,))
+    slopes = sampleSlopes(times, samples) if slopes is None else numpy.atleast_2d(numpy.asarray(slopes, dtype=float))
+    inSlopes = slopes if inSlopes is None else numpy.atleast_2d(numpy.asarray(inSlopes, dtype=float))
+    maxIterations = maxIterations if isinstance(maxIterations, int) else numSamples
+
+    # Initialize keys at the end points
+    # Any required samples are also kept regardless of their error!
+    #
+    keep = numpy.zeros((numChannels, numSamples), dtype=bool) if required is None else numpy.array(required, dtype=bool).reshape(numChannels, numSamples)
+
+    if numSamples > 0:
+
+        keep[:, 0] = True
+        keep[:, -1] = True
+
+    # Iterate until every channel is within tolerance
+    # An extra pass is made to evaluate the error left by the final iteration!
+    #
+    indices = numpy.arange(numSamples)
+    active = numpy.arange(numChannels) if numSamples > 2 else numpy.array([], dtype=int)
+
+    for iteration in range(maxIterations + 1):
+
+        # Check if there are any active channels
+        #
+        if active.size == 0:
+
+            break
+
+        # Locate the keys surrounding each sample
+        #
+        activeKeep = keep[active]
+        left = numpy.maximum.accumulate(numpy.where(activeKeep, indices, 0), axis=1)
+        right = numpy.minimum.accumulate(numpy.where(activeKeep, indices, numSamples - 1)[:, ::-1], axis=1)[:, ::-1]
+
+        # Evaluate hermite fit between the surrounding keys
+        #
+        activeSamples, activeSlopes, activeInSlopes = samples[active], slopes[active], inSlopes[active]
+
+        t0, t1 = times[left], times[right]
+        dt = t1 - t0
+        u = numpy.divide(times - t0, dt, out=numpy.zeros_like(dt), where=dt > 0.0)
+
+        v0, v1 = numpy.take_along_axis(activeSamples, left, axis=1), numpy.take_along_axis(activeSamples, right, axis=1)
+        m0, m1 = numpy.take_along_axis(activeSlopes, left, axis=1) * dt, numpy.take_along_axis(activeInSlopes, right, axis=1) * dt
+
+        u2 = u * u
+        u3 = u2 * u
+        fit = (((2.0 * u3) - (3.0 * u2) + 1.0) * v0) + ((u3 - (2.0 * u2) + u) * m0) + (((-2.0 * u3) + (3.0 * u2)) * v1) + ((u3 - u2) * m1)
+
+        # Collect samples that exceed their channel's tolerance
+        #
+        errors = numpy.abs(fit - activeSamples)
+        errors[activeKeep] = 0.0
+
+        exceeds = errors > tolerances[active, None]
+        rows, columns = numpy.nonzero(exceeds)
+
+        if rows.size == 0:
+
+            break
+
+        elif iteration == maxIterations:
+
+            log.warning(f'reduceSamples() exceeded {maxIterations} iteration(s)!')
+            break
+
+        # Split each failing segment at its largest error
+        #
+        segments = (rows * numSamples) + left[rows, columns]
+        order = numpy.lexsort((-errors[rows, columns], segments))
+        segments = segments[order]
+
+        isFirst = numpy.ones(segments.size, dtype=bool)
+        isFirst[1:] = segments[1:] != segments[:-1]
+        chosen = order[isFirst]
+
+        keep[active[rows[chosen]], columns[chosen]] = True
+        active = active[numpy.unique(rows)]
+
+    # Build curves from kept samples
+    #
+    channels, columns = numpy.nonzero(keep)
+    counts = numpy.bincount(channels, minlength=numChannels)
+    numKeys = columns.size
+
+    inTangents = numpy.zeros((numKeys, 3), dtype=float)
+    inTangents[:, 0] = 1.0
+    inTangents[:, 1] = inSlopes[channels, columns]
+
+    outTangents = numpy.zeros((numKeys, 3), dtype=float)
+    outTangents[:, 0] = 1.0
+    outTangents[:, 1] = slopes[channels, columns]
+
+    return AnimCurveArray(
+        times=times[columns],
+        values=samples[channels, columns],
+        inTangents=inTangents,
+        outTangents=outTangents,
+        inTangentTypes=[TangentType.Fixed] * numKeys,
+        outTangentTypes=[TangentType.Fixed] * numKeys,
+        offsets=numpy.concatenate([[0], numpy.cumsum(counts)])
+    )
+
+
+def reduceCurves(curves, tolerances, step=1.0):
+    """
+    Returns the reduced version of the supplied curves.
+    Each curve is densely sampled at the supplied step, alongside its original key times, before being reduced.
+
+    :type curves: AnimCurveArray
+    :type tolerances: Union[float, Sequence[float], numpy.ndarray]
+    :type step: float
+    :rtype: AnimCurveArray
+    """
+
+    # Check if there are any keys
+    #
+    if curves.numKeys() == 0:
+
+        return curves.copy()
+
+    # Sample curves over their combined time range
+    #
+    startTime, endTime = curves.times.min(), curves.times.max()
+    times = numpy.union1d(numpy.arange(startTime, endTime, step), curves.times)
+
+    values, slopes = curves.evaluate(times, slopes=True)
+    inSlopes = curves.evaluate(times, slopes=True, side='left')[1]
+
+    # Reduce samples while preserving each curve's end points
+    #
+    startTimes, endTimes = curves.timeRange()
+    channels = numpy.arange(len(curves))
+
+    required = numpy.zeros(values.shape, dtype=bool)
+    required[channels, numpy.searchsorted(times, startTimes)] = True
+    required[channels, numpy.searchsorted(times, endTimes)] = True
+
+    reduced = reduceSamples(times, values, tolerances, slopes=slopes, inSlopes=inSlopes, required=required)
+
+    # Trim reduced curves to their original time ranges
+    # Any empty curves are preserved as empty curves!
+    #
+    curveIds = reduced.curveIds()
+
+    isEmpty = numpy.diff(curves.offsets) == 0
+    mask = (reduced.times >= startTimes[curveIds]) & (reduced.times <= endTimes[curveIds]) & ~isEmpty[curveIds]
+    counts = numpy.bincount(curveIds[mask], minlength=len(reduced))
+
+    return reduced.take(numpy.flatnonzero(mask), numpy.concatenate([[0], numpy.cumsum(counts)]))
+
+
+def reduceKeyframes(keyframes, tolerance, step=1.0):
+    """
+    Returns the reduced version of the supplied keyframes.
+
+    :type keyframes: List[keyframe.Keyframe]
+    :type tolerance: float
+    :type step: float
+    :rtype: List[keyframe.Keyframe]
+    """
+
+    curves = AnimCurveArray.fromKeyframes(keyframes)
+    return reduceCurves(curves, tolerance, step=step).toKeyframes(0)
+
+
+def benchmark(numChannels=900, numSamples=1000, tolerance=1e-3, seed=0):
+    """
+    Reduces a batch of synthetic channels and reports the key count and elapsed time.
+
+    :type numChannels: int
+    :type numSamples: int
+    :type tolerance: float
+    :type seed: int
+    :rtype: Dict[str, Union[int, float]]
+    """
+
+    # Generate smooth synthetic channels
+    #
+    generator = numpy.random.default_rng(seed)
+    times = numpy.arange(numSamples, dtype=float)
+
+    frequencies = generator.uniform(0.005, 0.05, size=(numChannels, 3, 1))
+    amplitudes = generator.uniform(0.1, 10.0, size=(numChannels, 3, 1))
+    phases = generator.uniform(0.0, 6.28318, size=(numChannels, 3, 1))
+    samples = (amplitudes * numpy.sin((frequencies * times) + phases)).sum(axis=1)
+
+    # Reduce channels
+    #
+    startTime = time.perf_counter()
+    curves = reduceSamples(times, samples, tolerance)
+    elapsed = time.perf_counter() - startTime
+
+    # Verify reduced channels
+    #
+    maxError = float(numpy.abs(curves.evaluate(times) - samples).max())
+
+    results = {
+        'numChannels': numChannels,
+        'numSamples': numChannels * numSamples,
+        'numKeys': curves.numKeys(),
+        'ratio': curves.numKeys() / float(numChannels * numSamples),
+        'maxError': maxError,
+        'elapsed': elapsed
+    }
+
+    log.info(f'Reduced {results["numSamples"]} sample(s) to {results["numKeys"]} key(s) ({results["ratio"]:.1%}) in {elapsed:.3f}s, max error: {maxError:.2e}')
+    return results
@@ -0,0 +1,385 @@
+from dataclasses import dataclass, field
+from typing import List
+from . import rotationmath
+from ..python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+def getDepths(parents):
+    """
+    Returns the depth of each node from the supplied parent indices.
+    Root nodes are expected to have a parent index of -1 and a depth of zero!
+
+    :type parents: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Jump pointers until every node references a root
+    # Each pass doubles the distance covered so only log(depth) passes are required!
+    #
+    parents = numpy.asarray(parents, dtype=int)
+    numNodes = len(parents)
+
+    depths = (parents >= 0).astype(int)
+    pointers = parents.copy()
+
+    for i in range(numNodes.bit_length() + 1):
+
+        isLinked = pointers >= 0
+
+        if not isLinked.any():
+
+            return depths
+
+        linked = pointers[isLinked]
+        depths[isLinked] += depths[linked]
+        pointers[isLinked] = pointers[linked]
+
+    raise TypeError('getDepths() expects an acyclic hierarchy!')
+
+
+def sortHierarchy(parents):
+    """
+    Returns the topological order and the remapped parent indices for the supplied hierarchy.
+    Parents are guaranteed to appear before their children, and siblings retain their original order.
+
+    :type parents: numpy.ndarray
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    parents = numpy.asarray(parents, dtype=int)
+    order = numpy.argsort(getDepths(parents), kind='stable')
+
+    remap = numpy.empty_like(order)
+    remap[order] = numpy.arange(len(order))
+
+    sortedParents = parents[order]
+    sortedParents = numpy.where(sortedParents >= 0, remap[sortedParents], -1)
+
+    return order, sortedParents
+
+
+def getLevels(parents):
+    """
+    Returns the node indices grouped by depth.
+    Every node in a level only depends on nodes from the previous levels.
+
+    :type parents: numpy.ndarray
+    :rtype: List[numpy.ndarray]
+    """
+
+    depths = getDepths(parents)
+    order = numpy.argsort(depths, kind='stable')
+    counts = numpy.bincount(depths)
+
+    return numpy.split(order, numpy.cumsum(counts)[:-1])
+
+
+def localToWorld(matrices, parents, rootMatrices=None):
+    """
+    Returns the world matrices for the supplied local matrices.
+    Like `TransformationMatrix`, the matrices use row vectors so each local matrix is multiplied by its parent's world matrix.
+    Any leading axes, such as frames, are evaluated together with one pass per hierarchy level.
+
+    :type matrices: numpy.ndarray
+    :type parents: numpy.ndarray
+    :type rootMatrices: Union[numpy.ndarray, None]
+    :rtype: numpy.ndarray
+    """
+
+    matrices = numpy.asarray(matrices, dtype=float)
+    parents = numpy.asarray(parents, dtype=int)
+
+    worldMatrices = numpy.empty_like(matrices)
+
+    for (depth, level) in enumerate(getLevels(parents)):
+
+        # Check if these are root nodes
+        # Roots are optionally offset by the world matrices of their DCC parents!
+        #
+        if depth == 0:
+
+            worldMatrices[..., level, :, :] = matrices[..., level, :, :]
+
+            if rootMatrices is not None:
+
+                worldMatrices[..., level, :, :] = matrices[..., level, :, :] @ numpy.asarray(rootMatrices, dtype=float)[..., level, :, :]
+
+        else:
+
+            worldMatrices[..., level, :, :] = matrices[..., level, :, :] @ worldMatrices[..., parents[level], :, :]
+
+    return worldMatrices
+
+
+def worldToLocal(worldMatrices, parents, rootMatrices=None):
+    """
+    Returns the local matrices for the supplied world matrices.
+    Unlike `localToWorld`, every node is evaluated in a single pass since the parent world matrices are already known.
+
+    :type worldMatrices: numpy.ndarray
+    :type parents: numpy.ndarray
+    :type rootMatrices: Union[numpy.ndarray, None]
+    :rtype: numpy.ndarray
+    """
+
+    worldMatrices = numpy.asarray(worldMatrices, dtype=float)
+    parents = numpy.asarray(parents, dtype=int)
+
+    # Collect parent matrices
+    # Roots default to the identity matrix unless their DCC parent matrices are supplied!
+    #
+    isRoot = parents < 0
+
+    if rootMatrices is not None:
+
+        parentMatrices = numpy.broadcast_to(numpy.asarray(rootMatrices, dtype=float), worldMatrices.shape).copy()
+
+    else:
+
+        parentMatrices = numpy.broadcast_to(numpy.eye(4), worldMatrices.shape).copy()
+
+    parentMatrices[..., ~isRoot, :, :] = worldMatrices[..., parents[~isRoot], :, :]
+
+    return worldMatrices @ numpy.linalg.inv(parentMatrices)
+
+
+def composeMatrices(translations, eulerAngles, scales, orders='xyz', preRotations=None):
+    """
+    Returns the local matrices for the supplied transform components.
+    The rotation orders can either be a single order or one order per node, and euler angles are expected in radians.
+    Pre-rotations, such as joint orients, are applied after the euler rotation just like Maya's joints.
+
+    :type translations: numpy.ndarray
+    :type eulerAngles: numpy.ndarray
+    :type scales: numpy.ndarray
+    :type orders: Union[str, List[str]]
+    :type preRotations: Union[numpy.ndarray, None]
+    :rtype: numpy.ndarray
+    """
+
+    translations = numpy.asarray(translations, dtype=float)
+    eulerAngles = numpy.asarray(eulerAngles, dtype=float)
+    scales = numpy.asarray(scales, dtype=float)
+
+    # Compose rotation matrices
+    # Nodes are grouped by rotation order so each order is evaluated in a single pass!
+    #
+    rotations = getRotationMatrices(eulerAngles, orders)
+
+    if preRotations is not None:
+
+        rotations = rotations @ rotationmath.eulerToMatrix(preRotations)
+
+    # Compose transform matrices
+    #
+    matrices = numpy.zeros(translations.shape[:-1] + (4, 4), dtype=float)
+    matrices[..., :3, :3] = rotations * scales[..., :, None]
+    matrices[..., 3, :3] = translations
+    matrices[..., 3, 3] = 1.0
+
+    return matrices
+
+
+def decomposeMatrices(matrices, orders='xyz', preRotations=None):
+    """
+    Returns the translations, euler angles and scales from the supplied local matrices.
+    Negative scales are assigned to the x-axis so that the remaining rotation matrix is orthonormal.
+
+    :type matrices: numpy.ndarray
+    :type orders: Union[str, List[str]]
+    :type preRotations: Union[numpy.ndarray, None]
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+
+    matrices = numpy.asarray(matrices, dtype=float)
+
+    # Extract translation and scale
+    #
+    translations = matrices[..., 3, :3].copy()
+
+    scales = numpy.linalg.norm(matrices[..., :3, :3], axis=-1)
+    scales[..., 0] *= numpy.where(numpy.linalg.det(matrices[..., :3, :3]) < 0.0, -1.0, 1.0)
+
+    # Remove pre-rotations before extracting the euler angles
+    #
+    rotations = numpy.divide(matrices[..., :3, :3], scales[..., :, None], out=numpy.zeros(matrices.shape[:-2] + (3, 3)), where=scales[..., :, None] != 0.0)
+
+    if preRotations is not None:
+
+        rotations = rotations @ numpy.swapaxes(rotationmath.eulerToMatrix(preRotations), -1, -2)
+
+    eulerAngles = numpy.empty_like(translations)
+
+    for (order, indices) in groupOrders(orders, matrices.shape[-3]):
+
+        eulerAngles[..., indices, :] = rotationmath.matrixToEuler(rotations[..., indices, :, :], order=order)
+
+    return translations, eulerAngles, scales
+
+
+def groupOrders(orders, numNodes):
+    """
+    Returns the node indices grouped by rotation order.
+
+    :type orders: Union[str, List[str]]
+    :type numNodes: int
+    :rtype: List[Tuple[str, numpy.ndarray]]
+    """
+
+    if isinstance(orders, str):
+
+        return [(orders.lower(), numpy.arange(numNodes))]
+
+    orders = numpy.asarray([order.lower() for order in orders])
+    return [(order, numpy.flatnonzero(orders == order)) for order in numpy.unique(orders)]
+
+
+def getRotationMatrices(eulerAngles, orders='xyz'):
+    """
+    Returns the rotation matrices for the supplied euler angles with mixed rotation orders.
+
+    :type eulerAngles: numpy.ndarray
+    :type orders: Union[str, List[str]]
+    :rtype: numpy.ndarray
+    """
+
+    eulerAngles = numpy.asarray(eulerAngles, dtype=float)
+    rotations = numpy.empty(eulerAngles.shape[:-1] + (3, 3), dtype=float)
+
+    for (order, indices) in groupOrders(orders, eulerAngles.shape[-2]):
+
+        rotations[..., indices, :, :] = rotationmath.eulerToMatrix(eulerAngles[..., indices, :], order=order)
+
+    return rotations
+
+
+@dataclass
+class HierarchySnapshot:
+    """
+    Data class for interfacing with a captured transform hierarchy.
+    Nodes are stored in topological order and matrices are stored with a leading frame axis.
+    """
+
+    handles: List[int] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    parents: numpy.ndarray = field(default_factory=lambda: numpy.zeros(0, dtype=int))
+    orders: List[str] = field(default_factory=list)
+    preRotations: numpy.ndarray = field(default_factory=lambda: numpy.zeros((0, 3)))
+    matrices: numpy.ndarray = field(default_factory=lambda: numpy.zeros((0, 0, 4, 4)))
+    rootMatrices: numpy.ndarray = field(default_factory=lambda: numpy.zeros((0, 0, 4, 4)))
+    times: List[float] = field(default_factory=list)
+
+    def numNodes(self):
+        """
+        Returns the number of captured nodes.
+
+        :rtype: int
+        """
+
+        return len(self.handles)
+
+    def numFrames(self):
+        """
+        Returns the number of captured frames.
+
+        :rtype: int
+        """
+
+        return len(self.matrices)
+
+    def indexOf(self, handle):
+        """
+        Returns the index of the supplied node handle.
+
+        :type handle: int
+        :rtype: int
+        """
+
+        return self.handles.index(handle)
+
+    def roots(self):
+        """
+        Returns the indices of the root nodes.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.flatnonzero(self.parents < 0)
+
+    def worldMatrices(self):
+        """
+        Returns the world matrices for every frame.
+
+        :rtype: numpy.ndarray
+        """
+
+        return localToWorld(self.matrices, self.parents, rootMatrices=self.rootMatrices)
+
+    def setWorldMatrices(self, worldMatrices):
+        """
+        Updates the local matrices from the supplied world matrices.
+
+        :type worldMatrices: numpy.ndarray
+        :rtype: None
+        """
+
+        self.matrices = worldToLocal(worldMatrices, self.parents, rootMatrices=self.rootMatrices)
+
+    def decompose(self):
+        """
+        Returns the local translations, euler angles and scales for every frame.
+
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+
+        return decomposeMatrices(self.matrices, orders=self.orders, preRotations=self.preRotations)
+
+    def compose(self, translations, eulerAngles, scales):
+        """
+        Updates the local matrices from the supplied transform components.
+
+        :type translations: numpy.ndarray
+        :type eulerAngles: numpy.ndarray
+        :type scales: numpy.ndarray
+        :rtype: None
+        """
+
+        self.matrices = composeMatrices(translations, eulerAngles, scales, orders=self.orders, preRotations=self.preRotations)
+
+    def moveToOrigin(self):
+        """
+        Moves the root nodes to the world origin on every frame.
+        Since only the root matrices are changed, the descendants follow along without any further evaluation!
+
+        :rtype: None
+        """
+
+        roots = self.roots()
+        worldMatrices = self.matrices[:, roots] @ self.rootMatrices[:, roots]
+        worldMatrices[..., 3, :3] = 0.0
+
+        self.matrices[:, roots] = worldMatrices @ numpy.linalg.inv(self.rootMatrices[:, roots])
+
+    def compare(self, other, tolerance=1e-3):
+        """
+        Returns the indices of the nodes whose world matrices differ from the supplied snapshot.
+
+        :type other: HierarchySnapshot
+        :type tolerance: float
+        :rtype: numpy.ndarray
+        """
+
+        if self.handles != other.handles or self.numFrames() != other.numFrames():
+
+            raise TypeError('compare() expects a snapshot with matching nodes and frames!')
+
+        errors = numpy.abs(self.worldMatrices() - other.worldMatrices()).max(axis=(0, 2, 3), initial=0.0)
+        return numpy.flatnonzero(errors > tolerance)
@@ -0,0 +1,415 @@
+from ..python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+def dot(a, b):
+    """
+    Returns the row-wise dot products of the supplied vectors.
+
+    :type a: numpy.ndarray
+    :type b: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return numpy.einsum('...i,...i->...', a, b)
+
+
+def normalize(vectors, tolerance=1e-12):
+    """
+    Returns the supplied vectors with a unit length.
+    Any vectors shorter than the tolerance are returned unchanged.
+
+    :type vectors: numpy.ndarray
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    lengths = numpy.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / numpy.where(lengths > tolerance, lengths, 1.0)
+
+
+def closestSegmentParameters(points, starts, ends):
+    """
+    Returns the clamped parameter of the closest point on each of the supplied segments.
+
+    :type points: numpy.ndarray
+    :type starts: numpy.ndarray
+    :type ends: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    edges = ends - starts
+    lengths = dot(edges, edges)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+
+        parameters = numpy.where(lengths > 0.0, dot(points - starts, edges) / lengths, 0.0)
+
+    return numpy.clip(parameters, 0.0, 1.0)
+
+
+def barycentricCoordinates(points, triangles):
+    """
+    Returns the barycentric co-ordinates of the closest point on each of the supplied triangles.
+    Rather than branching on the seven Voronoi regions, the interior solution is tested against the closest point on each edge and the nearest candidate is kept.
+
+    :type points: numpy.ndarray
+    :type triangles: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Solve the interior projection
+    #
+    points = numpy.asarray(points, dtype=float)
+    triangles = numpy.asarray(triangles, dtype=float)
+
+    p0, p1, p2 = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    v0, v1, v2 = p1 - p0, p2 - p0, p0 - points
+
+    a, b, c = dot(v0, v0), dot(v0, v1), dot(v1, v1)
+    d, e = dot(v0, v2), dot(v1, v2)
+
+    det = (a * c) - (b * b)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+
+        s = numpy.where(det > 0.0, ((b * e) - (c * d)) / det, -1.0)
+        t = numpy.where(det > 0.0, ((b * d) - (a * e)) / det, -1.0)
+
+    # Collect the interior and edge candidates
+    #
+    e0 = closestSegmentParameters(points, p0, p1)
+    e1 = closestSegmentParameters(points, p1, p2)
+    e2 = closestSegmentParameters(points, p2, p0)
+
+    candidates = numpy.stack(
+        [
+            numpy.stack([1.0 - s - t, s, t], axis=-1),
+            numpy.stack([1.0 - e0, e0, numpy.zeros_like(e0)], axis=-1),
+            numpy.stack([numpy.zeros_like(e1), 1.0 - e1, e1], axis=-1),
+            numpy.stack([e2, numpy.zeros_like(e2), 1.0 - e2], axis=-1)
+        ],
+        axis=1
+    )
+
+    # Select the closest valid candidate
+    #
+    inside = (s >= 0.0) & (t >= 0.0) & ((s + t) <= 1.0)
+
+    positions = numpy.einsum('nkj,nji->nki', candidates, triangles)
+    distances = numpy.sum(numpy.square(positions - points[:, None, :]), axis=-1)
+    distances[:, 0] = numpy.where(inside, -1.0, numpy.inf)
+
+    choice = numpy.argmin(distances, axis=1)
+
+    return candidates[numpy.arange(len(points)), choice]
+
+
+def bilinearCoordinates(points, quadrilaterals, iterations=5):
+    """
+    Returns the bilinear co-ordinates of each point on the supplied quadrilaterals.
+    Each quadrilateral is flattened onto its averaged plane before the co-ordinates are solved using batched Newton iterations.
+
+    :type points: numpy.ndarray
+    :type quadrilaterals: numpy.ndarray
+    :type iterations: int
+    :rtype: numpy.ndarray
+    """
+
+    # Calculate averaged normals
+    #
+    points = numpy.asarray(points, dtype=float)
+    quadrilaterals = numpy.asarray(quadrilaterals, dtype=float)
+
+    p0, p1, p2, p3 = (quadrilaterals[:, i] for i in range(4))
+    origins = quadrilaterals.mean(axis=1)
+
+    n0 = normalize(numpy.cross(p1 - p0, p3 - p0))
+    n1 = normalize(numpy.cross(p2 - p1, p0 - p1))
+    n2 = normalize(numpy.cross(p3 - p2, p1 - p2))
+    n3 = normalize(numpy.cross(p0 - p3, p2 - p3))
+    normals = normalize(n0 + n1 + n2 + n3)
+
+    # Flatten quadrilaterals onto their planes
+    #
+    vertices = numpy.concatenate([quadrilaterals, points[:, None, :]], axis=1)
+    vertices -= dot(vertices - origins[:, None, :], normals[:, None, :])[..., None] * normals[:, None, :]
+
+    # Convert points into local space
+    # Since the local axes are orthonormal the inverse is just the transpose!
+    #
+    q0, q1, q2 = vertices[:, 0], vertices[:, 1], vertices[:, 2]
+
+    xAxes = normalize(q1 - q0)
+    zAxes = normalize(numpy.cross(xAxes, normalize(q2 - q0)))
+    yAxes = normalize(numpy.cross(zAxes, xAxes))
+
+    relative = vertices - q0[:, None, :]
+    x = dot(relative, xAxes[:, None, :])
+    y = dot(relative, yAxes[:, None, :])
+
+    # Iteratively solve for UV weights
+    #
+    x0, x1, x2, x3, px = (x[:, i] for i in range(5))
+    y0, y1, y2, y3, py = (y[:, i] for i in range(5))
+
+    u = numpy.zeros(len(points))
+    v = numpy.zeros(len(points))
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+
+        for i in range(iterations):
+
+            r1 = x0 * (1.0 - u) * (1.0 - v) + x1 * u * (1.0 - v) + x2 * u * v + x3 * (1.0 - u) * v - px
+            r2 = y0 * (1.0 - u) * (1.0 - v) + y1 * u * (1.0 - v) + y2 * u * v + y3 * (1.0 - u) * v - py
+
+            j11 = -x0 * (1.0 - v) + x1 * (1.0 - v) + x2 * v - x3 * v
+            j21 = -y0 * (1.0 - v) + y1 * (1.0 - v) + y2 * v - y3 * v
+            j12 = -x0 * (1.0 - u) - x1 * u + x2 * u + x3 * (1.0 - u)
+            j22 = -y0 * (1.0 - u) - y1 * u + y2 * u + y3 * (1.0 - u)
+
+            inverseDeterminant = 1.0 / (j11 * j22 - j12 * j21)
+
+            u = u - inverseDeterminant * (j22 * r1 - j12 * r2)
+            v = v - inverseDeterminant * (-j21 * r1 + j11 * r2)
+
+    return numpy.stack([u, v], axis=-1)
+
+
+def barycentricPoints(triangles, coordinates):
+    """
+    Returns the points on the supplied triangles from their barycentric co-ordinates.
+
+    :type triangles: numpy.ndarray
+    :type coordinates: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return numpy.einsum('nj,nji->ni', coordinates, triangles)
+
+
+def bilinearPoints(quadrilaterals, coordinates):
+    """
+    Returns the points on the supplied quadrilaterals from their bilinear co-ordinates.
+
+    :type quadrilaterals: numpy.ndarray
+    :type coordinates: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    u, v = coordinates[:, 0, None], coordinates[:, 1, None]
+    p0, p1, p2, p3 = (quadrilaterals[:, i] for i in range(4))
+
+    return (p0 + (p1 - p0) * u) * (1.0 - v) + (p3 + (p2 - p3) * u) * v
+
+
+def faceVertexOffsets(faceVertexCounts):
+    """
+    Returns the offset of the first face-vertex for each face.
+
+    :type faceVertexCounts: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    faceVertexCounts = numpy.asarray(faceVertexCounts, dtype=int)
+    return numpy.cumsum(faceVertexCounts) - faceVertexCounts
+
+
+def nextFaceVertices(faceVertexCounts):
+    """
+    Returns the index of the next face-vertex, in winding order, for each face-vertex.
+
+    :type faceVertexCounts: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    faceVertexCounts = numpy.asarray(faceVertexCounts, dtype=int)
+    offsets = faceVertexOffsets(faceVertexCounts)
+
+    nextIndices = numpy.arange(int(faceVertexCounts.sum())) + 1
+    nextIndices[offsets + faceVertexCounts - 1] = offsets
+
+    return nextIndices
+
+
+def newellNormals(facePoints, faceVertexCounts):
+    """
+    Returns the normal of each face from its flattened face-vertex points using Newell's method.
+
+    :type facePoints: numpy.ndarray
+    :type faceVertexCounts: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    offsets, nextIndices = faceVertexOffsets(faceVertexCounts), nextFaceVertices(faceVertexCounts)
+
+    crossProducts = numpy.cross(facePoints, facePoints[nextIndices])
+    return normalize(numpy.add.reduceat(crossProducts, offsets, axis=0))
+
+
+def projectPoints(points, origins, normals):
+    """
+    Returns the supplied points projected onto the planes defined by the origins and normals.
+
+    :type points: numpy.ndarray
+    :type origins: numpy.ndarray
+    :type normals: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    normals = normalize(normals)
+    return points - dot(points - origins, normals)[:, None] * normals
+
+
+def connectedComponents(numNodes, sources, targets):
+    """
+    Returns the zero-based component label for each node connected by the supplied source-target pairs.
+    Components are labelled by hooking roots onto their smallest connected root followed by pointer jumping.
+    As a result, labels are ordered by the smallest node in each component.
+
+    :type numNodes: int
+    :type sources: numpy.ndarray
+    :type targets: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    parents = numpy.arange(numNodes)
+    sources = numpy.asarray(sources, dtype=int)
+    targets = numpy.asarray(targets, dtype=int)
+
+    while True:
+
+        # Hook any roots onto their smallest connected root
+        #
+        sourceRoots, targetRoots = parents[sources], parents[targets]
+        changed = sourceRoots != targetRoots
+
+        if not numpy.any(changed):
+
+            break
+
+        sources, targets = sources[changed], targets[changed]
+        sourceRoots, targetRoots = sourceRoots[changed], targetRoots[changed]
+
+        parents[numpy.maximum(sourceRoots, targetRoots)] = numpy.minimum(sourceRoots, targetRoots)
+
+        # Compress paths until every node points to its root
+        #
+        while True:
+
+            grandparents = parents[parents]
+
+            if numpy.array_equal(grandparents, parents):
+
+                break
+
+            parents = grandparents
+
+    return numpy.unique(parents, return_inverse=True)[1].reshape(-1)
+
+
+def groupLabels(labels):
+    """
+    Returns the zero-based indices that belong to each label.
+
+    :type labels: numpy.ndarray
+    :rtype: List[numpy.ndarray]
+    """
+
+    labels = numpy.asarray(labels, dtype=int)
+
+    order = numpy.argsort(labels, kind='stable')
+    counts = numpy.bincount(labels)
+
+    return numpy.split(order, numpy.cumsum(counts)[:-1])
+
+
+def faceVertexEdges(faceVertexCounts, faceVertexIndices):
+    """
+    Returns the unique edge index for each face-vertex.
+    Each face-vertex owns the edge to the next face-vertex in winding order.
+
+    :type faceVertexCounts: numpy.ndarray
+    :type faceVertexIndices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    faceVertexIndices = numpy.asarray(faceVertexIndices, dtype=int)
+    nextIndices = nextFaceVertices(faceVertexCounts)
+
+    # Encode each vertex pair as a single key
+    # This is considerably faster than finding unique rows!
+    #
+    starts, ends = faceVertexIndices, faceVertexIndices[nextIndices]
+    numVertices = int(faceVertexIndices.max()) + 1 if len(faceVertexIndices) > 0 else 0
+
+    keys = numpy.minimum(starts, ends).astype(numpy.int64) * numVertices + numpy.maximum(starts, ends)
+
+    return numpy.unique(keys, return_inverse=True)[1].reshape(-1)
+
+
+def faceLabels(faceVertexCounts, faceVertexIndices):
+    """
+    Returns the zero-based component label for each face.
+    Faces are only considered connected when they share an edge.
+
+    :type faceVertexCounts: numpy.ndarray
+    :type faceVertexIndices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Sort face-vertices by edge
+    #
+    faceVertexCounts = numpy.asarray(faceVertexCounts, dtype=int)
+    numFaces = len(faceVertexCounts)
+
+    edgeIndices = faceVertexEdges(faceVertexCounts, faceVertexIndices)
+    faceIndices = numpy.repeat(numpy.arange(numFaces), faceVertexCounts)
+
+    order = numpy.argsort(edgeIndices, kind='stable')
+    edgeIndices, faceIndices = edgeIndices[order], faceIndices[order]
+
+    # Connect consecutive faces that share an edge
+    #
+    shared = edgeIndices[1:] == edgeIndices[:-1]
+    return connectedComponents(numFaces, faceIndices[:-1][shared], faceIndices[1:][shared])
+
+
+def vertexLabels(numVertices, faceVertexCounts, faceVertexIndices):
+    """
+    Returns the zero-based component label for each vertex.
+    Any vertices that are not referenced by a face are assigned their own label.
+
+    :type numVertices: int
+    :type faceVertexCounts: numpy.ndarray
+    :type faceVertexIndices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    faceVertexIndices = numpy.asarray(faceVertexIndices, dtype=int)
+    nextIndices = nextFaceVertices(faceVertexCounts)
+
+    return connectedComponents(numVertices, faceVertexIndices, faceVertexIndices[nextIndices])
+
+
+def edgeLabels(numVertices, edgeVertexIndices):
+    """
+    Returns the zero-based component label for each edge.
+    Edges are only considered connected when they share a vertex.
+
+    :type numVertices: int
+    :type edgeVertexIndices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    edgeVertexIndices = numpy.asarray(edgeVertexIndices, dtype=int).reshape(-1, 2)
+    labels = connectedComponents(numVertices, edgeVertexIndices[:, 0], edgeVertexIndices[:, 1])
+
+    return numpy.unique(labels[edgeVertexIndices[:, 0]], return_inverse=True)[1].reshape(-1)
@@ -0,0 +1,373 @@
+from ..python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+AXES = {'x': 0, 'y': 1, 'z': 2}
+ORDERS = ('xyz', 'xzy', 'yzx', 'yxz', 'zxy', 'zyx')
+
+
+def getAxisIndices(order):
+    """
+    Returns the axis indices and parity for the supplied rotation order.
+    The parity is positive for cyclic orders and negative for anti-cyclic orders.
+
+    :type order: str
+    :rtype: Tuple[int, int, int, int]
+    """
+
+    order = order.lower()
+
+    if order not in ORDERS:
+
+        raise TypeError(f'getAxisIndices() expects a valid rotation order ({order} given)!')
+
+    i, j, k = (AXES[char] for char in order)
+    parity = 1 if (j - i) % 3 == 1 else -1
+
+    return i, j, k, parity
+
+
+def axisAngleToMatrix(axis, angles):
+    """
+    Returns the rotation matrices for the supplied angles, in radians, around the specified axis.
+    Like `TransformationMatrix`, the matrices use row vectors.
+
+    :type axis: int
+    :type angles: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    angles = numpy.asarray(angles, dtype=float)
+    cos, sin = numpy.cos(angles), numpy.sin(angles)
+
+    matrices = numpy.zeros(angles.shape + (3, 3), dtype=float)
+    matrices[..., axis, axis] = 1.0
+
+    j, k = (axis + 1) % 3, (axis + 2) % 3
+    matrices[..., j, j] = cos
+    matrices[..., j, k] = sin
+    matrices[..., k, j] = -sin
+    matrices[..., k, k] = cos
+
+    return matrices
+
+
+def eulerToMatrix(angles, order='xyz'):
+    """
+    Returns the rotation matrices for the supplied euler angles, in radians.
+    The angles are expected in XYZ component order regardless of the rotation order, just like `EulerAngles`.
+
+    :type angles: numpy.ndarray
+    :type order: str
+    :rtype: numpy.ndarray
+    """
+
+    angles = numpy.asarray(angles, dtype=float)
+    i, j, k, parity = getAxisIndices(order)
+
+    return axisAngleToMatrix(i, angles[..., i]) @ axisAngleToMatrix(j, angles[..., j]) @ axisAngleToMatrix(k, angles[..., k])
+
+
+def normalizeMatrix(matrices):
+    """
+    Returns the rotation part of the supplied matrices by normalizing each axis.
+    Both 3x3 and 4x4 matrices are accepted.
+
+    :type matrices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    matrices = numpy.asarray(matrices, dtype=float)[..., :3, :3]
+    lengths = numpy.linalg.norm(matrices, axis=-1, keepdims=True)
+
+    return numpy.divide(matrices, lengths, out=numpy.zeros_like(matrices), where=lengths > 0.0)
+
+
+def matrixToEuler(matrices, order='xyz', tolerance=1e-9):
+    """
+    Returns the euler angles, in radians, from the supplied matrices.
+    The angles are returned in XYZ component order regardless of the rotation order, just like `EulerAngles`.
+
+    :type matrices: numpy.ndarray
+    :type order: str
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    # Transpose the row-vector matrices
+    # This allows for the standard column-vector decomposition of R = Rk * Rj * Ri
+    #
+    matrices = numpy.swapaxes(normalizeMatrix(matrices), -1, -2)
+    i, j, k, parity = getAxisIndices(order)
+
+    sinY = numpy.clip(-parity * matrices[..., k, i], -1.0, 1.0)
+    isLocked = numpy.abs(sinY) >= (1.0 - tolerance)
+
+    first = numpy.where(
+        isLocked,
+        numpy.arctan2(-parity * matrices[..., j, k], matrices[..., j, j]),
+        numpy.arctan2(parity * matrices[..., k, j], matrices[..., k, k])
+    )
+
+    second = numpy.arcsin(sinY)
+
+    third = numpy.where(
+        isLocked,
+        0.0,
+        numpy.arctan2(parity * matrices[..., j, i], matrices[..., i, i])
+    )
+
+    # Reorder angles into XYZ components
+    #
+    angles = numpy.empty(matrices.shape[:-2] + (3,), dtype=float)
+    angles[..., i] = first
+    angles[..., j] = second
+    angles[..., k] = third
+
+    return angles
+
+
+def matrixToQuaternion(matrices):
+    """
+    Returns the quaternions, in XYZW component order, from the supplied matrices.
+    Each quaternion is derived from the largest diagonal term to remain numerically stable.
+
+    :type matrices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Transpose the row-vector matrices
+    #
+    m = numpy.swapaxes(normalizeMatrix(matrices), -1, -2)
+
+    trace = m[..., 0, 0] + m[..., 1, 1] + m[..., 2, 2]
+    diagonal = numpy.stack([m[..., 0, 0], m[..., 1, 1], m[..., 2, 2], trace], axis=-1)
+    choice = numpy.argmax(diagonal, axis=-1)
+
+    # Evaluate every candidate solution
+    #
+    candidates = numpy.empty(m.shape[:-2] + (4, 4), dtype=float)
+
+    candidates[..., 0, :] = numpy.stack([1.0 + m[..., 0, 0] - m[..., 1, 1] - m[..., 2, 2], m[..., 1, 0] + m[..., 0, 1], m[..., 0, 2] + m[..., 2, 0], m[..., 2, 1] - m[..., 1, 2]], axis=-1)
+    candidates[..., 1, :] = numpy.stack([m[..., 1, 0] + m[..., 0, 1], 1.0 - m[..., 0, 0] + m[..., 1, 1] - m[..., 2, 2], m[..., 2, 1] + m[..., 1, 2], m[..., 0, 2] - m[..., 2, 0]], axis=-1)
+    candidates[..., 2, :] = numpy.stack([m[..., 0, 2] + m[..., 2, 0], m[..., 2, 1] + m[..., 1, 2], 1.0 - m[..., 0, 0] - m[..., 1, 1] + m[..., 2, 2], m[..., 1, 0] - m[..., 0, 1]], axis=-1)
+    candidates[..., 3, :] = numpy.stack([m[..., 2, 1] - m[..., 1, 2], m[..., 0, 2] - m[..., 2, 0], m[..., 1, 0] - m[..., 0, 1], 1.0 + trace], axis=-1)
+
+    # Select and normalize solutions
+    #
+    quaternions = numpy.take_along_axis(candidates, choice[..., None, None], axis=-2)[..., 0, :]
+    quaternions /= numpy.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+    return numpy.where(quaternions[..., 3:] < 0.0, -quaternions, quaternions)
+
+
+def quaternionToMatrix(quaternions):
+    """
+    Returns the row-vector rotation matrices from the supplied quaternions.
+
+    :type quaternions: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    quaternions = normalizeQuaternion(quaternions)
+    x, y, z, w = quaternions[..., 0], quaternions[..., 1], quaternions[..., 2], quaternions[..., 3]
+
+    matrices = numpy.empty(quaternions.shape[:-1] + (3, 3), dtype=float)
+
+    matrices[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[..., 0, 1] = 2.0 * (x * y + z * w)
+    matrices[..., 0, 2] = 2.0 * (x * z - y * w)
+    matrices[..., 1, 0] = 2.0 * (x * y - z * w)
+    matrices[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[..., 1, 2] = 2.0 * (y * z + x * w)
+    matrices[..., 2, 0] = 2.0 * (x * z + y * w)
+    matrices[..., 2, 1] = 2.0 * (y * z - x * w)
+    matrices[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    return matrices
+
+
+def eulerToQuaternion(angles, order='xyz'):
+    """
+    Returns the quaternions, in XYZW component order, from the supplied euler angles.
+
+    :type angles: numpy.ndarray
+    :type order: str
+    :rtype: numpy.ndarray
+    """
+
+    return matrixToQuaternion(eulerToMatrix(angles, order=order))
+
+
+def quaternionToEuler(quaternions, order='xyz'):
+    """
+    Returns the euler angles, in radians, from the supplied quaternions.
+
+    :type quaternions: numpy.ndarray
+    :type order: str
+    :rtype: numpy.ndarray
+    """
+
+    return matrixToEuler(quaternionToMatrix(quaternions), order=order)
+
+
+def normalizeQuaternion(quaternions):
+    """
+    Returns the unit length versions of the supplied quaternions.
+
+    :type quaternions: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    quaternions = numpy.asarray(quaternions, dtype=float)
+    lengths = numpy.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+    return numpy.divide(quaternions, lengths, out=numpy.zeros_like(quaternions), where=lengths > 0.0)
+
+
+def unwrapQuaternion(quaternions, axis=0):
+    """
+    Returns the supplied quaternions with their signs flipped so each quaternion lies in the same hemisphere as its predecessor.
+    This ensures interpolating between consecutive quaternions always takes the shortest path.
+
+    :type quaternions: numpy.ndarray
+    :type axis: int
+    :rtype: numpy.ndarray
+    """
+
+    quaternions = numpy.moveaxis(numpy.asarray(quaternions, dtype=float), axis, 0)
+
+    dots = numpy.sum(quaternions[1:] * quaternions[:-1], axis=-1)
+    signs = numpy.concatenate([numpy.ones((1,) + dots.shape[1:]), numpy.cumprod(numpy.where(dots < 0.0, -1.0, 1.0), axis=0)], axis=0)
+
+    return numpy.moveaxis(quaternions * signs[..., None], 0, axis)
+
+
+def nlerp(start, end, weight):
+    """
+    Returns the normalized linear interpolation between the supplied quaternions.
+    The end quaternions are flipped where required to take the shortest path.
+
+    :type start: numpy.ndarray
+    :type end: numpy.ndarray
+    :type weight: Union[float, numpy.ndarray]
+    :rtype: numpy.ndarray
+    """
+
+    start, end = numpy.asarray(start, dtype=float), numpy.asarray(end, dtype=float)
+    weight = numpy.asarray(weight, dtype=float)[..., None]
+
+    dots = numpy.sum(start * end, axis=-1, keepdims=True)
+    end = numpy.where(dots < 0.0, -end, end)
+
+    return normalizeQuaternion(start + ((end - start) * weight))
+
+
+def slerp(start, end, weight, tolerance=1e-6):
+    """
+    Returns the spherical linear interpolation between the supplied quaternions.
+    Any nearly parallel quaternions fallback on normalized linear interpolation.
+
+    :type start: numpy.ndarray
+    :type end: numpy.ndarray
+    :type weight: Union[float, numpy.ndarray]
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    # Ensure shortest path
+    #
+    start, end = normalizeQuaternion(start), normalizeQuaternion(end)
+    weight = numpy.asarray(weight, dtype=float)[..., None]
+
+    dots = numpy.sum(start * end, axis=-1, keepdims=True)
+    end = numpy.where(dots < 0.0, -end, end)
+    dots = numpy.clip(numpy.abs(dots), 0.0, 1.0)
+
+    # Evaluate interpolation weights
+    #
+    theta = numpy.arccos(dots)
+    sinTheta = numpy.sin(theta)
+    isParallel = sinTheta < tolerance
+
+    startWeight = numpy.where(isParallel, 1.0 - weight, numpy.sin((1.0 - weight) * theta) / numpy.where(isParallel, 1.0, sinTheta))
+    endWeight = numpy.where(isParallel, weight, numpy.sin(weight * theta) / numpy.where(isParallel, 1.0, sinTheta))
+
+    return normalizeQuaternion((start * startWeight) + (end * endWeight))
+
+
+def alternateEuler(angles, order='xyz'):
+    """
+    Returns the alternate euler solutions that produce the same rotation as the supplied angles.
+    The first and last axes are rotated by 180 degrees while the middle axis is mirrored.
+
+    :type angles: numpy.ndarray
+    :type order: str
+    :rtype: numpy.ndarray
+    """
+
+    angles = numpy.array(angles, dtype=float)
+    i, j, k, parity = getAxisIndices(order)
+
+    angles[..., i] += numpy.pi
+    angles[..., j] = numpy.pi - angles[..., j]
+    angles[..., k] += numpy.pi
+
+    return angles
+
+
+def wrapAngles(angles, reference):
+    """
+    Returns the supplied angles offset by multiples of 360 degrees to lie closest to the reference angles.
+
+    :type angles: numpy.ndarray
+    :type reference: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    twoPi = 2.0 * numpy.pi
+    return angles - (numpy.round((angles - reference) / twoPi) * twoPi)
+
+
+def unwrapEuler(angles, order='xyz', reference=None, axis=0):
+    """
+    Returns a continuous version of the supplied euler angles, in radians, over time.
+    For each frame, both equivalent euler solutions are wrapped against the previous frame and the closest solution is kept.
+    The time axis is processed sequentially while any other axes, such as joints, are processed at once.
+
+    :type angles: numpy.ndarray
+    :type order: str
+    :type reference: Union[numpy.ndarray, None]
+    :type axis: int
+    :rtype: numpy.ndarray
+    """
+
+    # Move time axis to the front
+    #
+    angles = numpy.moveaxis(numpy.asarray(angles, dtype=float), axis, 0)
+    alternates = alternateEuler(angles, order=order)
+
+    unwrapped = numpy.empty_like(angles)
+    previous = angles[0] if reference is None else numpy.broadcast_to(numpy.asarray(reference, dtype=float), angles.shape[1:])
+
+    # Iterate through frames
+    #
+    for frame in range(angles.shape[0]):
+
+        solution = wrapAngles(angles[frame], previous)
+        alternate = wrapAngles(alternates[frame], previous)
+
+        solutionDistance = numpy.sum(numpy.square(solution - previous), axis=-1, keepdims=True)
+        alternateDistance = numpy.sum(numpy.square(alternate - previous), axis=-1, keepdims=True)
+
+        previous = numpy.where(alternateDistance < solutionDistance, alternate, solution)
+        unwrapped[frame] = previous
+
+    return numpy.moveaxis(unwrapped, 0, axis)
@@ -0,0 +1,483 @@
+from dataclasses import dataclass, field
+from . import rotationmath
+from ..python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
+METHODS = ('lbs', 'dqs')
+BYTES_PER_SAMPLE = {'lbs': 96, 'dqs': 640}
+
+
+def compressWeights(vertexWeights, numVertices=None):
+    """
+    Returns the compressed sparse rows for the supplied vertex weights.
+    The vertex weights are expected in the same format as `AFnSkin.vertexWeights`.
+
+    :type vertexWeights: Dict[int, Dict[int, float]]
+    :type numVertices: Union[int, None]
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+
+    numVertices = (max(vertexWeights.keys(), default=-1) + 1) if numVertices is None else numVertices
+
+    counts = numpy.zeros(numVertices, dtype=int)
+    counts[list(vertexWeights.keys())] = [len(weights) for weights in vertexWeights.values()]
+
+    offsets = numpy.zeros(numVertices + 1, dtype=int)
+    numpy.cumsum(counts, out=offsets[1:])
+
+    influenceIds = numpy.zeros(offsets[-1], dtype=int)
+    weights = numpy.zeros(offsets[-1], dtype=float)
+
+    for (vertexIndex, vertexWeights) in vertexWeights.items():
+
+        start, end = offsets[vertexIndex], offsets[vertexIndex + 1]
+        influenceIds[start:end] = list(vertexWeights.keys())
+        weights[start:end] = list(vertexWeights.values())
+
+    return offsets, influenceIds, weights
+
+
+def padWeights(offsets, influenceIds, weights):
+    """
+    Returns the padded influence indices and weights from the supplied compressed sparse rows.
+    Each row is padded up to the largest number of influences with zero weights.
+
+    :type offsets: numpy.ndarray
+    :type influenceIds: numpy.ndarray
+    :type weights: numpy.ndarray
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    offsets = numpy.asarray(offsets, dtype=int)
+    counts = numpy.diff(offsets)
+
+    numVertices = len(counts)
+    numColumns = max(int(counts.max(initial=0)), 1)
+
+    rows = numpy.repeat(numpy.arange(numVertices), counts)
+    columns = numpy.arange(len(rows)) - offsets[rows]
+
+    paddedIds = numpy.zeros((numVertices, numColumns), dtype=int)
+    paddedIds[rows, columns] = influenceIds
+
+    paddedWeights = numpy.zeros((numVertices, numColumns), dtype=float)
+    paddedWeights[rows, columns] = weights
+
+    return paddedIds, paddedWeights
+
+
+def preBindMatrices(bindMatrices):
+    """
+    Returns the pre-bind matrices from the supplied joint world matrices at bind time.
+    This mirrors the matrices written by `AFnSkin.resetPreBindMatrices`.
+
+    :type bindMatrices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return numpy.linalg.inv(numpy.asarray(bindMatrices, dtype=float))
+
+
+def skinMatrices(preBindMatrices, jointMatrices, bindShapeMatrix=None):
+    """
+    Returns the skin matrices from the supplied pre-bind and per-frame joint world matrices.
+    Like `TransformationMatrix`, the matrices use row vectors so points are transformed by the pre-bind matrix first.
+
+    :type preBindMatrices: numpy.ndarray
+    :type jointMatrices: numpy.ndarray
+    :type bindShapeMatrix: Union[numpy.ndarray, None]
+    :rtype: numpy.ndarray
+    """
+
+    matrices = numpy.matmul(numpy.asarray(preBindMatrices, dtype=float), numpy.asarray(jointMatrices, dtype=float))
+
+    if bindShapeMatrix is not None:
+
+        matrices = numpy.matmul(numpy.asarray(bindShapeMatrix, dtype=float), matrices)
+
+    return matrices
+
+
+def multiplyQuaternions(start, end):
+    """
+    Returns the Hamilton product of the supplied XYZW quaternions.
+
+    :type start: numpy.ndarray
+    :type end: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    startVector, startScalar = start[..., :3], start[..., 3:]
+    endVector, endScalar = end[..., :3], end[..., 3:]
+
+    vector = (startScalar * endVector) + (endScalar * startVector) + numpy.cross(startVector, endVector)
+    scalar = (startScalar * endScalar) - numpy.sum(startVector * endVector, axis=-1, keepdims=True)
+
+    return numpy.concatenate([vector, scalar], axis=-1)
+
+
+def conjugateQuaternions(quaternions):
+    """
+    Returns the conjugates of the supplied XYZW quaternions.
+
+    :type quaternions: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return quaternions * numpy.array([-1.0, -1.0, -1.0, 1.0])
+
+
+def matrixToDualQuaternion(matrices):
+    """
+    Returns the dual quaternions, as real-dual XYZW pairs, and the scale-shear matrices from the supplied matrices.
+    Since dual quaternions can only represent rigid transforms, any scale or shear is split out so it can be blended linearly.
+
+    :type matrices: numpy.ndarray
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+
+    # Split rotation from scale and shear
+    #
+    rotations = rotationmath.normalizeMatrix(matrices[..., :3, :3])
+    scales = numpy.matmul(matrices[..., :3, :3], numpy.swapaxes(rotations, -1, -2))
+
+    # Compose dual quaternions
+    #
+    real = rotationmath.matrixToQuaternion(rotations)
+
+    translations = numpy.zeros(real.shape, dtype=float)
+    translations[..., :3] = matrices[..., 3, :3]
+
+    dual = 0.5 * multiplyQuaternions(translations, real)
+
+    return numpy.concatenate([real, dual], axis=-1), scales
+
+
+def linearBlendSkinning(points, indices, weights, matrices):
+    """
+    Returns the deformed points for each frame using linear blend skinning.
+    Vertices without any weights remain at their bind-pose points.
+    Weighted points are grouped by influence so each influence transforms all of its vertices, across all frames, in a single matrix product.
+    Influence IDs are expected to be unique per vertex, as they are in the compressed rows of a skin.
+
+    :type points: numpy.ndarray
+    :type indices: numpy.ndarray
+    :type weights: numpy.ndarray
+    :type matrices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Group non-zero weights by influence
+    #
+    numFrames, numInfluences = matrices.shape[:2]
+    numVertices, numColumns = indices.shape
+
+    rows = numpy.repeat(numpy.arange(numVertices), numColumns)
+    influenceIds = indices.reshape(-1)
+    influenceWeights = weights.reshape(-1)
+
+    nonZero = influenceWeights != 0.0
+    order = numpy.argsort(influenceIds[nonZero], kind='stable')
+
+    rows, influenceIds, influenceWeights = rows[nonZero][order], influenceIds[nonZero][order], influenceWeights[nonZero][order]
+    splits = numpy.flatnonzero(numpy.diff(influenceIds)) + 1
+
+    # Transform the weighted points by each influence for all frames
+    #
+    homogeneous = numpy.concatenate([points, numpy.ones((numVertices, 1))], axis=1)
+    transforms = numpy.ascontiguousarray(matrices[..., :3].transpose(1, 2, 0, 3)).reshape(numInfluences, 4, numFrames * 3)
+
+    deformed = numpy.zeros((numVertices, numFrames * 3), dtype=float)
+
+    for (influenceRows, influenceIndices, influenceWeights) in zip(numpy.split(rows, splits), numpy.split(influenceIds, splits), numpy.split(influenceWeights, splits)):
+
+        if len(influenceRows) == 0:
+
+            continue
+
+        deformed[influenceRows] += numpy.matmul(homogeneous[influenceRows] * influenceWeights[:, None], transforms[influenceIndices[0]])
+
+    # Restore any unweighted points
+    #
+    deformed = deformed.reshape(numVertices, numFrames, 3).transpose(1, 0, 2)
+    unweighted = weights.sum(axis=1) == 0.0
+
+    if unweighted.any():
+
+        deformed[:, unweighted] = points[unweighted]
+
+    return deformed
+
+
+def dualQuaternionSkinning(points, indices, weights, matrices):
+    """
+    Returns the deformed points for each frame using dual quaternion skinning.
+    Any scale or shear is blended linearly and applied before the blended rigid transform.
+    Vertices without any weights remain at their bind-pose points.
+
+    :type points: numpy.ndarray
+    :type indices: numpy.ndarray
+    :type weights: numpy.ndarray
+    :type matrices: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    # Blend the dual quaternions for each vertex
+    # Be sure to keep each quaternion in the same hemisphere as the first influence!
+    #
+    dualQuaternions, scales = matrixToDualQuaternion(matrices)
+    isRigid = numpy.allclose(scales, numpy.identity(3), atol=1e-6)
+
+    numFrames, numVertices = len(matrices), len(points)
+    pivots = dualQuaternions[:, indices[:, 0], :4]
+
+    blended = numpy.zeros((numFrames, numVertices, 8), dtype=float)
+    blendedScales = None if isRigid else numpy.zeros((numFrames, numVertices, 3, 3), dtype=float)
+
+    for column in range(indices.shape[1]):
+
+        influenceIndices = indices[:, column]
+        gathered = dualQuaternions[:, influenceIndices]
+
+        signs = numpy.where(numpy.sum(gathered[..., :4] * pivots, axis=-1) < 0.0, -1.0, 1.0)
+        blended += (weights[None, :, column] * signs)[..., None] * gathered
+
+        if not isRigid:
+
+            blendedScales += weights[None, :, column, None, None] * scales[:, influenceIndices]
+
+    # Normalize blended dual quaternions
+    #
+    unweighted = weights.sum(axis=1) == 0.0
+    blended[:, unweighted] = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0]
+
+    norms = numpy.linalg.norm(blended[..., :4], axis=-1, keepdims=True)
+    real, dual = blended[..., :4] / norms, blended[..., 4:] / norms
+
+    # Scale points by blended scale-shear matrices
+    #
+    if isRigid:
+
+        scaled = numpy.broadcast_to(points, (numFrames, numVertices, 3))
+
+    else:
+
+        blendedScales[:, unweighted] = numpy.identity(3)
+        scaled = numpy.einsum('vi,fvij->fvj', points, blendedScales)
+
+    # Rotate and translate points by blended dual quaternions
+    #
+    vector, scalar = real[..., :3], real[..., 3:]
+    cross = numpy.cross(vector, scaled)
+
+    translations = 2.0 * multiplyQuaternions(dual, conjugateQuaternions(real))[..., :3]
+    deformed = scaled + (2.0 * ((scalar * cross) + numpy.cross(vector, cross))) + translations
+
+    return deformed
+
+
+def getChunkSizes(numFrames, numVertices, numColumns, memoryBudget, method='lbs'):
+    """
+    Returns the number of frames and vertices to evaluate per chunk while staying within the memory budget.
+    Frames are chunked first so that each vertex chunk spans as many frames as possible.
+
+    :type numFrames: int
+    :type numVertices: int
+    :type numColumns: int
+    :type memoryBudget: int
+    :type method: str
+    :rtype: Tuple[int, int]
+    """
+
+    samples = max(memoryBudget // (BYTES_PER_SAMPLE[method] + (numColumns * 16)), 1)
+
+    frameChunk = max(min(numFrames, samples // max(numVertices, 1)), 1)
+    vertexChunk = max(min(numVertices, samples // frameChunk), 1)
+
+    return frameChunk, vertexChunk
+
+
+def iterDeformedPoints(points, indices, weights, matrices, method='lbs', memoryBudget=268435456):
+    """
+    Returns a generator that yields frame-vertex slices and their deformed points in chunks.
+    The supplied matrices are expected to be the per-frame skin matrices from `skinMatrices`.
+
+    :type points: numpy.ndarray
+    :type indices: numpy.ndarray
+    :type weights: numpy.ndarray
+    :type matrices: numpy.ndarray
+    :type method: str
+    :type memoryBudget: int
+    :rtype: Iterator[Tuple[slice, slice, numpy.ndarray]]
+    """
+
+    # Check if method is valid
+    #
+    if method not in METHODS:
+
+        raise TypeError(f'iterDeformedPoints() expects a valid method ({method} given)!')
+
+    func = linearBlendSkinning if method == 'lbs' else dualQuaternionSkinning
+
+    # Iterate through chunks
+    #
+    points = numpy.asarray(points, dtype=float)
+    matrices = numpy.asarray(matrices, dtype=float)
+
+    numFrames, numVertices = len(matrices), len(points)
+    frameChunk, vertexChunk = getChunkSizes(numFrames, numVertices, indices.shape[1], memoryBudget, method=method)
+
+    log.debug(f'Evaluating {numFrames} frames x {numVertices} vertices in {frameChunk} x {vertexChunk} chunks.')
+
+    for frameStart in range(0, numFrames, frameChunk):
+
+        frames = slice(frameStart, min(frameStart + frameChunk, numFrames))
+
+        for vertexStart in range(0, numVertices, vertexChunk):
+
+            vertices = slice(vertexStart, min(vertexStart + vertexChunk, numVertices))
+            yield frames, vertices, func(points[vertices], indices[vertices], weights[vertices], matrices[frames])
+
+
+def deformPoints(points, indices, weights, matrices, method='lbs', memoryBudget=268435456):
+    """
+    Returns the deformed points for each frame.
+    The entire result is allocated up front so use `iterDeformedPoints` for large batches!
+
+    :type points: numpy.ndarray
+    :type indices: numpy.ndarray
+    :type weights: numpy.ndarray
+    :type matrices: numpy.ndarray
+    :type method: str
+    :type memoryBudget: int
+    :rtype: numpy.ndarray
+    """
+
+    deformed = numpy.empty((len(matrices), len(points), 3), dtype=float)
+
+    for (frames, vertices, chunk) in iterDeformedPoints(points, indices, weights, matrices, method=method, memoryBudget=memoryBudget):
+
+        deformed[frames, vertices] = chunk
+
+    return deformed
+
+
+@dataclass
+class SkinningReport:
+    """
+    Data class for interfacing with skinning comparisons.
+    """
+
+    method: str = 'lbs'
+    tolerance: float = 1e-3
+    maxError: float = 0.0
+    meanError: float = 0.0
+    numExceeded: int = 0
+    worstFrame: int = -1
+    worstVertex: int = -1
+    frameErrors: numpy.ndarray = field(default_factory=lambda: numpy.zeros(0))
+    vertexErrors: numpy.ndarray = field(default_factory=lambda: numpy.zeros(0))
+
+    def passed(self):
+        """
+        Evaluates if every deformed point is within tolerance.
+
+        :rtype: bool
+        """
+
+        return self.maxError <= self.tolerance
+
+    def failedFrames(self):
+        """
+        Returns the frame indices that exceed the tolerance.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.flatnonzero(self.frameErrors > self.tolerance)
+
+    def failedVertices(self):
+        """
+        Returns the vertex indices that exceed the tolerance.
+
+        :rtype: numpy.ndarray
+        """
+
+        return numpy.flatnonzero(self.vertexErrors > self.tolerance)
+
+    def summary(self):
+        """
+        Returns a readable summary of this report.
+
+        :rtype: str
+        """
+
+        status = 'Passed' if self.passed() else 'Failed'
+
+        return (
+            f'{status} {self.method.upper()} comparison: max error {self.maxError:.6g} at frame {self.worstFrame}, vertex {self.worstVertex}; '
+            f'mean error {self.meanError:.6g}; {self.numExceeded} samples exceed {self.tolerance:.6g} '
+            f'across {len(self.failedFrames())} frames and {len(self.failedVertices())} vertices.'
+        )
+
+
+def compareSkinning(points, indices, weights, matrices, sampledPoints, tolerance=1e-3, method='lbs', memoryBudget=268435456):
+    """
+    Returns a report comparing the deformed points against the supplied DCC-sampled points.
+    The sampled points can be a memory-mapped array so that only one chunk is read into memory at a time.
+
+    :type points: numpy.ndarray
+    :type indices: numpy.ndarray
+    :type weights: numpy.ndarray
+    :type matrices: numpy.ndarray
+    :type sampledPoints: numpy.ndarray
+    :type tolerance: float
+    :type method: str
+    :type memoryBudget: int
+    :rtype: SkinningReport
+    """
+
+    # Check if sampled points are compatible
+    #
+    numFrames, numVertices = len(matrices), len(points)
+    expectedShape = (numFrames, numVertices, 3)
+
+    if tuple(sampledPoints.shape) != expectedShape:
+
+        raise TypeError(f'compareSkinning() expects sampled points with shape {expectedShape} ({sampledPoints.shape} given)!')
+
+    # Accumulate errors from each chunk
+    #
+    report = SkinningReport(method=method, tolerance=tolerance, frameErrors=numpy.zeros(numFrames), vertexErrors=numpy.zeros(numVertices))
+    total = 0.0
+
+    for (frames, vertices, deformed) in iterDeformedPoints(points, indices, weights, matrices, method=method, memoryBudget=memoryBudget // 2):
+
+        errors = numpy.linalg.norm(deformed - numpy.asarray(sampledPoints[frames, vertices], dtype=float), axis=-1)
+
+        total += float(errors.sum())
+        report.numExceeded += int(numpy.count_nonzero(errors > tolerance))
+
+        report.frameErrors[frames] = numpy.maximum(report.frameErrors[frames], errors.max(axis=1))
+        report.vertexErrors[vertices] = numpy.maximum(report.vertexErrors[vertices], errors.max(axis=0))
+
+        frameIndex, vertexIndex = numpy.unravel_index(numpy.argmax(errors), errors.shape)
+        maxError = float(errors[frameIndex, vertexIndex])
+
+        if maxError > report.maxError or report.worstFrame < 0:
+
+            report.maxError = maxError
+            report.worstFrame = frames.start + int(frameIndex)
+            report.worstVertex = vertices.start + int(vertexIndex)
+
+    report.meanError = total / max(numFrames * numVertices, 1)
+
+    return report
@@ -0,0 +1,687 @@
+import os
+import time
+import hashlib
+import tempfile
+
+from collections import OrderedDict
+from ..python import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+spatial = importutils.tryImport('scipy.spatial', __locals__=locals(), __globals__=globals())
+
+
+METHODS = ('position', 'topology')
+NEIGHBOUR_CELLS = tuple((x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1))
+
+
+def topologyFingerprint(faceVertexCounts, faceVertexIndices, points, decimals=6):
+    """
+    Returns a stable fingerprint from the supplied face-vertex connectivity and rest points.
+    The points are rounded to the specified number of decimals to absorb any floating point noise.
+
+    :type faceVertexCounts: Union[numpy.ndarray, List[int]]
+    :type faceVertexIndices: Union[numpy.ndarray, List[int]]
+    :type points: Union[numpy.ndarray, List[Tuple[float, float, float]]]
+    :type decimals: int
+    :rtype: str
+    """
+
+    counts = numpy.asarray(faceVertexCounts, dtype='<i8')
+    indices = numpy.asarray(faceVertexIndices, dtype='<i8')
+    rounded = numpy.round(numpy.asarray(points, dtype='<f8'), decimals=decimals) + 0.0  # Removes any negative zeros!
+
+    digest = hashlib.sha1()
+    digest.update(numpy.array([len(counts), len(indices), len(rounded)], dtype='<i8').tobytes())
+    digest.update(counts.tobytes())
+    digest.update(indices.tobytes())
+    digest.update(numpy.ascontiguousarray(rounded, dtype='<f8').tobytes())
+
+    return digest.hexdigest()
+
+
+def connectivityFingerprint(faceVertexCounts, faceVertexIndices, numVertices):
+    """
+    Returns a stable fingerprint from the supplied face-vertex connectivity and vertex count.
+    Unlike `topologyFingerprint`, this fingerprint is unaffected by any deformations.
+
+    :type faceVertexCounts: Union[numpy.ndarray, List[int]]
+    :type faceVertexIndices: Union[numpy.ndarray, List[int]]
+    :type numVertices: int
+    :rtype: str
+    """
+
+    return topologyFingerprint(faceVertexCounts, faceVertexIndices, numpy.zeros((numVertices, 0), dtype=float))
+
+
+def mirrorPoints(points, axis=0):
+    """
+    Returns the supplied points mirrored across the specified axis.
+
+    :type points: numpy.ndarray
+    :type axis: int
+    :rtype: numpy.ndarray
+    """
+
+    mirrored = numpy.array(points, dtype=float)
+    mirrored[:, axis] *= -1.0
+
+    return mirrored
+
+
+def matchPoints(points, queries, tolerance=1e-3):
+    """
+    Returns the index of the closest point within tolerance for each of the supplied queries.
+    Any queries without a match are assigned -1.
+    If scipy is unavailable then the points are hashed into a uniform grid instead.
+
+    :type points: numpy.ndarray
+    :type queries: numpy.ndarray
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    # Check if a KD-tree is available
+    #
+    numPoints, numQueries = len(points), len(queries)
+
+    if spatial is not None:
+
+        distances, indices = spatial.cKDTree(points).query(queries, distance_upper_bound=tolerance)
+        return numpy.where(indices == numPoints, -1, indices).astype(int)
+
+    # Sort points by grid cell
+    #
+    tolerance = max(tolerance, 1e-12)
+
+    cells = numpy.floor(points / tolerance).astype(numpy.int64)
+    keys = hashCells(cells)
+    order = numpy.argsort(keys, kind='stable')
+    sortedKeys = keys[order]
+
+    # Evaluate the neighbouring cells for each query
+    #
+    queryCells = numpy.floor(queries / tolerance).astype(numpy.int64)
+
+    closestIndices = numpy.full(numQueries, -1, dtype=int)
+    closestDistances = numpy.full(numQueries, numpy.inf)
+
+    for offset in NEIGHBOUR_CELLS:
+
+        # Collect candidate points from cell
+        #
+        queryKeys = hashCells(queryCells + offset)
+        starts = numpy.searchsorted(sortedKeys, queryKeys, side='left')
+        ends = numpy.searchsorted(sortedKeys, queryKeys, side='right')
+
+        counts = ends - starts
+        numCandidates = int(counts.sum())
+
+        if numCandidates == 0:
+
+            continue
+
+        queryIndices = numpy.repeat(numpy.arange(numQueries), counts)
+        candidateIndices = order[numpy.repeat(starts - numpy.cumsum(counts) + counts, counts) + numpy.arange(numCandidates)]
+
+        # Update closest points within tolerance
+        #
+        distances = numpy.linalg.norm(points[candidateIndices] - queries[queryIndices], axis=1)
+        valid = distances <= tolerance
+
+        queryIndices, candidateIndices, distances = queryIndices[valid], candidateIndices[valid], distances[valid]
+        numpy.minimum.at(closestDistances, queryIndices, distances)
+
+        closest = distances == closestDistances[queryIndices]
+        closestIndices[queryIndices[closest]] = candidateIndices[closest]
+
+    return closestIndices
+
+
+def hashCells(cells):
+    """
+    Returns a hash key for each of the supplied integer grid cells.
+    Collisions are harmless since candidates are always validated by distance.
+
+    :type cells: numpy.ndarray
+    :rtype: numpy.ndarray
+    """
+
+    return (cells[:, 0] * 73856093) ^ (cells[:, 1] * 19349663) ^ (cells[:, 2] * 83492791)
+
+
+def positionalSymmetry(points, axis=0, tolerance=1e-3):
+    """
+    Returns the mirrored vertex index for each of the supplied points.
+    Any vertices without a mirrored point within tolerance are assigned -1.
+
+    :type points: numpy.ndarray
+    :type axis: int
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    points = numpy.asarray(points, dtype=float)
+    return matchPoints(points, mirrorPoints(points, axis=axis), tolerance=tolerance)
+
+
+def topologicalSymmetry(faceVertexCounts, faceVertexIndices, points, axis=0, tolerance=1e-3):
+    """
+    Returns the mirrored vertex index for each vertex by walking the mesh topology.
+    Each connected component is seeded from a face whose positionally mirrored vertices form another face.
+    From there, faces are paired by walking across shared edges in opposite winding orders, so posed or asymmetrically deformed meshes still mirror correctly.
+    Any vertices that cannot be reached are assigned -1.
+
+    :type faceVertexCounts: Union[numpy.ndarray, List[int]]
+    :type faceVertexIndices: Union[numpy.ndarray, List[int]]
+    :type points: numpy.ndarray
+    :type axis: int
+    :type tolerance: float
+    :rtype: numpy.ndarray
+    """
+
+    # Split face-vertex indices into faces
+    #
+    counts = numpy.asarray(faceVertexCounts, dtype=int)
+    offsets = numpy.concatenate([[0], numpy.cumsum(counts)]).tolist()
+    indices = numpy.asarray(faceVertexIndices, dtype=int).tolist()
+
+    numFaces, numVertices = len(counts), len(points)
+    faces = [indices[offsets[i]:offsets[i + 1]] for i in range(numFaces)]
+
+    # Map each directed edge to its face and position
+    #
+    halfEdges = {}
+
+    for (faceIndex, face) in enumerate(faces):
+
+        size = len(face)
+
+        for position in range(size):
+
+            halfEdges[(face[position], face[(position + 1) % size])] = (faceIndex, position)
+
+    # Iterate through unvisited faces
+    #
+    positional = positionalSymmetry(points, axis=axis, tolerance=tolerance).tolist()
+    symmetry = [-1] * numVertices
+    visited = [False] * numFaces
+
+    for (seedIndex, seedFace) in enumerate(faces):
+
+        # Check if face can be seeded from its positional mirror
+        #
+        if visited[seedIndex]:
+
+            continue
+
+        mirrored = [positional[vertexIndex] for vertexIndex in seedFace]
+
+        if -1 in mirrored:
+
+            continue
+
+        mirrorFace = halfEdges.get((mirrored[1], mirrored[0]), None)
+
+        if mirrorFace is None or sorted(faces[mirrorFace[0]]) != sorted(mirrored):
+
+            continue
+
+        # Walk faces in opposite winding orders
+        #
+        queue = [(seedIndex, 0, mirrorFace[0], (mirrorFace[1] + 1) % len(faces[mirrorFace[0]]))]
+        visited[seedIndex] = True
+
+        while len(queue) > 0:
+
+            faceIndex, position, otherIndex, otherPosition = queue.pop()
+            face, otherFace = faces[faceIndex], faces[otherIndex]
+            size = len(face)
+
+            if size != len(otherFace):
+
+                continue
+
+            for step in range(size):
+
+                # Pair face-vertices
+                #
+                vertexIndex = face[(position + step) % size]
+                nextIndex = face[(position + step + 1) % size]
+
+                otherVertex = otherFace[(otherPosition - step) % size]
+                otherNext = otherFace[(otherPosition - step - 1) % size]
+
+                if symmetry[vertexIndex] == -1:
+
+                    symmetry[vertexIndex] = otherVertex
+
+                # Queue the faces across the paired edges
+                #
+                neighbour = halfEdges.get((nextIndex, vertexIndex), None)
+                otherNeighbour = halfEdges.get((otherVertex, otherNext), None)
+
+                if neighbour is None or otherNeighbour is None or visited[neighbour[0]]:
+
+                    continue
+
+                visited[neighbour[0]] = True
+                queue.append((neighbour[0], neighbour[1], otherNeighbour[0], (otherNeighbour[1] + 1) % len(faces[otherNeighbour[0]])))
+
+    return numpy.array(symmetry, dtype=int)
+
+
+class SymmetryCache(object):
+    """
+    Base class used to cache symmetry maps by topology fingerprint, axis, tolerance and method.
+    Maps are kept in a least recently used memory cache that is backed by an on-disk cache.
+    The on-disk cache is bounded by both size and age, and only the latest entry is kept for each connectivity, axis, tolerance and method.
+    """
+
+    # region Dunderscores
+    __slots__ = ('__directory__', '__maps__', '__capacity__', '__diskBudget__', '__maxAge__')
+
+    def __init__(self, directory=None, capacity=32, diskBudget=67108864, maxAge=2592000):
+        """
+        Private method called after a new instance has been created.
+        If no directory is supplied then the `DCC_SYMMETRY_CACHE` environment variable, or the temp directory, is used instead.
+
+        :type directory: Union[str, None]
+        :type capacity: int
+        :type diskBudget: int
+        :type maxAge: float
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SymmetryCache, self).__init__()
+
+        # Declare private variables
+        #
+        self.__directory__ = directory
+        self.__maps__ = OrderedDict()
+        self.__capacity__ = capacity
+        self.__diskBudget__ = diskBudget
+        self.__maxAge__ = maxAge
+    # endregion
+
+    # region Methods
+    def directory(self):
+        """
+        Returns the on-disk cache directory.
+        An empty string signifies that the on-disk cache is disabled!
+
+        :rtype: str
+        """
+
+        if self.__directory__ is not None:
+
+            return self.__directory__
+
+        else:
+
+            return os.environ.get('DCC_SYMMETRY_CACHE', os.path.join(tempfile.gettempdir(), 'dcc', 'symmetry'))
+
+    def diskBudget(self):
+        """
+        Returns the on-disk budget in bytes.
+
+        :rtype: int
+        """
+
+        return self.__diskBudget__
+
+    def setDiskBudget(self, diskBudget):
+        """
+        Updates the on-disk budget in bytes.
+
+        :type diskBudget: int
+        :rtype: None
+        """
+
+        self.__diskBudget__ = diskBudget
+
+    def maxAge(self):
+        """
+        Returns the max age, in seconds, of any on-disk entries.
+
+        :rtype: float
+        """
+
+        return self.__maxAge__
+
+    def setMaxAge(self, maxAge):
+        """
+        Updates the max age, in seconds, of any on-disk entries.
+
+        :type maxAge: float
+        :rtype: None
+        """
+
+        self.__maxAge__ = maxAge
+
+    @staticmethod
+    def key(connectivity, fingerprint, axis=0, tolerance=1e-3, method='position'):
+        """
+        Returns the cache key for the supplied fingerprints, axis, tolerance and method.
+
+        :type connectivity: str
+        :type fingerprint: str
+        :type axis: int
+        :type tolerance: float
+        :type method: str
+        :rtype: Tuple[str, str, str, int, float]
+        """
+
+        return connectivity, fingerprint, method, int(axis), float(tolerance)
+
+    @staticmethod
+    def keyDigest(key):
+        """
+        Returns the digest used to prefix the on-disk file names for the supplied key.
+        The point fingerprint is omitted so that maps superseded by any deformations can be located!
+
+        :type key: Tuple[str, str, str, int, float]
+        :rtype: str
+        """
+
+        connectivity, fingerprint, method, axis, tolerance = key
+        return hashlib.sha1(f'{connectivity}|{method}|{axis}|{tolerance:g}'.encode('utf-8')).hexdigest()
+
+    def filePath(self, key):
+        """
+        Returns the on-disk file path for the supplied key.
+
+        :type key: Tuple[str, str, str, int, float]
+        :rtype: str
+        """
+
+        return os.path.join(self.directory(), f'{self.keyDigest(key)}-{key[1]}.npy')
+
+    def get(self, key):
+        """
+        Returns the cached symmetry map for the supplied key.
+        If no map has been cached then none is returned!
+
+        :type key: Tuple[str, str, str, int, float]
+        :rtype: Union[numpy.ndarray, None]
+        """
+
+        # Check memory cache
+        #
+        symmetry = self.__maps__.get(key, None)
+
+        if symmetry is not None:
+
+            self.__maps__.move_to_end(key)
+            return symmetry
+
+        # Check disk cache
+        #
+        directory = self.directory()
+
+        if len(directory) == 0:
+
+            return None
+
+        filePath = self.filePath(key)
+
+        if not os.path.isfile(filePath):
+
+            return None
+
+        try:
+
+            symmetry = numpy.load(filePath, allow_pickle=False)
+            os.utime(filePath)
+
+        except (OSError, ValueError) as exception:
+
+            log.warning(f'Unable to read symmetry cache: {filePath} ({exception})')
+            return None
+
+        self.store(key, symmetry, persist=False)
+
+        return symmetry
+
+    def store(self, key, symmetry, persist=True):
+        """
+        Caches the supplied symmetry map under the specified key.
+        Any superseded on-disk entries for the same key are removed and the disk cache is then pruned.
+
+        :type key: Tuple[str, str, str, int, float]
+        :type symmetry: numpy.ndarray
+        :type persist: bool
+        :rtype: None
+        """
+
+        # Update memory cache
+        #
+        symmetry.setflags(write=False)
+
+        self.__maps__[key] = symmetry
+        self.__maps__.move_to_end(key)
+
+        while len(self.__maps__) > self.__capacity__:
+
+            self.__maps__.popitem(last=False)
+
+        # Check if map should be written to disk
+        # Be sure to write to a temporary file first to remain safe across processes!
+        #
+        directory = self.directory()
+
+        if not persist or len(directory) == 0:
+
+            return
+
+        try:
+
+            os.makedirs(directory, exist_ok=True)
+
+            filePath = self.filePath(key)
+            tempPath = f'{filePath}.{os.getpid()}.tmp'
+
+            with open(tempPath, 'wb') as stream:
+
+                numpy.save(stream, symmetry, allow_pickle=False)
+
+            os.replace(tempPath, filePath)
+
+        except OSError as exception:
+
+            log.warning(f'Unable to write symmetry cache: {directory} ({exception})')
+            return
+
+        # Remove superseded entries
+        #
+        prefix = f'{self.keyDigest(key)}-'
+        fileName = os.path.basename(filePath)
+
+        for entry in self.iterDiskEntries():
+
+            if entry.name.startswith(prefix) and entry.name != fileName:
+
+                self.removeDiskEntry(entry.path)
+
+        self.prune()
+
+    def iterDiskEntries(self):
+        """
+        Returns a generator that yields the on-disk cache entries.
+
+        :rtype: Iterator[os.DirEntry]
+        """
+
+        directory = self.directory()
+
+        if len(directory) == 0:
+
+            return
+
+        try:
+
+            with os.scandir(directory) as entries:
+
+                for entry in entries:
+
+                    if entry.name.endswith('.npy') and entry.is_file():
+
+                        yield entry
+
+        except OSError as exception:
+
+            log.debug(exception)
+
+    @staticmethod
+    def removeDiskEntry(filePath):
+        """
+        Removes the supplied on-disk cache entry.
+
+        :type filePath: str
+        :rtype: bool
+        """
+
+        try:
+
+            os.remove(filePath)
+            return True
+
+        except OSError as exception:
+
+            log.debug(exception)
+            return False
+
+    def prune(self):
+        """
+        Removes any on-disk entries that exceed the max age, followed by the least recently used entries that exceed the disk budget.
+
+        :rtype: None
+        """
+
+        # Collect on-disk entries
+        #
+        entries = []
+
+        for entry in self.iterDiskEntries():
+
+            try:
+
+                stats = entry.stat()
+
+            except OSError as exception:
+
+                log.debug(exception)
+                continue
+
+            entries.append((stats.st_mtime, stats.st_size, entry.path))
+
+        # Remove expired entries
+        #
+        expiry = time.time() - self.__maxAge__
+        entries.sort()
+
+        size = 0
+        remaining = []
+
+        for (modified, entrySize, entryPath) in entries:
+
+            if modified < expiry:
+
+                self.removeDiskEntry(entryPath)
+
+            else:
+
+                size += entrySize
+                remaining.append((entrySize, entryPath))
+
+        # Remove least recently used entries until within budget
+        # The most recently used entry is always kept regardless of its size!
+        #
+        for (entrySize, entryPath) in remaining[:-1]:
+
+            if size <= self.__diskBudget__:
+
+                break
+
+            if self.removeDiskEntry(entryPath):
+
+                size -= entrySize
+
+    def symmetry(self, faceVertexCounts, faceVertexIndices, points, axis=0, tolerance=1e-3, method='position', key=None):
+        """
+        Returns the symmetry map for the supplied topology.
+        The map is only computed if it has not been cached for this fingerprint, axis, tolerance and method.
+        If the key has already been computed by the caller then it can be supplied to skip hashing the arrays!
+
+        :type faceVertexCounts: Union[numpy.ndarray, List[int]]
+        :type faceVertexIndices: Union[numpy.ndarray, List[int]]
+        :type points: numpy.ndarray
+        :type axis: int
+        :type tolerance: float
+        :type method: str
+        :type key: Union[Tuple[str, str, str, int, float], None]
+        :rtype: numpy.ndarray
+        """
+
+        # Check if method is valid
+        #
+        if method not in METHODS:
+
+            raise TypeError(f'symmetry() expects a valid method ({method} given)!')
+
+        # Check if symmetry has already been cached
+        #
+        if key is None:
+
+            connectivity = connectivityFingerprint(faceVertexCounts, faceVertexIndices, len(points))
+            fingerprint = topologyFingerprint(faceVertexCounts, faceVertexIndices, points)
+            key = self.key(connectivity, fingerprint, axis=axis, tolerance=tolerance, method=method)
+
+        symmetry = self.get(key)
+
+        if symmetry is not None:
+
+            return symmetry
+
+        # Compute and cache symmetry
+        #
+        log.debug(f'Computing {method} symmetry for: {key[1]}')
+
+        if method == 'topology':
+
+            symmetry = topologicalSymmetry(faceVertexCounts, faceVertexIndices, points, axis=axis, tolerance=tolerance)
+
+        else:
+
+            symmetry = positionalSymmetry(points, axis=axis, tolerance=tolerance)
+
+        self.store(key, symmetry)
+
+        return symmetry
+
+    def clear(self, disk=False):
+        """
+        Removes all the cached symmetry maps.
+        If disk is enabled then the on-disk cache is also removed.
+
+        :type disk: bool
+        :rtype: None
+        """
+
+        self.__maps__.clear()
+
+        if not disk:
+
+            return
+
+        for entry in list(self.iterDiskEntries()):
+
+            self.removeDiskEntry(entry.path)
+    # endregion
@@ -5,7 +5,7 @@ from .libs import wrapperutils, propertyutils, arrayutils, meshutils
 from . import fnnode
 from ..abstract import afnmesh
 from ..generators.inclusiverange import inclusiveRange
-from ..python import stringutils
+from ..python import stringutils, importutils
 from ..dataclasses.vector import Vector
 from ..dataclasses.colour import Colour
 from ..vendor.six import integer_types
@@ -16,6 +16,9 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+numpy = importutils.tryImport('numpy', __locals__=locals(), __globals__=globals())
+
+
 class FnMesh(fnnode.FnNode, afnmesh.AFnMesh):
     """
     Overload of `AFnMesh` that implements the mesh interface for 3ds-Max.
@@ -57,6 +60,7 @@ class FnMesh(fnnode.FnNode, afnmesh.AFnMesh):
         if meshutils.isTriMesh(obj):
 
             self._object = obj  # Tri-mesh object handles return the associated node!
+            self.invalidate()
 
         elif meshutils.isEditableMesh(obj) or meshutils.isEditablePoly(obj):
 
@@ -515,6 +519,17 @@ class FnMesh(fnnode.FnNode, afnmesh.AFnMesh):
 
         return meshutils.iterFaceVertexColorIndices(self.object(), indices=indices)
 
+    def getEdgeVertexIndices(self):
+        """
+        Returns the zero-based vertex pair for each edge as an array.
+        Max returns the connected vertices of multiple edges as a bit array so the pairs are collected in maxscript instead!
+
+        :rtype: numpy.ndarray
+        """
+
+        edgeVertexIndices = meshutils.getEdgeVertexIndices(self.baseObject())
+        return numpy.array(edgeVertexIndices, dtype=int).reshape(-1, 2) - self.arrayIndexType
+
     def iterConnectedVertices(self, *indices, **kwargs):
         """
         Returns a generator that yields the connected vertex elements.
@@ -201,6 +201,52 @@ class FnNode(afnnode.AFnNode):
 
         return int(pymxs.runtime.getHandleByAnim(self.object()))
 
+    def batchQuery(self, objects, name, *args):
+        """
+        Returns the results from the named method for each of the supplied objects.
+        Names and handles are evaluated directly from each wrapper without attaching it to this function set.
+
+        :type objects: List[Union[str, int, pymxs.MXSWrapperBase]]
+        :type name: str
+        :rtype: Union[List[Any], None]
+        """
+
+        # Check if query can be evaluated in bulk
+        #
+        if name not in ('name', 'handle'):
+
+            return super(FnNode, self).batchQuery(objects, name, *args)
+
+        # Iterate through objects
+        # Any objects that cannot be resolved are assigned none!
+        #
+        results = [None] * len(objects)
+
+        for (i, obj) in enumerate(objects):
+
+            try:
+
+                obj = self.getMXSWrapper(obj)
+
+            except TypeError as exception:
+
+                log.debug(exception)
+                continue
+
+            if obj is None:
+
+                continue
+
+            elif name == 'handle':
+
+                results[i] = int(pymxs.runtime.getHandleByAnim(obj))
+
+            else:
+
+                results[i] = obj.name if pymxs.runtime.isProperty(obj, 'name') else ''
+
+        return results
+
     def isTransform(self):
         """
         Evaluates if this node represents a transform.
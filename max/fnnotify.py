@@ -92,6 +92,58 @@ class FnNotify(AFnNotify):
         pymxs.runtime.callbacks.addScript(pymxs.runtime.Name('sceneRedo'), func, id=callbackId, persistent=False)
         self.registerNotify(self.Notification.Redo, callbackId)
 
+    def addNodeAddedNotify(self, func):
+        """
+        Adds notify when a node is added to the scene.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = pymxs.runtime.Name(uuid4().hex)
+
+        pymxs.runtime.callbacks.addScript(pymxs.runtime.Name('nodeCreated'), func, id=callbackId, persistent=False)
+        self.registerNotify(self.Notification.NodeAdded, callbackId)
+
+    def addNodeRemovedNotify(self, func):
+        """
+        Adds notify when a node is removed from the scene.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = pymxs.runtime.Name(uuid4().hex)
+
+        pymxs.runtime.callbacks.addScript(pymxs.runtime.Name('nodePostDelete'), func, id=callbackId, persistent=False)
+        self.registerNotify(self.Notification.NodeRemoved, callbackId)
+
+    def addNameChangedNotify(self, func):
+        """
+        Adds notify when any node is renamed.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = pymxs.runtime.Name(uuid4().hex)
+
+        pymxs.runtime.callbacks.addScript(pymxs.runtime.Name('nodeRenamed'), func, id=callbackId, persistent=False)
+        self.registerNotify(self.Notification.NameChanged, callbackId)
+
+    def addReferenceLoadedNotify(self, func):
+        """
+        Adds notify after an object xref has been merged into the scene.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = pymxs.runtime.Name(uuid4().hex)
+
+        pymxs.runtime.callbacks.addScript(pymxs.runtime.Name('objectXrefPostMerge'), func, id=callbackId, persistent=False)
+        self.registerNotify(self.Notification.ReferenceLoaded, callbackId)
+
     def clear(self):
         """
         Removes all notifications.
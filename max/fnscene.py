@@ -355,6 +355,15 @@ class FnScene(afnscene.AFnScene):
 
         return 'z'
 
+    def isDirty(self):
+        """
+        Evaluates if the scene has any unsaved changes.
+
+        :rtype: bool
+        """
+
+        return pymxs.runtime.getSaveRequired()
+
     def markDirty(self):
         """
         Marks the scene as dirty which will prompt the user for a save upon close.
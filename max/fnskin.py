@@ -10,6 +10,23 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def geometryChanged(event, handles):
+    """
+    Node event callback that increments the weight revision for any nodes with modified geometry.
+    Changing skin weights, including painting, modifies the geometry channel of the skinned node!
+
+    :type event: pymxs.MXSWrapperBase
+    :type handles: List[int]
+    :rtype: None
+    """
+
+    revisions = FnSkin.__weight_revisions__
+
+    for handle in handles:
+
+        revisions[handle] = revisions.get(handle, 0) + 1
+
+
 class FnSkin(afnskin.AFnSkin, fnnode.FnNode):
     """
     Overload of `AFnSkin` that implements the skin interface for 3ds-Max.
@@ -19,6 +36,8 @@ class FnSkin(afnskin.AFnSkin, fnnode.FnNode):
 
     # region Dunderscores
     __slots__ = ('_node', '_baseObject')
+    __weight_callback__ = None
+    __weight_revisions__ = {}
 
     def __init__(self, *args, **kwargs):
         """
@@ -262,6 +281,8 @@ class FnSkin(afnskin.AFnSkin, fnnode.FnNode):
 
             skinutils.removeInfluence(self.object(), influenceId)
 
+        self.invalidateInfluenceIndex()
+
     def numInfluences(self):
         """
         Returns the number of influences in use by this skin.
@@ -311,6 +332,20 @@ class FnSkin(afnskin.AFnSkin, fnnode.FnNode):
 
         return skinutils.iterVertexWeights(self.object(), vertexIndices=indices)
 
+    def weightSignature(self):
+        """
+        Returns a cheap signature that changes whenever the weights on this skin change.
+        A node event callback is registered on first use to count geometry changes without reading the weights.
+
+        :rtype: Hashable
+        """
+
+        if FnSkin.__weight_callback__ is None:
+
+            FnSkin.__weight_callback__ = pymxs.runtime.NodeEventCallback(geometryChanged=geometryChanged)
+
+        return self.weightRevision(), FnSkin.__weight_revisions__.get(self._node, 0)
+
     def applyVertexWeights(self, vertexWeights):
         """
         Assigns the supplied vertex weights to this skin.
@@ -320,6 +355,7 @@ class FnSkin(afnskin.AFnSkin, fnnode.FnNode):
         """
 
         skinutils.setVertexWeights(self.object(), vertexWeights)
+        self.updateInfluenceIndex(vertexWeights)
 
     def resetPreBindMatrices(self):
         """
@@ -17,6 +17,8 @@ log.setLevel(logging.INFO)
 
 
 __face_triangles__ = {}
+__poly_edge_verts__ = pymxs.runtime.execute('fn polyEdgeVerts poly = ( for i = 1 to (polyOp.getNumEdges poly) collect (polyOp.getEdgeVerts poly i) );')
+__mesh_edge_verts__ = pymxs.runtime.execute('fn meshEdgeVerts mesh = ( local edges = #(); for i = 1 to (meshOp.getNumFaces mesh) do ( local face = getFace mesh i; join edges #(#(face.x, face.y), #(face.y, face.z), #(face.z, face.x)) ); edges );')
 
 
 def isEditablePoly(mesh):
@@ -431,6 +433,26 @@ def iterVertexNormals(mesh, indices=None):
             yield pymxs.runtime.getNormal(mesh, index)
 
 
+def getEdgeVertexIndices(mesh):
+    """
+    Returns the vertex pair for each edge using a single maxscript call.
+    Editable meshes have 3 edges per face, starting with the edge between the first and second face-vertex!
+
+    :type mesh: pymxs.MXSWrapperBase
+    :rtype: List[Tuple[int, int]]
+    """
+
+    if isEditablePoly(mesh):
+
+        edgeVerts = __poly_edge_verts__(mesh)
+
+    else:
+
+        edgeVerts = __mesh_edge_verts__(mesh)
+
+    return [tuple(arrayutils.iterElements(vertices)) for vertices in edgeVerts]
+
+
 def iterFaceVertexIndices(mesh, indices=None):
     """
     Returns a generator that yields face-vertex indices.
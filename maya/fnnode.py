@@ -308,6 +308,69 @@ class FnNode(afnnode.AFnNode):
         plug = plugutils.findPlug(self.object(), name)
         return plugmutators.getValue(plug)
 
+    def getBatchQueries(self, *args):
+        """
+        Returns a dictionary of queries that can be evaluated directly from a dependency node.
+
+        :rtype: Dict[str, Callable]
+        """
+
+        def handle(dependNode):
+
+            objectHandle = om.MObjectHandle(dependNode)
+            hashCode = objectHandle.hashCode()
+
+            self.__handles__[hashCode] = objectHandle
+            return hashCode
+
+        return {
+            'name': lambda dependNode: dagutils.stripNamespace(om.MFnDependencyNode(dependNode).name()),
+            'namespace': lambda dependNode: om.MFnDependencyNode(dependNode).namespace,
+            'absoluteName': lambda dependNode: om.MFnDependencyNode(dependNode).name(),
+            'handle': handle,
+            'getAttr': lambda dependNode: plugmutators.getValue(plugutils.findPlug(dependNode, *args))
+        }
+
+    def batchQuery(self, objects, name, *args):
+        """
+        Returns the results from the named method for each of the supplied objects.
+        Supported queries are evaluated directly from each dependency node without attaching it to this function set.
+
+        :type objects: List[Union[str, om.MObject, om.MDagPath]]
+        :type name: str
+        :rtype: Union[List[Any], None]
+        """
+
+        # Check if query can be evaluated in bulk
+        #
+        func = self.getBatchQueries(*args).get(name, None)
+
+        if func is None:
+
+            return super(FnNode, self).batchQuery(objects, name, *args)
+
+        # Iterate through objects
+        # Any objects that cannot be resolved are assigned none!
+        #
+        results = [None] * len(objects)
+
+        for (i, obj) in enumerate(objects):
+
+            try:
+
+                dependNode = dagutils.getMObject(obj)
+
+            except (RuntimeError, TypeError) as exception:
+
+                log.debug(exception)
+                continue
+
+            if not dependNode.isNull():
+
+                results[i] = func(dependNode)
+
+        return results
+
     def hasAttr(self, name):
         """
         Evaluates if this node has the specified attribute.
@@ -79,3 +79,62 @@ class FnNotify(AFnNotify):
 
         callbackId = om.MEventMessage.addEventCallback('Redo', func)
         self.registerNotify(self.Notification.Redo, callbackId)
+
+    def addNodeAddedNotify(self, func):
+        """
+        Adds notify when a node is added to the scene.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = om.MDGMessage.addNodeAddedCallback(func, 'dependNode')
+        self.registerNotify(self.Notification.NodeAdded, callbackId)
+
+    def addNodeRemovedNotify(self, func):
+        """
+        Adds notify when a node is removed from the scene.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = om.MDGMessage.addNodeRemovedCallback(func, 'dependNode')
+        self.registerNotify(self.Notification.NodeRemoved, callbackId)
+
+    def addNameChangedNotify(self, func):
+        """
+        Adds notify when any node is renamed.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        callbackId = om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, func)
+        self.registerNotify(self.Notification.NameChanged, callbackId)
+
+    def addReferenceLoadedNotify(self, func):
+        """
+        Adds notify when a reference is created or loaded.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        for message in (om.MSceneMessage.kAfterCreateReference, om.MSceneMessage.kAfterLoadReference):
+
+            callbackId = om.MSceneMessage.addCallback(message, func)
+            self.registerNotify(self.Notification.ReferenceLoaded, callbackId)
+
+    def addReferenceUnloadedNotify(self, func):
+        """
+        Adds notify when a reference is removed or unloaded.
+
+        :type func: Callable
+        :rtype: None
+        """
+
+        for message in (om.MSceneMessage.kAfterRemoveReference, om.MSceneMessage.kAfterUnloadReference):
+
+            callbackId = om.MSceneMessage.addCallback(message, func)
+            self.registerNotify(self.Notification.ReferenceUnloaded, callbackId)
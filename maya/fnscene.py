@@ -333,6 +333,15 @@ class FnScene(afnscene.AFnScene):
 
         return sceneutils.currentUpAxis()
 
+    def isDirty(self):
+        """
+        Evaluates if the scene has any unsaved changes.
+
+        :rtype: bool
+        """
+
+        return sceneutils.isDirty()
+
     def markDirty(self):
         """
         Marks the scene as dirty which will prompt the user for a save upon close.
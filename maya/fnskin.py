@@ -11,6 +11,26 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+WEIGHT_MESSAGES = om.MNodeMessage.kAttributeSet | om.MNodeMessage.kAttributeArrayAdded | om.MNodeMessage.kAttributeArrayRemoved
+
+
+def weightsChanged(message, plug, otherPlug, clientData):
+    """
+    Attribute changed callback that increments the weight revision for a skin cluster.
+    Only changes to the weight list are counted, which includes painting weights!
+
+    :type message: int
+    :type plug: om.MPlug
+    :type otherPlug: om.MPlug
+    :type clientData: List[int]
+    :rtype: None
+    """
+
+    if (message & WEIGHT_MESSAGES) and om.MFnAttribute(plug.attribute()).name in ('weightList', 'weights'):
+
+        clientData[0] += 1
+
+
 class FnSkin(fnnode.FnNode, afnskin.AFnSkin):
     """
     Overload of `AFnSkin` that implements the skin interface for Maya.
@@ -18,6 +38,7 @@ class FnSkin(fnnode.FnNode, afnskin.AFnSkin):
 
     # region Dunderscores
     __slots__ = ('_transform', '_shape', '_intermediateObject')
+    __weight_revisions__ = {}
     __color_set_name__ = 'paintWeightsColorSet1'
     __color_ramp__ = '1,0,0,1,1,1,0.5,0,0.8,1,1,1,0,0.6,1,0,1,0,0.4,1,0,0,1,0,1'
 
@@ -463,6 +484,8 @@ class FnSkin(fnnode.FnNode, afnskin.AFnSkin):
 
             skinutils.removeInfluence(self.object(), influenceId)
 
+        self.invalidateInfluenceIndex()
+
     def iterVertexWeights(self, *args):
         """
         Returns a generator that yields vertex-weights pairs from this skin.
@@ -473,6 +496,28 @@ class FnSkin(fnnode.FnNode, afnskin.AFnSkin):
 
         return skinutils.iterWeightList(self.object(), vertexIndices=args)
 
+    def weightSignature(self):
+        """
+        Returns a cheap signature that changes whenever the weights on this skin change.
+        An attribute changed callback is registered on first use to count weight list changes without reading the weights.
+
+        :rtype: Hashable
+        """
+
+        # Check if callback has been registered
+        #
+        handle = self.handle()
+        revision = self.__weight_revisions__.get(handle, None)
+
+        if revision is None:
+
+            revision = [0]
+            om.MNodeMessage.addAttributeChangedCallback(self.object(), weightsChanged, revision)
+
+            self.__weight_revisions__[handle] = revision
+
+        return self.weightRevision(), revision[0]
+
     @undo.Undo(name='Apply Vertex Weights')
     def applyVertexWeights(self, vertexWeights):
         """
@@ -483,6 +528,7 @@ class FnSkin(fnnode.FnNode, afnskin.AFnSkin):
         """
 
         skinutils.setWeightList(self.object(), vertexWeights)
+        self.updateInfluenceIndex(vertexWeights)
 
     @undo.Undo(name='Reset Pre-Bind Matrices')
     def resetPreBindMatrices(self):
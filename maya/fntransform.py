@@ -85,6 +85,19 @@ class FnTransform(afntransform.AFnTransform, fnnode.FnNode):
 
         return eulerangles.EulerAngles(eulerRotation.x, eulerRotation.y, eulerRotation.z, order=order)
 
+    def preEulerRotation(self):
+        """
+        Returns the joint orient, as euler angles, from this node.
+        If this node is not a joint then a zero rotation is returned!
+
+        :rtype: eulerangles.EulerAngles
+        """
+
+        dagPath = om.MDagPath.getAPathTo(self.object())
+        jointOrient = transformutils.getJointOrient(dagPath)
+
+        return eulerangles.EulerAngles(jointOrient.x, jointOrient.y, jointOrient.z, order='xyz')
+
     def setEulerRotation(self, rotation, **kwargs):
         """
         Updates the rotation values, as euler angles, for this node.
@@ -278,6 +291,20 @@ class FnTransform(afntransform.AFnTransform, fnnode.FnNode):
 
         return self.denativizeMatrix(parentMatrix)
 
+    def getBatchQueries(self, *args):
+        """
+        Returns a dictionary of queries that can be evaluated directly from a dependency node.
+
+        :rtype: Dict[str, Callable]
+        """
+
+        queries = super(FnTransform, self).getBatchQueries(*args)
+        queries['matrix'] = lambda dependNode: self.denativizeMatrix(transformutils.getMatrix(om.MDagPath.getAPathTo(dependNode)))
+        queries['worldMatrix'] = lambda dependNode: self.denativizeMatrix(om.MDagPath.getAPathTo(dependNode).inclusiveMatrix())
+        queries['parentMatrix'] = lambda dependNode: self.denativizeMatrix(om.MDagPath.getAPathTo(dependNode).exclusiveMatrix())
+
+        return queries
+
     def freezeTransform(self):
         """
         Freezes this transform node so all values equal zero.
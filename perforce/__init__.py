@@ -21,6 +21,7 @@ def createAdapter(**kwargs):
     :key port: The server address to access.
     :key host: The host name to filter values.
     :key client: The client name associated with the user.
+    :key exceptionLevel: The severity at which exceptions are raised, warnings are included by default.
     :rtype: P4.P4
     """
 
@@ -75,6 +76,7 @@ def createAdapter(**kwargs):
     p4.host = str(host)
     p4.client = str(client)
     p4.password = str(password)
+    p4.exception_level = int(kwargs.get('exceptionLevel', 2))
 
     return p4
 
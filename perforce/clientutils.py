@@ -7,7 +7,6 @@ from . import cmds
 from .. import fnqt
 from .decorators import relogin
 from ..python import stringutils
-from ..vendor.Qt import QtWidgets
 from ..vendor.six.moves import collections_abc
 
 import logging
@@ -545,7 +544,10 @@ def changeClient():
     """
 
     # Collect all clients
+    # Qt is imported on demand to keep headless sessions Qt-free!
     #
+    from ..vendor.Qt import QtWidgets
+
     fnQt = fnqt.FnQt()
     parent = fnQt.getMainWindow()
 
@@ -2,7 +2,6 @@ import os
 import getpass
 
 from .. import cmds
-from ..dialogs import qlogindialog
 from ...decorators import abstractdecorator
 
 import logging
@@ -115,6 +114,8 @@ class Relogin(abstractdecorator.AbstractDecorator):
         username = os.environ.get('P4USER', getpass.getuser())
         port = os.environ.get('P4PORT', 'localhost:1666')
 
+        from ..dialogs import qlogindialog  # Qt is imported on demand to keep headless sessions Qt-free!
+
         dialog = qlogindialog.QLoginDialog(username=username, port=port)
         result = dialog.exec_()
 
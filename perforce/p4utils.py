@@ -4,9 +4,9 @@ import stat
 import json
 import subprocess
 
-from . import createAdapter, cmds, clientutils, searchutils
+from . import createAdapter, cmds, clientutils, searchutils, textureutils
 from .decorators import relogin
-from .. import fnscene, fntexture
+from .. import fnscene
 from ..python import importutils
 
 P4 = importutils.tryImport('P4', __locals__=locals(), __globals__=globals())
@@ -663,130 +663,25 @@ def findDepotPath(filePath, client=None):
 
 
 @relogin.Relogin()
-def fixBrokenTextures():
+def fixBrokenTextures(dryRun=False):
     """
     Fixes any broken textures using perforce.
+    See `textureutils.TextureResolver` for details on how textures are resolved in batches.
 
-    :rtype: bool
+    :type dryRun: bool
+    :rtype: textureutils.TextureReport
     """
 
-    # Iterate through texture nodes
-    #
-    scene = fnscene.FnScene()
-
-    texture = fntexture.FnTexture()
-    texture.setQueue(texture.instances())
-
-    while not texture.isDone():
-
-        # Find associated depot file
-        #
-        filePath = texture.filePath()
-        depotPath = findDepotPath(filePath)
-
-        if isNullOrEmpty(depotPath):
-
-            log.warning(f'Unable to fix file path: {filePath}')
-            texture.next()
-
-            continue
-
-        # Get file stats
-        #
-        stats = cmds.fstat(depotPath)
-        numStats = len(stats)
-
-        if numStats == 0:
-
-            log.warning(f'Unable to locate file stats: {filePath}')
-            texture.next()
-
-            continue
-
-        # Check if file needs syncing
-        #
-        fileStat = stats[0]
-        haveRev = fileStat.get('haveRev', 0)  # P4 omits `haveRev` if the file has not been synced!
-
-        if haveRev != fileStat['headRev']:
-
-            cmds.sync(depotPath)
-
-        # Convert to local path
-        #
-        client = clientutils.getCurrentClient()
-
-        localPath = client.mapToView(depotPath)
-        absolutePath = scene.makePathAbsolute(filePath)  # This will resolve once the file has been synced
-
-        if localPath != absolutePath:
-
-            log.info(f'Fixing {filePath} to {localPath}')
-            texture.setFilePath(localPath)
-
-        # Go to next item
-        #
-        texture.next()
-
-    # Refresh viewport
-    #
-    scene.refreshTextures()
+    return textureutils.resolveTextures(repath=True, sync=True, dryRun=dryRun)
 
 
 @relogin.Relogin()
-def syncMissingTextures():
+def syncMissingTextures(dryRun=False):
     """
     Syncs any missing textures from perforce.
 
-    :rtype: None
+    :type dryRun: bool
+    :rtype: textureutils.TextureReport
     """
 
-    # Iterate through texture nodes
-    #
-    texture = fntexture.FnTexture()
-    texture.setQueue(texture.instances())
-
-    while not texture.isDone():
-
-        # Check if file exists in client view
-        #
-        fullFilePath = texture.fullFilePath()
-        client = clientutils.getCurrentClient()
-
-        if not client.hasAbsoluteFile(fullFilePath):
-
-            log.warning(f'Unable to locate: {fullFilePath}, from perforce!')
-            texture.next()
-
-            continue
-
-        # Check if file needs syncing
-        #
-        depotPath = client.mapToDepot(fullFilePath)
-
-        stats = cmds.fstat(depotPath)
-        numStats = len(stats)
-
-        if numStats == 0:
-
-            log.warning(f'Unable to locate file stats: {depotPath}, from perforce!')
-            texture.next()
-
-            continue
-
-        # Check if file is up-to-date
-        #
-        fileStat = stats[0]
-        haveRev = fileStat.get('haveRev', 0)  # P4 omits `haveRev` if the file has not been synced!
-
-        if haveRev != fileStat['headRev']:
-
-            cmds.sync(depotPath)
-
-        else:
-
-            log.info(f'File is already up to date: {depotPath}')
-
-        # Go to next item
-        #
-        texture.next()
+    return textureutils.resolveTextures(repath=False, sync=True, dryRun=dryRun)
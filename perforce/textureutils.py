@@ -0,0 +1,380 @@
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+from . import cmds, clientutils, searchutils
+from .. import fnscene
+from ..python import stringutils, pathutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+@dataclass
+class TextureStatus:
+    """
+    Data class for interfacing with the resolved state of a texture file path.
+    """
+
+    filePath: str = ''
+    fullFilePath: str = ''
+    textures: List[Any] = field(default_factory=list)
+    exists: bool = False
+    depotPath: str = ''
+    localPath: str = ''
+    haveRev: str = ''
+    headRev: str = ''
+    candidates: List[str] = field(default_factory=list)
+
+    def isResolved(self):
+        """
+        Evaluates if this file path has an associated depot file.
+
+        :rtype: bool
+        """
+
+        return len(self.depotPath) > 0 and len(self.headRev) > 0
+
+    def needsSync(self):
+        """
+        Evaluates if the associated depot file is out-of-date.
+
+        :rtype: bool
+        """
+
+        return self.isResolved() and self.haveRev != self.headRev
+
+    def needsRepath(self):
+        """
+        Evaluates if the textures should be updated to the resolved local path.
+
+        :rtype: bool
+        """
+
+        return len(self.localPath) > 0 and os.path.normcase(self.localPath) != os.path.normcase(self.fullFilePath)
+
+
+@dataclass
+class TextureReport:
+    """
+    Data class for interfacing with the results of a texture resolution.
+    """
+
+    statuses: List[TextureStatus] = field(default_factory=list)
+    synced: List[str] = field(default_factory=list)
+    repathed: List[Tuple[str, str]] = field(default_factory=list)
+    dryRun: bool = False
+
+    def missing(self):
+        """
+        Returns the statuses for file paths that do not exist locally.
+
+        :rtype: List[TextureStatus]
+        """
+
+        return [status for status in self.statuses if not status.exists]
+
+    def unresolved(self):
+        """
+        Returns the statuses for missing file paths that could not be resolved from perforce.
+
+        :rtype: List[TextureStatus]
+        """
+
+        return [status for status in self.statuses if not status.exists and not status.isResolved()]
+
+    def summary(self):
+        """
+        Returns a readable summary of this report.
+
+        :rtype: str
+        """
+
+        prefix = 'Would have' if self.dryRun else 'Successfully'
+
+        return (
+            f'Resolved {len(self.statuses)} texture paths, {len(self.missing())} missing and {len(self.unresolved())} unresolved. '
+            f'{prefix} synced {len(self.synced)} files and repathed {len(self.repathed)} textures.'
+        )
+
+
+class TextureResolver(object):
+    """
+    Class used to resolve, sync and repair scene textures from perforce in batches.
+    Texture paths are collected once and deduplicated, local files are checked concurrently and perforce is queried in chunks.
+    """
+
+    __slots__ = ('_scene', '_client', '_maxWorkers', '_chunkSize')
+
+    def __init__(self, client=None, maxWorkers=None, chunkSize=100):
+        """
+        Private method called after a new instance has been created.
+
+        :type client: Union[clientutils.ClientSpec, None]
+        :type maxWorkers: Union[int, None]
+        :type chunkSize: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(TextureResolver, self).__init__()
+
+        # Declare private variables
+        #
+        self._scene = fnscene.FnScene()
+        self._client = client if client is not None else clientutils.getCurrentClient()
+        self._maxWorkers = maxWorkers
+        self._chunkSize = chunkSize
+
+    def client(self):
+        """
+        Returns the client used to resolve depot files.
+
+        :rtype: clientutils.ClientSpec
+        """
+
+        return self._client
+
+    def iterChunks(self, items):
+        """
+        Returns a generator that yields the supplied items in chunks.
+        This prevents perforce commands from exceeding the command line limit!
+
+        :type items: List[Any]
+        :rtype: Iterator[List[Any]]
+        """
+
+        for i in range(0, len(items), self._chunkSize):
+
+            yield items[i:i + self._chunkSize]
+
+    def collect(self):
+        """
+        Returns the statuses for every unique texture path in the scene.
+        Each path is only made absolute once with the content paths queried up front.
+
+        :rtype: List[TextureStatus]
+        """
+
+        paths = self._scene.paths()
+        texturePaths = self._scene.getTexturePaths()
+
+        return [
+            TextureStatus(filePath=filePath, fullFilePath=pathutils.makePathAbsolute(filePath, paths=paths), textures=textures)
+            for (filePath, textures) in texturePaths.items()
+            if not stringutils.isNullOrEmpty(filePath)
+        ]
+
+    def checkExistence(self, statuses):
+        """
+        Updates the existence of each status on a thread pool.
+
+        :type statuses: List[TextureStatus]
+        :rtype: None
+        """
+
+        fullFilePaths = [status.fullFilePath for status in statuses]
+
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+
+            for (status, exists) in zip(statuses, executor.map(os.path.exists, fullFilePaths)):
+
+                status.exists = exists
+
+    def mapStatuses(self, statuses):
+        """
+        Updates the depot paths for any statuses that are derived from the client view.
+        No commands are issued since this only uses the client mapping!
+
+        :type statuses: List[TextureStatus]
+        :rtype: List[TextureStatus]
+        """
+
+        unmapped = []
+
+        for status in statuses:
+
+            if self._client.hasAbsoluteFile(status.fullFilePath):
+
+                status.depotPath = self._client.mapToDepot(status.fullFilePath)
+
+            else:
+
+                unmapped.append(status)
+
+        return unmapped
+
+    def searchStatuses(self, statuses):
+        """
+        Updates the depot paths for the supplied statuses by searching the client view.
+        All the searches are issued together in chunks rather than once per texture.
+
+        :type statuses: List[TextureStatus]
+        :rtype: None
+        """
+
+        # Collect unique searches
+        # Make sure to leave out the parent directory in case the file has been moved!
+        #
+        searches = {}
+
+        for status in statuses:
+
+            filename = os.path.basename(os.path.normpath(status.fullFilePath))
+
+            for branch in searchutils.__search_engine__.filterBranches(self._client, status.fullFilePath):
+
+                searches['/'.join([branch.clientPath, '...', filename])] = None
+
+        # Execute searches in chunks
+        # Warnings are suppressed so that a single missing file does not discard the entire chunk!
+        #
+        results = {}
+
+        for chunk in self.iterChunks(list(searches.keys())):
+
+            for spec in cmds.files(*chunk, client=self._client.name, exceptionLevel=1):
+
+                depotFile = spec.get('depotFile', '') if isinstance(spec, dict) else ''
+                results.setdefault(depotFile.rsplit('/', 1)[-1].lower(), []).append(depotFile)
+
+        # Evaluate search results
+        # Ambiguous results are disambiguated by parent directory, just like `SearchEngine.findFile`!
+        #
+        for status in statuses:
+
+            segments = os.path.normpath(status.fullFilePath).split(os.path.sep)
+            candidates = list(dict.fromkeys(results.get(segments[-1].lower(), [])))
+
+            if len(candidates) > 1 and len(segments) > 1:
+
+                directory = f'{segments[-2]}/{segments[-1]}'.lower()
+                filtered = [candidate for candidate in candidates if candidate.lower().endswith(directory)]
+
+                candidates = filtered if len(filtered) > 0 else candidates
+
+            status.candidates = candidates
+
+            if len(candidates) == 1:
+
+                status.depotPath = candidates[0]
+                status.localPath = self._client.mapToView(candidates[0])
+
+            elif len(candidates) > 1:
+
+                log.warning(f'Multiple depot files found for: {status.filePath}')
+
+            else:
+
+                log.warning(f'Unable to locate: {status.filePath}, from perforce!')
+
+    def statStatuses(self, statuses):
+        """
+        Updates the revisions for the supplied statuses using chunked file stats.
+
+        :type statuses: List[TextureStatus]
+        :rtype: None
+        """
+
+        statuses = [status for status in statuses if len(status.depotPath) > 0]
+        depotPaths = list(dict.fromkeys(status.depotPath for status in statuses))
+
+        fileStats = {}
+
+        for chunk in self.iterChunks(depotPaths):
+
+            for fileStat in cmds.fstat(*chunk, client=self._client.name, exceptionLevel=1):
+
+                if isinstance(fileStat, dict) and 'depotFile' in fileStat:
+
+                    fileStats[fileStat['depotFile'].lower()] = fileStat
+
+        for status in statuses:
+
+            fileStat = fileStats.get(status.depotPath.lower(), {})
+
+            status.headRev = str(fileStat.get('headRev', ''))
+            status.haveRev = str(fileStat.get('haveRev', ''))  # P4 omits `haveRev` if the file has not been synced!
+
+    def resolve(self, repath=True, sync=True, dryRun=False):
+        """
+        Resolves all the scene textures against perforce and returns a report.
+        Any missing textures outside the client view are searched for and, if repath is enabled, updated to the found local path.
+        If dry-run is enabled then no files are synced and no textures are changed!
+
+        :type repath: bool
+        :type sync: bool
+        :type dryRun: bool
+        :rtype: TextureReport
+        """
+
+        # Collect statuses and check existence
+        #
+        statuses = self.collect()
+        self.checkExistence(statuses)
+
+        # Resolve depot paths
+        # Only missing textures outside the client view require a depot search!
+        #
+        unmapped = self.mapStatuses(statuses)
+
+        if repath:
+
+            self.searchStatuses([status for status in unmapped if not status.exists])
+
+        self.statStatuses(statuses)
+
+        # Sync out-of-date files in chunks
+        #
+        report = TextureReport(statuses=statuses, dryRun=dryRun)
+
+        if sync:
+
+            report.synced = list(dict.fromkeys(status.depotPath for status in statuses if status.needsSync()))
+
+            if not dryRun:
+
+                for chunk in self.iterChunks(report.synced):
+
+                    cmds.sync(*chunk, client=self._client.name)
+
+        # Write back repaired texture paths
+        #
+        if repath:
+
+            remapping = {status.filePath: status.localPath for status in statuses if status.needsRepath()}
+            report.repathed = list(remapping.items())
+
+            if not dryRun and len(remapping) > 0:
+
+                texturePaths = {status.filePath: status.textures for status in statuses}
+                self._scene.setTexturePaths(remapping, texturePaths=texturePaths)
+
+        # Refresh viewport
+        #
+        if not dryRun and (len(report.synced) > 0 or len(report.repathed) > 0):
+
+            self._scene.refreshTextures()
+
+        log.info(report.summary())
+        return report
+
+
+def resolveTextures(repath=True, sync=True, dryRun=False, client=None, maxWorkers=None):
+    """
+    Resolves all the scene textures against perforce and returns a report.
+
+    :type repath: bool
+    :type sync: bool
+    :type dryRun: bool
+    :type client: Union[clientutils.ClientSpec, None]
+    :type maxWorkers: Union[int, None]
+    :rtype: TextureReport
+    """
+
+    resolver = TextureResolver(client=client, maxWorkers=maxWorkers)
+    return resolver.resolve(repath=repath, sync=sync, dryRun=dryRun)
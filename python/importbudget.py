@@ -0,0 +1,48 @@
+"""
+Checks that the headless core of this package imports within budget and without Qt.
+Run from the directory containing this package using: `python -m dcc.python.importbudget`
+A non-zero exit code is returned if any module exceeds its budget or imports a forbidden module!
+"""
+import os
+import sys
+
+from . import importutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+IMPORT_TIME_BUDGET = 0.25  # Seconds per module, measured in a fresh interpreter
+
+__budgets__ = {
+    'dcc': IMPORT_TIME_BUDGET,
+    'dcc.json.psonobject': IMPORT_TIME_BUDGET,
+    'dcc.dataclasses': IMPORT_TIME_BUDGET,
+    'dcc.math': IMPORT_TIME_BUDGET,
+    'dcc.collections': IMPORT_TIME_BUDGET,
+    'dcc.perforce': IMPORT_TIME_BUDGET
+}
+
+__forbidden__ = ('dcc.vendor.Qt', 'PySide2', 'PySide6', 'PyQt5', 'PyQt6')
+
+
+def main(executable=None):
+    """
+    Checks every module against its import-time budget and returns the exit code.
+    The headless backend is used so that no DCC backend is imported along the way!
+
+    :type executable: Union[str, None]
+    :rtype: int
+    """
+
+    os.environ.setdefault('DCC_BACKEND', 'headless')
+
+    results = [importutils.checkImportTime(modulePath, budget, forbidden=__forbidden__, executable=executable) for (modulePath, budget) in __budgets__.items()]
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
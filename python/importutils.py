@@ -2,6 +2,8 @@ import os
 import site
 import sys
 import inspect
+import importlib
+import subprocess
 
 from collections.abc import Sequence
 from . import stringutils, pathutils
@@ -14,6 +16,9 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+__code_cache__ = {}
+
+
 def filePathToModulePath(filePath):
     """
     Converts a file path into a module path compatible with import statements.
@@ -267,6 +272,199 @@ def tryImport(path, default=None, quiet=True, __locals__=None, __globals__=None)
         return module
 
 
+def lazyImport(modulePath, package=None, message='', __globals__=None):
+    """
+    Returns a module-level `__getattr__` and `__dir__` pair that defers importing the supplied module.
+    Once a member is requested the module is imported and its public members are copied into the supplied globals.
+    If no module path is supplied then a module-not-found error, using the supplied message, is raised on access!
+
+    :type modulePath: Union[str, None]
+    :type package: Union[str, None]
+    :type message: str
+    :type __globals__: Union[dict, None]
+    :rtype: Tuple[Callable, Callable]
+    """
+
+    # Evaluate supplied globals
+    #
+    if __globals__ is None:
+
+        __globals__ = {}
+
+    def importModule():
+        """
+        Imports the deferred module and copies its public members into the associated globals.
+
+        :rtype: module
+        """
+
+        # Check if module path is valid
+        #
+        if stringutils.isNullOrEmpty(modulePath):
+
+            raise ModuleNotFoundError(message)
+
+        # Import module and collect public members
+        #
+        module = importlib.import_module(modulePath, package=package)
+        names = getattr(module, '__all__', None)
+
+        if names is None:
+
+            names = [name for name in module.__dict__.keys() if not name.startswith('_')]
+
+        for name in names:
+
+            __globals__.setdefault(name, getattr(module, name))  # Preserve any overridden members!
+
+        __globals__['__all__'] = list(names)
+
+        return module
+
+    def __getattr__(name):
+        """
+        Private method that returns a member from the deferred module.
+
+        :type name: str
+        :rtype: Any
+        """
+
+        # Ignore any private members used to inspect modules
+        #
+        if name.startswith('__') and name != '__all__':
+
+            raise AttributeError(f'module {__globals__.get("__name__", "")!r} has no attribute {name!r}')
+
+        # Import module and return member
+        #
+        importModule()
+
+        try:
+
+            return __globals__[name]
+
+        except KeyError:
+
+            raise AttributeError(f'module {__globals__.get("__name__", "")!r} has no attribute {name!r}')
+
+    def __dir__():
+        """
+        Private method that returns the members from the deferred module.
+
+        :rtype: List[str]
+        """
+
+        importModule()
+        return sorted(__globals__.keys())
+
+    return __getattr__, __dir__
+
+
+def iterImportTimes(modulePath, executable=None):
+    """
+    Returns a generator that yields the self and cumulative import times, in microseconds, for the supplied module.
+    The module is imported inside a fresh interpreter using the `-X importtime` flag to avoid any cached modules!
+
+    :type modulePath: str
+    :type executable: Union[str, None]
+    :rtype: Iterator[Tuple[str, int, int]]
+    """
+
+    # Evaluate supplied executable
+    #
+    if stringutils.isNullOrEmpty(executable):
+
+        executable = sys.executable
+
+    # Import module inside a fresh interpreter
+    # The import times are written to stderr
+    #
+    process = subprocess.run(
+        [executable, '-X', 'importtime', '-c', f'import {modulePath}'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        cwd=os.getcwd()
+    )
+
+    if process.returncode != 0:
+
+        raise ImportError(f'iterImportTimes() unable to import: {modulePath}')
+
+    # Iterate through import times
+    #
+    for line in process.stderr.splitlines():
+
+        # Check if this is a valid entry
+        #
+        if not line.startswith('import time:'):
+
+            continue
+
+        selfTime, cumulativeTime, name = [string.strip() for string in line[12:].split('|', 2)]
+
+        if not (selfTime.isdigit() and cumulativeTime.isdigit()):
+
+            continue
+
+        yield name.strip(), int(selfTime), int(cumulativeTime)
+
+
+def getImportTime(modulePath, executable=None):
+    """
+    Returns the cumulative import time, in seconds, for the supplied module.
+
+    :type modulePath: str
+    :type executable: Union[str, None]
+    :rtype: float
+    """
+
+    importTimes = {name: cumulativeTime for (name, selfTime, cumulativeTime) in iterImportTimes(modulePath, executable=executable)}
+    return importTimes.get(modulePath, 0) * 1e-6
+
+
+def checkImportTime(modulePath, budget, forbidden=(), executable=None):
+    """
+    Evaluates if the supplied module can be imported within the specified budget, in seconds.
+    Any forbidden modules that are imported along the way will also fail the check!
+
+    :type modulePath: str
+    :type budget: float
+    :type forbidden: Sequence[str]
+    :type executable: Union[str, None]
+    :rtype: bool
+    """
+
+    # Collect import times
+    #
+    importTimes = {name: cumulativeTime for (name, selfTime, cumulativeTime) in iterImportTimes(modulePath, executable=executable)}
+    importTime = importTimes.get(modulePath, 0) * 1e-6
+
+    # Check if any forbidden modules were imported
+    #
+    success = True
+
+    for name in importTimes.keys():
+
+        if any(name == prefix or name.startswith(f'{prefix}.') for prefix in forbidden):
+
+            log.error(f'"{modulePath}" imports forbidden module: {name}')
+            success = False
+
+    # Check if import time exceeds budget
+    #
+    if importTime > budget:
+
+        log.error(f'"{modulePath}" took {importTime:.3f} secs to import, exceeding its {budget:.3f} sec budget!')
+        success = False
+
+    else:
+
+        log.info(f'"{modulePath}" took {importTime:.3f} secs to import, within its {budget:.3f} sec budget.')
+
+    return success
+
+
 def executeFile(filePath, __locals__=None, __globals__=None):
     """
     Executes a python file much like `execfile` in Python2x.
@@ -299,11 +497,41 @@ def executeFile(filePath, __locals__=None, __globals__=None):
 
     # Execute python file
     #
+    exec(compileFile(filePath), __globals__, __locals__)
+
+    return True
+
+
+def compileFile(filePath):
+    """
+    Returns the compiled code object for the supplied python file.
+    Code objects are cached by file path and only recompiled once the file has been modified!
+
+    :type filePath: str
+    :rtype: types.CodeType
+    """
+
+    # Check if code has been cached
+    #
+    stats = os.stat(filePath)
+    key = os.path.normcase(os.path.abspath(filePath))
+    signature = (stats.st_size, stats.st_mtime_ns)
+
+    cache = __code_cache__.get(key, None)
+
+    if cache is not None and cache[0] == signature:
+
+        return cache[1]
+
+    # Compile python file
+    #
     with open(filePath, 'rb') as file:
 
-        exec(compile(file.read(), filePath, 'exec'), __globals__, __locals__)
+        code = compile(file.read(), filePath, 'exec')
 
-    return True
+    __code_cache__[key] = (signature, code)
+
+    return code
 
 
 def iterPaths(paths):
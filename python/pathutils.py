@@ -8,7 +8,6 @@ import subprocess
 import platform
 
 from string import ascii_uppercase
-from ctypes import windll
 from fnmatch import fnmatch
 from . import stringutils, piputils
 
@@ -40,7 +39,7 @@ def getDriveLetters():
     # Collect letters using drive bitmask
     #
     drives = []
-    bitmask = windll.kernel32.GetLogicalDrives()
+    bitmask = ctypes.windll.kernel32.GetLogicalDrives()
 
     for letter in ascii_uppercase:
 
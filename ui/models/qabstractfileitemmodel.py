@@ -1,8 +1,9 @@
 import os
+import weakref
 
 from enum import IntEnum
 from datetime import datetime
-from . import qfilepath
+from . import qfilepath, qdirectoryloader
 from ...python import stringutils
 from ...vendor.Qt import QtCore, QtWidgets
 
@@ -39,6 +40,7 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
     }
 
     __setters__ = {}
+    __poll_interval__ = 2000
 
     def __init__(self, *paths, cwd='', parent=None):
         """
@@ -59,6 +61,15 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         self._cwd = None
         self._paths = []
         self._headerLabels = [FileHeaderLabels.Name]
+        self._handles = weakref.WeakValueDictionary()
+        self._loaders = {}
+        self._loading = {}
+        self._watched = {}
+        self._pinned = {}
+        self._pollTimer = QtCore.QTimer(self)
+        self._pollTimer.setInterval(self.__poll_interval__)
+        self._pollTimer.timeout.connect(self.poll)
+        self._pollTimer.start()
 
         # Check if paths were supplied
         #
@@ -118,7 +129,7 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         if cwd is not None and not self.isSameFile(cwd, self._cwd):
 
             self._cwd = cwd
-            self.setPaths(self._cwd.children)
+            self.refresh()
 
     def paths(self):
         """
@@ -138,7 +149,11 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         """
 
         self.beginResetModel()
+        self.cancelLoaders()
+        self.unpinDirectories()
         self._paths = list(filter(lambda path: path is not None, map(qfilepath.QFilePath, paths)))
+        self._handles.clear()
+        self._watched.clear()
         self.endResetModel()
 
     def headerLabels(self):
@@ -197,10 +212,42 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         Returns the path associated with the given index.
 
         :type index: QtCore.QModelIndex
-        :rtype: Path
+        :rtype: Union[qfilepath.QFilePath, None]
+        """
+
+        # Check if index is valid
+        #
+        if not index.isValid():
+
+            return None
+
+        # Check if path is still referenced by this model
+        # Otherwise, fallback on the path cache in case the path was indexed elsewhere!
+        #
+        handle = index.internalId()
+        path = self._handles.get(handle, None)
+
+        if path is None:
+
+            path = qfilepath.QFilePath.__instances__.get(handle, None)
+
+        return path
+
+    def createPathIndex(self, row, column, path):
+        """
+        Returns an index for the supplied path.
+        The path is registered with this model so it can be retrieved from the index's internal ID.
+
+        :type row: int
+        :type column: int
+        :type path: qfilepath.QFilePath
+        :rtype: QtCore.QModelIndex
         """
 
-        return qfilepath.QFilePath.__instances__.get(index.internalId(), None)
+        handle = hash(path)
+        self._handles[handle] = path
+
+        return self.createIndex(row, column, id=handle)
 
     def parent(self, index):
         """
@@ -219,27 +266,32 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
 
             return QtCore.QModelIndex()
 
-        # Check if path is a root drive
+        # Check if path is a top-level path
         # Otherwise the path will have no parent!
         #
-        paths = self.paths()
+        parent = path.parent
 
-        if path in paths:
+        if parent is None or parent is self._cwd or path in self._paths:
 
             return QtCore.QModelIndex()
 
-        # Check if parent path is also a root drive
+        # Check if parent path is a root drive
         #
-        parent = path.parent
+        grandparent = parent.parent
 
-        if not parent.isDrive():
+        if grandparent is None:
 
-            row = parent.parent.children.index(parent)
-            return self.createIndex(row, 0, id=hash(parent))
+            return QtCore.QModelIndex()
 
-        else:
+        try:
 
-            return QtCore.QModelIndex()
+            row = grandparent.indexOf(parent)
+
+        except ValueError:
+
+            row = self._paths.index(parent)  # Parent must be a top-level path!
+
+        return self.createPathIndex(row, 0, parent)
 
     def index(self, row, column, parent=QtCore.QModelIndex()):
         """
@@ -258,12 +310,13 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
             # Check if child is in range
             #
             path = self.pathFromIndex(parent)
-            numChildren = len(path.children)
+            children = path.loadedChildren() if path is not None else []
+            numChildren = len(children)
 
             if 0 <= row < numChildren:
 
-                child = path.children[row]
-                return self.createIndex(row, column, id=hash(child))
+                child = children[row]
+                return self.createPathIndex(row, column, child)
 
             else:
 
@@ -278,7 +331,7 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
             if 0 <= row < numPaths:
 
                 path = self._paths[row]
-                return self.createIndex(row, column, id=hash(path))
+                return self.createPathIndex(row, column, path)
 
             else:
 
@@ -297,12 +350,301 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         if parent.isValid():
 
             path = self.pathFromIndex(parent)
-            return len(path.children)
+            return len(path.loadedChildren()) if path is not None else 0
 
         else:
 
             return len(self._paths)
 
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """
+        Evaluates if the given parent has any children.
+        Directories are assumed to have children until they have been loaded!
+
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        # Check if parent is valid
+        #
+        if parent.isValid():
+
+            path = self.pathFromIndex(parent)
+
+            if path is None or not path.isDir():
+
+                return False
+
+            elif path.isLoaded() and hash(path) not in self._loading:
+
+                return len(path.loadedChildren()) > 0
+
+            else:
+
+                return True
+
+        else:
+
+            return len(self._paths) > 0
+
+    def canFetchMore(self, parent):
+        """
+        Evaluates if there is more data available for the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        # Check if parent is valid
+        #
+        if not parent.isValid():
+
+            return False
+
+        # Check if directory requires loading
+        #
+        path = self.pathFromIndex(parent)
+
+        if path is None:
+
+            return False
+
+        else:
+
+            return path.isDir() and not path.isLoaded()
+
+    def fetchMore(self, parent):
+        """
+        Fetches any available data for the given parent.
+        The directory is scanned on a worker thread and any entries are inserted in batches.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        path = self.pathFromIndex(parent)
+
+        if path is not None:
+
+            self.loadDirectory(path, parent=parent)
+
+    def isLoading(self):
+        """
+        Evaluates if any directories are still being loaded.
+
+        :rtype: bool
+        """
+
+        return len(self._loading) > 0
+
+    def loadDirectory(self, path, parent=QtCore.QModelIndex()):
+        """
+        Loads the children of the supplied directory on a worker thread.
+        An invalid parent index implies the directory is the current working directory!
+
+        :type path: qfilepath.QFilePath
+        :type parent: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        # Check if directory is already loading
+        #
+        handle = hash(path)
+
+        if handle in self._loading:
+
+            return
+
+        # Reset loaded children
+        # The path is pinned so that its children outlive any cache evictions while displayed!
+        #
+        path.invalidate()
+        path.extendChildren([])
+        path.setLoading(True)
+
+        self.pinDirectory(path)
+
+        # Start loader
+        #
+        loader = qdirectoryloader.QDirectoryLoader(path.toString())
+        loader.entriesLoaded.connect(self.onEntriesLoaded)
+        loader.loadFinished.connect(self.onLoadFinished)
+        loader.finished.connect(self.onLoaderFinished)
+
+        self._loaders[loader] = (path, QtCore.QPersistentModelIndex(parent))
+        self._loading[handle] = loader
+
+        loader.start()
+
+    def reloadDirectory(self, path, parent=QtCore.QModelIndex()):
+        """
+        Removes the loaded children from the supplied directory and reloads them.
+
+        :type path: qfilepath.QFilePath
+        :type parent: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        # Check if this is the current working directory
+        #
+        if not parent.isValid():
+
+            self.refresh()
+            return
+
+        # Remove any loaded children
+        #
+        self.cancelLoader(path)
+        numChildren = len(path.loadedChildren())
+
+        if numChildren > 0:
+
+            self.beginRemoveRows(parent, 0, numChildren - 1)
+            path.invalidate()
+            self.endRemoveRows()
+
+        else:
+
+            path.invalidate()
+
+        # Reload children
+        #
+        self.loadDirectory(path, parent=parent)
+
+    def cancelLoader(self, path):
+        """
+        Interrupts the loader associated with the supplied directory.
+
+        :type path: qfilepath.QFilePath
+        :rtype: None
+        """
+
+        loader = self._loading.pop(hash(path), None)
+
+        if loader is not None:
+
+            loader.requestInterruption()
+            path.setLoading(False)
+
+    def cancelLoaders(self):
+        """
+        Interrupts all active loaders.
+        Interrupted loaders remain referenced until their threads have finished!
+
+        :rtype: None
+        """
+
+        for loader in self._loading.values():
+
+            loader.requestInterruption()
+
+            path, persistentIndex = self._loaders.get(loader, (None, None))
+
+            if path is not None:
+
+                path.setLoading(False)
+
+        self._loading.clear()
+
+    def pinDirectory(self, path):
+        """
+        Pins the supplied directory for as long as this model displays it.
+
+        :type path: qfilepath.QFilePath
+        :rtype: None
+        """
+
+        handle = hash(path)
+
+        if handle not in self._pinned:
+
+            path.pin()
+            self._pinned[handle] = path
+
+    def unpinDirectory(self, path):
+        """
+        Unpins the supplied directory.
+
+        :type path: qfilepath.QFilePath
+        :rtype: None
+        """
+
+        path = self._pinned.pop(hash(path), None)
+
+        if path is not None:
+
+            path.unpin()
+
+    def unpinDirectories(self):
+        """
+        Unpins all the directories displayed by this model.
+
+        :rtype: None
+        """
+
+        for path in self._pinned.values():
+
+            path.unpin()
+
+        self._pinned.clear()
+
+    def isActiveLoader(self, loader):
+        """
+        Evaluates if the supplied loader has not been interrupted.
+
+        :type loader: qdirectoryloader.QDirectoryLoader
+        :rtype: bool
+        """
+
+        path, parent = self._loaders.get(loader, (None, None))
+
+        if path is None:
+
+            return False
+
+        else:
+
+            return self._loading.get(hash(path), None) is loader
+
+    def poll(self):
+        """
+        Polls the loaded directories for any changes.
+        Changed directories are reloaded in the background.
+
+        :rtype: None
+        """
+
+        # Check if current working directory has changed
+        #
+        if self._cwd is not None and hash(self._cwd) not in self._loading:
+
+            if not self._cwd.isUpToDate(force=True):
+
+                self.refresh()
+                return
+
+        # Iterate through watched directories
+        #
+        for (handle, (path, persistentIndex)) in list(self._watched.items()):
+
+            # Check if directory is still visible
+            #
+            if not persistentIndex.isValid():
+
+                del self._watched[handle]
+                self.unpinDirectory(path)
+
+                continue
+
+            # Check if directory has changed
+            #
+            if handle in self._loading or path.isUpToDate(force=True):
+
+                continue
+
+            del self._watched[handle]
+            self.reloadDirectory(path, parent=QtCore.QModelIndex(persistentIndex))
+
     def columnCount(self, parent=QtCore.QModelIndex()):
         """
         Returns the number of columns under the given parent.
@@ -421,5 +763,102 @@ class QAbstractFileItemModel(QtCore.QAbstractItemModel):
         #
         if self._cwd is not None:
 
-            self.setPaths(self._cwd.children)
+            self.setPaths([])
+            self.loadDirectory(self._cwd)
+    # endregion
+
+    # region Slots
+    @QtCore.Slot(str, object)
+    def onEntriesLoaded(self, directory, entries):
+        """
+        Slot method for a loader's `entriesLoaded` signal.
+        Inserts the batch of entries under the associated parent.
+
+        :type directory: str
+        :type entries: List[Tuple[str, os.stat_result, bool]]
+        :rtype: None
+        """
+
+        # Check if loader is still active
+        #
+        loader = self.sender()
+
+        if not self.isActiveLoader(loader):
+
+            return
+
+        # Check if parent is still valid
+        #
+        path, persistentIndex = self._loaders[loader]
+        numEntries = len(entries)
+
+        if persistentIndex.isValid():
+
+            parent = QtCore.QModelIndex(persistentIndex)
+            firstRow = len(path.loadedChildren())
+
+            self.beginInsertRows(parent, firstRow, firstRow + (numEntries - 1))
+            path.extendChildren(entries)
+            self.endInsertRows()
+
+        elif path is self._cwd:
+
+            firstRow = len(self._paths)
+
+            self.beginInsertRows(QtCore.QModelIndex(), firstRow, firstRow + (numEntries - 1))
+            self._paths.extend(path.extendChildren(entries))
+            self.endInsertRows()
+
+        else:
+
+            self.cancelLoader(path)
+
+    @QtCore.Slot(str)
+    def onLoadFinished(self, directory):
+        """
+        Slot method for a loader's `loadFinished` signal.
+        Watches the loaded directory for any changes.
+
+        :type directory: str
+        :rtype: None
+        """
+
+        # Check if loader is still active
+        #
+        loader = self.sender()
+
+        if not self.isActiveLoader(loader):
+
+            return
+
+        # Watch loaded directory
+        #
+        path, persistentIndex = self._loaders[loader]
+        handle = hash(path)
+
+        del self._loading[handle]
+        path.setLoading(False)
+
+        if persistentIndex.isValid():
+
+            self._watched[handle] = (path, persistentIndex)
+
+    @QtCore.Slot()
+    def onLoaderFinished(self):
+        """
+        Slot method for a loader's `finished` signal.
+        Releases the loader now that its thread has finished.
+
+        :rtype: None
+        """
+
+        loader = self.sender()
+        path, persistentIndex = self._loaders.pop(loader, (None, None))
+
+        if path is not None and self._loading.get(hash(path), None) is loader:
+
+            del self._loading[hash(path)]
+            path.setLoading(False)
+
+        loader.deleteLater()
     # endregion
@@ -0,0 +1,160 @@
+import os
+import stat
+
+from ...vendor.Qt import QtCore
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def scanDirectory(path):
+    """
+    Returns a generator that yields the readable entries from the supplied directory.
+    Each entry consists of a path, stat result and symbolic link flag, with directories always preceding files!
+    The stat results are derived from the directory entries in order to avoid any redundant system calls.
+    Readability is evaluated from the owner read bit of each stat result rather than querying the file system again.
+
+    :type path: str
+    :rtype: Iterator[Tuple[str, os.stat_result, bool]]
+    """
+
+    # Iterate through directory entries
+    #
+    directories, files = [], []
+
+    try:
+
+        with os.scandir(path) as iterator:
+
+            for entry in iterator:
+
+                # Evaluate entry type
+                #
+                try:
+
+                    isDir = entry.is_dir()
+                    isFile = not isDir and entry.is_file()
+                    stats = entry.stat()
+
+                except OSError:
+
+                    continue  # Broken links and locked files can be ignored!
+
+                # Check if entry is readable
+                #
+                if not stats.st_mode & stat.S_IRUSR:
+
+                    continue
+
+                item = (entry.path, stats, entry.is_symlink())
+
+                if isDir:
+
+                    directories.append(item)
+
+                elif isFile:
+
+                    files.append(item)
+
+                else:
+
+                    continue
+
+    except OSError as exception:
+
+        log.debug(exception)
+
+    yield from directories
+    yield from files
+
+
+class QDirectoryLoader(QtCore.QThread):
+    """
+    Overload of QThread that scans a directory on a worker thread.
+    Entries are delivered in batches to keep the receiving model responsive while browsing large directories.
+    """
+
+    # region Dunderscores
+    __batch_size__ = 512
+
+    def __init__(self, path, batchSize=None, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type path: str
+        :type batchSize: Union[int, None]
+        :type parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QDirectoryLoader, self).__init__(parent)
+
+        # Declare private variables
+        #
+        self._path = path
+        self._batchSize = batchSize if isinstance(batchSize, int) else self.__batch_size__
+    # endregion
+
+    # region Signals
+    entriesLoaded = QtCore.Signal(str, object)
+    loadFinished = QtCore.Signal(str)
+    # endregion
+
+    # region Methods
+    def path(self):
+        """
+        Returns the directory being loaded.
+
+        :rtype: str
+        """
+
+        return self._path
+
+    def batchSize(self):
+        """
+        Returns the number of entries emitted per batch.
+
+        :rtype: int
+        """
+
+        return self._batchSize
+
+    def run(self):
+        """
+        Scans the associated directory and emits the entries in batches.
+        Only plain tuples are emitted since the path cache is not thread-safe!
+
+        :rtype: None
+        """
+
+        batch = []
+
+        for entry in scanDirectory(self._path):
+
+            # Check if loader has been interrupted
+            #
+            if self.isInterruptionRequested():
+
+                return
+
+            # Check if batch is full
+            #
+            batch.append(entry)
+
+            if len(batch) >= self._batchSize:
+
+                self.entriesLoaded.emit(self._path, batch)
+                batch = []
+
+        # Emit any remaining entries
+        #
+        if len(batch) > 0:
+
+            self.entriesLoaded.emit(self._path, batch)
+
+        self.loadFinished.emit(self._path)
+    # endregion
@@ -1,6 +1,9 @@
 import os
 import stat
+import time
 
+from collections import OrderedDict
+from . import qdirectoryloader
 from ...vendor.Qt import QtCore, QtWidgets
 
 import logging
@@ -13,11 +16,31 @@ class QFilePath(object):
     """
     Base class used to interface with files from a string path.
     Instances use a singleton pattern so external interfaces can perform reverse lookups via hash IDs.
+    The singleton cache is bounded so that the least recently used paths are released while browsing!
+    Since parents reference their children, evicted paths also release their loaded children unless they have been pinned.
     """
 
     # region Dunderscores
-    __slots__ = ('_path', '_name', '_basename', '_extension', '_icon', '_stat', '_parent', '_children', '_siblings')
-    __instances__ = {}
+    __slots__ = (
+        '_path',
+        '_name',
+        '_basename',
+        '_extension',
+        '_icon',
+        '_stat',
+        '_link',
+        '_polled',
+        '_parent',
+        '_children',
+        '_rows',
+        '_loading',
+        '_pins',
+        '__weakref__'
+    )
+
+    __instances__ = OrderedDict()
+    __cache_size__ = 10000
+    __poll_interval__ = 2.0
     __icons__ = QtWidgets.QFileIconProvider()
 
     def __new__(cls, path):
@@ -50,7 +73,11 @@ class QFilePath(object):
         if instance is None:
 
             instance = super(QFilePath, cls).__new__(cls)
-            cls.__instances__[handle] = instance
+            cls.cacheInstance(handle, instance)
+
+        else:
+
+            cls.__instances__.move_to_end(handle)
 
         return instance
 
@@ -78,12 +105,16 @@ class QFilePath(object):
         self._name = os.path.basename(self._path)
         self._basename, self._extension = '', ''
         self._stat = os.stat(self._path)
+        self._link = os.path.islink(self._path)
+        self._polled = time.time()
         self._parent = None
         self._children = None
-        self._siblings = None
+        self._rows = None
+        self._loading = False
+        self._pins = 0
         self._icon = None
 
-        if os.path.isfile(self._path):
+        if self.isFile():
 
             name, extension = os.path.splitext(self._name)
             self._basename, self._extension = name, extension.lstrip('.')
@@ -219,9 +250,9 @@ class QFilePath(object):
 
         # Check if parent has been initialized
         #
-        if (self._parent is None or not self.isUpToDate()) and not self.isDrive():
+        if self._parent is None and not self.isDrive():
 
-            self.update()
+            self._parent = QFilePath(os.path.dirname(self._path))
 
         return self._parent
 
@@ -229,10 +260,17 @@ class QFilePath(object):
     def children(self):
         """
         Getter method that returns the children from this path.
+        If the children are being loaded in the background then the loaded children are returned as-is!
 
         :rtype: List[Path]
         """
 
+        # Check if children are being loaded
+        #
+        if self._loading:
+
+            return self.loadedChildren()
+
         # Check if children have been initialized
         #
         if self._children is None or not self.isUpToDate():
@@ -249,16 +287,115 @@ class QFilePath(object):
         :rtype: List[Path]
         """
 
-        # Check if children have been initialized
+        # Check if parent exists
         #
-        if self._siblings is None or not self.isUpToDate():
+        parent = self.parent
 
-            self.update()
+        if parent is None:
+
+            return []
 
-        return self._siblings
+        else:
+
+            return [path for path in parent.children if path is not self]
     # endregion
 
     # region Methods
+    @classmethod
+    def cacheInstance(cls, handle, instance):
+        """
+        Adds the supplied instance to the singleton cache.
+        Any least recently used instances that exceed the cache size are released.
+
+        :type handle: int
+        :type instance: QFilePath
+        :rtype: None
+        """
+
+        cls.__instances__[handle] = instance
+
+        # Evict least recently used instances
+        # Pinned instances are skipped since their children are still in use!
+        #
+        attempts = len(cls.__instances__)
+
+        while len(cls.__instances__) > cls.__cache_size__ and attempts > 0:
+
+            attempts -= 1
+            oldestHandle, oldestInstance = cls.__instances__.popitem(last=False)
+
+            if oldestInstance is instance or oldestInstance.isPinned():
+
+                cls.__instances__[oldestHandle] = oldestInstance
+
+            else:
+
+                oldestInstance.releaseChildren()
+
+    @classmethod
+    def clearCache(cls):
+        """
+        Removes all instances from the singleton cache.
+
+        :rtype: None
+        """
+
+        cls.__instances__.clear()
+
+    @classmethod
+    def fromEntry(cls, path, stats, isLink=False, parent=None):
+        """
+        Returns a path from the supplied directory entry.
+        Unlike the constructor, no system calls are made since the entry's stat result is reused!
+
+        :type path: str
+        :type stats: os.stat_result
+        :type isLink: bool
+        :type parent: Union[QFilePath, None]
+        :rtype: QFilePath
+        """
+
+        # Check if instance already exists for path
+        #
+        handle = abs(hash(path.lower()))
+        instance = cls.__instances__.get(handle, None)
+
+        if instance is not None:
+
+            cls.__instances__.move_to_end(handle)
+            instance._stat = stats
+            instance._link = isLink
+
+            return instance
+
+        # Initialize new instance from entry
+        #
+        instance = super(QFilePath, cls).__new__(cls)
+        instance._path = path
+        instance._name = os.path.basename(path)
+        instance._stat = stats
+        instance._link = isLink
+        instance._polled = time.time()
+        instance._parent = parent
+        instance._children = None
+        instance._rows = None
+        instance._loading = False
+        instance._pins = 0
+        instance._icon = None
+
+        if instance.isFile():
+
+            name, extension = os.path.splitext(instance._name)
+            instance._basename, instance._extension = name, extension.lstrip('.')
+
+        else:
+
+            instance._basename, instance._extension = instance._name, ''
+
+        cls.cacheInstance(handle, instance)
+
+        return instance
+
     def isDir(self):
         """
         Evaluates if this path represents a directory.
@@ -266,7 +403,7 @@ class QFilePath(object):
         :rtype: bool
         """
 
-        return os.path.isdir(self._path)
+        return stat.S_ISDIR(self._stat.st_mode)
 
     def isDrive(self):
         """
@@ -284,7 +421,7 @@ class QFilePath(object):
         :rtype: bool
         """
 
-        return os.path.isfile(self._path)
+        return stat.S_ISREG(self._stat.st_mode)
 
     def isLink(self):
         """
@@ -293,7 +430,7 @@ class QFilePath(object):
         :rtype: bool
         """
 
-        return os.path.islink(self._path)
+        return self._link
 
     def isReadOnly(self):
         """
@@ -352,21 +489,188 @@ class QFilePath(object):
 
         return all([hasattr(self, x) for x in self.__class__.__slots__])
 
-    def isUpToDate(self):
+    def isLoaded(self):
+        """
+        Evaluates if this instance's children have been loaded.
+
+        :rtype: bool
+        """
+
+        return self._children is not None
+
+    def isLoading(self):
+        """
+        Evaluates if this instance's children are being loaded in the background.
+
+        :rtype: bool
+        """
+
+        return self._loading
+
+    def setLoading(self, loading):
+        """
+        Updates the loading state for this instance.
+        While loading, the children are only appended to by the loader and are never re-scanned!
+
+        :type loading: bool
+        :rtype: None
+        """
+
+        self._loading = bool(loading)
+
+    def isPinned(self):
+        """
+        Evaluates if this instance has been pinned.
+
+        :rtype: bool
+        """
+
+        return self._pins > 0
+
+    def pin(self):
+        """
+        Pins this instance so that its children are kept when evicted from the cache.
+        Each call must be paired with a call to `unpin`!
+
+        :rtype: None
+        """
+
+        self._pins += 1
+
+    def unpin(self):
+        """
+        Unpins this instance.
+
+        :rtype: None
+        """
+
+        self._pins = max(self._pins - 1, 0)
+
+    def releaseChildren(self):
+        """
+        Releases the loaded children from this instance.
+        Any children that are being loaded, or pinned, are kept!
+
+        :rtype: None
+        """
+
+        if not (self._loading or self.isPinned()):
+
+            self._children = None
+            self._rows = None
+
+    def isUpToDate(self, force=False):
         """
         Evaluates if this instance's stats are up-to-date.
+        The modified time is only polled once per interval unless forced!
 
+        :type force: bool
         :rtype: bool
         """
 
-        if os.path.exists(self._path):
+        # Check if poll interval has elapsed
+        #
+        currentTime = time.time()
 
-            return os.stat(self._path).st_mtime == self.stat.st_mtime
+        if (currentTime - self._polled) < self.__poll_interval__ and not force:
 
-        else:
+            return True
+
+        self._polled = currentTime
+
+        # Compare modified times
+        #
+        try:
+
+            return os.stat(self._path).st_mtime == self._stat.st_mtime
+
+        except OSError:
 
             return True  # Safe to say we can no longer test for changes!
 
+    def loadedChildren(self):
+        """
+        Returns the children that have been loaded so far without scanning this directory.
+
+        :rtype: List[QFilePath]
+        """
+
+        return self._children if self._children is not None else []
+
+    def indexOf(self, child):
+        """
+        Returns the row of the supplied child from the loaded children.
+        If the child does not belong to this path then a value error is raised!
+
+        :type child: QFilePath
+        :rtype: int
+        """
+
+        # Check if row lookup requires initializing
+        #
+        children = self.loadedChildren()
+
+        if self._rows is None:
+
+            self._rows = {hash(path): row for (row, path) in enumerate(children)}
+
+        # Check if child exists
+        #
+        row = self._rows.get(hash(child), None)
+
+        if row is None:
+
+            raise ValueError(f'indexOf() {child!r} is not a child of {self!r}!')
+
+        return row
+
+    def extendChildren(self, entries):
+        """
+        Appends the supplied directory entries to the loaded children.
+        Returns the paths that were appended.
+
+        :type entries: List[Tuple[str, os.stat_result, bool]]
+        :rtype: List[QFilePath]
+        """
+
+        # Convert entries to paths
+        #
+        paths = [self.fromEntry(path, stats, isLink=isLink, parent=self) for (path, stats, isLink) in entries]
+
+        if self._children is None:
+
+            self._children = []
+
+        # Update row lookup
+        #
+        if self._rows is not None:
+
+            start = len(self._children)
+            self._rows.update({hash(path): row for (row, path) in enumerate(paths, start=start)})
+
+        self._children.extend(paths)
+
+        return paths
+
+    def invalidate(self):
+        """
+        Invalidates this instance's internal stats and children.
+
+        :rtype: None
+        """
+
+        try:
+
+            self._stat = os.stat(self._path)
+
+        except OSError as exception:
+
+            log.debug(exception)
+
+        self._polled = time.time()
+        self._children = None
+        self._rows = None
+
     def update(self):
         """
         Forces this instance to update its internal properties.
@@ -376,30 +680,18 @@ class QFilePath(object):
 
         # Update internal stats
         #
-        self._stat = os.stat(self._path)
-        self._parent = QFilePath(os.path.dirname(self._path))
+        self.invalidate()
 
         # Re-populate child array
         #
         if self.isDir():
 
-            children = tuple(map(lambda filename: os.path.join(self._path, filename), os.listdir(self._path)))
-            filteredChildren = tuple(filter(lambda path: os.access(path, os.R_OK), children))
-
-            directories = tuple(filter(lambda path: os.path.isdir(path), filteredChildren))
-            filePaths = tuple(filter(lambda path: os.path.isfile(path), filteredChildren))
-            sortedChildren = directories + filePaths
-
-            self._children = list(map(QFilePath, sortedChildren))
+            self.extendChildren(list(qdirectoryloader.scanDirectory(self._path)))
 
         else:
 
             self._children = []
 
-        # Re-populate siblings array
-        #
-        self._siblings = [path for path in self._parent.children if path is not self]
-
     def toString(self):
         """
         Returns a string representation of this instance.
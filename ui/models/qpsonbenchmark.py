@@ -0,0 +1,293 @@
+"""
+Measures the traversal time of the `QPSONItemModel` over a synthetic document with thousands of export ranges.
+Run from the directory containing this package using: `python -m dcc.ui.models.qpsonbenchmark`
+The offscreen platform is used unless the `QT_QPA_PLATFORM` environment variable has already been set!
+"""
+import os
+import sys
+import time
+
+from . import qpsonitemmodel
+from ...json import psonobject
+from ...collections import notifylist
+from ...vendor.Qt import QtCore, QtWidgets
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class BenchmarkRange(psonobject.PSONObject):
+    """
+    Overload of `PSONObject` that mimics an export range.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_name', '_startFrame', '_endFrame', '_tags')
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BenchmarkRange, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._name = ''
+        self._startFrame = 0
+        self._endFrame = 1
+        self._tags = notifylist.NotifyList()
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of this range.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Setter method that updates the name of this range.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._name = name
+
+    @property
+    def startFrame(self):
+        """
+        Getter method that returns the start frame.
+
+        :rtype: int
+        """
+
+        return self._startFrame
+
+    @startFrame.setter
+    def startFrame(self, startFrame):
+        """
+        Setter method that updates the start frame.
+
+        :type startFrame: int
+        :rtype: None
+        """
+
+        self._startFrame = startFrame
+
+    @property
+    def endFrame(self):
+        """
+        Getter method that returns the end frame.
+
+        :rtype: int
+        """
+
+        return self._endFrame
+
+    @endFrame.setter
+    def endFrame(self, endFrame):
+        """
+        Setter method that updates the end frame.
+
+        :type endFrame: int
+        :rtype: None
+        """
+
+        self._endFrame = endFrame
+
+    @property
+    def tags(self):
+        """
+        Getter method that returns the tags.
+
+        :rtype: List[str]
+        """
+
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        """
+        Setter method that updates the tags.
+
+        :type tags: List[str]
+        :rtype: None
+        """
+
+        self._tags.clear()
+        self._tags.extend(tags)
+    # endregion
+
+
+class BenchmarkDocument(psonobject.PSONObject):
+    """
+    Overload of `PSONObject` that mimics a referenced asset.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_ranges',)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(BenchmarkDocument, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._ranges = notifylist.NotifyList()
+    # endregion
+
+    # region Properties
+    @property
+    def ranges(self):
+        """
+        Getter method that returns the export ranges.
+
+        :rtype: List[BenchmarkRange]
+        """
+
+        return self._ranges
+
+    @ranges.setter
+    def ranges(self, ranges):
+        """
+        Setter method that updates the export ranges.
+
+        :type ranges: List[BenchmarkRange]
+        :rtype: None
+        """
+
+        self._ranges.clear()
+        self._ranges.extend(ranges)
+    # endregion
+
+
+def traverse(model, parent=None):
+    """
+    Walks every row beneath the supplied parent and requests the display data for each column.
+    Any rows that are fetched incrementally are fetched along the way.
+
+    :type model: qpsonitemmodel.QPSONItemModel
+    :type parent: Union[QtCore.QModelIndex, None]
+    :rtype: int
+    """
+
+    parent = QtCore.QModelIndex() if parent is None else parent
+
+    while model.canFetchMore(parent):
+
+        model.fetchMore(parent)
+
+    numRows = model.rowCount(parent)
+    numColumns = model.columnCount(parent)
+    numItems = numRows
+
+    for row in range(numRows):
+
+        for column in range(numColumns):
+
+            model.data(model.index(row, column, parent), role=QtCore.Qt.DisplayRole)
+
+        index = model.index(row, 0, parent)
+
+        if model.hasChildren(index):
+
+            numItems += traverse(model, parent=index)
+
+    return numItems
+
+
+def benchmark(numRanges=5000, numPasses=3):
+    """
+    Traverses a synthetic document and reports the cold and warm traversal times.
+    The cold pass resolves every index and display string, while any warm passes are served from the internal caches.
+
+    :type numRanges: int
+    :type numPasses: int
+    :rtype: Dict[str, Union[int, float]]
+    """
+
+    # Initialize offscreen application
+    # The platform is only read once the application has been created!
+    #
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+    # Generate synthetic document
+    #
+    document = BenchmarkDocument()
+    document.ranges = [BenchmarkRange(name=f'range{i}', startFrame=i, endFrame=i + 100, tags=['cinematic', 'loop']) for i in range(numRanges)]
+
+    model = qpsonitemmodel.QPSONItemModel()
+    model.invisibleRootProperty = 'ranges'
+    model.invisibleRootItem = document
+
+    # Traverse model
+    #
+    startTime = time.perf_counter()
+    numItems = traverse(model)
+    cold = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+
+    for i in range(numPasses):
+
+        traverse(model)
+
+    warm = (time.perf_counter() - startTime) / max(numPasses, 1)
+
+    # Edit a single range outside the model and traverse again
+    #
+    document.ranges[1].startFrame = -1
+    model.invalidate(model.index(1, 0))
+
+    startTime = time.perf_counter()
+    traverse(model)
+    edited = time.perf_counter() - startTime
+
+    results = {
+        'numRanges': numRanges,
+        'numItems': numItems,
+        'cold': cold,
+        'warm': warm,
+        'edited': edited
+    }
+
+    log.info(f'Traversed {numItems} item(s) in {cold:.3f}s cold, {warm:.3f}s warm and {edited:.3f}s after an edit ({application.platformName()} platform)')
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and returns the exit code.
+
+    :rtype: int
+    """
+
+    benchmark()
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
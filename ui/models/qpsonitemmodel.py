@@ -1,9 +1,11 @@
 import json
 
 from enum import Enum, IntEnum
+from functools import partial
 from . import qpsonpath
 from ... import fnqt
 from ...python import stringutils
+from ...collections import notifylist, notifydict
 from ...vendor.Qt import QtCore, QtWidgets, QtGui, QtCompat
 from ...vendor.six import string_types, integer_types
 from ...vendor.six.moves import collections_abc
@@ -28,10 +30,13 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
     """
     Overload of QAbstractItemModel used to represent python objects and their data properties.
     This class uses pathing collections to navigate through the data structure.
+    Any resolved indices and display data are cached by internal ID until the underlying structure changes.
+    Large sequences are populated incrementally via `canFetchMore` and `fetchMore`!
     """
 
     # region Dunderscores
     __builtins__ = (bool, int, float, str, collections_abc.Sequence, collections_abc.Mapping)
+    __fetch_size__ = 256
 
     def __init__(self, parent=None):
         """
@@ -47,12 +52,20 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         # Declare private variables
         #
-        self._qt = fnqt.FnQt()
+        self._qt = None
         self._invisibleRootItem = None
         self._invisibleRootProperty = ''
         self._viewDetails = [ViewDetails.Name, ViewDetails.Value]
         self._headerLabels = [stringutils.pascalize(x.name, separator=' ') for x in self._viewDetails]
         self._internalIds = {}
+        self._childIds = {}
+        self._parentIds = {}
+        self._rowCounts = {}
+        self._hasChildren = {}
+        self._fetchedRows = {}
+        self._displayData = {}
+        self._notifiers = {}
+        self._editDepth = 0
     # endregion
 
     # region Properties
@@ -60,10 +73,15 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
     def qt(self):
         """
         Getter method that returns the qt function set.
+        The function set is initialized on demand so this model can also be used outside of a DCC!
 
         :rtype: fnqt.FnQt
         """
 
+        if self._qt is None:
+
+            self._qt = fnqt.FnQt()
+
         return self._qt
 
     @property
@@ -87,7 +105,7 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         self.beginResetModel()
         self._invisibleRootItem = invisibleRootItem
-        self._internalIds.clear()
+        self.clearCache()
         self.endResetModel()
 
     @property
@@ -111,7 +129,7 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         self.beginResetModel()
         self._invisibleRootProperty = invisibleRootProperty
-        self._internalIds.clear()
+        self.clearCache()
         self.endResetModel()
 
     @property
@@ -141,6 +159,7 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         #
         self._viewDetails = viewDetails
         self._headerLabels = [stringutils.pascalize(x.name, separator=' ') for x in self._viewDetails]
+        self._displayData.clear()
 
         # Signal reset complete
         #
@@ -157,6 +176,26 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         return self._headerLabels
     # endregion
 
+    # region Callbacks
+    def itemsChanged(self, indices, items):
+        """
+        Callback method that invalidates the internal caches whenever a watched collection changes.
+        Any changes made outside of this model will also reset the model!
+
+        :type indices: Union[range, List[Union[int, str]]]
+        :type items: List[Any]
+        :rtype: None
+        """
+
+        if self._editDepth > 0:
+
+            self.invalidateCache()
+
+        else:
+
+            self.refresh()
+    # endregion
+
     # region Methods
     def encodeInternalId(self, *indices):
         """
@@ -172,6 +211,140 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         return internalId
 
+    def watchItem(self, item):
+        """
+        Subscribes to the batched notifies from the supplied collection.
+        This ensures the internal caches are invalidated whenever the collection changes!
+        Collections only hold weak references to their callbacks so releasing the callback also unsubscribes from the collection.
+
+        :type item: Any
+        :rtype: None
+        """
+
+        # Check if item supports notifies
+        #
+        if not isinstance(item, (notifylist.NotifyList, notifydict.NotifyDict)):
+
+            return
+
+        # Check if item is already being watched
+        #
+        key = id(item)
+
+        if key in self._notifiers:
+
+            return
+
+        callback = partial(self.itemsChanged)
+
+        item.addCallback('itemsAdded', callback)
+        item.addCallback('itemsRemoved', callback)
+
+        self._notifiers[key] = (item, callback)
+
+    def invalidateCache(self):
+        """
+        Invalidates any cached indices, row counts and display data.
+        Internal IDs remain valid since they are derived from their paths!
+
+        :rtype: None
+        """
+
+        self._childIds.clear()
+        self._parentIds.clear()
+        self._rowCounts.clear()
+        self._hasChildren.clear()
+        self._displayData.clear()
+
+    def clearCache(self):
+        """
+        Clears all internal caches and unsubscribes from any watched collections.
+
+        :rtype: None
+        """
+
+        # Unsubscribe from watched collections
+        # Releasing the callbacks removes their weak references from the collections!
+        #
+        self._notifiers.clear()
+
+        # Clear internal caches
+        #
+        self.invalidateCache()
+        self._internalIds.clear()
+        self._fetchedRows.clear()
+
+    def refresh(self):
+        """
+        Resets the model and clears all internal caches.
+        Use this after modifying the structure of the underlying items outside of this model, such as reassigning sequences!
+
+        :rtype: None
+        """
+
+        self.beginResetModel()
+        self.clearCache()
+        self.endResetModel()
+
+    def invalidate(self, index=QtCore.QModelIndex()):
+        """
+        Invalidates the cached display data for the supplied index and all of its descendants.
+        Use this after modifying the values of the underlying items outside of this model!
+        If the row count of any cached descendant has changed then the model is refreshed instead.
+
+        :type index: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        # Collect cached items beneath index
+        #
+        internalId = index.internalId()
+        prefix = tuple(self.decodeInternalId(internalId))
+        depth = len(prefix)
+
+        internalIds = {otherId for (otherId, path) in self._internalIds.items() if tuple(path)[:depth] == prefix}
+        internalIds.add(internalId)
+
+        # Check if any cached row counts have changed
+        #
+        for otherId in internalIds:
+
+            rowCount = self._rowCounts.get(otherId, None)
+
+            if rowCount is None:
+
+                continue
+
+            path = self.decodeInternalId(otherId)
+            hasChildren = path.hasChildren() or path.isRoot()
+
+            if not hasChildren or len(path.value()) != rowCount:
+
+                self.refresh()
+                return
+
+        # Remove cached display data
+        #
+        numColumns = self.columnCount()
+
+        for otherId in internalIds:
+
+            for column in range(numColumns):
+
+                self._displayData.pop((otherId, column), None)
+
+        # Notify views of data change
+        #
+        if index.isValid():
+
+            self.dataChanged.emit(index.sibling(index.row(), 0), index.sibling(index.row(), numColumns - 1))
+
+        numRows = self.rowCount(index)
+
+        if numRows > 0 and numColumns > 0:
+
+            self.dataChanged.emit(self.index(0, 0, index), self.index(numRows - 1, numColumns - 1, index))
+
     def decodeInternalId(self, internalId):
         """
         Returns an item path from the supplied internal ID.
@@ -180,7 +353,13 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: qpsonpath.QPSONPath
         """
 
-        return self._internalIds.get(internalId, qpsonpath.QPSONPath(self.invisibleRootProperty, model=self))
+        path = self._internalIds.get(internalId, None)
+
+        if path is None:
+
+            path = qpsonpath.QPSONPath(self.invisibleRootProperty, model=self)
+
+        return path
 
     def itemFromIndex(self, index):
         """
@@ -217,18 +396,125 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: int
         """
 
-        # Evaluate parent item
+        # Check if row count has already been cached
         #
-        parentId = self.decodeInternalId(parent.internalId())
+        internalId = parent.internalId()
+        rowCount = self._rowCounts.get(internalId, None)
+
+        if rowCount is None:
+
+            # Evaluate parent item
+            #
+            parentId = self.decodeInternalId(internalId)
+            rowCount = 0
+
+            if parentId.hasChildren() or parentId.isRoot():
+
+                parentItem = parentId.value()
+                rowCount = len(parentItem)
 
-        if parentId.hasChildren() or parentId.isRoot():
+                self.watchItem(parentItem)
 
-            parentItem = parentId.value()
-            return len(parentItem)
+                # Check if sequence is large enough to be fetched incrementally
+                #
+                isSequence = isinstance(parentItem, collections_abc.Sequence)
+
+                if isSequence and rowCount > self.__fetch_size__ and internalId not in self._fetchedRows:
+
+                    self._fetchedRows[internalId] = self.__fetch_size__
+
+            self._rowCounts[internalId] = rowCount
+
+        # Evaluate number of fetched rows
+        #
+        fetchedRows = self._fetchedRows.get(internalId, rowCount)
+        return min(rowCount, fetchedRows)
+
+    def canFetchMore(self, parent):
+        """
+        Evaluates if there are more rows available for the parent item.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+
+        self.rowCount(parent)  # Ensures the row count has been cached
+        internalId = parent.internalId()
+
+        if internalId in self._fetchedRows:
+
+            return self._fetchedRows[internalId] < self._rowCounts.get(internalId, 0)
+
+        else:
+
+            return False
+
+    def fetchMore(self, parent):
+        """
+        Fetches any available rows for the items with the parent specified by the parent index.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        self.fetchRows(parent, self.__fetch_size__)
+
+    def fetchAll(self, parent=QtCore.QModelIndex()):
+        """
+        Fetches all remaining rows for the supplied parent.
+        This is required before any structural changes are made to a partially fetched parent!
+
+        :type parent: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        self.rowCount(parent)  # Ensures the row count has been cached
+        self.fetchRows(parent, None)
+
+    def fetchRows(self, parent, count):
+        """
+        Fetches the specified number of rows for the supplied parent.
+        If no count is supplied then all remaining rows are fetched!
+
+        :type parent: QtCore.QModelIndex
+        :type count: Union[int, None]
+        :rtype: None
+        """
+
+        # Check if parent is being fetched incrementally
+        #
+        internalId = parent.internalId()
+
+        if internalId not in self._fetchedRows:
+
+            return
+
+        # Evaluate remaining rows
+        #
+        fetchedRows = self._fetchedRows[internalId]
+        rowCount = self._rowCounts.get(internalId, fetchedRows)
+        remaining = rowCount - fetchedRows
+
+        count = remaining if count is None else min(count, remaining)
+
+        if count <= 0:
+
+            del self._fetchedRows[internalId]
+            return
+
+        # Signal start of insertion
+        #
+        self.beginInsertRows(parent, fetchedRows, (fetchedRows + count) - 1)
+
+        if (fetchedRows + count) >= rowCount:
+
+            del self._fetchedRows[internalId]
 
         else:
 
-            return 0
+            self._fetchedRows[internalId] = fetchedRows + count
+
+        self.endInsertRows()
 
     def columnCount(self, parent=QtCore.QModelIndex()):
         """
@@ -250,9 +536,18 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: QtCore.QModelIndex
         """
 
+        # Check if child ID has already been cached
+        #
+        parentInternalId = parent.internalId()
+        childId = self._childIds.get((parentInternalId, row), None)
+
+        if childId is not None:
+
+            return self.createIndex(row, column, id=childId)
+
         # Evaluate parent type
         #
-        parentId = self.decodeInternalId(parent.internalId())
+        parentId = self.decodeInternalId(parentInternalId)
         parentItem = parentId.value()
 
         if isinstance(parentItem, collections_abc.Sequence):
@@ -264,7 +559,6 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
             if 0 <= row < numItems:
 
                 childId = self.encodeInternalId(parentId, row)
-                return self.createIndex(row, column, id=childId)
 
             else:
 
@@ -280,7 +574,6 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
             if 0 <= row < numKeys:
 
                 childId = self.encodeInternalId(parentId, keys[row])
-                return self.createIndex(row, column, id=childId)
 
             else:
 
@@ -290,6 +583,14 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
             return QtCore.QModelIndex()
 
+        # Cache child and parent IDs
+        # The parent's row is stored so `parent` can skip evaluating the data structure!
+        #
+        self._childIds[(parentInternalId, row)] = childId
+        self._parentIds[childId] = (parent.row() if parent.isValid() else -1, parentInternalId)
+
+        return self.createIndex(row, column, id=childId)
+
     def parent(self, *args):
         """
         Returns the parent of the model item with the given index.
@@ -307,9 +608,17 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
             return super(QtCore.QAbstractItemModel, self).parent()
 
-        # Evaluate internal id
+        # Check if parent ID has already been cached
         #
         index = args[0]
+        parentRow, parentId = self._parentIds.get(index.internalId(), (None, None))
+
+        if parentRow is not None:
+
+            return self.createIndex(parentRow, 0, id=parentId) if parentRow >= 0 else QtCore.QModelIndex()
+
+        # Evaluate internal id
+        #
         internalId = self.decodeInternalId(index.internalId())
 
         if internalId.isRoot():
@@ -348,10 +657,15 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: bool
         """
 
-        # Check if parent has children
+        # Check if parent has already been evaluated
         #
-        internalId = self.decodeInternalId(parent.internalId())
-        hasChildren = internalId.hasChildren()
+        internalId = parent.internalId()
+        hasChildren = self._hasChildren.get(internalId, None)
+
+        if hasChildren is None:
+
+            hasChildren = self.decodeInternalId(internalId).hasChildren()
+            self._hasChildren[internalId] = hasChildren
 
         return hasChildren
 
@@ -429,12 +743,16 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         """
 
         # Signal start of insertion
+        # Any remaining rows must be fetched beforehand to keep the row indices in sync!
         #
+        self.fetchAll(parent)
+
         count = len(items)
         firstRow = row if row > 0 else self.rowCount(parent)
         lastRow = (firstRow + count) - 1
 
         self.beginInsertRows(parent, firstRow, lastRow)
+        self._editDepth += 1
 
         # Verify parent is a mutable sequence
         #
@@ -453,7 +771,10 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         # Signal end of insertion
         #
+        self.invalidateCache()
+        self._editDepth -= 1
         self.endInsertRows()
+
         return success
 
     def removeRows(self, row, count, parent=QtCore.QModelIndex()):
@@ -467,10 +788,14 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: bool
         """
 
-        # Signal start of insertion
+        # Signal start of removal
+        # Any remaining rows must be fetched beforehand to keep the row indices in sync!
         #
+        self.fetchAll(parent)
+
         lastRow = (row + count) - 1
         self.beginRemoveRows(parent, row, lastRow)
+        self._editDepth += 1
 
         # Verify parent is mutable
         #
@@ -482,9 +807,12 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
             del parentItem[row:(lastRow + 1)]
             success = True
 
-        # Signal end of insertion
+        # Signal end of removal
         #
+        self.invalidateCache()
+        self._editDepth -= 1
         self.endRemoveRows()
+
         return success
 
     def appendRow(self, item, parent=QtCore.QModelIndex()):
@@ -537,7 +865,11 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         """
 
         # Signal start of move
+        # Any remaining rows must be fetched beforehand to keep the row indices in sync!
         #
+        self.fetchAll(sourceParent)
+        self.fetchAll(destinationParent)
+
         lastSourceRow = (sourceRow + count) - 1
         lastDestinationRow = (destinationRow + count) - 1
 
@@ -562,6 +894,8 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         # Insert source items under destination parent
         #
+        self._editDepth += 1
+
         items = sourceItems[sourceRow:(lastSourceRow + 1)]
         del sourceItems[sourceRow:(lastSourceRow + 1)]
 
@@ -571,7 +905,10 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
 
         # Signal end of move
         #
+        self.invalidateCache()
+        self._editDepth -= 1
         self.endMoveRows()
+
         return True
 
     def resizeRow(self, size, T, parent=QtCore.QModelIndex()):
@@ -729,16 +1066,30 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
         :rtype: Any
         """
 
-        # Evaluate data role
+        # Check if display data has already been cached
+        # Display data is requested on every paint event so it is only re-evaluated once the data structure changes!
+        # Any changes made to the underlying items outside of this model must be followed by either `invalidate` or `refresh`.
         #
         column = index.column()
-        path = self.decodeInternalId(index.internalId())
+        internalId = index.internalId()
 
         if role == QtCore.Qt.DisplayRole:
 
-            return self.details(index, asString=True)
+            key = (internalId, column)
+            details = self._displayData.get(key, None)
+
+            if details is None:
+
+                details = self.details(index, asString=True)
+                self._displayData[key] = details
+
+            return details
 
-        elif role == QtCore.Qt.EditRole:
+        # Evaluate data role
+        #
+        path = self.decodeInternalId(internalId)
+
+        if role == QtCore.Qt.EditRole:
 
             # Verify this is the value column
             #
@@ -816,6 +1167,7 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
                 internalId = self.decodeInternalId(index.internalId())
                 internalId.setValue(value)
 
+                self.invalidate(index.parent())
                 return True
 
         elif role == QtCore.Qt.CheckStateRole:
@@ -823,6 +1175,7 @@ class QPSONItemModel(QtCore.QAbstractItemModel):
             boolean = True if (QtCore.Qt.CheckState(value) == QtCore.Qt.Checked) else False
             internalId.setValue(boolean)
 
+            self.invalidate(index.parent())
             return True
 
         else: